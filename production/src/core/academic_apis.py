@@ -2,41 +2,38 @@ import time
 import unicodedata
 
 import requests
-
-SURNAME_PARTICLES = {
-    "van",
-    "von",
-    "de",
-    "del",
-    "della",
-    "di",
-    "la",
-    "le",
-    "den",
-    "der",
-    "ten",
-    "ter",
-    "das",
-    "dos",
-    "du",
-    "el",
-    "al",
-    "bin",
-}
+from core.identity_index import names_match
+from core.ror_index import get_index as get_ror_index
 
 
 class AcademicProfileEnricher:
     S2_BASE = "https://api.semanticscholar.org/graph/v1"
     OA_BASE = "https://api.openalex.org"
-    S2_FIELDS = "name,citationCount,paperCount,hIndex,papers.title,papers.year,papers.citationCount,papers.venue"
+    S2_FIELDS = "name,citationCount,paperCount,hIndex,papers.title,papers.year,papers.citationCount,papers.venue,papers.authors"
     RATE_LIMIT = 0.6
 
     def __init__(self, session: requests.Session):
         self.session = session
         self._last_request = 0
         self._inst_cache = {}
+        self._profiles = {}
+        # Optional co-authorship graph fed with every paper list fetched
+        self.coauthors = None
+
+    def _profile_key(self, name, orcid_id=None, institution=None):
+        return (orcid_id or "", self._normalize(name or ""), self._normalize(institution or ""))
+
+    def cached_profile(self, name, orcid_id=None, institution=None):
+        """Profile from an earlier ``enrich`` call this session (``{}`` = not found), else None."""
+        return self._profiles.get(self._profile_key(name, orcid_id, institution))
 
     def enrich(self, name, orcid_id=None, institution=None):
+        key = self._profile_key(name, orcid_id, institution)
+        if key not in self._profiles:
+            self._profiles[key] = self._enrich(name, orcid_id, institution)
+        return self._profiles[key]
+
+    def _enrich(self, name, orcid_id=None, institution=None):
         result = {}
 
         s2 = self._semantic_scholar(name, orcid_id, institution)
@@ -105,6 +102,9 @@ class AcademicProfileEnricher:
 
     def _parse_s2(self, author):
         papers = author.get("papers", [])
+        if self.coauthors is not None:
+            for paper in papers:
+                self.coauthors.add_s2_paper(paper)
         top_papers = sorted(papers, key=lambda p: p.get("citationCount") or 0, reverse=True)[:5]
         return {
             "author_id": author.get("authorId"),
@@ -278,6 +278,9 @@ class AcademicProfileEnricher:
         return sorted(pool, key=lambda x: x.get("cited_by_count") or 0, reverse=True)[0], False
 
     def _institution_match(self, known, api_inst):
+        same = get_ror_index().same_institution(known, api_inst)
+        if same is not None:
+            return same
         stop = {
             "university",
             "universite",
@@ -335,47 +338,8 @@ class AcademicProfileEnricher:
         needed = 2 if len(known_words) >= 3 else 1
         return overlap >= needed
 
-    def _extract_surname(self, parts, original_name):
-        if "," in original_name:
-            raw = self._normalize(original_name.split(",")[0].strip())
-            surname_parts = [p for p in raw.split() if p]
-            core = [p for p in surname_parts if p not in SURNAME_PARTICLES]
-            return core[-1] if core else surname_parts[-1] if surname_parts else ""
-        core = [p for p in parts if p not in SURNAME_PARTICLES]
-        return core[-1] if core else parts[-1] if parts else ""
-
     def _name_match(self, api_name, target_name):
-        api_norm = self._normalize(api_name.replace(",", " ").replace(".", " "))
-        target_norm = self._normalize(target_name.replace(",", " ").replace(".", " "))
-        api_parts = [p for p in api_norm.split() if p]
-        target_parts = [p for p in target_norm.split() if p]
-        if not api_parts or not target_parts:
-            return False
-
-        api_surname = self._extract_surname(api_parts, api_name)
-        target_surname = self._extract_surname(target_parts, target_name)
-
-        if api_surname != target_surname:
-            return False
-
-        api_given = [p for p in api_parts if p != api_surname and p not in SURNAME_PARTICLES]
-        target_given = [
-            p for p in target_parts if p != target_surname and p not in SURNAME_PARTICLES
-        ]
-
-        if not api_given or not target_given:
-            return len(api_parts) == 1 and len(target_parts) == 1
-
-        for ag in api_given:
-            for tg in target_given:
-                if ag == tg:
-                    return True
-                if len(ag) == 1 and tg.startswith(ag):
-                    return True
-                if len(tg) == 1 and ag.startswith(tg):
-                    return True
-
-        return False
+        return names_match(api_name, target_name)
 
     def name_match(self, api_name, target_name):
         return self._name_match(api_name, target_name)
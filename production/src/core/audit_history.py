@@ -0,0 +1,108 @@
+"""Incremental audit-trail extraction against a stored per-manuscript history.
+
+Each manuscript's parsed audit trail is kept in ``StateStore`` together with
+a high-water mark (newest event timestamp and hash). Extractors read audit
+pages newest-first and feed them to ``AuditHistory.add_page``; reading stops
+at the first event already stored and ``finish`` merges the new events with
+the stored history. A manuscript with hundreds of events then costs one page
+load per run instead of one per ten events.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+
+# Session-bound or derived fields that must not affect an event's identity
+_VOLATILE_FIELDS = frozenset({"email_content_url", "datetime", "popup_url", "manuscript_id"})
+
+
+def event_hash(event: dict) -> str:
+    stable = {k: v for k, v in event.items() if k not in _VOLATILE_FIELDS}
+    raw = json.dumps(stable, sort_keys=True, ensure_ascii=False, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def event_time(event: dict) -> str:
+    for key in ("datetime", "timestamp_gmt", "date"):
+        value = event.get(key)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if value:
+            return str(value)
+    return ""
+
+
+def encode_events(events: list[dict]) -> str:
+    def _default(value):
+        if isinstance(value, datetime):
+            return {"$dt": value.isoformat()}
+        return str(value)
+
+    return json.dumps(events, ensure_ascii=False, default=_default)
+
+
+def decode_events(raw: str) -> list[dict]:
+    def _hook(obj):
+        if set(obj) == {"$dt"}:
+            return datetime.fromisoformat(obj["$dt"])
+        return obj
+
+    return json.loads(raw, object_hook=_hook)
+
+
+def _newest_first(page: list[dict]) -> list[dict]:
+    times = [e["datetime"] for e in page if isinstance(e.get("datetime"), datetime)]
+    if len(times) >= 2 and times[0] < times[-1]:
+        return list(reversed(page))
+    return list(page)
+
+
+class AuditHistory:
+    """Stored audit trail of one manuscript plus the events read this run."""
+
+    def __init__(self, journal: str, manuscript_id: str, store=None, full: bool = False):
+        if store is None:
+            from core.state_store import StateStore
+
+            store = StateStore()
+        self.journal = journal.lower()
+        self.manuscript_id = manuscript_id
+        self.store = store
+        self.stored, self.latest_hash = (
+            ([], "") if full else store.get_audit_history(manuscript_id, self.journal)
+        )
+        self.known = {event_hash(e) for e in self.stored}
+        self.new: list[dict] = []
+        self.reached_known = False
+
+    def add_page(self, page: list[dict]) -> bool:
+        """Record a page of events; return False once a stored event is reached."""
+        for event in _newest_first(page):
+            h = event_hash(event)
+            if h in self.known:
+                if self.new or h == self.latest_hash:
+                    self.reached_known = True
+                    return False
+                # An older stored event came first: pages are not newest-first,
+                # so fall back to reading the full trail.
+                self.known = set()
+            self.new.append(event)
+        return True
+
+    def finish(self) -> list[dict]:
+        """Merge new events with the stored history (newest first) and persist it.
+
+        When no stored event was reached the pages read are the full history
+        and replace the stored one.
+        """
+        merged = self.new + self.stored if self.reached_known else list(self.new)
+        seen = set()
+        events = []
+        for event in merged:
+            h = event_hash(event)
+            if h not in seen:
+                seen.add(h)
+                events.append(event)
+        if events and (self.new or not self.reached_known):
+            self.store.save_audit_history(self.manuscript_id, self.journal, events)
+        return events
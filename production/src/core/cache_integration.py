@@ -9,11 +9,14 @@ Handles both test and production modes automatically.
 
 import glob
 import os
+import re
 from datetime import datetime
 from pathlib import Path
 
 # Import cache components
 from .cache_manager import ExtractorCacheMixin
+from .ror_index import get_index as get_ror_index
+from .snapshot_diff import person_key
 
 
 class CachedExtractorMixin(ExtractorCacheMixin):
@@ -70,6 +73,12 @@ class CachedExtractorMixin(ExtractorCacheMixin):
             print(f"         📚 Cache hit: {email_domain} → {institution}")
             return institution
 
+        org = get_ror_index().by_domain(email_domain)
+        if org:
+            self.cache_manager.cache_institution(email_domain, org["name"], org["country"])
+            print(f"         🏛️ ROR index: {email_domain} → {org['name']}")
+            return org["name"]
+
         # If not in cache, use existing inference logic
         # This should call the original infer_institution_from_email_domain
         if hasattr(self, "infer_institution_from_email_domain"):
@@ -164,6 +173,71 @@ class CachedExtractorMixin(ExtractorCacheMixin):
                 pass
         self.cache_manager.update_web_profile(key, name, orcid_id, profile_data, source)
 
+    def _artifact_key(self, manuscript_id: str, referee, revision):
+        referee_key = person_key(referee) if isinstance(referee, dict) else referee
+        if revision is None:
+            m = re.search(r"\.R(\d+)$", manuscript_id)
+            revision = int(m.group(1)) if m else 0
+        return getattr(self, "journal_name", ""), manuscript_id, referee_key, revision
+
+    def get_cached_artifact(
+        self, artifact_type: str, manuscript_id: str, referee="", revision: int | None = None
+    ):
+        cache = getattr(self, "cache_manager", None)
+        if cache is None or not manuscript_id or getattr(self, "force_refresh", False):
+            return None
+        journal, ms_id, referee_key, revision = self._artifact_key(manuscript_id, referee, revision)
+        try:
+            cached = cache.get_artifact(journal, ms_id, artifact_type, referee_key, revision)
+        except Exception:
+            return None
+        if cached is not None:
+            print(f"         📦 [CACHE] {artifact_type} for {ms_id} {referee_key}".rstrip())
+        return cached
+
+    def store_artifact(
+        self,
+        artifact_type: str,
+        manuscript_id: str,
+        data,
+        referee="",
+        revision: int | None = None,
+    ):
+        cache = getattr(self, "cache_manager", None)
+        if cache is None or not manuscript_id:
+            return
+        journal, ms_id, referee_key, revision = self._artifact_key(manuscript_id, referee, revision)
+        try:
+            cache.put_artifact(journal, ms_id, artifact_type, data, referee_key, revision)
+        except Exception:
+            pass
+
+    def cached_artifact(
+        self,
+        artifact_type: str,
+        manuscript_id: str,
+        fetch,
+        referee: dict | str = "",
+        revision: int | None = None,
+        keep=bool,
+    ):
+        """Return an immutable artifact from cache, or ``fetch()`` it and store it.
+
+        Only for artifacts that never change once they exist (submitted
+        referee reports, decision letters, author responses, past versions).
+        A fetched result is stored only if ``keep(result)`` is true, so
+        failed or partial extractions are retried next run. The key is
+        (journal, manuscript_id, referee, revision, artifact_type); the
+        revision defaults to the ``.R<n>`` suffix of the manuscript ID.
+        """
+        cached = self.get_cached_artifact(artifact_type, manuscript_id, referee, revision)
+        if cached is not None:
+            return cached
+        result = fetch()
+        if result is not None and keep(result):
+            self.store_artifact(artifact_type, manuscript_id, result, referee, revision)
+        return result
+
     def finish_extraction_with_stats(self):
         """Finish extraction and show comprehensive statistics."""
         self.finish_extraction()
@@ -6,6 +6,7 @@ import random
 import re
 import sys
 import time
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -22,6 +23,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.cache_integration import CachedExtractorMixin
+from core.popup_capture import PopupCapture
+from core.resource_policy import apply_resource_policy
+from core.session_vault import SessionVault
+from core.stage_pipeline import StagedPipeline
 from core.web_enrichment import enrich_people_from_web
 
 try:
@@ -50,6 +55,8 @@ class EMExtractor(CachedExtractorMixin):
         self.headless = headless
         self.init_cached_extractor(self.JOURNAL_CODE)
         self.setup_directories()
+        self.session_vault = SessionVault(self.JOURNAL_CODE)
+        self.popups = PopupCapture()
         self.setup_chrome_options()
         self.driver = None
         self.wait = None
@@ -72,6 +79,10 @@ class EMExtractor(CachedExtractorMixin):
         self.chrome_options.add_argument("--disable-popup-blocking")
         self.chrome_options.add_argument("--window-size=1400,900")
 
+        profile = self.session_vault.profile_dir()
+        if profile:
+            self.chrome_options.add_argument(f"--user-data-dir={profile}")
+
     def setup_directories(self):
         self.base_dir = Path(__file__).parent.parent.parent
         jc = self.JOURNAL_CODE.lower()
@@ -116,6 +127,7 @@ class EMExtractor(CachedExtractorMixin):
         self.wait = WebDriverWait(self.driver, 30)
         self.original_window = self.driver.current_window_handle
         self._in_content_frame = False
+        apply_resource_policy(self.driver, "em")
         print(f"🖥️  Browser configured for {self.JOURNAL_CODE}")
 
     # ── Frame management ──────────────────────────────────────
@@ -193,13 +205,13 @@ class EMExtractor(CachedExtractorMixin):
         except Exception:
             pass
 
-    def _save_debug_html(self, label: str):
+    def _save_debug_html(self, label: str, html: str | None = None):
         try:
             debug_dir = Path(self.output_dir) / "debug"
             debug_dir.mkdir(parents=True, exist_ok=True)
             filepath = debug_dir / f"{self.JOURNAL_CODE.lower()}_{label}.html"
             with open(filepath, "w") as f:
-                f.write(self.driver.page_source)
+                f.write(self.driver.page_source if html is None else html)
         except Exception:
             pass
 
@@ -212,6 +224,9 @@ class EMExtractor(CachedExtractorMixin):
             return False
 
         login_url = f"{self.BASE_URL}/default.aspx"
+        if self._resume_saved_session(login_url):
+            return True
+
         print(f"🔐 Logging in to {login_url}")
         self.driver.get(login_url)
         self.smart_wait(4)
@@ -290,6 +305,21 @@ class EMExtractor(CachedExtractorMixin):
         if not self._select_editor_role():
             print("   ⚠️ Could not switch to editor role")
 
+        self.session_vault.save(self.driver)
+        return True
+
+    def _resume_saved_session(self, login_url: str) -> bool:
+        """Reuse vaulted cookies; the editor role is kept server-side."""
+        if not self.session_vault.restore(self.driver, login_url):
+            return False
+        self.driver.get(login_url)
+        self.smart_wait(3)
+        if not self._verify_login():
+            print("   ⚠️ Saved session expired, logging in")
+            self.session_vault.invalidate()
+            return False
+        self.session_vault.mark_valid()
+        print("   ✅ Resumed saved session")
         return True
 
     def _verify_login(self) -> bool:
@@ -1434,29 +1464,13 @@ class EMExtractor(CachedExtractorMixin):
 
         js_code = js_href.replace("javascript:", "").strip().rstrip(";")
         try:
-            if folder_url:
-                self.switch_to_default()
-                self.driver.get(folder_url)
-                self.smart_wait(3)
+            self._load_folder(folder_url)
 
             if self.switch_to_content_frame():
-                main_handle = self.driver.current_window_handle
-                existing_handles = set(self.driver.window_handles)
-
-                self.driver.execute_script(js_code)
-                self.smart_wait(5)
-
-                new_handles = set(self.driver.window_handles) - existing_handles
-                if new_handles:
-                    popup_handle = new_handles.pop()
-                    self.driver.switch_to.window(popup_handle)
-                    self.smart_wait(3)
-                    src = self.driver.page_source
-                    self._in_content_frame = False
-                    self._save_debug_html(f"{debug_prefix}_{ms_id}")
-                    self.driver.close()
-                    self.driver.switch_to.window(main_handle)
-                    self._in_content_frame = False
+                src = self.popups.capture(self.driver, lambda: self.driver.execute_script(js_code))
+                self._in_content_frame = False
+                if src is not None:
+                    self._save_debug_html(f"{debug_prefix}_{ms_id}", src)
                     return BeautifulSoup(src, "lxml")
         except Exception as e:
             print(f"      ⚠️ Frame fallback failed ({debug_prefix}): {str(e)[:60]}")
@@ -1704,50 +1718,44 @@ class EMExtractor(CachedExtractorMixin):
 
     # ── Detail page extraction (reviews, details, history) ────
 
+    @staticmethod
+    def _em_js_code(js_href: str) -> str:
+        js_code = js_href.replace("javascript:", "").strip().rstrip(";")
+        return js_code.replace("PopupHistoryWindow(", "popupHistoryWindow(")
+
+    def _load_folder(self, folder_url: str):
+        if folder_url:
+            self.switch_to_default()
+            self.driver.get(folder_url)
+            self._wait_for_page_load()
+
     def _exec_em_js_and_capture(
         self, js_href: str, ms_id: str, debug_prefix: str, folder_url: str = ""
     ) -> BeautifulSoup | None:
         if not js_href:
             return None
 
-        js_code = js_href.replace("javascript:", "").strip().rstrip(";")
-        js_code = js_code.replace("PopupHistoryWindow(", "popupHistoryWindow(")
+        js_code = self._em_js_code(js_href)
 
         try:
-            if folder_url:
-                self.switch_to_default()
-                self.driver.get(folder_url)
-                self.smart_wait(3)
-
+            self._load_folder(folder_url)
             self.switch_to_default()
-            main_handle = self.driver.current_window_handle
-            existing_handles = set(self.driver.window_handles)
-
-            self.driver.execute_script(js_code)
-            self.smart_wait(5)
+            src = self.popups.capture(self.driver, lambda: self.driver.execute_script(js_code))
+            self._in_content_frame = False
+            if src is not None:
+                self._save_debug_html(f"{debug_prefix}_{ms_id}", src)
+                return BeautifulSoup(src, "lxml")
 
-            new_handles = set(self.driver.window_handles) - existing_handles
-            if new_handles:
-                popup_handle = new_handles.pop()
-                self.driver.switch_to.window(popup_handle)
-                self.smart_wait(3)
+            # No new window: the opener navigated in place
+            if self.switch_to_content_frame():
                 src = self.driver.page_source
-                self._in_content_frame = False
                 self._save_debug_html(f"{debug_prefix}_{ms_id}")
-                self.driver.close()
-                self.driver.switch_to.window(main_handle)
-                self._in_content_frame = False
+                self.switch_to_default()
                 return BeautifulSoup(src, "lxml")
             else:
-                if self.switch_to_content_frame():
-                    src = self.driver.page_source
-                    self._save_debug_html(f"{debug_prefix}_{ms_id}")
-                    self.switch_to_default()
-                    return BeautifulSoup(src, "lxml")
-                else:
-                    src = self.driver.page_source
-                    self._save_debug_html(f"{debug_prefix}_{ms_id}")
-                    return BeautifulSoup(src, "lxml")
+                src = self.driver.page_source
+                self._save_debug_html(f"{debug_prefix}_{ms_id}")
+                return BeautifulSoup(src, "lxml")
 
         except Exception as e:
             print(f"      ⚠️ JS exec failed ({debug_prefix}): {str(e)[:60]}")
@@ -1758,6 +1766,39 @@ class EMExtractor(CachedExtractorMixin):
             self._in_content_frame = False
             return None
 
+    def _exec_em_js_and_capture_many(
+        self, popups: list[tuple[str, str]], ms_id: str, folder_url: str = ""
+    ) -> list[BeautifulSoup | None]:
+        """Capture several (js_href, debug_prefix) popups in parallel windows.
+
+        Popups that did not open a window are retried one at a time.
+        """
+        if len(popups) < 2:
+            return [
+                self._exec_em_js_and_capture(js, ms_id, prefix, folder_url) for js, prefix in popups
+            ]
+
+        codes = [self._em_js_code(js) for js, _ in popups]
+        try:
+            self._load_folder(folder_url)
+            self.switch_to_default()
+            pages = self.popups.capture_many(
+                self.driver, [lambda c=c: self.driver.execute_script(c) for c in codes]
+            )
+        except Exception as e:
+            print(f"      ⚠️ Parallel popups failed, capturing one by one: {str(e)[:60]}")
+            pages = [None] * len(popups)
+        self._in_content_frame = False
+
+        soups = []
+        for (js, prefix), src in zip(popups, pages, strict=True):
+            if src is None:
+                soups.append(self._exec_em_js_and_capture(js, ms_id, prefix, folder_url))
+            else:
+                self._save_debug_html(f"{prefix}_{ms_id}", src)
+                soups.append(BeautifulSoup(src, "lxml"))
+        return soups
+
     def _return_to_dashboard(self):
         try:
             self.switch_to_default()
@@ -2344,6 +2385,160 @@ class EMExtractor(CachedExtractorMixin):
 
         print(f"      📜 History: {len(audit_trail)} events")
 
+    def _parse_review_popup(self, pl: dict, pid: int, ms_info: dict, folder_url: str):
+        soup = self._exec_em_js_and_capture(
+            pl["js"],
+            ms_info["manuscript_id"],
+            f"review_r{pl['revision']}_p{pid}",
+            folder_url,
+        )
+        if not soup:
+            return None
+
+        report = {"revision": pl["revision"]}
+
+        meta_table = soup.find("table", id="tblSubmissionMetaData")
+        if meta_table:
+            for row in meta_table.find_all("tr"):
+                label_td = row.find("td", class_="label")
+                if label_td:
+                    value_td = label_td.find_next_sibling("td")
+                    if value_td:
+                        label = label_td.get_text(strip=True).lower()
+                        value = value_td.get_text(strip=True)
+                        if value and value not in ("\xa0", "&nbsp;", "(None)"):
+                            if "recommendation" in label:
+                                report["recommendation"] = value
+
+            for th in meta_table.find_all("th"):
+                th_text = th.get_text(strip=True).lower()
+                next_row = th.find_parent("tr")
+                if next_row:
+                    next_tr = next_row.find_next_sibling("tr")
+                    if next_tr:
+                        td = next_tr.find("td")
+                        if td:
+                            value = td.get_text(strip=True)
+                            if value and value not in ("\xa0", "&nbsp;"):
+                                if "comment" in th_text and "author" in th_text:
+                                    report["comments_to_author"] = value[:20000]
+                                elif "comment" in th_text and "editor" in th_text:
+                                    report["confidential_comments"] = value[:20000]
+
+        if not meta_table:
+            for table in soup.find_all("table"):
+                for row in table.find_all("tr"):
+                    cells = row.find_all("td")
+                    if len(cells) < 2:
+                        continue
+                    label = cells[0].get_text(strip=True).lower()
+                    value = cells[1].get_text(strip=True)
+                    if not value or value in ("\xa0", "&nbsp;", "(None)"):
+                        continue
+                    if "recommendation" in label:
+                        report["recommendation"] = value
+                    elif "remark" in label and "author" in label:
+                        report["comments_to_author"] = value[:20000]
+                    elif "confidential" in label or ("comment" in label and "editor" in label):
+                        report["confidential_comments"] = value[:20000]
+
+        bigtitle = soup.find("div", class_="bigtitle")
+        if bigtitle:
+            reviewer_span = bigtitle.find("span", style=re.compile(r"color"))
+            if reviewer_span:
+                num_match = re.search(r"Reviewer\s+(\d+)", reviewer_span.get_text())
+                if num_match:
+                    report["reviewer_number"] = int(num_match.group(1))
+
+        if not report.get("comments_to_author"):
+            comments_box = soup.find("div", class_="reviewerCommentsBox")
+            if comments_box:
+                body_text = comments_box.get_text(separator="\n", strip=True)
+                if len(body_text) > 100:
+                    report["raw_text"] = body_text[:20000]
+
+        attach_panel = soup.find("div", id="reviewerAttachmentsControl_reviewerAttachmentPanel")
+        if attach_panel:
+            att_table = attach_panel.find(
+                "table", id=re.compile(r"reviewerAttachmentsControl_Attachments")
+            )
+            if att_table:
+                attachment_urls = []
+                for att_row in att_table.find_all("tr"):
+                    att_cells = att_row.find_all("td")
+                    if len(att_cells) < 2:
+                        continue
+                    dl_link = None
+                    for att_a in att_row.find_all("a", href=True):
+                        att_href = att_a.get("href", "")
+                        if "download.aspx" in att_href and "scheme=9" not in att_href:
+                            dl_link = att_a
+                            break
+                    if not dl_link:
+                        for att_a in att_row.find_all("a", href=True):
+                            att_href = att_a.get("href", "")
+                            if "download.aspx" in att_href:
+                                dl_link = att_a
+                                break
+                    if dl_link:
+                        att_texts = [c.get_text(strip=True) for c in att_cells]
+                        attachment_urls.append(
+                            {
+                                "url": dl_link.get("href", ""),
+                                "description": (att_texts[1] if len(att_texts) > 1 else ""),
+                                "filename": att_texts[2] if len(att_texts) > 2 else "",
+                            }
+                        )
+                if attachment_urls:
+                    report["_attachment_urls"] = attachment_urls
+
+        # Apply canonical schema annotations
+        report.setdefault("source", "em_popup")
+        cta = report.get("comments_to_author") or ""
+        raw = report.get("raw_text") or ""
+        has_attachments = bool(report.get("_attachment_urls"))
+        report["available"] = bool(
+            cta
+            or raw
+            or report.get("scores")
+            or has_attachments
+            or (
+                report.get("recommendation")
+                and report["recommendation"].lower() not in ("", "unknown", "n/a", "(none)")
+            )
+        )
+        if cta or raw:
+            report["extraction_status"] = "ok"
+        elif report.get("recommendation") or has_attachments:
+            report["extraction_status"] = "shell_only"
+        else:
+            report["extraction_status"] = "popup_failed"
+        word_text = cta or raw
+        report["word_count"] = len(word_text.split()) if word_text else 0
+
+        return report
+
+    def _review_report(self, pl: dict, pid: int, ref: dict, ms_info: dict, folder_url: str):
+        """One review popup's report, reused from the artifact cache when final.
+
+        ``download.aspx`` attachment links only work in the session that
+        rendered the popup, so they are left out of the cached copy; a cached
+        report that had attachments reopens the popup for fresh links.
+        """
+        ms_id = ms_info["manuscript_id"]
+        cached = self.get_cached_artifact("referee_report", ms_id, ref, pl["revision"])
+        if cached is not None and not cached.pop("_attachment_count", 0):
+            return cached
+
+        report = self._parse_review_popup(pl, pid, ms_info, folder_url)
+        if report is None:
+            return cached
+        if report.get("extraction_status") == "ok":
+            payload = {k: v for k, v in report.items() if k != "_attachment_urls"}
+            payload["_attachment_count"] = len(report.get("_attachment_urls", []))
+            self.store_artifact("referee_report", ms_id, payload, ref, pl["revision"])
+        return report
+
     def _extract_referee_reports(self, manuscript: dict, ms_info: dict):
         review_links = ms_info.get("review_detail_links", [])
         if not review_links:
@@ -2393,143 +2588,10 @@ class EMExtractor(CachedExtractorMixin):
 
             for pl in revs:
                 try:
-                    soup = self._exec_em_js_and_capture(
-                        pl["js"],
-                        ms_info["manuscript_id"],
-                        f"review_r{pl['revision']}_p{pid}",
-                        folder_url,
-                    )
-                    if not soup:
+                    report = self._review_report(pl, pid, ref, ms_info, folder_url)
+                    if not report:
                         continue
 
-                    report = {"revision": pl["revision"]}
-
-                    meta_table = soup.find("table", id="tblSubmissionMetaData")
-                    if meta_table:
-                        for row in meta_table.find_all("tr"):
-                            label_td = row.find("td", class_="label")
-                            if label_td:
-                                value_td = label_td.find_next_sibling("td")
-                                if value_td:
-                                    label = label_td.get_text(strip=True).lower()
-                                    value = value_td.get_text(strip=True)
-                                    if value and value not in ("\xa0", "&nbsp;", "(None)"):
-                                        if "recommendation" in label:
-                                            report["recommendation"] = value
-
-                        for th in meta_table.find_all("th"):
-                            th_text = th.get_text(strip=True).lower()
-                            next_row = th.find_parent("tr")
-                            if next_row:
-                                next_tr = next_row.find_next_sibling("tr")
-                                if next_tr:
-                                    td = next_tr.find("td")
-                                    if td:
-                                        value = td.get_text(strip=True)
-                                        if value and value not in ("\xa0", "&nbsp;"):
-                                            if "comment" in th_text and "author" in th_text:
-                                                report["comments_to_author"] = value[:20000]
-                                            elif "comment" in th_text and "editor" in th_text:
-                                                report["confidential_comments"] = value[:20000]
-
-                    if not meta_table:
-                        for table in soup.find_all("table"):
-                            for row in table.find_all("tr"):
-                                cells = row.find_all("td")
-                                if len(cells) < 2:
-                                    continue
-                                label = cells[0].get_text(strip=True).lower()
-                                value = cells[1].get_text(strip=True)
-                                if not value or value in ("\xa0", "&nbsp;", "(None)"):
-                                    continue
-                                if "recommendation" in label:
-                                    report["recommendation"] = value
-                                elif "remark" in label and "author" in label:
-                                    report["comments_to_author"] = value[:20000]
-                                elif "confidential" in label or (
-                                    "comment" in label and "editor" in label
-                                ):
-                                    report["confidential_comments"] = value[:20000]
-
-                    bigtitle = soup.find("div", class_="bigtitle")
-                    if bigtitle:
-                        reviewer_span = bigtitle.find("span", style=re.compile(r"color"))
-                        if reviewer_span:
-                            num_match = re.search(r"Reviewer\s+(\d+)", reviewer_span.get_text())
-                            if num_match:
-                                report["reviewer_number"] = int(num_match.group(1))
-
-                    if not report.get("comments_to_author"):
-                        comments_box = soup.find("div", class_="reviewerCommentsBox")
-                        if comments_box:
-                            body_text = comments_box.get_text(separator="\n", strip=True)
-                            if len(body_text) > 100:
-                                report["raw_text"] = body_text[:20000]
-
-                    attach_panel = soup.find(
-                        "div", id="reviewerAttachmentsControl_reviewerAttachmentPanel"
-                    )
-                    if attach_panel:
-                        att_table = attach_panel.find(
-                            "table", id=re.compile(r"reviewerAttachmentsControl_Attachments")
-                        )
-                        if att_table:
-                            attachment_urls = []
-                            for att_row in att_table.find_all("tr"):
-                                att_cells = att_row.find_all("td")
-                                if len(att_cells) < 2:
-                                    continue
-                                dl_link = None
-                                for att_a in att_row.find_all("a", href=True):
-                                    att_href = att_a.get("href", "")
-                                    if "download.aspx" in att_href and "scheme=9" not in att_href:
-                                        dl_link = att_a
-                                        break
-                                if not dl_link:
-                                    for att_a in att_row.find_all("a", href=True):
-                                        att_href = att_a.get("href", "")
-                                        if "download.aspx" in att_href:
-                                            dl_link = att_a
-                                            break
-                                if dl_link:
-                                    att_texts = [c.get_text(strip=True) for c in att_cells]
-                                    attachment_urls.append(
-                                        {
-                                            "url": dl_link.get("href", ""),
-                                            "description": (
-                                                att_texts[1] if len(att_texts) > 1 else ""
-                                            ),
-                                            "filename": att_texts[2] if len(att_texts) > 2 else "",
-                                        }
-                                    )
-                            if attachment_urls:
-                                report["_attachment_urls"] = attachment_urls
-
-                    # Apply canonical schema annotations
-                    report.setdefault("source", "em_popup")
-                    cta = report.get("comments_to_author") or ""
-                    raw = report.get("raw_text") or ""
-                    has_attachments = bool(report.get("_attachment_urls"))
-                    report["available"] = bool(
-                        cta
-                        or raw
-                        or report.get("scores")
-                        or has_attachments
-                        or (
-                            report.get("recommendation")
-                            and report["recommendation"].lower()
-                            not in ("", "unknown", "n/a", "(none)")
-                        )
-                    )
-                    if cta or raw:
-                        report["extraction_status"] = "ok"
-                    elif report.get("recommendation") or has_attachments:
-                        report["extraction_status"] = "shell_only"
-                    else:
-                        report["extraction_status"] = "popup_failed"
-                    word_text = cta or raw
-                    report["word_count"] = len(word_text.split()) if word_text else 0
-
                     reports.append(report)
                     report_count += 1
 
@@ -2574,22 +2636,26 @@ class EMExtractor(CachedExtractorMixin):
         folder_url = ms_info.get("folder_url", "")
         enriched = 0
 
-        for ref in referees:
-            pid = ref.get("people_id")
-            if not pid:
-                continue
-            if ref.get("email") and ref.get("affiliation"):
-                continue
-
-            js_code = f"popupReviewerInfo({pid}, {docid})"
+        targets = [
+            ref
+            for ref in referees
+            if ref.get("people_id") and not (ref.get("email") and ref.get("affiliation"))
+        ]
+        soups = self._exec_em_js_and_capture_many(
+            [
+                (
+                    f"popupReviewerInfo({ref['people_id']}, {docid})",
+                    f"refcontact_p{ref['people_id']}",
+                )
+                for ref in targets
+            ],
+            ms_info["manuscript_id"],
+            folder_url,
+        )
 
+        for ref, soup in zip(targets, soups, strict=True):
+            pid = ref["people_id"]
             try:
-                soup = self._exec_em_js_and_capture(
-                    js_code,
-                    ms_info["manuscript_id"],
-                    f"refcontact_p{pid}",
-                    folder_url,
-                )
                 if not soup:
                     continue
 
@@ -3150,6 +3216,7 @@ class EMExtractor(CachedExtractorMixin):
             get_cached_web_profile=self.get_cached_web_profile,
             save_web_profile=self.save_web_profile,
             platform_label="em_metadata",
+            defer_to=self.JOURNAL_CODE,
         )
 
     def _enrich_audit_trail_with_gmail(self, manuscript_data: dict, manuscript_id: str):
@@ -3305,6 +3372,7 @@ class EMExtractor(CachedExtractorMixin):
             "extractor_version": "2.0.0",
             "manuscripts": manuscripts,
             "summary": summary,
+            "popup_capture": self.popups.report(),
         }
 
         from core.output_schema import normalize_wrapper
@@ -3382,12 +3450,37 @@ class EMExtractor(CachedExtractorMixin):
             self.driver = None
         self._in_content_frame = False
 
+    def _report_popup_timing(self):
+        report = self.popups.report()
+        if not report["popups"]:
+            return
+        print(
+            f"⏱️ Popups: {report['popups']} captured in {report['seconds']}s "
+            f"(fixed waits: {report['fixed_wait_seconds']}s, speed-up x{report['speedup']})"
+        )
+
     # ── Main entry point ──────────────────────────────────────
 
+    def _post_processing_stages(self) -> list[tuple[str, Callable[[dict], None]]]:
+        def timeline(data: dict):
+            analytics = self.extract_timeline_analytics(data)
+            if analytics:
+                data["timeline_analytics"] = analytics
+
+        return [
+            ("Enrichment", self._enrich_people_from_web),
+            (
+                "Gmail",
+                lambda data: self._enrich_audit_trail_with_gmail(data, data["manuscript_id"]),
+            ),
+            ("Timeline analytics", timeline),
+        ]
+
     def run(self) -> list[dict]:
         print(f"🚀 {self.JOURNAL_CODE} EXTRACTION — EDITORIAL MANAGER")
         print("=" * 60)
 
+        pipeline = None
         try:
             self.setup_driver()
 
@@ -3422,6 +3515,7 @@ class EMExtractor(CachedExtractorMixin):
                 return []
 
             print(f"\n📚 Total unique manuscripts: {len(all_manuscript_infos)}")
+            pipeline = StagedPipeline(self._post_processing_stages())
 
             for ms_info in all_manuscript_infos:
                 ms_id = ms_info["manuscript_id"]
@@ -3441,29 +3535,19 @@ class EMExtractor(CachedExtractorMixin):
                             break
 
                 if data:
-                    try:
-                        self._enrich_people_from_web(data)
-                    except Exception as e:
-                        print(f"      ⚠️ Enrichment error: {str(e)[:60]}")
-                    try:
-                        self._enrich_audit_trail_with_gmail(data, ms_id)
-                    except Exception as e:
-                        print(f"      ⚠️ Gmail error: {str(e)[:60]}")
-                    try:
-                        timeline_analytics = self.extract_timeline_analytics(data)
-                        if timeline_analytics:
-                            data["timeline_analytics"] = timeline_analytics
-                    except Exception as e:
-                        print(f"      ⚠️ Timeline analytics error: {str(e)[:60]}")
-                    self.manuscripts_data.append(data)
+                    pipeline.submit(data)
 
+            self.manuscripts_data.extend(pipeline.drain())
             self.save_results(self.manuscripts_data)
             return self.manuscripts_data
 
         except Exception as e:
             print(f"❌ Extraction failed: {str(e)[:100]}")
+            if pipeline is not None:
+                self.manuscripts_data.extend(pipeline.drain())
             if self.manuscripts_data:
                 self.save_results(self.manuscripts_data)
             return self.manuscripts_data
         finally:
+            self._report_popup_timing()
             self.cleanup_driver()
@@ -0,0 +1,208 @@
+"""Deferred web enrichment, decoupled from extraction runs.
+
+During extraction ``enrich_people_from_web(..., defer_to=journal)`` only
+applies cached profiles and queues manuscripts that still have people
+without one. After the run ``run_extractors.py`` starts ``drain`` in a
+detached process: it looks up every queued person once (appearances across
+manuscripts and journals are merged by ``core.person_registry``), patches
+the profiles into the latest output files and refreshes the referee database.
+
+``EXTRACTOR_DEFER_ENRICHMENT=false`` restores inline enrichment.
+
+Usage:
+    python3 -m core.enrichment_queue            # drain the queue
+    python3 -m core.enrichment_queue --status
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / "cache"
+DB_PATH = CACHE_DIR / "enrichment_queue.db"
+LOCK_PATH = CACHE_DIR / "enrichment_queue.lock"
+OUTPUTS_DIR = Path(__file__).resolve().parents[2] / "outputs"
+
+
+def deferral_enabled() -> bool:
+    return os.environ.get("EXTRACTOR_DEFER_ENRICHMENT", "true").lower() not in ("0", "false", "no")
+
+
+class EnrichmentQueue:
+    def __init__(self, db_path: Path | None = None):
+        self.db_path = db_path or DB_PATH
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        with self._lock, sqlite3.connect(str(self.db_path)) as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS queue (
+                    journal TEXT NOT NULL,
+                    manuscript_id TEXT NOT NULL,
+                    platform_label TEXT,
+                    queued_at TEXT NOT NULL,
+                    PRIMARY KEY (journal, manuscript_id)
+                )"""
+            )
+
+    def enqueue(self, journal: str, manuscript_id: str, platform_label: str = ""):
+        with self._lock, sqlite3.connect(str(self.db_path)) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO queue VALUES (?, ?, ?, ?)",
+                (journal.lower(), manuscript_id, platform_label, datetime.now().isoformat()),
+            )
+
+    def pending(self) -> list[dict]:
+        with self._lock, sqlite3.connect(str(self.db_path)) as conn:
+            rows = conn.execute(
+                "SELECT journal, manuscript_id, platform_label, queued_at FROM queue "
+                "ORDER BY queued_at"
+            ).fetchall()
+        keys = ("journal", "manuscript_id", "platform_label", "queued_at")
+        return [dict(zip(keys, row, strict=False)) for row in rows]
+
+    def mark_done(self, entries: list[dict]):
+        """Remove drained entries; rows re-queued since they were read stay."""
+        with self._lock, sqlite3.connect(str(self.db_path)) as conn:
+            conn.executemany(
+                "DELETE FROM queue WHERE journal = ? AND manuscript_id = ? AND queued_at = ?",
+                [(e["journal"], e["manuscript_id"], e["queued_at"]) for e in entries],
+            )
+
+
+def latest_output(journal: str, outputs_dir: Path = OUTPUTS_DIR) -> Path | None:
+    files = sorted((outputs_dir / journal).glob(f"{journal}_extraction_*.json"))
+    return files[-1] if files else None
+
+
+def _write_atomic(path: Path, data: dict):
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    os.replace(tmp, path)
+
+
+def _profile_cache():
+    from core.cache_integration import CachedExtractorMixin
+    from core.cache_manager import CacheManager
+
+    class _ProfileCache(CachedExtractorMixin):
+        def __init__(self):
+            self.cache_manager = CacheManager()
+
+    return _ProfileCache()
+
+
+def drain(
+    queue: EnrichmentQueue | None = None,
+    outputs_dir: Path = OUTPUTS_DIR,
+    enrich: Callable | None = None,
+    get_cached_web_profile: Callable | None = None,
+    save_web_profile: Callable | None = None,
+    backfill: bool = True,
+) -> dict:
+    """Enrich everyone in the queued manuscripts and patch the latest outputs."""
+    from core.person_registry import PersonRegistry
+
+    queue = queue or EnrichmentQueue()
+    if get_cached_web_profile is None or save_web_profile is None:
+        cache = _profile_cache()
+        get_cached_web_profile = cache.get_cached_web_profile
+        save_web_profile = cache.save_web_profile
+
+    entries = queue.pending()
+    stats = {"manuscripts": 0, "people": 0, "lookups": 0, "files": 0}
+    if not entries:
+        return stats
+
+    # Load each journal's latest output once and register everyone still unenriched
+    by_journal: dict[str, list[dict]] = {}
+    for entry in entries:
+        by_journal.setdefault(entry["journal"], []).append(entry)
+    outputs = {}
+    registry = PersonRegistry()
+    for journal, journal_entries in by_journal.items():
+        path = latest_output(journal, outputs_dir)
+        if path is None:
+            continue
+        with open(path) as f:
+            data = json.load(f)
+        outputs[path] = data
+        wanted = {e["manuscript_id"]: e["platform_label"] for e in journal_entries}
+        for ms in data.get("manuscripts", []):
+            ms_id = ms.get("manuscript_id") or ms.get("id", "")
+            if ms_id in wanted:
+                stats["manuscripts"] += 1
+                registry.add_manuscript(ms, wanted[ms_id] or "platform_metadata")
+
+    result = registry.enrich(get_cached_web_profile, save_web_profile, enrich=enrich)
+    stats["people"] = result["enriched"]
+    stats["lookups"] = result["lookups"]
+
+    for path, data in outputs.items():
+        _write_atomic(path, data)
+        stats["files"] += 1
+    queue.mark_done(entries)
+
+    if backfill and stats["people"]:
+        try:
+            from pipeline.referee_db_backfill import backfill as backfill_referee_db
+
+            backfill_referee_db(incremental=True)
+        except Exception as e:
+            print(f"⚠️ Referee DB backfill failed: {e}")
+    return stats
+
+
+def drain_exclusive(**kwargs) -> dict | None:
+    """``drain`` until the queue is empty, unless another worker holds the lock.
+
+    Manuscripts queued while a drain is running (e.g. the next journal of an
+    ``--all`` sweep) are picked up by the following pass.
+    """
+    import fcntl
+
+    LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(LOCK_PATH, "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return None
+        queue = kwargs.pop("queue", None) or EnrichmentQueue()
+        total = drain(queue=queue, **kwargs)
+        while queue.pending():
+            for key, value in drain(queue=queue, **kwargs).items():
+                total[key] += value
+        return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deferred web enrichment worker")
+    parser.add_argument("--status", action="store_true", help="Show queued manuscripts")
+    args = parser.parse_args()
+
+    if args.status:
+        entries = EnrichmentQueue().pending()
+        print(f"🌐 {len(entries)} manuscript(s) queued for web enrichment")
+        for e in entries:
+            print(
+                f"   {e['journal'].upper():6} {e['manuscript_id']}  (since {e['queued_at'][:19]})"
+            )
+        return
+
+    stats = drain_exclusive()
+    if stats is None:
+        print("🌐 Another enrichment worker is running")
+        return
+    print(
+        f"🌐 Enriched {stats['people']} people in {stats['manuscripts']} manuscript(s) "
+        f"with {stats['lookups']} lookup(s), {stats['files']} output file(s) updated"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -34,8 +34,14 @@ def process_extraction(data: dict, journal: str, source_file: str | None = None)
         if not ms_id:
             continue
 
+        # The new tree is committed once the event's handlers have run
+        diff = store.diff_manuscript(manuscript, journal, commit=False)
         event = store.update_state(manuscript, journal)
-        if event:
+        if not event:
+            store.commit_tree(ms_id, journal)
+        else:
+            if diff:
+                event["diff"] = diff
             event["timestamp"] = datetime.now().isoformat()
             event["extraction_ts"] = data.get("extraction_timestamp", "")
             if source_file:
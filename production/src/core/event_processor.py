@@ -5,6 +5,7 @@ import sys
 from pathlib import Path
 
 from core.event_dispatcher import get_pending_events, mark_processed
+from core.state_store import StateStore
 
 
 def _notify(title: str, message: str):
@@ -22,15 +23,18 @@ def _notify(title: str, message: str):
         print(f"  ⚠️ Notification failed: {e}")
 
 
-def _record_outcomes(events: list[dict]):
+def _record_outcomes(events: list[dict]) -> list[dict]:
+    """Record referee outcomes; returns the events whose recording failed."""
+    failed = []
     try:
+        from core.snapshot_diff import changed_referee_keys, person_key, status_changed
         from pipeline import normalize_name_orderless
         from pipeline.referee_db import RefereeDB
         from reporting.cross_journal_report import load_journal_data
 
         relevant = [e for e in events if e.get("type") in ("STATUS_CHANGED", "ALL_REPORTS_IN")]
         if not relevant:
-            return
+            return failed
 
         db = RefereeDB()
         journals_loaded = {}
@@ -48,6 +52,11 @@ def _record_outcomes(events: list[dict]):
             if not data:
                 continue
 
+            # A status or decision change can settle referees whose own node
+            # didn't change, so it re-checks all of them
+            diff = event.get("diff")
+            changed = changed_referee_keys(diff) if diff and not status_changed(diff) else None
+
             for ms in data.get("manuscripts", []):
                 if ms.get("manuscript_id") != ms_id:
                     continue
@@ -55,6 +64,8 @@ def _record_outcomes(events: list[dict]):
                     name = ref.get("name", "")
                     if not name:
                         continue
+                    if changed is not None and person_key(ref) not in changed:
+                        continue
                     status = (ref.get("status") or "").lower()
                     dates = ref.get("dates") or {}
                     returned_date = dates.get("returned")
@@ -75,15 +86,33 @@ def _record_outcomes(events: list[dict]):
                         db._update_assignment_outcome(key, journal, ms_id, response, returned_date)
                     except Exception as e:
                         print(f"  ⚠️ Outcome update failed for {name}: {e}", file=sys.stderr)
+                        if all(f is not event for f in failed):
+                            failed.append(event)
                 break
 
         try:
+            from pipeline.training import ModelTrainer
+
             db.resolve_predictions()
+            learned = ModelTrainer().update_response_model(db)
+            if learned:
+                print(f"  Response predictor updated with {learned} outcome(s)")
         except Exception as e:
             print(f"  ⚠️ Prediction resolution failed: {e}", file=sys.stderr)
 
     except Exception as e:
         print(f"  ⚠️ Outcome recording failed (non-critical): {e}")
+    return failed
+
+
+def _commit_snapshots(events: list[dict]):
+    try:
+        store = StateStore()
+        for event in events:
+            if event.get("journal") and event.get("manuscript_id"):
+                store.commit_tree(event["manuscript_id"], event["journal"])
+    except Exception as e:
+        print(f"  ⚠️ Snapshot commit failed: {e}", file=sys.stderr)
 
 
 def process_all(provider: str = "claude") -> list[dict]:
@@ -195,10 +224,16 @@ def process_all(provider: str = "claude") -> list[dict]:
             f"{len(new_manuscripts)} new manuscript(s) processed",
         )
 
-    mark_processed(processed)
-    _record_outcomes(processed)
-    print(f"\n✅ Processed {len(processed)} event(s)")
-    return processed
+    # Events whose outcomes couldn't be recorded stay pending, with their
+    # diff, and the snapshot isn't advanced past them
+    failed = _record_outcomes(processed)
+    done = [e for e in processed if all(f is not e for f in failed)]
+    mark_processed(done)
+    _commit_snapshots(done)
+    if failed:
+        print(f"\n⚠️ {len(failed)} event(s) left pending for retry")
+    print(f"\n✅ Processed {len(done)} event(s)")
+    return done
 
 
 def main():
@@ -3,6 +3,8 @@
 import json
 from pathlib import Path
 
+from core.snapshot_archive import glob_snapshots, load_snapshot
+
 OUTPUTS_DIR = Path(__file__).resolve().parents[2] / "outputs"
 
 _SKIP_PATTERNS = ("BASELINE", "debug", "rec_", "partial", "ae_", "recommendation")
@@ -13,7 +15,7 @@ def list_extraction_files(journal: str) -> list[Path]:
     if not journal_dir.exists():
         return []
     return sorted(
-        [f for f in journal_dir.glob("*.json") if not any(s in f.name for s in _SKIP_PATTERNS)],
+        [f for f in glob_snapshots(journal_dir) if not any(s in f.name for s in _SKIP_PATTERNS)],
         key=lambda f: f.name,
         reverse=True,
     )
@@ -28,8 +30,11 @@ def load_latest_extraction(journal: str) -> dict | None:
     path = find_latest_output(journal)
     if not path:
         return None
+    return load_extraction(path)
+
+
+def load_extraction(path: Path) -> dict | None:
     try:
-        with open(path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return load_snapshot(path)
+    except (json.JSONDecodeError, OSError, ValueError):
         return None
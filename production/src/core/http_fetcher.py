@@ -0,0 +1,123 @@
+"""Pooled HTTP fetcher that shares an authenticated browser session.
+
+Server-rendered pages (SIAM detail pages, EditFlow listings) can be fetched
+over plain HTTP once the browser has logged in: the Selenium cookies and user
+agent are copied into a pooled ``requests.Session`` and GET-only pages are
+fetched concurrently, bounded per host. Any response that looks like a
+Cloudflare challenge or a login page (``login_markers`` present, or none of
+``session_markers`` present) yields ``None`` so the caller can fall back to
+the browser.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+CHALLENGE_MARKERS = (
+    "just a moment...",
+    "cf-browser-verification",
+    "challenge-platform",
+    "cf-chl-",
+)
+
+
+class HTTPPageFetcher:
+    def __init__(
+        self,
+        max_per_host: int = 4,
+        timeout: float = 30,
+        login_markers: tuple = (),
+        session_markers: tuple = (),
+        max_failures: int = 5,
+    ):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.login_markers = tuple(m.lower() for m in login_markers)
+        self.session_markers = tuple(m.lower() for m in session_markers)
+        self.max_failures = max_failures
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(max_per_host, 4))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.stats = {"fetched": 0, "rejected": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.failures < self.max_failures
+
+    def import_driver_cookies(self, driver) -> int:
+        """Copy cookies and user agent from a Selenium driver; return cookie count."""
+        try:
+            ua = driver.execute_script("return navigator.userAgent")
+            if ua:
+                self.session.headers["User-Agent"] = ua
+        except Exception:
+            pass
+        count = 0
+        for c in driver.get_cookies():
+            self.session.cookies.set(
+                c["name"],
+                c["value"],
+                domain=c.get("domain", ""),
+                path=c.get("path", "/"),
+                secure=c.get("secure", False),
+            )
+            count += 1
+        self.failures = 0
+        return count
+
+    def _slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def _looks_blocked(self, url: str, resp: requests.Response) -> bool:
+        if urlparse(resp.url).netloc != urlparse(url).netloc:
+            return True
+        head = resp.text[:5000].lower()
+        if resp.status_code in (403, 503) and any(m in head for m in CHALLENGE_MARKERS):
+            return True
+        if "<title>just a moment" in head:
+            return True
+        if any(m in head for m in self.login_markers):
+            return True
+        if self.session_markers:
+            text = resp.text.lower()
+            return not any(m in text for m in self.session_markers)
+        return False
+
+    def fetch(self, url: str) -> str | None:
+        if not self.enabled:
+            return None
+        try:
+            with self._slot(url):
+                resp = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException:
+            self.stats["errors"] += 1
+            self.failures += 1
+            return None
+        if resp.status_code != 200 or self._looks_blocked(url, resp):
+            self.stats["rejected"] += 1
+            self.failures += 1
+            return None
+        self.stats["fetched"] += 1
+        return resp.text
+
+    def fetch_many(self, urls, max_workers: int | None = None) -> dict[str, str | None]:
+        urls = list(dict.fromkeys(u for u in urls if u))
+        if not urls:
+            return {}
+        workers = max_workers or min(len(urls), self.max_per_host * 2)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(urls, pool.map(self.fetch, urls), strict=True))
+
+    def close(self):
+        self.session.close()
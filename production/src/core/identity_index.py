@@ -0,0 +1,195 @@
+"""Shared identity resolution for referee and author matching.
+
+``name_form`` precomputes each name's normalized parts, surname and given
+names once (memoized). ``names_match`` is the single name-equality rule
+(same surname, compatible given names or initials) used by
+``AcademicProfileEnricher.name_match`` and the conflict checker.
+
+``IdentityIndex`` holds known people keyed by ORCID, email, surname
+(the blocking key: two names can only match when their surnames agree) and
+a Soundex code of the surname for fuzzy lookups. ``match`` compares a query
+only against its block, so matching n candidates against m known people
+costs about n + m instead of n * m comparisons.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple
+
+SURNAME_PARTICLES = frozenset(
+    {
+        "van",
+        "von",
+        "de",
+        "del",
+        "della",
+        "di",
+        "la",
+        "le",
+        "den",
+        "der",
+        "ten",
+        "ter",
+        "das",
+        "dos",
+        "du",
+        "el",
+        "al",
+        "bin",
+    }
+)
+
+_ORCID_RE = re.compile(r"\d{4}-\d{4}-\d{4}-\d{3}[\dX]")
+_ORDERLESS_SEP = re.compile(r"[,;.]+")
+
+
+def normalize(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode().lower().strip()
+
+
+@lru_cache(maxsize=65536)
+def orderless_key(name: str) -> str:
+    """Accent-, case- and order-insensitive key ("HUBERT, Emma" -> "emma hubert")."""
+    return " ".join(sorted(_ORDERLESS_SEP.sub(" ", normalize(name)).split()))
+
+
+_SOUNDEX = {
+    c: str(digit)
+    for digit, letters in enumerate(("bfpv", "cgjkqsxz", "dt", "l", "mn", "r"), 1)
+    for c in letters
+}
+
+
+def soundex(word: str) -> str:
+    letters = [c for c in word if c.isalpha()]
+    if not letters:
+        return ""
+    out, last = letters[0], _SOUNDEX.get(letters[0], "")
+    for c in letters[1:]:
+        code = _SOUNDEX.get(c, "")
+        if code and code != last:
+            out += code
+        if c not in "hw":
+            last = code
+    return (out + "000")[:4]
+
+
+class NameForm(NamedTuple):
+    parts: tuple[str, ...]
+    surname: str
+    given: tuple[str, ...]
+
+
+@lru_cache(maxsize=65536)
+def name_form(name: str) -> NameForm:
+    parts = tuple(p for p in normalize(name.replace(",", " ").replace(".", " ")).split() if p)
+    if "," in name:
+        raw = [p for p in normalize(name.split(",")[0].strip()).split() if p]
+        core = [p for p in raw if p not in SURNAME_PARTICLES]
+        surname = core[-1] if core else raw[-1] if raw else ""
+    else:
+        core = [p for p in parts if p not in SURNAME_PARTICLES]
+        surname = core[-1] if core else parts[-1] if parts else ""
+    given = tuple(p for p in parts if p != surname and p not in SURNAME_PARTICLES)
+    return NameForm(parts, surname, given)
+
+
+def _given_compatible(a: NameForm, b: NameForm) -> bool:
+    if not a.given or not b.given:
+        return len(a.parts) == 1 and len(b.parts) == 1
+    for ag in a.given:
+        for tg in b.given:
+            if ag == tg:
+                return True
+            if len(ag) == 1 and tg.startswith(ag):
+                return True
+            if len(tg) == 1 and ag.startswith(tg):
+                return True
+    return False
+
+
+def forms_match(a: NameForm, b: NameForm) -> bool:
+    if not a.parts or not b.parts or a.surname != b.surname:
+        return False
+    return _given_compatible(a, b)
+
+
+def names_match(a: str, b: str) -> bool:
+    """Same surname and a shared given name or compatible initial."""
+    return forms_match(name_form(a), name_form(b))
+
+
+def orcid_of(value: str) -> str:
+    m = _ORCID_RE.search(value or "")
+    return m.group(0) if m else ""
+
+
+# Scores of the evidence a match rests on
+ORCID_SCORE = 1.0
+EMAIL_SCORE = 0.95
+FULL_NAME_SCORE = 0.9
+NAME_SCORE = 0.8
+PHONETIC_SCORE = 0.6
+
+
+class IdentityIndex:
+    """In-memory index of known people answering "who matches this person?"."""
+
+    def __init__(self, people=()):
+        self.people: list[dict] = []
+        self._forms: list[NameForm] = []
+        self._by_orcid: dict[str, list[int]] = {}
+        self._by_email: dict[str, list[int]] = {}
+        self._by_surname: dict[str, list[int]] = {}
+        self._by_sound: dict[str, list[int]] = {}
+        for person in people:
+            self.add(person)
+
+    def add(self, person: dict) -> int:
+        i = len(self.people)
+        form = name_form(person.get("name") or "")
+        self.people.append(person)
+        self._forms.append(form)
+        orcid = orcid_of(person.get("orcid") or "")
+        if orcid:
+            self._by_orcid.setdefault(orcid, []).append(i)
+        email = (person.get("email") or "").strip().lower()
+        if email:
+            self._by_email.setdefault(email, []).append(i)
+        if form.surname:
+            self._by_surname.setdefault(form.surname, []).append(i)
+            self._by_sound.setdefault(soundex(form.surname), []).append(i)
+        return i
+
+    def match(
+        self, name: str = "", email: str = "", orcid: str = "", fuzzy: bool = False
+    ) -> list[tuple[float, dict]]:
+        """Known people matching the query, best first, with their scores."""
+        scores: dict[int, float] = {}
+
+        def hit(i: int, score: float):
+            if score > scores.get(i, 0.0):
+                scores[i] = score
+
+        for i in self._by_orcid.get(orcid_of(orcid or ""), ()):
+            hit(i, ORCID_SCORE)
+        for i in self._by_email.get((email or "").strip().lower(), ()):
+            hit(i, EMAIL_SCORE)
+        form = name_form(name or "")
+        if form.parts:
+            for i in self._by_surname.get(form.surname, ()):
+                known = self._forms[i]
+                if _given_compatible(form, known):
+                    hit(i, FULL_NAME_SCORE if set(form.given) == set(known.given) else NAME_SCORE)
+            if fuzzy and form.surname:
+                for i in self._by_sound.get(soundex(form.surname), ()):
+                    known = self._forms[i]
+                    if known.surname != form.surname and _given_compatible(form, known):
+                        hit(i, PHONETIC_SCORE)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(score, self.people[i]) for i, score in ranked]
+
+    def best(self, name: str = "", email: str = "", orcid: str = "", fuzzy: bool = False):
+        matches = self.match(name, email, orcid, fuzzy)
+        return matches[0][1] if matches else None
@@ -0,0 +1,149 @@
+"""Run-level registry of the people to enrich across manuscripts and journals.
+
+Each referee or author appearance is resolved to a canonical identity: two
+appearances are the same person when they share an ORCID, an email address,
+or the same name (order- and accent-insensitive) at the same institution.
+``enrich`` then checks the web-profile cache under every variant of an
+identity, looks up each remaining identity once in a single batch (one HTTP
+session), and copies the result back to every appearance, so external calls
+scale with unique people rather than appearances.
+"""
+
+import re
+import unicodedata
+from collections.abc import Callable
+
+ORCID_RE = re.compile(r"\d{4}-\d{4}-\d{4}-\d{3}[\dX]")
+
+
+def _norm(s: str) -> str:
+    s = unicodedata.normalize("NFKD", s or "").encode("ascii", "ignore").decode().lower()
+    return " ".join(sorted(re.sub(r"[,;.]+", " ", s).split()))
+
+
+def _institution(person: dict) -> str:
+    return (
+        person.get("institution", "")
+        or person.get("affiliation", "")
+        or person.get("institution_parsed", "")
+    )
+
+
+def orcid_of(person: dict) -> str:
+    m = ORCID_RE.search(person.get("orcid") or "")
+    return m.group(0) if m else ""
+
+
+def identity_keys(person: dict) -> list[str]:
+    keys = []
+    orcid = orcid_of(person)
+    if orcid:
+        keys.append(f"orcid:{orcid}")
+    email = (person.get("email") or "").strip().lower()
+    if "@" in email:
+        keys.append(f"email:{email}")
+    keys.append(f"name:{_norm(person.get('name', ''))}|{_norm(_institution(person))}")
+    return keys
+
+
+def _is_real(profile) -> bool:
+    return bool(profile) and not str(profile.get("source", "")).endswith("_metadata")
+
+
+class PersonRegistry:
+    def __init__(self):
+        self._parent: dict[str, str] = {}
+        self._appearances: list[tuple[str, dict, str]] = []
+
+    def _find(self, key: str) -> str:
+        root = self._parent.setdefault(key, key)
+        while root != self._parent[root]:
+            root = self._parent[root]
+        while key != root:
+            self._parent[key], key = root, self._parent[key]
+        return root
+
+    def add(self, person: dict, role: str, platform_label: str = "platform_metadata"):
+        """Register one appearance (``role`` is "referees" or "authors")."""
+        if not person.get("name") or person.get("web_profile"):
+            return
+        keys = identity_keys(person)
+        root = self._find(keys[0])
+        for key in keys[1:]:
+            self._parent[self._find(key)] = root
+        self._appearances.append((role, person, platform_label))
+
+    def add_manuscript(self, manuscript: dict, platform_label: str = "platform_metadata"):
+        for role in ("referees", "authors"):
+            for person in manuscript.get(role) or []:
+                if isinstance(person, dict):
+                    self.add(person, role, platform_label)
+
+    def identities(self) -> list[list[tuple[str, dict, str]]]:
+        groups: dict[str, list] = {}
+        for appearance in self._appearances:
+            root = self._find(identity_keys(appearance[1])[0])
+            groups.setdefault(root, []).append(appearance)
+        return list(groups.values())
+
+    def enrich(
+        self,
+        get_cached_web_profile: Callable,
+        save_web_profile: Callable,
+        enrich: Callable | None = None,
+        session=None,
+    ) -> dict:
+        """Enrich each identity once and fan the profile out to its appearances."""
+        from core.web_enrichment import enrich_people_from_web, metadata_profile
+
+        enrich = enrich or enrich_people_from_web
+        identities = self.identities()
+        stats = {"appearances": len(self._appearances), "identities": len(identities)}
+
+        # Cache pass: any variant (ORCID, name|institution) may already be cached
+        todo = []
+        for members in identities:
+            profile = None
+            for _role, person, _label in members:
+                orcid = orcid_of(person)
+                profile = get_cached_web_profile(person["name"], _institution(person), orcid)
+                if profile:
+                    break
+            if profile:
+                for _role, person, _label in members:
+                    person["web_profile"] = profile
+                    person["web_profile_source"] = "cache"
+            else:
+                todo.append(members)
+        stats["cache_hits"] = len(identities) - len(todo)
+
+        # One lookup per remaining identity, all in one call (one session)
+        batch = {"referees": [], "authors": []}
+        representatives = []
+        for members in todo:
+            rep = min(
+                members,
+                key=lambda m: (not orcid_of(m[1]), not _institution(m[1]), m[0] != "referees"),
+            )
+            lookup = {k: v for k, v in rep[1].items() if k != "web_profile"}
+            batch["referees"].append(lookup)
+            representatives.append(lookup)
+        stats["lookups"] = len(representatives)
+        if representatives:
+            try:
+                enrich(batch, get_cached_web_profile, save_web_profile, session=session)
+            except Exception as e:
+                print(f"⚠️ Web enrichment failed: {str(e)[:60]}")
+
+        enriched = 0
+        for members, lookup in zip(todo, representatives, strict=True):
+            profile = lookup.get("web_profile")
+            for role, person, label in members:
+                if _is_real(profile):
+                    person["web_profile"] = profile
+                elif role == "authors":
+                    person["web_profile"] = metadata_profile(person, label)
+                if person.get("web_profile"):
+                    enriched += 1
+        stats["enriched"] = enriched
+        return stats
@@ -0,0 +1,120 @@
+"""Capture JS-opened popup windows without fixed sleeps.
+
+After a popup opener runs, ``PopupCapture`` polls ``driver.window_handles``
+for the new window instead of sleeping, waits until the popup's document is
+``complete`` and its resource count has stopped growing (network idle),
+reads the HTML and closes the window. ``capture_many`` fires several openers
+before reading any popup, so their page loads overlap in parallel windows.
+
+Each capture is timed; ``report`` compares the measured time with the fixed
+waits it replaces (``FIXED_WAIT_SECONDS`` per popup).
+"""
+
+import time
+
+# smart_wait(5) + smart_wait(3), each with +0.15 s mean jitter
+FIXED_WAIT_SECONDS = 8.3
+
+_READY_JS = "return [document.readyState, performance.getEntriesByType('resource').length]"
+
+
+class PopupCapture:
+    def __init__(
+        self,
+        open_timeout: float = 5.0,
+        load_timeout: float = 15.0,
+        poll_interval: float = 0.1,
+        idle_interval: float = 0.3,
+    ):
+        self.open_timeout = open_timeout
+        self.load_timeout = load_timeout
+        self.poll_interval = poll_interval
+        self.idle_interval = idle_interval
+        self.stats = {"popups": 0, "missed": 0, "load_timeouts": 0, "seconds": 0.0}
+
+    def open(self, driver, opener) -> str | None:
+        """Run ``opener()`` and return the handle of the window it opened."""
+        before = set(driver.window_handles)
+        opener()
+        deadline = time.monotonic() + self.open_timeout
+        while True:
+            new = [h for h in driver.window_handles if h not in before]
+            if new:
+                # Free the window name so a later opener targeting the same
+                # name gets its own window instead of reusing this one.
+                try:
+                    driver.switch_to.window(new[0])
+                    driver.execute_script("window.name = ''")
+                except Exception:
+                    pass
+                return new[0]
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
+
+    def wait_ready(self, driver) -> bool:
+        """Wait for the current window's document to finish loading."""
+        deadline = time.monotonic() + self.load_timeout
+        last = None
+        while time.monotonic() < deadline:
+            try:
+                state, resources = driver.execute_script(_READY_JS)
+            except Exception:
+                state, resources = None, None
+            if state == "complete":
+                if resources == last:
+                    return True
+                last = resources
+                time.sleep(self.idle_interval)
+            else:
+                last = None
+                time.sleep(self.poll_interval)
+        self.stats["load_timeouts"] += 1
+        return False
+
+    def read(self, driver, handle: str, main_handle: str) -> str | None:
+        """Read and close popup ``handle``, then return to ``main_handle``."""
+        try:
+            driver.switch_to.window(handle)
+            self.wait_ready(driver)
+            return driver.page_source
+        except Exception:
+            return None
+        finally:
+            try:
+                driver.close()
+            except Exception:
+                pass
+            driver.switch_to.window(main_handle)
+
+    def capture(self, driver, opener) -> str | None:
+        """HTML of the popup opened by ``opener()``, or None if no window opened."""
+        return self.capture_many(driver, [opener])[0]
+
+    def capture_many(self, driver, openers) -> list[str | None]:
+        """Open all popups first, then read each; results follow ``openers`` order."""
+        start = time.monotonic()
+        main_handle = driver.current_window_handle
+        handles = []
+        for opener in openers:
+            handle = self.open(driver, opener)
+            driver.switch_to.window(main_handle)
+            handles.append(handle)
+        results = [self.read(driver, h, main_handle) if h else None for h in handles]
+        self.stats["popups"] += sum(1 for h in handles if h)
+        self.stats["missed"] += sum(1 for h in handles if not h)
+        self.stats["seconds"] += time.monotonic() - start
+        return results
+
+    def report(self) -> dict:
+        """Measured popup time versus the fixed waits it replaces."""
+        popups = self.stats["popups"]
+        measured = round(self.stats["seconds"], 1)
+        baseline = round(popups * FIXED_WAIT_SECONDS, 1)
+        return {
+            **self.stats,
+            "seconds": measured,
+            "fixed_wait_seconds": baseline,
+            "seconds_saved": round(baseline - measured, 1),
+            "speedup": round(baseline / measured, 1) if measured else None,
+        }
@@ -0,0 +1,108 @@
+"""Per-platform resource blocking for Selenium extractors.
+
+The extractors only read DOM text and links, so images, fonts, media and
+third-party trackers are blocked via CDP ``Network.setBlockedURLs`` on the
+main tab. Each platform keeps what its pages need: ScholarOne locates and
+clicks tab, arrow and letter icons by their ``.gif`` sources. Stylesheets are
+never blocked because visibility checks depend on them.
+
+SIAM, ScholarOne and Wiley sit behind Cloudflare, whose challenge pulls
+assets from ``challenges.cloudflare.com`` and ``/cdn-cgi/``.
+``setBlockedURLs`` has no allow-list, so those extractors apply the policy
+only once a challenge has passed and lift it (``lift_resource_policy``) while
+another one is showing.
+
+``EXTRACTOR_BLOCK_RESOURCES=false`` disables blocking. ``compare_outputs``
+backs the A/B mode of ``run_extractors.py --resource-ab``, which runs a
+journal with and without blocking and checks the outputs match.
+"""
+
+import os
+
+from core.snapshot_diff import build_tree, diff_trees
+
+IMAGES = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp")
+FONTS = ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot")
+MEDIA = ("*.mp4", "*.webm", "*.ogg", "*.mp3", "*.wav", "*.m4a")
+TRACKERS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*hotjar.com*",
+    "*newrelic.com*",
+    "*nr-data.net*",
+    "*connect.facebook.net*",
+    "*scorecardresearch.com*",
+    "*quantserve.com*",
+    "*pendo.io*",
+    "*fullstory.com*",
+    "*clarity.ms*",
+)
+
+# Patterns each platform's pages need in order to render and be navigated
+PLATFORM_KEEP = {
+    "scholarone": ("*.gif",),
+    "siam": ("*.svg",),
+    "em": (),
+    "wiley": ("*.svg",),
+    "editflow": (),
+}
+
+
+def enabled() -> bool:
+    return os.environ.get("EXTRACTOR_BLOCK_RESOURCES", "true").lower() not in ("0", "false", "no")
+
+
+def blocked_patterns(platform: str) -> list[str]:
+    keep = set(PLATFORM_KEEP.get(platform, ()))
+    return [p for p in IMAGES + FONTS + MEDIA + TRACKERS if p not in keep]
+
+
+def apply_resource_policy(driver, platform: str) -> bool:
+    """Block the platform's unneeded resources on the driver's current tab."""
+    if not enabled():
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_patterns(platform)})
+    except Exception as e:
+        print(f"   ⚠️ Resource policy not applied: {str(e)[:60]}")
+        return False
+    return True
+
+
+def lift_resource_policy(driver) -> bool:
+    """Unblock everything on the driver's current tab."""
+    try:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+    except Exception as e:
+        print(f"   ⚠️ Resource policy not lifted: {str(e)[:60]}")
+        return False
+    return True
+
+
+# Per-run fields that legitimately differ between two extractions
+VOLATILE_FIELDS = ("extraction_timestamp", "extracted_at", "extraction_time", "last_updated")
+
+
+def _stable(ms: dict) -> dict:
+    return {k: v for k, v in ms.items() if k not in VOLATILE_FIELDS}
+
+
+def compare_outputs(baseline: list[dict], blocked: list[dict]) -> dict:
+    """Per-manuscript structural diff between two extraction outputs."""
+    base = {ms.get("manuscript_id", ""): ms for ms in baseline}
+    new = {ms.get("manuscript_id", ""): ms for ms in blocked}
+    common = sorted(base.keys() & new.keys())
+    differences = {}
+    for ms_id in common:
+        changes = diff_trees(build_tree(_stable(base[ms_id])), build_tree(_stable(new[ms_id])))
+        if changes:
+            differences[ms_id] = [c["path"] for c in changes]
+    return {
+        "manuscripts": len(common),
+        "identical": len(common) - len(differences),
+        "differences": differences,
+        "unmatched": sorted(base.keys() ^ new.keys()),
+    }
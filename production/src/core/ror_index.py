@@ -0,0 +1,394 @@
+"""Offline institution and country resolver backed by a ROR data dump.
+
+``python3 -m core.ror_index --refresh [DUMP]`` builds a read-only sqlite
+index in ``production/cache/ror_index.db`` from a ROR data dump (the zip or
+JSON published on Zenodo; without ``DUMP`` the newest release is
+downloaded). It maps email/website domains, normalized name variants
+(display name, labels, aliases) and acronyms to ROR IDs with country and
+parent/child relationships. Lookups are sqlite point queries over a
+memory-mapped file, memoized per process; names with no exact variant fall
+back to fuzzy matching over the candidates sharing the query's rarest word.
+
+When no index has been built ``get_index().available`` is False and callers
+keep their previous heuristics.
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+import zipfile
+from difflib import SequenceMatcher
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / "cache"
+DB_PATH = CACHE_DIR / "ror_index.db"
+ZENODO_RECORDS = "https://zenodo.org/api/communities/ror-data/records?q=&sort=newest"
+
+FUZZY_MIN_SCORE = 0.88
+MAX_CANDIDATES = 2000
+
+# Too common in institution names to identify one
+STOP_WORDS = frozenset(
+    "university universite universidad universita universitat universiteit "
+    "of the and for at in d de des du la le les del di der und "
+    "institute institut instituto school college center centre department faculty "
+    "national technical technology science sciences research state".split()
+)
+FREEMAIL_DOMAINS = frozenset(
+    "gmail.com googlemail.com yahoo.com hotmail.com outlook.com aol.com mail.com "
+    "protonmail.com icloud.com live.com msn.com ymail.com qq.com 163.com 126.com".split()
+)
+
+GENERIC_SLDS = frozenset("ac edu co gov org or ne com net".split())
+
+
+def normalize(s: str) -> str:
+    s = unicodedata.normalize("NFKD", s or "").encode("ascii", "ignore").decode().lower()
+    s = re.sub(r"[^a-z0-9]+", " ", s)
+    return " ".join(w for w in s.split() if w != "the")
+
+
+def _tokens(norm: str) -> set[str]:
+    return {w for w in norm.split() if w not in STOP_WORDS and len(w) > 1}
+
+
+def _host(url: str) -> str:
+    host = re.sub(r"^[a-z]+://", "", (url or "").strip().lower()).split("/")[0].split(":")[0]
+    return host[4:] if host.startswith("www.") else host
+
+
+# ── Dump parsing (ROR schema v1 and v2) ──────────────────────────────────
+
+
+def _parse_org(org: dict) -> dict | None:
+    if org.get("status", "active") != "active":
+        return None
+    names, acronyms = [], []
+    if "names" in org:
+        display = ""
+        for n in org["names"]:
+            types = n.get("types", [])
+            if "acronym" in types:
+                acronyms.append(n["value"])
+            else:
+                names.append(n["value"])
+            if "ror_display" in types:
+                display = n["value"]
+        name = display or (names[0] if names else "")
+        links = [link.get("value", "") for link in org.get("links", [])]
+        geo = (org.get("locations") or [{}])[0].get("geonames_details", {})
+        country = geo.get("country_name", "")
+        code = geo.get("country_code", "")
+        city = geo.get("name", "")
+    else:
+        name = org.get("name", "")
+        names = [name, *org.get("aliases", []), *(lb["label"] for lb in org.get("labels", []))]
+        acronyms = list(org.get("acronyms", []))
+        links = list(org.get("links", []))
+        country = org.get("country", {}).get("country_name", "")
+        code = org.get("country", {}).get("country_code", "")
+        city = ((org.get("addresses") or [{}])[0]).get("city", "")
+    domains = {d.lower().lstrip(".") for d in org.get("domains", []) if d}
+    # Website hosts are weaker evidence: a unit's site often lives under its
+    # parent's host (math.ethz.ch/risklab), and web.mit.edu implies mit.edu
+    # (but ox.ac.uk never implies ac.uk)
+    site_domains = set()
+    for link in links:
+        host = _host(link)
+        if not host:
+            continue
+        site_domains.add(host)
+        rest = host.split(".", 1)[-1]
+        if "." in rest and rest.split(".")[0] not in GENERIC_SLDS:
+            site_domains.add(rest)
+    relations = [
+        (r["id"], r["type"].lower())
+        for r in org.get("relationships", [])
+        if r.get("type", "").lower() in ("parent", "child")
+    ]
+    return {
+        "id": org["id"],
+        "name": name,
+        "country": country,
+        "country_code": code,
+        "city": city,
+        "names": [n for n in names if n],
+        "acronyms": [a for a in acronyms if a],
+        "domains": sorted(domains),
+        "site_domains": sorted(site_domains - domains),
+        "relations": relations,
+    }
+
+
+def _load_dump(dump_path: Path) -> list[dict]:
+    if dump_path.suffix == ".zip":
+        with zipfile.ZipFile(dump_path) as zf:
+            members = [m for m in zf.namelist() if m.endswith(".json")]
+            members.sort(key=lambda m: "schema_v2" not in m)
+            with zf.open(members[0]) as f:
+                return json.load(f)
+    with open(dump_path) as f:
+        return json.load(f)
+
+
+def build_index(dump_path: Path, db_path: Path | None = None) -> dict:
+    """Build the index from a ROR dump; replaces the existing index atomically."""
+    db_path = db_path or DB_PATH
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = db_path.with_suffix(".db.tmp")
+    tmp.unlink(missing_ok=True)
+
+    orgs = [o for o in map(_parse_org, _load_dump(dump_path)) if o]
+    conn = sqlite3.connect(str(tmp))
+    conn.executescript(
+        """
+        CREATE TABLE orgs (ror_id TEXT PRIMARY KEY, name TEXT, country TEXT,
+                           country_code TEXT, city TEXT);
+        CREATE TABLE domains (domain TEXT, ror_id TEXT, kind TEXT);
+        CREATE TABLE names (key TEXT, ror_id TEXT, kind TEXT);
+        CREATE TABLE tokens (token TEXT, ror_id TEXT);
+        CREATE TABLE token_df (token TEXT PRIMARY KEY, df INTEGER);
+        CREATE TABLE relations (ror_id TEXT, related_id TEXT, type TEXT);
+        CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+        """
+    )
+    df: dict[str, int] = {}
+    for org in orgs:
+        rid = org["id"]
+        conn.execute(
+            "INSERT INTO orgs VALUES (?, ?, ?, ?, ?)",
+            (rid, org["name"], org["country"], org["country_code"], org["city"]),
+        )
+        conn.executemany(
+            "INSERT INTO domains VALUES (?, ?, 'domain')", [(d, rid) for d in org["domains"]]
+        )
+        conn.executemany(
+            "INSERT INTO domains VALUES (?, ?, 'site')", [(d, rid) for d in org["site_domains"]]
+        )
+        keys = {normalize(n) for n in org["names"]} - {""}
+        conn.executemany("INSERT INTO names VALUES (?, ?, 'name')", [(k, rid) for k in keys])
+        acronyms = {normalize(a) for a in org["acronyms"]} - {""}
+        conn.executemany("INSERT INTO names VALUES (?, ?, 'acronym')", [(a, rid) for a in acronyms])
+        tokens = set().union(*(_tokens(k) for k in keys)) if keys else set()
+        conn.executemany("INSERT INTO tokens VALUES (?, ?)", [(t, rid) for t in tokens])
+        for t in tokens:
+            df[t] = df.get(t, 0) + 1
+        conn.executemany(
+            "INSERT INTO relations VALUES (?, ?, ?)", [(rid, r, t) for r, t in org["relations"]]
+        )
+    conn.executemany("INSERT INTO token_df VALUES (?, ?)", df.items())
+    conn.executemany(
+        "INSERT INTO meta VALUES (?, ?)",
+        [("source", dump_path.name), ("organizations", str(len(orgs)))],
+    )
+    conn.executescript(
+        """
+        CREATE INDEX idx_domains ON domains(domain);
+        CREATE INDEX idx_names ON names(key);
+        CREATE INDEX idx_tokens ON tokens(token);
+        CREATE INDEX idx_relations ON relations(ror_id);
+        """
+    )
+    conn.commit()
+    conn.close()
+    os.replace(tmp, db_path)
+    return {"organizations": len(orgs), "source": dump_path.name}
+
+
+def download_latest_dump(dest_dir: Path | None = None) -> Path:
+    import requests
+
+    dest_dir = dest_dir or CACHE_DIR
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    record = requests.get(ZENODO_RECORDS, timeout=30).json()["hits"]["hits"][0]
+    file = next(f for f in record["files"] if f["key"].endswith(".zip"))
+    dest = dest_dir / file["key"]
+    with requests.get(file["links"]["self"], stream=True, timeout=300) as resp:
+        resp.raise_for_status()
+        with open(dest, "wb") as f:
+            for chunk in resp.iter_content(1 << 20):
+                f.write(chunk)
+    return dest
+
+
+# ── Lookups ──────────────────────────────────────────────────────────────
+
+
+class RorIndex:
+    def __init__(self, db_path: Path | None = None):
+        self.db_path = db_path or DB_PATH
+        self.available = self.db_path.exists()
+        self._lock = threading.Lock()
+        self._memo: dict[tuple, object] = {}
+        self._conn = None
+        if self.available:
+            self._conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA mmap_size = 1073741824")
+
+    def _query(self, sql: str, params: tuple) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _memoized(self, kind: str, key: str, compute):
+        memo_key = (kind, key)
+        if memo_key not in self._memo:
+            self._memo[memo_key] = compute(key) if self.available and key else None
+        return self._memo[memo_key]
+
+    def _org(self, ror_id: str) -> dict | None:
+        rows = self._query(
+            "SELECT ror_id, name, country, country_code, city FROM orgs WHERE ror_id = ?",
+            (ror_id,),
+        )
+        if not rows:
+            return None
+        return dict(
+            zip(("ror_id", "name", "country", "country_code", "city"), rows[0], strict=False)
+        )
+
+    def by_domain(self, email_or_domain: str) -> dict | None:
+        """Organization for an email address or domain (subdomains walk up)."""
+        domain = email_or_domain.strip().lower().rsplit("@", 1)[-1]
+        return self._memoized("domain", domain, self._by_domain)
+
+    def _by_domain(self, domain: str) -> dict | None:
+        if domain in FREEMAIL_DOMAINS:
+            return None
+        labels = domain.split(".")
+        suffixes = [".".join(labels[i:]) for i in range(len(labels) - 1)]
+        for kind in ("domain", "site"):
+            for suffix in suffixes:
+                rows = self._query(
+                    "SELECT DISTINCT ror_id FROM domains WHERE domain = ? AND kind = ?",
+                    (suffix, kind),
+                )
+                if rows:
+                    return self._org(rows[0][0]) if len(rows) == 1 else None
+        return None
+
+    def by_name(self, name: str, fuzzy: bool = True) -> dict | None:
+        """Organization for a name, alias, label or acronym."""
+        norm = normalize(name)
+        hit = self._memoized("name", norm, self._exact)
+        if hit is None and fuzzy:
+            hit = self._memoized("fuzzy", norm, self._fuzzy)
+        return hit
+
+    def _exact(self, norm: str) -> dict | None:
+        rows = self._query("SELECT DISTINCT ror_id, kind FROM names WHERE key = ?", (norm,))
+        ids = {r for r, kind in rows if kind == "name"} or {r for r, _ in rows}
+        return self._org(ids.pop()) if len(ids) == 1 else None
+
+    def _fuzzy(self, norm: str) -> dict | None:
+        tokens = _tokens(norm)
+        if not tokens:
+            return None
+        marks = ",".join("?" * len(tokens))
+        dfs = self._query(f"SELECT token, df FROM token_df WHERE token IN ({marks})", tuple(tokens))
+        if not dfs:
+            return None
+        rarest = min(dfs, key=lambda row: row[1])[0]
+        rows = self._query(
+            "SELECT n.key, n.ror_id FROM tokens t JOIN names n ON n.ror_id = t.ror_id "
+            "WHERE t.token = ? AND n.kind = 'name' LIMIT ?",
+            (rarest, MAX_CANDIDATES),
+        )
+        best, best_score = None, FUZZY_MIN_SCORE
+        for key, ror_id in rows:
+            score = SequenceMatcher(None, norm, key).ratio()
+            if score > best_score:
+                best, best_score = ror_id, score
+        return self._org(best) if best else None
+
+    def resolve(self, affiliation: str = "", email: str = "") -> dict | None:
+        """Best organization for free-text affiliation and/or email.
+
+        Comma-separated affiliation parts are tried exactly first (so
+        "Dept. of Mathematics, ETH Zurich, Switzerland" finds ETH Zurich),
+        then the email domain, then fuzzy matching.
+        """
+        candidates = [affiliation] if affiliation else []
+        parts = [p for p in re.split(r"[,;]", affiliation or "") if p.strip()]
+        if len(parts) > 1:
+            candidates += parts
+        for candidate in candidates:
+            hit = self.by_name(candidate, fuzzy=False)
+            if hit:
+                return hit
+        if email:
+            hit = self.by_domain(email)
+            if hit:
+                return hit
+        for candidate in candidates:
+            hit = self.by_name(candidate)
+            if hit:
+                return hit
+        return None
+
+    def country(self, affiliation: str = "", email: str = "") -> str | None:
+        org = self.resolve(affiliation, email)
+        return org["country"] if org else None
+
+    def related(self, a: str, b: str) -> bool:
+        """Same organization, or one is the other's parent/child."""
+        if a == b:
+            return True
+        return bool(
+            self._query(
+                "SELECT 1 FROM relations WHERE ror_id = ? AND related_id = ? LIMIT 1", (a, b)
+            )
+        )
+
+    def same_institution(self, a: str, b: str) -> bool | None:
+        """True/False when both names resolve; None when either is unknown."""
+        org_a, org_b = self.resolve(a), self.resolve(b)
+        if not org_a or not org_b:
+            return None
+        return self.related(org_a["ror_id"], org_b["ror_id"])
+
+
+_index: RorIndex | None = None
+
+
+def get_index() -> RorIndex:
+    """Process-wide index (not available until ``--refresh`` has been run)."""
+    global _index
+    if _index is None:
+        _index = RorIndex()
+    return _index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline ROR institution index")
+    parser.add_argument(
+        "--refresh",
+        nargs="?",
+        const="",
+        metavar="DUMP",
+        help="Rebuild the index from a ROR dump (.zip/.json); downloads the newest if omitted",
+    )
+    parser.add_argument("--lookup", metavar="TEXT", help="Resolve an affiliation or email")
+    args = parser.parse_args()
+
+    if args.refresh is not None:
+        dump = Path(args.refresh) if args.refresh else download_latest_dump()
+        stats = build_index(dump)
+        print(f"🏛️ ROR index built: {stats['organizations']} organizations from {stats['source']}")
+    if args.lookup:
+        index = get_index()
+        if not index.available:
+            print("⚠️ No ROR index; run with --refresh first")
+            return
+        text = args.lookup
+        org = index.resolve(email=text) if "@" in text else index.resolve(text)
+        print(json.dumps(org, indent=2) if org else "No match")
+
+
+if __name__ == "__main__":
+    main()
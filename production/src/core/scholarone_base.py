@@ -29,7 +29,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 sys.path.append(str(Path(__file__).parent.parent))
+from core.audit_history import AuditHistory
 from core.cache_integration import CachedExtractorMixin
+from core.resource_policy import apply_resource_policy, lift_resource_policy
+from core.ror_index import get_index as get_ror_index
 from core.scholarone_utils import (
     capture_page as _capture_page_fn,
 )
@@ -66,6 +69,17 @@ except ImportError:
     GMAIL_SEARCH_AVAILABLE = False
 
 from core.gmail_verification import fetch_latest_verification_code
+from core.session_vault import SessionVault
+
+
+def _files_on_disk(report: dict) -> bool:
+    paths = list(report.get("attached_files") or [])
+    paths += [
+        a["local_path"]
+        for a in report.get("attachments") or []
+        if isinstance(a, dict) and a.get("local_path")
+    ]
+    return all(Path(p).exists() for p in paths)
 
 
 class ScholarOneBaseExtractor(CachedExtractorMixin):
@@ -103,6 +117,7 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
         if self.use_cache:
             self.init_cached_extractor(self.JOURNAL_CODE)
 
+        self.session_vault = SessionVault(self.JOURNAL_CODE)
         self.setup_chrome_options()
         self.setup_directories()
         self.driver = None
@@ -145,6 +160,10 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
         }
         self.chrome_options.add_experimental_option("prefs", prefs)
 
+        profile = self.session_vault.profile_dir()
+        if profile:
+            self.chrome_options.add_argument(f"--user-data-dir={profile}")
+
     def setup_directories(self):
         self.base_dir = Path(__file__).parent.parent.parent
         jc = self.JOURNAL_CODE.lower()
@@ -187,6 +206,8 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
                 self.driver.implicitly_wait(10)
                 self.wait = WebDriverWait(self.driver, 20)
                 self.original_window = self.driver.current_window_handle
+                # Applied by _wait_for_cloudflare once the first challenge has passed
+                self._blocking_resources = False
                 print(f"\U0001f5a5\ufe0f  Browser configured for {self.JOURNAL_CODE}")
                 return
             except (NoSuchWindowException, WebDriverException) as e:
@@ -245,10 +266,15 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
                 time.sleep(1)
                 continue
             if "just a moment" in title or title in ("404 not found", ""):
+                if getattr(self, "_blocking_resources", False):
+                    # The challenge needs its images and fonts
+                    self._blocking_resources = not lift_resource_policy(self.driver)
                 if i % 15 == 0:
                     print(f"   \u23f3 Cloudflare challenge... ({i}s)")
                 time.sleep(1)
                 continue
+            if not getattr(self, "_blocking_resources", True):
+                self._blocking_resources = apply_resource_policy(self.driver, "scholarone")
             return True
         return False
 
@@ -261,6 +287,18 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
             return
         _capture_page_fn(self.driver, self.JOURNAL_CODE, page_type, manuscript_id, is_popup)
 
+    def _audit_history(self, manuscript_id: str) -> AuditHistory | None:
+        """Stored audit trail for incremental reading (full re-read on force_refresh)."""
+        if not manuscript_id:
+            return None
+        try:
+            return AuditHistory(
+                self.JOURNAL_CODE, manuscript_id, full=getattr(self, "force_refresh", False)
+            )
+        except Exception as e:
+            print(f"      ⚠️ Audit history unavailable: {str(e)[:50]}")
+            return None
+
     def safe_click(self, element) -> bool:
         return _safe_click(self.driver, element)
 
@@ -366,10 +404,30 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
     # Login & Navigation
     # ------------------------------------------------------------------
 
+    def _resume_saved_session(self) -> bool:
+        """Reuse vaulted cookies if the AE Center link appears without logging in."""
+        if not self.session_vault.restore(self.driver, self.LOGIN_URL):
+            return False
+        self.driver.get(self.LOGIN_URL)
+        self._wait_for_cloudflare(30)
+        try:
+            WebDriverWait(self.driver, 5).until(
+                EC.presence_of_element_located((By.LINK_TEXT, "Associate Editor Center"))
+            )
+        except TimeoutException:
+            print("   ⚠️ Saved session expired, logging in")
+            self.session_vault.invalidate()
+            return False
+        self.session_vault.mark_valid()
+        print("✅ Resumed saved session")
+        return True
+
     @with_retry(max_attempts=3, delay=2.0)
     def login(self) -> bool:
         try:
             print(f"🔐 Logging in to {self.JOURNAL_CODE}...")
+            if self._resume_saved_session():
+                return True
 
             self.driver.get(self.LOGIN_URL)
             self._wait_for_cloudflare(180)
@@ -441,6 +499,7 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
                     EC.presence_of_element_located((By.LINK_TEXT, "Associate Editor Center"))
                 )
                 print("✅ Login successful!")
+                self.session_vault.save(self.driver)
                 return True
             except TimeoutException:
                 print("   ❌ Login verification failed")
@@ -1327,9 +1386,35 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
     def extract_referee_report_from_popup(
         self, referee: dict, manuscript_id: str = ""
     ) -> dict | None:
-        report_url = referee.get("report_url", "")
-        if not report_url:
+        """Referee report from its popup, reused from the artifact cache when final.
+
+        Attachment links are popWindow URLs tied to the session that rendered
+        the popup, so they are left out of the cached copy; a cached report
+        whose downloaded files are gone reopens the popup.
+        """
+        if not referee.get("report_url", ""):
+            return None
+        cached = self.get_cached_artifact("referee_report", manuscript_id, referee)
+        if cached is not None and _files_on_disk(cached):
+            return cached
+
+        report = self._open_referee_report_popup(referee, manuscript_id)
+        if report is None:
             return None
+        if report.get("extraction_status") == "ok" and (
+            report.get("comments_to_author") or report.get("raw_text")
+        ):
+            payload = dict(report)
+            if isinstance(report.get("attachments"), list):
+                payload["attachments"] = [
+                    {k: v for k, v in a.items() if k != "url"} if isinstance(a, dict) else a
+                    for a in report["attachments"]
+                ]
+            self.store_artifact("referee_report", manuscript_id, payload, referee)
+        return report
+
+    def _open_referee_report_popup(self, referee: dict, manuscript_id: str) -> dict | None:
+        report_url = referee.get("report_url", "")
 
         # ScholarOne's popWindow() URLs are often relative (e.g.
         # 'mor_misc/rev_ms_det_pop.html?XYZ'). Selenium's driver.get
@@ -1545,9 +1630,18 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
                 "error": str(e)[:200],
             }
 
-    def extract_decision_letter_from_popup(self, popup_url: str) -> str | None:
+    def extract_decision_letter_from_popup(
+        self, popup_url: str, manuscript_id: str = ""
+    ) -> str | None:
         if not popup_url:
             return None
+        return self.cached_artifact(
+            "decision_letter",
+            manuscript_id,
+            lambda: self._open_decision_letter_popup(popup_url),
+        )
+
+    def _open_decision_letter_popup(self, popup_url: str) -> str | None:
         try:
             original_window = self.driver.current_window_handle
             all_before = set(self.driver.window_handles)
@@ -1575,9 +1669,18 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
                 pass
             return None
 
-    def extract_author_response_from_popup(self, popup_url: str) -> str | None:
+    def extract_author_response_from_popup(
+        self, popup_url: str, manuscript_id: str = ""
+    ) -> str | None:
         if not popup_url:
             return None
+        return self.cached_artifact(
+            "author_response",
+            manuscript_id,
+            lambda: self._open_author_response_popup(popup_url),
+        )
+
+    def _open_author_response_popup(self, popup_url: str) -> str | None:
         try:
             original_window = self.driver.current_window_handle
             all_before = set(self.driver.window_handles)
@@ -2021,6 +2124,7 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
             get_cached_web_profile=self.get_cached_web_profile,
             save_web_profile=self.save_web_profile,
             platform_label="scholarone_metadata",
+            defer_to=self.JOURNAL_CODE,
         )
 
     def _enrich_audit_trail_with_gmail(self, manuscript_data: dict, manuscript_id: str):
@@ -2226,7 +2330,12 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
                 print(f"         📚 Using cached country: {cached_country}")
                 return cached_country
 
-            found_country = None
+            ror_index = get_ror_index()
+            found_country = ror_index.country(institution_name)
+            if found_country:
+                self._institution_country_cache[cache_key] = found_country
+                print(f"         ✅ Country found (ROR index): {found_country}")
+                return found_country
 
             direct_countries = {
                 "ETH Zurich": "Switzerland",
@@ -2284,6 +2393,10 @@ class ScholarOneBaseExtractor(CachedExtractorMixin):
                 print(f"         ✅ Country found (direct match): {found_country}")
                 return found_country
 
+            if ror_index.available:
+                self._institution_country_cache[cache_key] = None
+                return None
+
             try:
                 ror_url = f"https://api.ror.org/organizations?query={requests.utils.quote(institution_name)}"
                 resp = requests.get(ror_url, timeout=5)
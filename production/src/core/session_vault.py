@@ -0,0 +1,217 @@
+"""Per-journal vault of authenticated browser sessions.
+
+After a successful interactive login the extractor stores the Selenium
+cookies (and user agent) here. The next run restores them, validates the
+session with a single page load and skips the login form, 2FA and most
+Cloudflare waits; only when validation fails does it fall back to a full
+login. Each save, reuse and expiry is appended to ``session_stats.jsonl`` so
+observed session lifetimes can guide how often extractions are scheduled.
+
+``EXTRACTOR_SESSION_VAULT=false`` disables the vault.
+``EXTRACTOR_BROWSER_PROFILE=true`` additionally keeps a persistent Chrome
+user-data directory per journal (see ``profile_dir``).
+
+Usage: python3 -m core.session_vault [--journal MF] [--clear]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+VAULT_DIR = Path(__file__).parent.parent.parent / "cache" / "sessions"
+STATS_FILE = "session_stats.jsonl"
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.environ.get(name, default).lower() not in ("0", "false", "no")
+
+
+def _domain_matches(host: str, domain: str) -> bool:
+    domain = domain.lstrip(".").lower()
+    return bool(domain) and (host == domain or host.endswith("." + domain))
+
+
+class SessionVault:
+    def __init__(self, journal: str, vault_dir: Path | None = None, max_age_hours: float = 168):
+        self.journal = journal.lower()
+        self.dir = Path(vault_dir) if vault_dir else VAULT_DIR
+        self.path = self.dir / f"{self.journal}.json"
+        self.stats_path = self.dir / STATS_FILE
+        self.max_age_hours = max_age_hours
+        self.enabled = _env_flag("EXTRACTOR_SESSION_VAULT", "true")
+        self._restored: dict | None = None
+
+    # ── Persistence ───────────────────────────────────────────
+
+    def load(self) -> dict | None:
+        """Stored session record, or None if missing, stale or fully expired."""
+        if not self.enabled or not self.path.exists():
+            return None
+        try:
+            record = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None
+        age_h = (time.time() - record.get("saved_at", 0)) / 3600
+        if age_h > self.max_age_hours:
+            return None
+        now = time.time()
+        cookies = [c for c in record.get("cookies", []) if c.get("expiry", now + 1) > now]
+        if not cookies:
+            return None
+        record["cookies"] = cookies
+        return record
+
+    def save(self, driver) -> bool:
+        """Store the driver's cookies after a successful interactive login."""
+        if not self.enabled:
+            return False
+        try:
+            cookies = driver.get_cookies()
+            try:
+                user_agent = driver.execute_script("return navigator.userAgent")
+            except Exception:
+                user_agent = ""
+            record = {
+                "journal": self.journal,
+                "saved_at": time.time(),
+                "url": driver.current_url,
+                "user_agent": user_agent,
+                "cookies": cookies,
+            }
+            self.dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(record))
+            os.chmod(tmp, 0o600)
+            tmp.replace(self.path)
+        except Exception:
+            return False
+        self._record("login", 0.0)
+        return True
+
+    def restore(self, driver, url: str) -> bool:
+        """Load ``url`` and inject the stored cookies for its host.
+
+        Returns True if any cookie was added; the caller must reload a page
+        and then call ``mark_valid`` or ``invalidate``.
+        """
+        record = self.load()
+        if record is None:
+            return False
+        host = urlparse(url).netloc.lower()
+        try:
+            driver.get(url)
+        except Exception:
+            return False
+        added = 0
+        for cookie in record["cookies"]:
+            if not _domain_matches(host, cookie.get("domain", "")):
+                continue
+            cookie = dict(cookie)
+            if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+                cookie.pop("sameSite", None)
+            try:
+                driver.add_cookie(cookie)
+                added += 1
+            except Exception:
+                pass
+        if added:
+            self._restored = record
+        return added > 0
+
+    def mark_valid(self):
+        if self._restored is not None:
+            self._record("reused", self._age_hours(self._restored))
+
+    def invalidate(self):
+        record = self._restored or self.load()
+        if record is not None:
+            self._record("expired", self._age_hours(record))
+        self._restored = None
+        self.path.unlink(missing_ok=True)
+
+    def profile_dir(self) -> Path | None:
+        """Persistent Chrome user-data dir, when ``EXTRACTOR_BROWSER_PROFILE`` is on."""
+        if not self.enabled or not _env_flag("EXTRACTOR_BROWSER_PROFILE", "false"):
+            return None
+        path = self.dir / "profiles" / self.journal
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    # ── Statistics ────────────────────────────────────────────
+
+    @staticmethod
+    def _age_hours(record: dict) -> float:
+        return round((time.time() - record.get("saved_at", time.time())) / 3600, 2)
+
+    def _record(self, event: str, age_hours: float):
+        try:
+            self.dir.mkdir(parents=True, exist_ok=True)
+            entry = {"journal": self.journal, "event": event, "age_hours": age_hours}
+            entry["ts"] = round(time.time())
+            with open(self.stats_path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError:
+            pass
+
+
+def session_stats(vault_dir: Path | None = None) -> dict[str, dict]:
+    """Per-journal login/reuse/expiry counts and observed session ages.
+
+    ``max_reused_age_hours`` is a lower bound on session lifetime;
+    ``median_expired_age_hours`` an upper bound.
+    """
+    path = (Path(vault_dir) if vault_dir else VAULT_DIR) / STATS_FILE
+    events: dict[str, dict[str, list[float]]] = {}
+    if path.exists():
+        for line in path.read_text().splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            by_event = events.setdefault(entry.get("journal", "?"), {})
+            by_event.setdefault(entry.get("event", "?"), []).append(entry.get("age_hours", 0.0))
+
+    stats = {}
+    for journal, by_event in sorted(events.items()):
+        reused = by_event.get("reused", [])
+        expired = by_event.get("expired", [])
+        stats[journal] = {
+            "logins": len(by_event.get("login", [])),
+            "reuses": len(reused),
+            "expirations": len(expired),
+            "max_reused_age_hours": max(reused) if reused else None,
+            "median_expired_age_hours": statistics.median(expired) if expired else None,
+        }
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or clear saved browser sessions")
+    parser.add_argument("--journal", help="Limit to one journal code")
+    parser.add_argument("--clear", action="store_true", help="Delete the saved session(s)")
+    args = parser.parse_args()
+
+    if args.clear:
+        targets = [args.journal.lower()] if args.journal else None
+        for f in sorted(VAULT_DIR.glob("*.json")):
+            if targets is None or f.stem in targets:
+                f.unlink()
+                print(f"Cleared {f.stem}")
+        return
+
+    for journal, s in session_stats().items():
+        if args.journal and journal != args.journal.lower():
+            continue
+        print(
+            f"{journal.upper():6s} logins={s['logins']:3d} reuses={s['reuses']:3d} "
+            f"expired={s['expirations']:3d} max_reused_age={s['max_reused_age_hours']}h "
+            f"median_expired_age={s['median_expired_age_hours']}h"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ import random
 import re
 import sys
 import time
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -22,6 +23,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.cache_integration import CachedExtractorMixin
+from core.http_fetcher import HTTPPageFetcher
+from core.resource_policy import apply_resource_policy, lift_resource_policy
+from core.session_vault import SessionVault
+from core.stage_pipeline import StagedPipeline
 from core.web_enrichment import enrich_people_from_web
 
 try:
@@ -35,6 +40,14 @@ except ImportError:
 from core.scholarone_utils import with_retry
 
 
+def _attachments_on_disk(report: dict) -> bool:
+    return all(
+        Path(a["local_path"]).exists()
+        for a in report.get("attachments") or []
+        if isinstance(a, dict) and a.get("local_path")
+    )
+
+
 class SIAMExtractor(CachedExtractorMixin):
     JOURNAL_CODE = ""
     JOURNAL_NAME = ""
@@ -42,11 +55,22 @@ class SIAMExtractor(CachedExtractorMixin):
     MAIN_URL = ""
     MANUSCRIPT_PATTERN = r"M\d{6}"
     CLOUDFLARE_WAIT = 10
+    HTTP_MAX_PER_HOST = 4
+    HTTP_SUBPAGE_PATTERNS = (
+        "status_details",
+        "view_email",
+        "display_ed_decision_summary",
+        "display_all_reviews",
+    )
+    # Authenticated pages carry the Logout link; an expired session doesn't
+    HTTP_LOGIN_MARKERS = ("orcid.org/oauth/authorize",)
+    HTTP_SESSION_MARKERS = ("logout", "log out")
 
     def __init__(self, headless: bool = True):
         self.headless = headless
         self.init_cached_extractor(self.JOURNAL_CODE)
         self.setup_directories()
+        self.session_vault = SessionVault(self.JOURNAL_CODE)
         self.setup_chrome_options()
         self.driver = None
         self.wait = None
@@ -55,6 +79,9 @@ class SIAMExtractor(CachedExtractorMixin):
         self.manuscripts_data = []
         self._current_manuscript_id = ""
         self._last_exception_msg = ""
+        self.http_fetch = os.environ.get("EXTRACTOR_HTTP_FETCH", "true").lower() == "true"
+        self.http = None
+        self._http_pages = {}
 
         self.email = os.environ.get(f"{self.JOURNAL_CODE}_EMAIL") or os.environ.get("SICON_EMAIL")
         self.password = os.environ.get(f"{self.JOURNAL_CODE}_PASSWORD") or os.environ.get(
@@ -69,6 +96,10 @@ class SIAMExtractor(CachedExtractorMixin):
         self.chrome_options.add_argument("--window-size=1200,800")
         self.chrome_options.add_argument("--window-position=-2000,0")
 
+        profile = self.session_vault.profile_dir()
+        if profile:
+            self.chrome_options.add_argument(f"--user-data-dir={profile}")
+
     def setup_directories(self):
         self.base_dir = Path(__file__).parent.parent.parent
         jc = self.JOURNAL_CODE.lower()
@@ -126,6 +157,8 @@ class SIAMExtractor(CachedExtractorMixin):
         self.driver.implicitly_wait(10)
         self.wait = WebDriverWait(self.driver, 30)
         self.original_window = self.driver.current_window_handle
+        # Applied by _wait_for_cloudflare once the first challenge has passed
+        self._blocking_resources = False
         print(f"\U0001f5a5\ufe0f  Browser configured for {self.JOURNAL_CODE}")
 
     def safe_click(self, element) -> bool:
@@ -189,10 +222,15 @@ class SIAMExtractor(CachedExtractorMixin):
                 time.sleep(1)
                 continue
             if "just a moment" in title or title in ("404 not found", ""):
+                if getattr(self, "_blocking_resources", False):
+                    # The challenge needs its images and fonts
+                    self._blocking_resources = not lift_resource_policy(self.driver)
                 if i % 15 == 0:
                     print(f"   \u23f3 Cloudflare challenge... ({i}s)")
                 time.sleep(1)
                 continue
+            if not getattr(self, "_blocking_resources", True):
+                self._blocking_resources = apply_resource_policy(self.driver, "siam")
             return True
         return False
 
@@ -217,6 +255,12 @@ class SIAMExtractor(CachedExtractorMixin):
             f"&response_type=code&scope=%2Fread-limited"
         )
 
+    def _finish_login(self) -> bool:
+        if not self._ensure_dashboard_loaded():
+            return False
+        self.session_vault.save(self.driver)
+        return True
+
     @with_retry(max_attempts=3, delay=3.0)
     def login_via_orcid(self) -> bool:
         if not self.email or not self.password:
@@ -225,6 +269,7 @@ class SIAMExtractor(CachedExtractorMixin):
 
         base_domain = self.BASE_URL.replace("https://", "").replace("http://", "").split("/")[0]
 
+        restored = self.session_vault.restore(self.driver, self.MAIN_URL)
         print(f"\U0001f510 Navigating to {self.MAIN_URL}")
         self.driver.get(self.MAIN_URL)
         if not self._wait_for_cloudflare():
@@ -240,7 +285,14 @@ class SIAMExtractor(CachedExtractorMixin):
         has_logout = "Logout" in src or "Log Out" in src
         if has_logout and has_dashboard:
             print("\u2705 Already logged in with dashboard visible")
+            if restored:
+                self.session_vault.mark_valid()
+            else:
+                self.session_vault.save(self.driver)
             return True
+        if restored:
+            print("   \u26a0\ufe0f Saved session expired, logging in")
+            self.session_vault.invalidate()
 
         self._dismiss_cookie_overlay()
 
@@ -252,7 +304,7 @@ class SIAMExtractor(CachedExtractorMixin):
         url = self.driver.current_url
         if url.startswith(("https://" + base_domain, "http://" + base_domain)):
             print("\u2705 Already authenticated via saved session")
-            return self._ensure_dashboard_loaded()
+            return self._finish_login()
 
         if "orcid.org" not in url:
             print(f"\u274c Unexpected page: {url[:100]}")
@@ -299,7 +351,7 @@ class SIAMExtractor(CachedExtractorMixin):
             if url.startswith(("https://" + base_domain, "http://" + base_domain)):
                 print("\u2705 ORCID login successful")
                 self._save_debug_html("04_post_redirect")
-                return self._ensure_dashboard_loaded()
+                return self._finish_login()
 
         try:
             authorize_button = WebDriverWait(self.driver, 3).until(
@@ -319,22 +371,90 @@ class SIAMExtractor(CachedExtractorMixin):
                 continue
             if url.startswith(("https://" + base_domain, "http://" + base_domain)):
                 print("\u2705 ORCID login successful")
-                return self._ensure_dashboard_loaded()
+                return self._finish_login()
 
         print(f"\u274c Still on: {self.driver.current_url}")
         self._save_debug_html("05_login_failed")
         return False
 
-    def _save_debug_html(self, label: str):
+    def _save_debug_html(self, label: str, html: str | None = None):
         try:
             debug_dir = Path(self.output_dir) / "debug"
             debug_dir.mkdir(parents=True, exist_ok=True)
             filepath = debug_dir / f"{self.JOURNAL_CODE.lower()}_{label}.html"
             with open(filepath, "w") as f:
-                f.write(self.driver.page_source)
+                f.write(html if html is not None else self.driver.page_source)
         except Exception:
             pass
 
+    def _init_http_fetcher(self):
+        if not self.http_fetch or not self.driver:
+            return
+        try:
+            if self.http is None:
+                self.http = HTTPPageFetcher(
+                    max_per_host=self.HTTP_MAX_PER_HOST,
+                    login_markers=self.HTTP_LOGIN_MARKERS,
+                    session_markers=self.HTTP_SESSION_MARKERS,
+                )
+            n = self.http.import_driver_cookies(self.driver)
+            print(f"   🌐 HTTP fetcher ready ({n} cookies shared)")
+        except Exception as e:
+            print(f"   ⚠️ HTTP fetcher unavailable: {str(e)[:60]}")
+            self.http = None
+
+    def _http_get(self, url: str) -> str | None:
+        if url in self._http_pages:
+            return self._http_pages.pop(url)
+        if self.http is None or not self.http.enabled:
+            return None
+        return self.http.fetch(url)
+
+    def _find_subpage_urls(self, soup: BeautifulSoup) -> list[str]:
+        urls = []
+        for a in soup.find_all("a", href=True):
+            if any(p in a["href"] for p in self.HTTP_SUBPAGE_PATTERNS):
+                urls.append(self._resolve_url(a["href"]))
+        return urls
+
+    def _prefetch_detail_pages(self, ms_infos: list[dict]):
+        """Fetch manuscript pages, then their GET-only subpages, concurrently over HTTP."""
+        if self.http is None:
+            return
+        t0 = time.time()
+        pages = self.http.fetch_many(i.get("href", "") for i in ms_infos)
+        subpage_urls = []
+        for html in pages.values():
+            if html:
+                subpage_urls.extend(self._find_subpage_urls(BeautifulSoup(html, "html.parser")))
+        pages.update(self.http.fetch_many(subpage_urls))
+        self._http_pages.update({u: h for u, h in pages.items() if h})
+        print(
+            f"   🌐 Prefetched {len(self._http_pages)}/{len(pages)} pages over HTTP "
+            f"({time.time() - t0:.1f}s)"
+        )
+
+    def _load_subpage(self, url: str, debug_label: str = "") -> BeautifulSoup:
+        html = self._http_get(url)
+        if html is not None:
+            if debug_label:
+                self._save_debug_html(debug_label, html)
+            return BeautifulSoup(html, "html.parser")
+
+        current_url = self.driver.current_url
+        try:
+            self.driver.get(url)
+            self.smart_wait(2)
+            self._wait_for_cloudflare(30)
+            sub_soup = BeautifulSoup(self.driver.page_source, "html.parser")
+            if debug_label:
+                self._save_debug_html(debug_label)
+        finally:
+            self.driver.get(current_url)
+            self.smart_wait(2)
+            self._wait_for_cloudflare(30)
+        return sub_soup
+
     def _ensure_dashboard_loaded(self) -> bool:
         for attempt in range(3):
             self._wait_for_cloudflare(self.CLOUDFLARE_WAIT)
@@ -635,14 +755,12 @@ class SIAMExtractor(CachedExtractorMixin):
             print("      \u274c No URL for manuscript")
             return None
 
-        try:
-            self.driver.get(href)
-            self.smart_wait(3)
-            self._wait_for_cloudflare(60)
-            self.smart_wait(2)
-        except Exception as e:
-            print(f"      \u274c Could not navigate to manuscript: {str(e)[:60]}")
-            return None
+        page_source = self._http_get(href)
+        from_http = page_source is not None
+        if not from_http:
+            if not self._navigate_to_manuscript(href):
+                return None
+            page_source = self.driver.page_source
 
         manuscript = {
             "manuscript_id": ms_id,
@@ -655,15 +773,19 @@ class SIAMExtractor(CachedExtractorMixin):
             "documents": {},
         }
 
-        page_source = self.driver.page_source
         soup = BeautifulSoup(page_source, "html.parser")
         page_text = soup.get_text()
-        self._save_debug_html(f"ms_{ms_id}")
+        self._save_debug_html(f"ms_{ms_id}", page_source)
 
         self._extract_metadata(manuscript, page_text, soup)
         self._extract_referees(manuscript, page_text, soup)
         self._extract_authors_from_page(manuscript, page_text, soup)
 
+        if from_http and any(not r.get("email") for r in manuscript["referees"]):
+            # Contact popups are JS-driven; only now does the browser need the page.
+            if not self._navigate_to_manuscript(href):
+                return None
+
         for ref in manuscript["referees"]:
             if not ref.get("email"):
                 if self._is_session_dead():
@@ -680,14 +802,15 @@ class SIAMExtractor(CachedExtractorMixin):
         if author_email_count:
             print(f"      📧 Author emails: {author_email_count}/{len(manuscript['authors'])}")
 
-        ms_href = ms_info.get("href", "")
-        if ms_href and "view_ms" not in self.driver.current_url:
-            self.driver.get(ms_href)
-            self.smart_wait(2)
-        self._wait_for_cloudflare(30)
-        self._wait_for_page_load()
-        page_source = self.driver.page_source
-        soup = BeautifulSoup(page_source, "html.parser")
+        if not from_http:
+            ms_href = ms_info.get("href", "")
+            if ms_href and "view_ms" not in self.driver.current_url:
+                self.driver.get(ms_href)
+                self.smart_wait(2)
+            self._wait_for_cloudflare(30)
+            self._wait_for_page_load()
+            page_source = self.driver.page_source
+            soup = BeautifulSoup(page_source, "html.parser")
 
         self._extract_documents(manuscript, soup)
         self._extract_decision_letter(manuscript, soup)
@@ -730,6 +853,17 @@ class SIAMExtractor(CachedExtractorMixin):
 
         return manuscript
 
+    def _navigate_to_manuscript(self, href: str) -> bool:
+        try:
+            self.driver.get(href)
+            self.smart_wait(3)
+            self._wait_for_cloudflare(60)
+            self.smart_wait(2)
+            return True
+        except Exception as e:
+            print(f"      \u274c Could not navigate to manuscript: {str(e)[:60]}")
+            return False
+
     def _extract_metadata(self, manuscript: dict, page_text: str, soup: BeautifulSoup):
         metadata = {}
         field_map = {}
@@ -1468,32 +1602,15 @@ class SIAMExtractor(CachedExtractorMixin):
             if not decision_url:
                 return
 
-            decision_url = self._resolve_url(decision_url)
-
-            current_url = self.driver.current_url
-            self.driver.get(decision_url)
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-
-            page_source = self.driver.page_source
-            dec_soup = BeautifulSoup(page_source, "html.parser")
+            dec_soup = self._load_subpage(self._resolve_url(decision_url))
             letter_text = dec_soup.get_text(separator="\n", strip=True)
 
             if len(letter_text) > 50:
                 manuscript["decision_letter_text"] = letter_text[:20000]
                 print(f"         📝 Decision letter extracted ({len(letter_text)} chars)")
 
-            self.driver.get(current_url)
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-
         except Exception as e:
             print(f"         ⚠️ Decision letter error: {str(e)[:60]}")
-            try:
-                self.driver.get(current_url)
-                self.smart_wait(2)
-            except Exception:
-                pass
 
     def _extract_author_response(self, manuscript: dict, soup: BeautifulSoup):
         try:
@@ -1511,32 +1628,15 @@ class SIAMExtractor(CachedExtractorMixin):
             if not response_url:
                 return
 
-            response_url = self._resolve_url(response_url)
-
-            current_url = self.driver.current_url
-            self.driver.get(response_url)
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-
-            page_source = self.driver.page_source
-            resp_soup = BeautifulSoup(page_source, "html.parser")
+            resp_soup = self._load_subpage(self._resolve_url(response_url))
             response_text = resp_soup.get_text(separator="\n", strip=True)
 
             if len(response_text) > 50:
                 manuscript["author_response_text"] = response_text[:20000]
                 print(f"         📝 Author response extracted ({len(response_text)} chars)")
 
-            self.driver.get(current_url)
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-
         except Exception as e:
             print(f"         ⚠️ Author response error: {str(e)[:60]}")
-            try:
-                self.driver.get(current_url)
-                self.smart_wait(2)
-            except Exception:
-                pass
 
     def _extract_referee_reports(self, manuscript: dict, soup: BeautifulSoup):
         try:
@@ -1550,18 +1650,29 @@ class SIAMExtractor(CachedExtractorMixin):
             if not reviews_url:
                 return
 
-            reviews_url = self._resolve_url(reviews_url)
-
-            current_url = self.driver.current_url
-            self.driver.get(reviews_url)
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-
-            page_source = self.driver.page_source
-            rev_soup = BeautifulSoup(page_source, "html.parser")
-            self._save_debug_html(f"reviews_{manuscript['manuscript_id']}")
-
             referees = manuscript.get("referees", [])
+            revision = manuscript.get("revision_number", 0) or 0
+            cached = [
+                self.get_cached_artifact(
+                    "referee_report", manuscript["manuscript_id"], ref, revision
+                )
+                for ref in referees
+            ]
+            if referees and all(cached) and all(map(_attachments_on_disk, cached)):
+                # Every referee's report is already final and carries what
+                # _attach_referee_pdfs merged into it, so skip the reviews
+                # page. (reviews_page_text is only kept when no referee has a
+                # report, which never holds here.)
+                for ref, report in zip(referees, cached, strict=True):
+                    ref["report"] = report
+                    ref["reports"] = [report]
+                    if report.get("recommendation"):
+                        ref["recommendation"] = report["recommendation"]
+                return
+
+            rev_soup = self._load_subpage(
+                self._resolve_url(reviews_url), f"reviews_{manuscript['manuscript_id']}"
+            )
 
             def _match_referee(name_text: str, ref_num_text: str = ""):
                 name_lower = name_text.lower().strip()
@@ -1752,21 +1863,19 @@ class SIAMExtractor(CachedExtractorMixin):
                     manuscript["reviews_page_text"] = full_text[:20000]
                     print(f"         📝 Reviews page saved as raw text ({len(full_text)} chars)")
 
+            for ref in referees:
+                report = ref.get("report") or {}
+                if report.get("extraction_status") == "ok":
+                    self.store_artifact(
+                        "referee_report", manuscript["manuscript_id"], report, ref, revision
+                    )
+
             report_count = sum(1 for r in referees if r.get("report"))
             if report_count:
                 print(f"         📝 Extracted {report_count} structured referee reports")
 
-            self.driver.get(current_url)
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-
         except Exception as e:
             print(f"         ⚠️ Referee reports error: {str(e)[:60]}")
-            try:
-                self.driver.get(current_url)
-                self.smart_wait(2)
-            except Exception:
-                pass
 
     def _attach_referee_pdfs(self, manuscript: dict, rev_soup: BeautifulSoup) -> None:
         """Scan the SIAM reviews page for referee PDF attachments and
@@ -1876,25 +1985,11 @@ class SIAMExtractor(CachedExtractorMixin):
             if not href:
                 return None
 
-            current_url = self.driver.current_url
-            self.driver.get(self._resolve_url(href))
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-
-            status_soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            self._save_debug_html(f"status_{manuscript['manuscript_id']}")
-
-            self.driver.get(current_url)
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-            return status_soup
+            return self._load_subpage(
+                self._resolve_url(href), f"status_{manuscript['manuscript_id']}"
+            )
         except Exception as e:
             print(f"         ⚠️ Status details scrape error: {str(e)[:60]}")
-            try:
-                self.driver.get(current_url)
-                self.smart_wait(2)
-            except Exception:
-                pass
             return None
 
     def _scrape_email_log_page(self, manuscript: dict, soup: BeautifulSoup) -> BeautifulSoup | None:
@@ -1907,25 +2002,11 @@ class SIAMExtractor(CachedExtractorMixin):
             if not href:
                 return None
 
-            current_url = self.driver.current_url
-            self.driver.get(self._resolve_url(href))
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-
-            email_soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            self._save_debug_html(f"email_log_{manuscript['manuscript_id']}")
-
-            self.driver.get(current_url)
-            self.smart_wait(2)
-            self._wait_for_cloudflare(30)
-            return email_soup
+            return self._load_subpage(
+                self._resolve_url(href), f"email_log_{manuscript['manuscript_id']}"
+            )
         except Exception as e:
             print(f"         ⚠️ Email log scrape error: {str(e)[:60]}")
-            try:
-                self.driver.get(current_url)
-                self.smart_wait(2)
-            except Exception:
-                pass
             return None
 
     def _build_audit_trail(
@@ -3010,6 +3091,7 @@ class SIAMExtractor(CachedExtractorMixin):
             if not self.login_via_orcid():
                 print("      ❌ Re-login failed")
                 return False
+            self._init_http_fetcher()
             self.navigate_to_ae_dashboard()
             if not self._ensure_dashboard_loaded():
                 print("      ❌ Dashboard not loaded after recovery")
@@ -3034,6 +3116,7 @@ class SIAMExtractor(CachedExtractorMixin):
             get_cached_web_profile=self.get_cached_web_profile,
             save_web_profile=self.save_web_profile,
             platform_label="siam_metadata",
+            defer_to=self.JOURNAL_CODE,
         )
 
     def _enrich_audit_trail_with_gmail(self, manuscript_data: dict, manuscript_id: str):
@@ -3202,10 +3285,26 @@ class SIAMExtractor(CachedExtractorMixin):
         for k, v in summary.items():
             print(f"   {k}: {v}")
 
+    def _post_processing_stages(self) -> list[tuple[str, Callable[[dict], None]]]:
+        def timeline(data: dict):
+            analytics = self.extract_timeline_analytics(data)
+            if analytics:
+                data["timeline_analytics"] = analytics
+
+        return [
+            ("Enrichment", self._enrich_people_from_web),
+            (
+                "Gmail",
+                lambda data: self._enrich_audit_trail_with_gmail(data, data["manuscript_id"]),
+            ),
+            ("Timeline analytics", timeline),
+        ]
+
     def run(self) -> list[dict]:
         print(f"\U0001f680 {self.JOURNAL_CODE} EXTRACTION \u2014 SIAM PLATFORM")
         print("=" * 60)
 
+        pipeline = None
         try:
             self.setup_driver()
 
@@ -3247,6 +3346,10 @@ class SIAMExtractor(CachedExtractorMixin):
                 return []
 
             print(f"\n\U0001f4da Total unique manuscripts: {len(all_manuscript_infos)}")
+            pipeline = StagedPipeline(self._post_processing_stages())
+
+            self._init_http_fetcher()
+            self._prefetch_detail_pages(all_manuscript_infos)
 
             for ms_info in all_manuscript_infos:
                 ms_id = ms_info["manuscript_id"]
@@ -3266,29 +3369,22 @@ class SIAMExtractor(CachedExtractorMixin):
                             break
 
                 if data:
-                    try:
-                        self._enrich_people_from_web(data)
-                    except Exception as e:
-                        print(f"      \u26a0\ufe0f Enrichment error: {str(e)[:60]}")
-                    try:
-                        self._enrich_audit_trail_with_gmail(data, ms_id)
-                    except Exception as e:
-                        print(f"      \u26a0\ufe0f Gmail error: {str(e)[:60]}")
-                    try:
-                        timeline_analytics = self.extract_timeline_analytics(data)
-                        if timeline_analytics:
-                            data["timeline_analytics"] = timeline_analytics
-                    except Exception as e:
-                        print(f"      \u26a0\ufe0f Timeline analytics error: {str(e)[:60]}")
-                    self.manuscripts_data.append(data)
+                    pipeline.submit(data)
 
+            self.manuscripts_data.extend(pipeline.drain())
             self.save_results(self.manuscripts_data)
             return self.manuscripts_data
 
         except Exception as e:
             print(f"\u274c Extraction failed: {str(e)[:100]}")
+            if pipeline is not None:
+                self.manuscripts_data.extend(pipeline.drain())
             if self.manuscripts_data:
                 self.save_results(self.manuscripts_data)
             return self.manuscripts_data
         finally:
+            if self.http is not None:
+                print(f"   🌐 HTTP fetcher: {self.http.stats}")
+                self.http.close()
+                self.http = None
             self.cleanup_driver()
@@ -0,0 +1,254 @@
+"""Content-addressed, compressed archive for historical extraction snapshots.
+
+Each manuscript record is stored once under ``<journal_dir>/objects/`` keyed by
+the SHA-256 of its canonical JSON. A snapshot becomes a small manifest
+(``<stem>.manifest.zst``) holding the top-level envelope and the ordered list
+of ``(manuscript_id, record_hash)`` pairs. Readers in ``load_snapshot`` and
+``glob_snapshots`` treat plain JSON files and manifests interchangeably.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+OBJECTS_DIRNAME = "objects"
+MANIFEST_SUFFIXES = (".manifest.zst", ".manifest.gz")
+MANIFEST_VERSION = 1
+
+
+def _default_suffix() -> str:
+    return ".zst" if zstandard is not None else ".gz"
+
+
+def _compress(raw: bytes, suffix: str) -> bytes:
+    if suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError("zstandard package not installed: pip install zstandard")
+        return zstandard.ZstdCompressor(level=10).compress(raw)
+    return gzip.compress(raw, compresslevel=9)
+
+
+def _decompress(raw: bytes, suffix: str) -> bytes:
+    if suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError("zstandard package not installed: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(raw)
+    return gzip.decompress(raw)
+
+
+def _canonical(record: dict) -> bytes:
+    return json.dumps(
+        record, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode()
+
+
+def record_hash(record: dict) -> str:
+    return hashlib.sha256(_canonical(record)).hexdigest()
+
+
+def is_manifest(path: Path) -> bool:
+    return path.name.endswith(MANIFEST_SUFFIXES)
+
+
+def snapshot_stem(path: Path) -> str:
+    name = path.name
+    for suffix in MANIFEST_SUFFIXES:
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return path.stem
+
+
+def _object_path(objects_dir: Path, digest: str, suffix: str) -> Path:
+    return objects_dir / digest[:2] / f"{digest}{suffix}"
+
+
+def _write_object(objects_dir: Path, record: dict, suffix: str) -> str:
+    raw = _canonical(record)
+    digest = hashlib.sha256(raw).hexdigest()
+    path = _object_path(objects_dir, digest, suffix)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(_compress(raw, suffix))
+        os.replace(tmp, path)
+    return digest
+
+
+@lru_cache(maxsize=4096)
+def _read_object(path: str) -> bytes:
+    p = Path(path)
+    return _decompress(p.read_bytes(), ".zst" if p.suffix == ".zst" else ".gz")
+
+
+def _load_object(objects_dir: Path, digest: str, suffix: str) -> dict:
+    path = _object_path(objects_dir, digest, suffix)
+    if not path.exists():
+        alt = ".gz" if suffix == ".zst" else ".zst"
+        path = _object_path(objects_dir, digest, alt)
+    return json.loads(_read_object(str(path)))
+
+
+def archive_snapshot(path: Path, remove_source: bool = False, suffix: str | None = None) -> Path:
+    """Convert one JSON snapshot into a manifest plus shared record objects."""
+    path = Path(path)
+    suffix = suffix or _default_suffix()
+    with open(path) as f:
+        data = json.load(f)
+
+    objects_dir = path.parent / OBJECTS_DIRNAME
+    envelope = {k: v for k, v in data.items() if k != "manuscripts"}
+    entries = []
+    for ms in data.get("manuscripts", []) or []:
+        digest = _write_object(objects_dir, ms, suffix)
+        entries.append([ms.get("manuscript_id", ""), digest])
+
+    manifest = {
+        "archive_version": MANIFEST_VERSION,
+        "source_name": path.name,
+        "envelope": envelope,
+        "manuscripts": entries,
+    }
+    manifest_path = path.with_name(f"{path.stem}.manifest{suffix}")
+    tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp.write_bytes(_compress(_canonical(manifest), suffix))
+    os.replace(tmp, manifest_path)
+
+    st = path.stat()
+    os.utime(manifest_path, (st.st_atime, st.st_mtime))
+    if remove_source:
+        path.unlink()
+    return manifest_path
+
+
+def load_manifest(path: Path) -> dict:
+    path = Path(path)
+    suffix = ".zst" if path.name.endswith(".zst") else ".gz"
+    return json.loads(_decompress(path.read_bytes(), suffix))
+
+
+def load_snapshot(path: Path) -> dict:
+    """Load a snapshot from either a plain JSON file or an archive manifest."""
+    path = Path(path)
+    if not is_manifest(path):
+        with open(path) as f:
+            return json.load(f)
+
+    manifest = load_manifest(path)
+    suffix = ".zst" if path.name.endswith(".zst") else ".gz"
+    objects_dir = path.parent / OBJECTS_DIRNAME
+    data = dict(manifest.get("envelope", {}))
+    data["manuscripts"] = [
+        _load_object(objects_dir, digest, suffix) for _ms_id, digest in manifest["manuscripts"]
+    ]
+    return data
+
+
+def manifest_hashes(path: Path) -> dict[str, str]:
+    """Return ``{manuscript_id: record_hash}`` for a snapshot without loading records."""
+    path = Path(path)
+    if is_manifest(path):
+        return dict(load_manifest(path)["manuscripts"])
+    data = load_snapshot(path)
+    return {ms.get("manuscript_id", ""): record_hash(ms) for ms in data.get("manuscripts", [])}
+
+
+def iter_changed_records(path: Path, last_hashes: dict[str, str]):
+    """Yield manuscripts whose record differs from ``last_hashes[manuscript_id]``.
+
+    ``last_hashes`` is updated in place, so a scan over consecutive snapshots
+    only sees each manuscript when its content changes. For manifests the
+    unchanged records are never decompressed; plain JSON snapshots yield every
+    record and reset the stored hashes.
+    """
+    path = Path(path)
+    if is_manifest(path):
+        manifest = load_manifest(path)
+        suffix = ".zst" if path.name.endswith(".zst") else ".gz"
+        objects_dir = path.parent / OBJECTS_DIRNAME
+        for ms_id, digest in manifest["manuscripts"]:
+            if ms_id and last_hashes.get(ms_id) == digest:
+                continue
+            last_hashes[ms_id] = digest
+            yield _load_object(objects_dir, digest, suffix)
+        return
+
+    for ms in load_snapshot(path).get("manuscripts", []) or []:
+        last_hashes.pop(ms.get("manuscript_id", ""), None)
+        yield ms
+
+
+def glob_snapshots(journal_dir: Path, pattern: str = "*.json") -> list[Path]:
+    """Glob JSON snapshots and their archived manifests.
+
+    ``pattern`` is a JSON glob such as ``"*_extraction_*.json"``; manifests with
+    the same stem are matched too. When both forms of a snapshot exist the JSON
+    file wins.
+    """
+    journal_dir = Path(journal_dir)
+    if not journal_dir.exists():
+        return []
+    found = {p.stem: p for p in journal_dir.glob(pattern)}
+    base = pattern[: -len(".json")] if pattern.endswith(".json") else pattern
+    for suffix in MANIFEST_SUFFIXES:
+        for p in journal_dir.glob(f"{base}{suffix}"):
+            found.setdefault(snapshot_stem(p), p)
+    return list(found.values())
+
+
+def archive_journal(journal_dir: Path, keep_latest: int = 1, pattern: str = "*_extraction_*.json"):
+    """Archive all but the ``keep_latest`` newest JSON snapshots in ``journal_dir``."""
+    journal_dir = Path(journal_dir)
+    files = sorted(journal_dir.glob(pattern), key=lambda f: f.name, reverse=True)
+    archived = []
+    before = 0
+    for path in files[keep_latest:]:
+        before += path.stat().st_size
+        try:
+            archived.append(archive_snapshot(path, remove_source=True))
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"  ⚠️ {path.name}: {e}")
+    return {"archived": len(archived), "bytes_before": before}
+
+
+def _dir_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def main():
+    import argparse
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from core.file_utils import OUTPUTS_DIR
+
+    parser = argparse.ArgumentParser(description="Archive historical extraction snapshots")
+    parser.add_argument("--journal", action="append", help="Journal code (repeatable)")
+    parser.add_argument(
+        "--keep", type=int, default=1, help="Newest JSON snapshots to keep uncompressed"
+    )
+    args = parser.parse_args()
+
+    journals = args.journal or sorted(d.name for d in OUTPUTS_DIR.iterdir() if d.is_dir())
+    for journal in journals:
+        journal_dir = OUTPUTS_DIR / journal.lower()
+        if not journal_dir.exists():
+            continue
+        before = _dir_size(journal_dir)
+        result = archive_journal(journal_dir, keep_latest=args.keep)
+        after = _dir_size(journal_dir)
+        print(
+            f"  {journal.upper()}: {result['archived']} snapshot(s) archived, "
+            f"{before / 1e6:.1f} MB → {after / 1e6:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Structural (Merkle) diff between consecutive manuscript snapshots.
+
+A manuscript is hashed as a tree — fields, referees (fields, dates, report),
+authors and audit events — where every node's hash covers its subtree.
+Diffing two trees only descends into subtrees whose hashes differ, so the
+cost is proportional to what changed. Trees are persisted by ``StateStore``
+so the next diff needs only the new snapshot.
+"""
+
+import hashlib
+import json
+
+COLLECTIONS = ("referees", "authors", "audit_trail", "communication_timeline")
+
+# Manuscript fields whose change can settle every referee at once, e.g. a
+# decision that closes outstanding invitations without touching their nodes
+STATUS_FIELDS = frozenset(
+    {
+        "status",
+        "category",
+        "ae_status",
+        "status_details",
+        "decision",
+        "final_decision",
+        "decision_date",
+        "decision_letter_text",
+    }
+)
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+_MAX_STORED_VALUE = 200
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _leaf(value) -> dict:
+    raw = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode()
+    node = {"h": _digest(raw)}
+    if isinstance(value, _SCALAR_TYPES) and len(str(value)) <= _MAX_STORED_VALUE:
+        node["v"] = value
+    return node
+
+
+def _node(children: dict) -> dict:
+    raw = "|".join(f"{k}={children[k]['h']}" for k in sorted(children)).encode()
+    return {"h": _digest(raw), "c": children}
+
+
+def _unique(key: str, used: dict) -> str:
+    if key not in used:
+        return key
+    n = 2
+    while f"{key}#{n}" in used:
+        n += 1
+    return f"{key}#{n}"
+
+
+def person_key(person: dict) -> str:
+    email = (person.get("email") or "").lower().strip()
+    if email:
+        return email
+    return " ".join((person.get("name") or "").lower().split())
+
+
+def _referee_tree(ref: dict) -> dict:
+    children = {}
+    for key, value in ref.items():
+        if key == "dates" and isinstance(value, dict):
+            children[key] = _node({d: _leaf(v) for d, v in value.items()})
+        else:
+            children[key] = _leaf(value)
+    return _node(children)
+
+
+def _keyed(items, key_fn, tree_fn) -> dict:
+    children: dict = {}
+    for item in items or []:
+        if not isinstance(item, dict):
+            continue
+        children[_unique(key_fn(item) or "?", children)] = tree_fn(item)
+    return _node(children)
+
+
+def build_tree(manuscript: dict) -> dict:
+    fields = {k: _leaf(v) for k, v in manuscript.items() if k not in COLLECTIONS}
+    return _node(
+        {
+            "fields": _node(fields),
+            "referees": _keyed(manuscript.get("referees"), person_key, _referee_tree),
+            "authors": _keyed(manuscript.get("authors"), person_key, _leaf),
+            "audit_trail": _keyed(manuscript.get("audit_trail"), lambda e: _leaf(e)["h"], _leaf),
+            "communication_timeline": _keyed(
+                manuscript.get("communication_timeline"), lambda e: _leaf(e)["h"], _leaf
+            ),
+        }
+    )
+
+
+def _kind(path: tuple) -> str:
+    section = path[0]
+    if section == "fields":
+        return "manuscript_field"
+    if section in ("audit_trail", "communication_timeline"):
+        return "audit_event"
+    if section == "authors":
+        return "author"
+    if len(path) == 2:
+        return "referee"
+    if path[2] == "dates":
+        return "referee_date"
+    if path[2] in ("report", "reports"):
+        return "report"
+    return "referee_field"
+
+
+def _change(op: str, path: tuple, old: dict | None, new: dict | None) -> dict:
+    change = {"op": op, "kind": _kind(path), "path": "/".join(path)}
+    if old is not None and "v" in old:
+        change["old"] = old["v"]
+    if new is not None and "v" in new:
+        change["new"] = new["v"]
+    return change
+
+
+def _diff(old: dict, new: dict, path: tuple, out: list):
+    if old["h"] == new["h"]:
+        return
+    old_c = old.get("c")
+    new_c = new.get("c")
+    if old_c is None or new_c is None:
+        out.append(_change("modified", path, old, new))
+        return
+    for name in sorted(old_c.keys() | new_c.keys()):
+        child_path = path + (name,)
+        if name not in new_c:
+            out.append(_change("removed", child_path, old_c[name], None))
+        elif name not in old_c:
+            out.append(_change("added", child_path, None, new_c[name]))
+        else:
+            _diff(old_c[name], new_c[name], child_path, out)
+
+
+def diff_trees(old: dict | None, new: dict) -> list[dict]:
+    """Return the minimal typed change set between two manuscript trees.
+
+    Each change is ``{"op", "kind", "path"}`` plus ``old``/``new`` for scalar
+    leaves. ``op`` is ``added``, ``removed`` or ``modified``; ``kind`` is one of
+    ``manuscript_field``, ``referee``, ``referee_field``, ``referee_date``,
+    ``report``, ``author`` or ``audit_event``.
+    """
+    if old is None:
+        return [{"op": "added", "kind": "manuscript", "path": ""}]
+    out: list[dict] = []
+    if old["h"] == new["h"]:
+        return out
+    for section in sorted(old["c"].keys() | new["c"].keys()):
+        empty = _node({})
+        _diff(old["c"].get(section, empty), new["c"].get(section, empty), (section,), out)
+    return out
+
+
+def changed_referee_keys(changes: list[dict]) -> set[str]:
+    """Referee keys (see ``person_key``) touched by a change set."""
+    keys = set()
+    for change in changes:
+        parts = change.get("path", "").split("/")
+        if parts[0] == "referees" and len(parts) > 1:
+            keys.add(parts[1].split("#")[0])
+    return keys
+
+
+def status_changed(changes: list[dict]) -> bool:
+    """Whether a change set touches a manuscript status or decision field."""
+    for change in changes:
+        parts = change.get("path", "").split("/")
+        if parts[0] == "fields" and len(parts) > 1 and parts[1] in STATUS_FIELDS:
+            return True
+    return False
@@ -0,0 +1,82 @@
+"""Staged post-processing that runs alongside browser extraction.
+
+The browser thread only extracts manuscripts and ``submit``s them. Each
+post-processing stage (web enrichment, Gmail cross-check, timeline
+analytics) has its own worker thread, and bounded queues connect the
+stages. Different manuscripts move through the stages concurrently while
+the browser is already on the next manuscript. A stage's client (Gmail,
+HTTP) is only ever used from that stage's one thread. ``drain`` waits for
+the pipeline to empty and returns the manuscripts in submission order.
+
+``EXTRACTOR_PIPELINE=false`` runs the stages inline in ``submit`` instead.
+"""
+
+import os
+import queue
+import threading
+from collections.abc import Callable
+
+_STOP = object()
+
+
+class StagedPipeline:
+    def __init__(self, stages: list[tuple[str, Callable[[dict], None]]], maxsize: int = 4):
+        self.stages = stages
+        self.inline = os.environ.get("EXTRACTOR_PIPELINE", "true").lower() in ("0", "false", "no")
+        self._queues = [queue.Queue(maxsize) for _ in stages]
+        self._done: dict[int, dict] = {}
+        self._lock = threading.Lock()
+        self._count = 0
+        self._closed = False
+        self._threads = []
+        if not self.inline:
+            for i in range(len(stages)):
+                t = threading.Thread(target=self._work, args=(i,), daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def _run_stage(self, i: int, item: dict):
+        name, fn = self.stages[i]
+        try:
+            fn(item)
+        except Exception as e:
+            print(f"      ⚠️ {name} error ({item.get('manuscript_id', '')}): {str(e)[:60]}")
+
+    def _work(self, i: int):
+        inbox = self._queues[i]
+        outbox = self._queues[i + 1] if i + 1 < len(self.stages) else None
+        while True:
+            entry = inbox.get()
+            if entry is _STOP:
+                if outbox is not None:
+                    outbox.put(_STOP)
+                return
+            index, item = entry
+            self._run_stage(i, item)
+            if outbox is not None:
+                outbox.put(entry)
+            else:
+                with self._lock:
+                    self._done[index] = item
+
+    def submit(self, item: dict):
+        """Queue a manuscript; blocks while the first stage's queue is full."""
+        index = self._count
+        self._count += 1
+        if self.inline or not self.stages:
+            for i in range(len(self.stages)):
+                self._run_stage(i, item)
+            self._done[index] = item
+        else:
+            self._queues[0].put((index, item))
+
+    def drain(self) -> list[dict]:
+        """Wait for all submitted manuscripts; return them in submission order."""
+        if self._closed:
+            return []
+        self._closed = True
+        if self._threads:
+            self._queues[0].put(_STOP)
+            for t in self._threads:
+                t.join()
+        return [self._done[i] for i in sorted(self._done)]
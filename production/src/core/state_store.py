@@ -7,6 +7,9 @@ import threading
 from datetime import datetime
 from pathlib import Path
 
+from core.audit_history import decode_events, encode_events, event_hash, event_time
+from core.snapshot_diff import build_tree, diff_trees
+
 CACHE_DIR = Path(__file__).resolve().parents[2] / "cache"
 DB_PATH = CACHE_DIR / "manuscript_state.db"
 
@@ -36,6 +39,36 @@ class StateStore:
                     PRIMARY KEY (manuscript_id, journal)
                 )"""
             )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS manuscript_tree (
+                    manuscript_id TEXT NOT NULL,
+                    journal TEXT NOT NULL,
+                    root_hash TEXT NOT NULL,
+                    tree_json TEXT NOT NULL,
+                    PRIMARY KEY (manuscript_id, journal)
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS pending_tree (
+                    manuscript_id TEXT NOT NULL,
+                    journal TEXT NOT NULL,
+                    root_hash TEXT NOT NULL,
+                    tree_json TEXT NOT NULL,
+                    PRIMARY KEY (manuscript_id, journal)
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS audit_history (
+                    manuscript_id TEXT NOT NULL,
+                    journal TEXT NOT NULL,
+                    latest_ts TEXT,
+                    latest_hash TEXT,
+                    event_count INTEGER DEFAULT 0,
+                    events_json TEXT NOT NULL,
+                    updated_at TEXT,
+                    PRIMARY KEY (manuscript_id, journal)
+                )"""
+            )
             conn.commit()
             conn.close()
 
@@ -88,6 +121,109 @@ class StateStore:
                 return dict(row)
             return None
 
+    def diff_manuscript(
+        self, manuscript: dict, journal: str, commit: bool = True
+    ) -> list[dict] | None:
+        """Diff against the stored node hashes, then store the new tree.
+
+        Returns ``None`` for a manuscript seen for the first time, otherwise
+        the typed change set from ``core.snapshot_diff.diff_trees``. With
+        ``commit=False`` the new tree is only staged, and later diffs keep
+        comparing against the old one until ``commit_tree`` is called.
+        """
+        ms_id = manuscript.get("manuscript_id", "")
+        if not ms_id:
+            return None
+        new_tree = build_tree(manuscript)
+
+        with self._lock:
+            conn = sqlite3.connect(str(self.db_path))
+            row = conn.execute(
+                "SELECT root_hash, tree_json FROM manuscript_tree WHERE manuscript_id=? AND journal=?",
+                (ms_id, journal),
+            ).fetchone()
+            if row and row[0] == new_tree["h"]:
+                # Back to the stored tree: nothing staged is newer
+                conn.execute(
+                    "DELETE FROM pending_tree WHERE manuscript_id=? AND journal=?",
+                    (ms_id, journal),
+                )
+                conn.commit()
+                conn.close()
+                return []
+            table = "manuscript_tree" if commit else "pending_tree"
+            conn.execute(
+                f"""INSERT OR REPLACE INTO {table}
+                   (manuscript_id, journal, root_hash, tree_json) VALUES (?, ?, ?, ?)""",
+                (ms_id, journal, new_tree["h"], json.dumps(new_tree, default=str)),
+            )
+            conn.commit()
+            conn.close()
+
+        if row is None:
+            return None
+        return diff_trees(json.loads(row[1]), new_tree)
+
+    def commit_tree(self, manuscript_id: str, journal: str) -> bool:
+        """Make the tree staged by ``diff_manuscript(commit=False)`` the stored one."""
+        with self._lock:
+            conn = sqlite3.connect(str(self.db_path))
+            row = conn.execute(
+                "SELECT root_hash, tree_json FROM pending_tree WHERE manuscript_id=? AND journal=?",
+                (manuscript_id, journal),
+            ).fetchone()
+            if row:
+                conn.execute(
+                    """INSERT OR REPLACE INTO manuscript_tree
+                       (manuscript_id, journal, root_hash, tree_json) VALUES (?, ?, ?, ?)""",
+                    (manuscript_id, journal, row[0], row[1]),
+                )
+                conn.execute(
+                    "DELETE FROM pending_tree WHERE manuscript_id=? AND journal=?",
+                    (manuscript_id, journal),
+                )
+                conn.commit()
+            conn.close()
+        return row is not None
+
+    def get_audit_history(self, manuscript_id: str, journal: str) -> tuple[list[dict], str]:
+        """Stored audit events (newest first) and the hash of the newest one."""
+        with self._lock:
+            conn = sqlite3.connect(str(self.db_path))
+            row = conn.execute(
+                "SELECT events_json, latest_hash FROM audit_history WHERE manuscript_id=? AND journal=?",
+                (manuscript_id, journal),
+            ).fetchone()
+            conn.close()
+        if not row:
+            return [], ""
+        try:
+            return decode_events(row[0]), row[1] or ""
+        except (ValueError, TypeError):
+            return [], ""
+
+    def save_audit_history(self, manuscript_id: str, journal: str, events: list[dict]):
+        newest = events[0] if events else {}
+        with self._lock:
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute(
+                """INSERT OR REPLACE INTO audit_history
+                   (manuscript_id, journal, latest_ts, latest_hash, event_count,
+                    events_json, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    manuscript_id,
+                    journal,
+                    event_time(newest),
+                    event_hash(newest) if newest else "",
+                    len(events),
+                    encode_events(events),
+                    datetime.now().isoformat(),
+                ),
+            )
+            conn.commit()
+            conn.close()
+
     def update_state(self, manuscript: dict, journal: str) -> dict | None:
         ms_id = manuscript.get("manuscript_id", "")
         if not ms_id:
@@ -11,12 +11,20 @@ except ImportError:
     AcademicProfileEnricher = None
 
 
-def enrich_people_from_web(
-    manuscript_data: dict,
-    get_cached_web_profile: Callable,
-    save_web_profile: Callable,
-    platform_label: str = "platform_metadata",
-) -> int:
+def new_session() -> requests.Session:
+    """HTTP session for enrichment lookups; pass one in to share its connections."""
+    session = requests.Session()
+    session.headers.update(
+        {
+            "User-Agent": "Editorial-Scripts/1.0 (mailto:dylansmb@gmail.com)",
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+    )
+    return session
+
+
+def people_to_enrich(manuscript_data: dict) -> list[tuple[str, dict]]:
     people = []
     for ref in manuscript_data.get("referees", []):
         if ref.get("name"):
@@ -24,19 +32,89 @@ def enrich_people_from_web(
     for auth in manuscript_data.get("authors", []):
         if auth.get("name"):
             people.append(("author", auth))
+    return people
+
+
+def metadata_profile(person: dict, platform_label: str) -> dict:
+    """Fallback author profile built from platform data only."""
+    meta_profile = {"source": platform_label}
+    institution = (
+        person.get("institution", "")
+        or person.get("affiliation", "")
+        or person.get("institution_parsed", "")
+    )
+    if institution:
+        meta_profile["institution"] = institution
+    dept = person.get("department", "")
+    if dept:
+        meta_profile["department"] = dept
+    country = person.get("country", "")
+    if country:
+        meta_profile["country"] = country
+    email = person.get("email", "")
+    if email and "@" in email:
+        meta_profile["email_domain"] = email.split("@")[-1]
+    return meta_profile
+
 
+def _apply_cached_profiles(
+    manuscript_data: dict, get_cached_web_profile: Callable, journal: str, platform_label: str
+) -> int:
+    from core.enrichment_queue import EnrichmentQueue
+
+    hits = 0
+    pending = False
+    for _role, person in people_to_enrich(manuscript_data):
+        if person.get("web_profile"):
+            continue
+        orcid = (person.get("orcid") or "").rstrip("/").split("/")[-1]
+        institution = (
+            person.get("institution", "")
+            or person.get("affiliation", "")
+            or person.get("institution_parsed", "")
+        )
+        cached = get_cached_web_profile(person["name"], institution, orcid)
+        if cached:
+            person["web_profile"] = cached
+            person["web_profile_source"] = "cache"
+            hits += 1
+        else:
+            pending = True
+    ms_id = manuscript_data.get("manuscript_id") or manuscript_data.get("id", "")
+    if pending and ms_id:
+        EnrichmentQueue().enqueue(journal, ms_id, platform_label)
+        print(f"      🌐 Web enrichment deferred ({hits} from cache)")
+    return hits
+
+
+def enrich_people_from_web(
+    manuscript_data: dict,
+    get_cached_web_profile: Callable,
+    save_web_profile: Callable,
+    platform_label: str = "platform_metadata",
+    defer_to: str = "",
+    session: requests.Session | None = None,
+) -> int:
+    """Attach web profiles to referees and authors.
+
+    With ``defer_to`` (a journal code) and deferral enabled, only cached
+    profiles are applied and the manuscript is queued for
+    ``core.enrichment_queue`` so the extraction never waits on the APIs.
+    """
+    if defer_to:
+        from core.enrichment_queue import deferral_enabled
+
+        if deferral_enabled():
+            return _apply_cached_profiles(
+                manuscript_data, get_cached_web_profile, defer_to, platform_label
+            )
+
+    people = people_to_enrich(manuscript_data)
     if not people:
         return 0
 
     enriched = 0
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Editorial-Scripts/1.0 (mailto:dylansmb@gmail.com)",
-            "Accept": "text/html,application/xhtml+xml",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-    )
+    session = session or new_session()
 
     academic = None
     if AcademicProfileEnricher is not None:
@@ -233,19 +311,7 @@ def enrich_people_from_web(
                 source += "+academic"
             save_web_profile(name, institution, orcid_id or "", profile, source)
         elif role == "author":
-            meta_profile = {"source": platform_label}
-            if institution:
-                meta_profile["institution"] = institution
-            dept = person.get("department", "")
-            if dept:
-                meta_profile["department"] = dept
-            country = person.get("country", "")
-            if country:
-                meta_profile["country"] = country
-            email = person.get("email", "")
-            if email and "@" in email:
-                meta_profile["email_domain"] = email.split("@")[-1]
-            person["web_profile"] = meta_profile
+            person["web_profile"] = metadata_profile(person, platform_label)
             enriched += 1
 
     if enriched:
@@ -24,6 +24,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.cache_integration import CachedExtractorMixin
+from core.resource_policy import apply_resource_policy, lift_resource_policy
+from core.session_vault import SessionVault
 from core.web_enrichment import enrich_people_from_web
 
 try:
@@ -41,12 +43,12 @@ class WileyBaseExtractor(CachedExtractorMixin):
     DASHBOARD_URL = "https://review.wiley.com"
     CLOUDFLARE_WAIT = 300
     MANUSCRIPT_PATTERN = r"\d{7}"
-    COOKIE_FILE = "wiley_cookies.json"
 
     def __init__(self, headless: bool = False):
         self.headless = headless
         self.init_cached_extractor(self.JOURNAL_CODE)
         self.setup_directories()
+        self.session_vault = SessionVault(self.JOURNAL_CODE)
         self.setup_chrome_options()
         self.driver = None
         self.wait = None
@@ -71,6 +73,10 @@ class WileyBaseExtractor(CachedExtractorMixin):
         self.chrome_options.add_argument("--disable-dev-shm-usage")
         self.chrome_options.add_argument("--window-size=1200,800")
 
+        profile = self.session_vault.profile_dir()
+        if profile:
+            self.chrome_options.add_argument(f"--user-data-dir={profile}")
+
     def setup_directories(self):
         self.base_dir = Path(__file__).parent.parent.parent
         jc = self.JOURNAL_CODE.lower()
@@ -136,6 +142,8 @@ class WileyBaseExtractor(CachedExtractorMixin):
             time.sleep(2)
             self.original_window = self.driver.window_handles[0]
             self.driver.switch_to.window(self.original_window)
+        # Applied by _wait_for_cloudflare once the first challenge has passed
+        self._blocking_resources = False
         print(f"\U0001f5a5\ufe0f  Browser configured for {self.JOURNAL_CODE}")
 
     def cleanup_driver(self):
@@ -156,6 +164,9 @@ class WileyBaseExtractor(CachedExtractorMixin):
                 time.sleep(1)
                 continue
             if "just a moment" in title or "un instant" in title or title == "":
+                if getattr(self, "_blocking_resources", False):
+                    # The Turnstile widget needs its images and fonts
+                    self._blocking_resources = not lift_resource_policy(self.driver)
                 if i == 20 and not prompted:
                     self._prompt_cloudflare_click()
                     prompted = True
@@ -163,6 +174,8 @@ class WileyBaseExtractor(CachedExtractorMixin):
                     print(f"   \u23f3 Cloudflare challenge... ({i}s)")
                 time.sleep(1)
                 continue
+            if not getattr(self, "_blocking_resources", True):
+                self._blocking_resources = apply_resource_policy(self.driver, "wiley")
             return True
         print(f"   \u26a0\ufe0f Cloudflare timeout after {timeout}s")
         return False
@@ -192,33 +205,10 @@ class WileyBaseExtractor(CachedExtractorMixin):
         print("      (browser window brought to foreground)")
 
     def _save_cookies(self):
-        cookie_path = self.cache_dir_path / self.COOKIE_FILE
-        try:
-            cookies = self.driver.get_cookies()
-            with open(cookie_path, "w") as f:
-                json.dump(cookies, f)
-        except Exception:
-            pass
+        self.session_vault.save(self.driver)
 
     def _restore_cookies(self):
-        cookie_path = self.cache_dir_path / self.COOKIE_FILE
-        if not cookie_path.exists():
-            return False
-        try:
-            with open(cookie_path) as f:
-                cookies = json.load(f)
-            self.driver.get(self.DASHBOARD_URL)
-            time.sleep(2)
-            for cookie in cookies:
-                cookie.pop("sameSite", None)
-                cookie.pop("expiry", None)
-                try:
-                    self.driver.add_cookie(cookie)
-                except Exception:
-                    pass
-            return True
-        except Exception:
-            return False
+        return self.session_vault.restore(self.driver, self.DASHBOARD_URL)
 
     def _wait_for_element(self, by, value, timeout=30):
         try:
@@ -299,8 +289,10 @@ class WileyBaseExtractor(CachedExtractorMixin):
             self.driver.get(self.DASHBOARD_URL)
             if self._wait_for_cloudflare():
                 if self._ensure_dashboard_loaded():
+                    self.session_vault.mark_valid()
                     print("   \u2705 Restored session from cookies")
                     return True
+            self.session_vault.invalidate()
 
         self.driver.get(self.LOGIN_URL)
         if not self._wait_for_cloudflare():
@@ -866,7 +858,13 @@ class WileyBaseExtractor(CachedExtractorMixin):
 
     def _enrich_people_from_web(self, data: dict):
         try:
-            enrich_people_from_web(data, self.JOURNAL_CODE, cache=self._cache)
+            enrich_people_from_web(
+                data,
+                get_cached_web_profile=self.get_cached_web_profile,
+                save_web_profile=self.save_web_profile,
+                platform_label="wiley_metadata",
+                defer_to=self.JOURNAL_CODE,
+            )
         except Exception as e:
             print(f"   \u26a0\ufe0f Enrichment failed: {e}")
 
@@ -26,6 +26,7 @@ from typing import Any, Optional
 # Add cache integration
 sys.path.append(str(Path(__file__).parent.parent))
 from core.cache_integration import CachedExtractorMixin
+from core.ror_index import get_index as get_ror_index
 
 # Gmail API imports
 try:
@@ -1231,6 +1232,10 @@ class ComprehensiveFSExtractor(CachedExtractorMixin):
         if domain in known_domains:
             return known_domains[domain]
 
+        org = get_ror_index().by_domain(domain)
+        if org:
+            return org["name"]
+
         # Try to infer from domain structure
         parts = domain.split(".")
         if len(parts) >= 2:
@@ -1404,6 +1409,10 @@ class ComprehensiveFSExtractor(CachedExtractorMixin):
 
     def _infer_country_from_affiliation(self, affiliation: str) -> str:
         """Infer country from affiliation text."""
+        country = get_ror_index().country(affiliation)
+        if country:
+            return country
+
         affiliation_lower = affiliation.lower()
 
         # Country keywords
@@ -30,6 +30,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 sys.path.append(str(Path(__file__).parent.parent))
+from core.identity_index import names_match, orderless_key
+from core.ror_index import get_index as get_ror_index
 from core.scholarone_base import ScholarOneBaseExtractor
 
 try:
@@ -976,6 +978,9 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
         """Login to MF platform - ULTRAROBUST VERSION."""
         MAX_LOGIN_ATTEMPTS = 3
 
+        if self._resume_saved_session():
+            return True
+
         for attempt in range(MAX_LOGIN_ATTEMPTS):
             try:
                 print(f"🔐 Login attempt {attempt + 1}/{MAX_LOGIN_ATTEMPTS}...")
@@ -1158,6 +1163,7 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                         print("   ⏳ Waiting for page to fully load...")
 
                         # Don't return immediately - let page stabilize
+                        self.session_vault.save(self.driver)
                         return True
 
                 except Exception as e:
@@ -1182,6 +1188,7 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                             try:
                                 self.driver.find_element(by_method, selector)
                                 print("   ✅ Login successful (no 2FA needed)!")
+                                self.session_vault.save(self.driver)
                                 return True
                             except Exception:
                                 continue
@@ -1190,6 +1197,7 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                         current_url = self.driver.current_url
                         if "login" not in current_url.lower() and "mafi" in current_url:
                             print("   ✅ Login successful (based on URL)!")
+                            self.session_vault.save(self.driver)
                             return True
 
                     except Exception:
@@ -1558,8 +1566,13 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                 print(f"         📚 Using cached country: {cached_country}")
                 return cached_country
 
+            found_country = get_ror_index().country(institution_name)
+            if found_country:
+                self._institution_country_cache[cache_key] = found_country
+                print(f"         ✅ Country found (ROR index): {found_country}")
+                return found_country
+
             # Perform deep web search
-            found_country = None
 
             # Multiple search strategies
             search_queries = [
@@ -3063,7 +3076,7 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                             referee["report"] = {"available": True, "url": report_url}
 
                             print("         📄 Extracting report content from popup...")
-                            ms_id = manuscript.get("manuscript_id", "")
+                            ms_id = manuscript.get("manuscript_id") or manuscript.get("id", "")
                             report_data = self.extract_referee_report_from_popup(
                                 referee, manuscript_id=ms_id
                             )
@@ -3804,13 +3817,13 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
             if current_v:
                 dl_url = current_v.get("decision_letter_url", "")
                 if dl_url:
-                    dl_text = self.extract_decision_letter_from_popup(dl_url)
+                    dl_text = self.extract_decision_letter_from_popup(dl_url, manuscript["id"])
                     if dl_text:
                         manuscript["decision_letter_text"] = dl_text
                         print(f"      📨 Current version decision letter: {len(dl_text)} chars")
                 ar_url = current_v.get("author_response_url", "")
                 if ar_url:
-                    ar_text = self.extract_author_response_from_popup(ar_url)
+                    ar_text = self.extract_author_response_from_popup(ar_url, manuscript["id"])
                     if ar_text:
                         manuscript["author_response_text"] = ar_text
                         print(f"      📝 Current version author response: {len(ar_text)} chars")
@@ -3861,6 +3874,41 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
         except Exception as e:
             print(f"      ❌ Error navigating to Manuscript Information tab: {e}")
 
+    def navigate_to_default_tab(self):
+        """Return to the default (task) tab of the details page and wait for it.
+
+        Next Document keeps whichever tab was last open, so after reading the
+        Audit Trail the next manuscript would otherwise open on that tab.
+        """
+        default_selectors = [
+            "//td[contains(@class, 'redesigndetailtabon')]//a[contains(@href, 'MANUSCRIPT_DETAILS_SHOW_TAB')]",
+            "//a[contains(@class, 'redesigndetailsontext') and contains(@href, 'MANUSCRIPT_DETAILS_SHOW_TAB')]",
+            "//td[contains(@class, 'redesigndetailtab')]//a",
+        ]
+
+        for selector in default_selectors:
+            try:
+                elements = self.driver.find_elements(By.XPATH, selector)
+            except Exception:
+                continue
+            if not elements:
+                continue
+            try:
+                elements[0].click()
+                WebDriverWait(self.driver, 10).until(
+                    lambda driver: driver.execute_script("return document.readyState") == "complete"
+                )
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.XPATH, default_selectors[-1]))
+                )
+                return True
+            except Exception as e:
+                print(f"      ⚠️ Could not return to default tab: {e}")
+                return False
+
+        print("      ⚠️ Default tab link not found - may already be on it")
+        return False
+
     def extract_manuscript_details_page(self, manuscript):
         """Extract enhanced data from the manuscript details page."""
         try:
@@ -5490,7 +5538,7 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                         pass
 
                     # Extract communication events
-                    communications = self.extract_communication_events()
+                    communications = self.extract_communication_events(manuscript.get("id", ""))
 
                     if communications:
                         # Store raw audit trail events
@@ -5609,10 +5657,11 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
 
             traceback.print_exc()
 
-    def extract_communication_events(self):
-        """Extract individual communication events from audit trail table with pagination."""
+    def extract_communication_events(self, manuscript_id=""):
+        """Extract audit trail events, reading pages only until a stored event is reached."""
         try:
             all_communications = []
+            history = self._audit_history(manuscript_id)
 
             # First, check if there are multiple pages
             total_events = self.get_total_audit_events()
@@ -5620,7 +5669,7 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
 
             print(f"      📊 Found {total_events} total events across {pages_needed} pages")
 
-            # Extract events from each page
+            # ScholarOne lists newest events first, so page 1 holds anything new
             for page_num in range(1, pages_needed + 1):
                 print(f"      📄 Processing page {page_num}/{pages_needed}...")
 
@@ -5643,6 +5692,22 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                     f"         ✅ Extracted {len(page_communications)} events from page {page_num}"
                 )
 
+                if history is not None and not history.add_page(page_communications):
+                    print(f"         ⏭️ Reached stored history on page {page_num}, stopping")
+                    break
+
+            if history is None:
+                return all_communications
+
+            all_communications = history.finish()
+            if history.reached_known:
+                # Keep the email pool complete for the pages that were skipped
+                for event in history.stored:
+                    for field in ("to", "from"):
+                        self._all_page_emails.update(
+                            re.findall(r"[\w\.-]+@[\w\.-]+\.\w+", event.get(field, ""))
+                        )
+                print(f"      📚 {len(history.new)} new + {len(history.stored)} stored audit events")
             return all_communications
 
         except Exception as e:
@@ -6855,7 +6920,7 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
 
         self._dashboard_manifest["scanned"][category_name] = list(manuscript_ids_in_category)
 
-        # Store manuscript IDs in category for 3-pass processing
+        # Store manuscript IDs in category for single-pass processing
         category["manuscript_ids"] = manuscript_ids_in_category
 
         # Update count if different from expected (handle missing count)
@@ -6925,40 +6990,41 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                     print("   ⏳ Waiting for page to load...")
                     time.sleep(3)
 
-        # NEW 3-PASS SYSTEM
-        self.execute_3_pass_extraction(category)
+        self.execute_single_pass_extraction(category)
 
         # Return to AE Center
         self.navigate_to_ae_center()
 
-    def execute_3_pass_extraction(self, category):
-        """Execute the 3-pass system as specified by user."""
+    def execute_single_pass_extraction(self, category):
+        """Visit each manuscript in the category once, reading all three tabs.
+
+        For every manuscript the default page (referees, documents), the
+        Manuscript Information tab and the Audit Trail tab are read before
+        moving on with Next Document, after which the default tab is selected
+        again. This replaces the former forward /
+        backward / forward passes, which loaded every manuscript three times.
+        """
         # NOTE: We're already on the first manuscript details page
         # process_category() already clicked the category and first Take Action link
 
         manuscript_count = category["count"]
         manuscript_ids = []
 
-        print(f"\n🚀 EXECUTING 3-PASS SYSTEM for {manuscript_count} manuscripts")
+        print(f"\n🚀 SINGLE-PASS EXTRACTION for {manuscript_count} manuscripts")
         print("=" * 60)
 
-        # PASS 1: Forward - Referees, PDFs, basic data
-        print(f"\n📋 PASS 1: Forward navigation (1→{manuscript_count}) - Referees & Documents")
-        print("-" * 50)
-
         for i in range(manuscript_count):
             try:
                 # We're already on manuscript 1 for i=0 (process_category clicked it)
                 # For subsequent manuscripts, navigate_next_document() will take us there
-
-                # Get manuscript ID
+                if i > 0:
+                    # Next Document stays on the Audit Trail tab read last
+                    self.navigate_to_default_tab()
                 manuscript_id = self.get_current_manuscript_id()
                 manuscript_ids.append(manuscript_id)
                 self._current_manuscript_id = manuscript_id
-                print(f"   📄 Manuscript {i+1}: {manuscript_id}")
-                self._capture_page("manuscript_default", manuscript_id)
+                print(f"\n   📄 Manuscript {i+1}/{manuscript_count}: {manuscript_id}")
 
-                # Create manuscript object
                 manuscript = {
                     "id": manuscript_id,
                     "category": category["name"],
@@ -6967,179 +7033,121 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                     "authors": [],
                     "editors": [],
                 }
-
-                # Extract basic info from main page (title, status, dates)
-                print("   📋 Extracting basic manuscript info...")
-                self.extract_basic_manuscript_info(manuscript)
-
-                # Extract referees and documents (Pass 1 data)
-                print("   👥 Extracting referees...")
-                self.extract_referees_comprehensive(manuscript)
-                self.extract_referee_emails_from_source(manuscript.get("referees", []))
-
-                print("   📁 Extracting documents...")
-                self.extract_document_links(manuscript)
-
-                if category["name"] == "Awaiting AE Recommendation":
-                    self.extract_ae_recommendation_data(manuscript)
-
-                # Add to manuscripts list
+                self._extract_default_tab(manuscript, category["name"])
                 self.manuscripts.append(manuscript)
                 self.processed_manuscript_ids.add(manuscript_id)
 
-                print(f"   ✅ Pass 1 complete for {manuscript_id}")
-
-                # Navigate to next manuscript if not the last one
-                if i < manuscript_count - 1:
-                    success = self.navigate_next_document()
-                    if not success:
-                        print(f"   ❌ Navigation failed - unable to reach manuscript {i+2}")
-                        break
-
             except Exception as e:
                 print(f"   ❌ Error on manuscript {i+1}: {e}")
-                manuscript_ids.append("UNKNOWN")
-
-        # PASS 2: Backward - Manuscript Information tab
-        print(f"\n📊 PASS 2: Backward navigation ({manuscript_count}→1) - Manuscript Info")
-        print("-" * 50)
-
-        # We should be on the last manuscript after Pass 1
-        # But let's verify where we actually are
-        current_id = self.get_current_manuscript_id()
-        print(f"   📍 Currently on manuscript: {current_id}")
+                if len(manuscript_ids) <= i:
+                    manuscript_ids.append("UNKNOWN")
+                manuscript = None
 
-        # Start from the last manuscript and go backwards
-        for i in range(manuscript_count - 1, -1, -1):
-            try:
-                manuscript_id = manuscript_ids[i]
-                if manuscript_id and manuscript_id not in ["UNKNOWN", "NAVIGATION_FAILED"]:
-                    print(f"   📋 Manuscript {i+1}: {manuscript_id} - Info Tab")
-
-                    # Find the manuscript in our list
-                    manuscript = next(
-                        (m for m in self.manuscripts if m["id"] == manuscript_id), None
-                    )
-                    if manuscript:
-                        # We're already on the manuscript page from Pass 1
-                        # Just navigate to the Manuscript Information tab
-                        self.navigate_to_manuscript_information_tab()
-
-                        # Extract the info from this tab
-                        self.extract_editors_from_details(manuscript)
-                        self.extract_keywords_from_details(manuscript)
-                        self.extract_authors_from_details(manuscript)
-                        self.enrich_authors_from_html(manuscript)
-                        self.extract_recommended_opposed(manuscript)
-                        self.extract_metadata_from_details(manuscript)
-                        self.extract_cover_letter_from_details(manuscript)
+            if manuscript and manuscript_id not in ["", "UNKNOWN", "NAVIGATION_FAILED"]:
+                # Each tab is read independently so one failure doesn't cost the other
+                for read_tab in (self._extract_information_tab, self._extract_audit_tab):
+                    try:
+                        read_tab(manuscript)
+                    except Exception as e:
+                        print(f"   ❌ Error in {read_tab.__name__} for {manuscript_id}: {e}")
+                print(f"   ✅ Complete: {manuscript_id}")
 
-                        try:
-                            manuscript["version_history"] = self.extract_version_history_from_dom(
-                                manuscript
-                            )
-                            manuscript[
-                                "peer_review_milestones"
-                            ] = self.extract_peer_review_milestones()
-                            versions = manuscript["version_history"]
-                            ms_id = manuscript.get("id", "")
-                            is_revision = len(versions) > 1 or ".R" in ms_id
-                            revision_num = 0
-                            if ".R" in ms_id:
-                                rm = re.search(r"\.R(\d+)", ms_id)
-                                if rm:
-                                    revision_num = int(rm.group(1))
-                            elif len(versions) > 1:
-                                max_v = max(v.get("version_number", 0) for v in versions)
-                                if max_v > 0:
-                                    revision_num = max_v
-                                    is_revision = True
-                            manuscript["is_revision"] = is_revision
-                            manuscript["revision_number"] = revision_num
-                            if is_revision:
-                                original_id = re.sub(r"\.R\d+$", "", ms_id)
-                                previous_versions = []
-                                for v in versions:
-                                    if not v.get("is_current_version", False):
-                                        previous_versions.append(
-                                            {
-                                                "id": v["manuscript_id"],
-                                                "date_submitted": v.get("date_submitted", ""),
-                                                "decision_letter_url": v.get(
-                                                    "decision_letter_url", ""
-                                                ),
-                                                "author_response_url": v.get(
-                                                    "author_response_url", ""
-                                                ),
-                                            }
-                                        )
-                                manuscript["revision_info"] = {
-                                    "is_revision": True,
-                                    "revision_number": revision_num,
-                                    "original_manuscript_id": original_id,
-                                    "previous_versions": previous_versions,
-                                }
-                            else:
-                                manuscript["revision_info"] = {}
-                        except Exception as e:
-                            print(f"      ⚠️ Version history/milestones error: {e}")
-                            manuscript.setdefault("version_history", [])
-                            manuscript.setdefault("peer_review_milestones", {})
-                            manuscript.setdefault("revision_info", {})
+            # Navigate to next manuscript if not the last one
+            if i < manuscript_count - 1:
+                if not self.navigate_next_document():
+                    print(f"   ❌ Navigation failed - unable to reach manuscript {i+2}")
+                    break
 
-                        print(f"   ✅ Pass 2 complete for {manuscript_id}")
-                else:
-                    print(f"   ⏭️ Skipping manuscript {i+1} (no ID)")
+        self._finish_category_extraction(manuscript_ids)
 
-                # Navigate to previous manuscript (except on first)
-                if i > 0:
-                    success = self.navigate_previous_document()
-                    if not success:
-                        print("   ⚠️ Could not navigate to previous manuscript")
+    def _extract_default_tab(self, manuscript, category_name):
+        """Basic info, referees and documents from the default details page."""
+        self._capture_page("manuscript_default", manuscript["id"])
 
-            except Exception as e:
-                print(f"   ❌ Error in Pass 2 for manuscript {i+1}: {e}")
+        print("   📋 Extracting basic manuscript info...")
+        self.extract_basic_manuscript_info(manuscript)
 
-        # PASS 3: Forward - Audit Trail tab
-        print(f"\n📜 PASS 3: Forward navigation (1→{manuscript_count}) - Audit Trail")
-        print("-" * 50)
+        print("   👥 Extracting referees...")
+        self.extract_referees_comprehensive(manuscript)
+        self.extract_referee_emails_from_source(manuscript.get("referees", []))
 
-        # We should be on manuscript 1 after Pass 2
-        current_id = self.get_current_manuscript_id()
-        print(f"   📍 Currently on manuscript: {current_id}")
+        print("   📁 Extracting documents...")
+        self.extract_document_links(manuscript)
 
-        for i in range(manuscript_count):
-            try:
-                manuscript_id = manuscript_ids[i]
-                if manuscript_id and manuscript_id not in ["UNKNOWN", "NAVIGATION_FAILED"]:
-                    print(f"   📜 Manuscript {i+1}: {manuscript_id} - Audit Trail")
+        if category_name == "Awaiting AE Recommendation":
+            self.extract_ae_recommendation_data(manuscript)
 
-                    # Find the manuscript in our list
-                    manuscript = next(
-                        (m for m in self.manuscripts if m["id"] == manuscript_id), None
-                    )
-                    if manuscript:
-                        self.extract_audit_trail(manuscript)
-                        try:
-                            src = self.driver.page_source
-                            page_emails = set(re.findall(r"[\w\.-]+@[\w\.-]+\.\w+", src))
-                            self._all_page_emails.update(page_emails)
-                        except Exception:
-                            pass
-                        print(f"   ✅ Pass 3 complete for {manuscript_id}")
-                else:
-                    print(f"   ⏭️ Skipping manuscript {i+1} (no ID)")
+    def _extract_information_tab(self, manuscript):
+        """Editors, authors, keywords, metadata and version history."""
+        print("   📊 Manuscript Information tab")
+        self.navigate_to_manuscript_information_tab()
 
-                # Navigate to next manuscript (except on last)
-                if i < manuscript_count - 1:
-                    success = self.navigate_next_document()
-                    if not success:
-                        print("   ⚠️ Could not navigate to next manuscript")
+        self.extract_editors_from_details(manuscript)
+        self.extract_keywords_from_details(manuscript)
+        self.extract_authors_from_details(manuscript)
+        self.enrich_authors_from_html(manuscript)
+        self.extract_recommended_opposed(manuscript)
+        self.extract_metadata_from_details(manuscript)
+        self.extract_cover_letter_from_details(manuscript)
 
-            except Exception as e:
-                print(f"   ❌ Error in Pass 3 for manuscript {i+1}: {e}")
+        try:
+            manuscript["version_history"] = self.extract_version_history_from_dom(manuscript)
+            manuscript["peer_review_milestones"] = self.extract_peer_review_milestones()
+            versions = manuscript["version_history"]
+            ms_id = manuscript.get("id", "")
+            is_revision = len(versions) > 1 or ".R" in ms_id
+            revision_num = 0
+            if ".R" in ms_id:
+                rm = re.search(r"\.R(\d+)", ms_id)
+                if rm:
+                    revision_num = int(rm.group(1))
+            elif len(versions) > 1:
+                max_v = max(v.get("version_number", 0) for v in versions)
+                if max_v > 0:
+                    revision_num = max_v
+                    is_revision = True
+            manuscript["is_revision"] = is_revision
+            manuscript["revision_number"] = revision_num
+            if is_revision:
+                original_id = re.sub(r"\.R\d+$", "", ms_id)
+                previous_versions = []
+                for v in versions:
+                    if not v.get("is_current_version", False):
+                        previous_versions.append(
+                            {
+                                "id": v["manuscript_id"],
+                                "date_submitted": v.get("date_submitted", ""),
+                                "decision_letter_url": v.get("decision_letter_url", ""),
+                                "author_response_url": v.get("author_response_url", ""),
+                            }
+                        )
+                manuscript["revision_info"] = {
+                    "is_revision": True,
+                    "revision_number": revision_num,
+                    "original_manuscript_id": original_id,
+                    "previous_versions": previous_versions,
+                }
+            else:
+                manuscript["revision_info"] = {}
+        except Exception as e:
+            print(f"      ⚠️ Version history/milestones error: {e}")
+            manuscript.setdefault("version_history", [])
+            manuscript.setdefault("peer_review_milestones", {})
+            manuscript.setdefault("revision_info", {})
+
+    def _extract_audit_tab(self, manuscript):
+        """Audit trail events; also pools page emails for the final matching pass."""
+        print("   📜 Audit Trail tab")
+        self.extract_audit_trail(manuscript)
+        try:
+            src = self.driver.page_source
+            page_emails = set(re.findall(r"[\w\.-]+@[\w\.-]+\.\w+", src))
+            self._all_page_emails.update(page_emails)
+        except Exception:
+            pass
 
-        print("\n🎉 3-PASS EXTRACTION COMPLETE")
+    def _finish_category_extraction(self, manuscript_ids):
+        print("\n🎉 SINGLE-PASS EXTRACTION COMPLETE")
         print(f"   Processed {len([m for m in manuscript_ids if m])} manuscripts")
         print("=" * 60)
 
@@ -7924,7 +7932,14 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
                         f"\n📜 REVISION PASS for {manuscript.get('id', '?')}: {len(previous_versions)} previous version(s)"
                     )
                     for pv in previous_versions:
-                        prev_data = self.extract_previous_version_data(pv, manuscript["id"])
+                        prev_data = self.cached_artifact(
+                            "previous_version",
+                            pv.get("manuscript_id", ""),
+                            lambda pv=pv, ms=manuscript: self.extract_previous_version_data(
+                                pv, ms["id"]
+                            ),
+                            keep=lambda data: bool(data.get("referees") or data.get("audit_trail")),
+                        )
                         if prev_data and (
                             prev_data.get("referees") or prev_data.get("audit_trail")
                         ):
@@ -9141,15 +9156,7 @@ class ComprehensiveMFExtractor(ScholarOneBaseExtractor):
 
     def names_similar(self, name1, name2):
         """Check if two names are similar (for fuzzy matching)."""
-        # Simple similarity check - can be enhanced
-        name1_parts = set(name1.lower().split())
-        name2_parts = set(name2.lower().split())
-
-        # If names share at least 2 parts or are very similar length
-        common_parts = name1_parts.intersection(name2_parts)
-        return len(common_parts) >= 2 or (
-            abs(len(name1) - len(name2)) < 3 and len(common_parts) >= 1
-        )
+        return names_match(name1, name2) or orderless_key(name1) == orderless_key(name2)
 
     def infer_country_from_institution(self, institution):
         """Infer country from institution name."""
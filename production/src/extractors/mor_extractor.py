@@ -579,8 +579,8 @@ class MORExtractor(ScholarOneBaseExtractor):
 
         return parsed
 
-    def extract_complete_audit_trail(self) -> list[dict]:
-        """Extract complete audit trail with robust pagination"""
+    def extract_complete_audit_trail(self, manuscript_id: str = "") -> list[dict]:
+        """Extract the audit trail, paging only until a stored event is reached."""
         print("      📜 Extracting complete audit trail...")
 
         if not self.is_session_alive():
@@ -589,6 +589,7 @@ class MORExtractor(ScholarOneBaseExtractor):
 
         all_events = []
         seen_events = set()
+        history = self._audit_history(manuscript_id)
 
         try:
             # Navigate to Audit Trail tab
@@ -677,6 +678,12 @@ class MORExtractor(ScholarOneBaseExtractor):
                 else:
                     consecutive_empty += 1
 
+                if history is not None and not history.add_page(
+                    all_events[-new_events:] if new_events else []
+                ):
+                    print(f"         ⏭️ Reached stored history on page {page_num}, stopping")
+                    break
+
                 # Navigate to next page
                 next_found = False
 
@@ -725,6 +732,13 @@ class MORExtractor(ScholarOneBaseExtractor):
 
             print(f"         📊 Total: {len(all_events)} events from {page_num} pages")
 
+            if history is not None:
+                all_events = history.finish()
+                if history.reached_known:
+                    print(
+                        f"         📚 {len(history.new)} new + {len(history.stored)} stored events"
+                    )
+
             # Sort events by date (newest first)
             all_events.sort(key=lambda x: x["date"], reverse=True)
 
@@ -1271,52 +1285,28 @@ class MORExtractor(ScholarOneBaseExtractor):
                 print(f"      🔄 Revision #{revision_num} of {original_id}")
 
                 for pv in previous_versions:
-                    dl_url = pv.get("decision_letter_url", "")
-                    if dl_url:
-                        dl_text = self.extract_decision_letter_from_popup(dl_url)
-                        if dl_text:
-                            pv["decision_letter_text"] = dl_text
-                            print(f"         📨 Decision letter extracted: {len(dl_text)} chars")
-                    ar_url = pv.get("author_response_url", "")
-                    if ar_url:
-                        ar_text = self.extract_author_response_from_popup(ar_url)
-                        if ar_text:
-                            pv["author_response_text"] = ar_text
-                            print(f"         📝 Author response extracted: {len(ar_text)} chars")
-                    rd_url = pv.get("review_details_url", "") or manuscript_data.get(
-                        "_review_details_url", ""
+                    pv.update(
+                        self.cached_artifact(
+                            "previous_version",
+                            pv.get("id", ""),
+                            lambda pv=pv: self._extract_previous_version(
+                                pv, manuscript_id, manuscript_data
+                            ),
+                            keep=lambda data: bool(data.get("referees") or data.get("audit_trail")),
+                        )
                     )
-                    if rd_url:
-                        rd = self.extract_review_details_from_popup(rd_url)
-                        if rd:
-                            pv["review_details"] = rd
-
-                    prev_version_data = self.extract_previous_version_data(pv, manuscript_id)
-                    pv["referees"] = prev_version_data.get("referees", [])
-                    pv["authors"] = prev_version_data.get("authors", [])
-                    pv["audit_trail"] = prev_version_data.get("audit_trail", [])
-                    if prev_version_data.get("review_details") and not pv.get("review_details"):
-                        pv["review_details"] = prev_version_data["review_details"]
-                    if prev_version_data.get("decision_letter_text") and not pv.get(
-                        "decision_letter_text"
-                    ):
-                        pv["decision_letter_text"] = prev_version_data["decision_letter_text"]
-                    if prev_version_data.get("author_response_text") and not pv.get(
-                        "author_response_text"
-                    ):
-                        pv["author_response_text"] = prev_version_data["author_response_text"]
 
             current_v = next((v for v in versions if v.get("is_current_version")), None)
             if current_v:
                 dl_url = current_v.get("decision_letter_url", "")
                 if dl_url:
-                    dl_text = self.extract_decision_letter_from_popup(dl_url)
+                    dl_text = self.extract_decision_letter_from_popup(dl_url, manuscript_id)
                     if dl_text:
                         manuscript_data["decision_letter_text"] = dl_text
                         print(f"      📨 Current version decision letter: {len(dl_text)} chars")
                 ar_url = current_v.get("author_response_url", "")
                 if ar_url:
-                    ar_text = self.extract_author_response_from_popup(ar_url)
+                    ar_text = self.extract_author_response_from_popup(ar_url, manuscript_id)
                     if ar_text:
                         manuscript_data["author_response_text"] = ar_text
                         print(f"      📝 Current version author response: {len(ar_text)} chars")
@@ -1360,7 +1350,7 @@ class MORExtractor(ScholarOneBaseExtractor):
         print("\n   🔄 PASS 5: AUDIT TRAIL")
         print("   " + "-" * 25)
         try:
-            manuscript_data["audit_trail"] = self.extract_complete_audit_trail()
+            manuscript_data["audit_trail"] = self.extract_complete_audit_trail(manuscript_id)
         except Exception as e:
             print(f"      ❌ Audit trail error: {str(e)[:50]}")
             manuscript_data["audit_trail"] = []
@@ -2157,6 +2147,42 @@ class MORExtractor(ScholarOneBaseExtractor):
                 pass
             return None
 
+    def _extract_previous_version(
+        self, pv: dict, manuscript_id: str, manuscript_data: dict
+    ) -> dict:
+        """Popup and switched-page data for one previous version.
+
+        Returns only the extracted fields (not the session-bound popup URLs)
+        so the result can be cached as an immutable artifact.
+        """
+        data = {}
+        dl_url = pv.get("decision_letter_url", "")
+        if dl_url:
+            dl_text = self.extract_decision_letter_from_popup(dl_url, pv.get("id", ""))
+            if dl_text:
+                data["decision_letter_text"] = dl_text
+                print(f"         📨 Decision letter extracted: {len(dl_text)} chars")
+        ar_url = pv.get("author_response_url", "")
+        if ar_url:
+            ar_text = self.extract_author_response_from_popup(ar_url, pv.get("id", ""))
+            if ar_text:
+                data["author_response_text"] = ar_text
+                print(f"         📝 Author response extracted: {len(ar_text)} chars")
+        rd_url = pv.get("review_details_url", "") or manuscript_data.get("_review_details_url", "")
+        if rd_url:
+            rd = self.extract_review_details_from_popup(rd_url)
+            if rd:
+                data["review_details"] = rd
+
+        prev_version_data = self.extract_previous_version_data(pv, manuscript_id)
+        data["referees"] = prev_version_data.get("referees", [])
+        data["authors"] = prev_version_data.get("authors", [])
+        data["audit_trail"] = prev_version_data.get("audit_trail", [])
+        for key in ("review_details", "decision_letter_text", "author_response_text"):
+            if prev_version_data.get(key) and not data.get(key):
+                data[key] = prev_version_data[key]
+        return data
+
     def extract_previous_version_data(self, version_info: dict, current_manuscript_id: str) -> dict:
         prev_data = {
             "manuscript_id": version_info.get("id", ""),
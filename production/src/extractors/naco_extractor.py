@@ -25,6 +25,8 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from core.cache_integration import CachedExtractorMixin
+from core.http_fetcher import HTTPPageFetcher
+from core.resource_policy import apply_resource_policy
 from core.web_enrichment import enrich_people_from_web
 
 try:
@@ -39,7 +41,9 @@ class NACOExtractor(CachedExtractorMixin):
     JOURNAL_CODE = "NACO"
     JOURNAL_NAME = "Numerical Algebra, Control and Optimization"
     LOGIN_URL = "https://ef.msp.org/login.php"
+    BASE_URL = "https://ef.msp.org"
     PLATFORM = "EditFlow (MSP)"
+    HTTP_MAX_PER_HOST = 4
 
     SESSION_DEATH_KEYWORDS = [
         "httpconnectionpool",
@@ -79,6 +83,8 @@ class NACOExtractor(CachedExtractorMixin):
             self.logger.setLevel(logging.INFO)
 
         self.ae_filter = os.environ.get("NACO_AE_FILTER", "Possamai")
+        self.engine = os.environ.get("NACO_ENGINE", "http").lower()
+        self.http = None
 
         self.init_cached_extractor(self.JOURNAL_CODE)
 
@@ -102,6 +108,7 @@ class NACOExtractor(CachedExtractorMixin):
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
         self.wait = WebDriverWait(self.driver, 20)
+        apply_resource_policy(self.driver, "editflow")
         self.logger.info("Browser ready")
 
     def login(self) -> bool:
@@ -151,6 +158,132 @@ class NACOExtractor(CachedExtractorMixin):
             self._save_debug_html("login_error")
             return False
 
+    # --- HTTP engine (no browser) ---
+
+    @staticmethod
+    def _find_mine_href(soup: BeautifulSoup) -> str:
+        for link in soup.find_all("a", href=True):
+            text = link.get_text(strip=True).lower()
+            if text == "mine" or "mine" in link["href"].lower():
+                return link["href"]
+        return ""
+
+    def login_http(self) -> str | None:
+        """Log in with a form POST; return the post-login HTML or None."""
+        if not self.username or not self.password:
+            self.logger.error("NACO_USERNAME / NACO_PASSWORD not set")
+            return None
+
+        # Only an authenticated fetcher is kept on self: report downloads
+        # prefer self.http over the browser's cookies.
+        http = HTTPPageFetcher(
+            max_per_host=self.HTTP_MAX_PER_HOST, login_markers=('name="signin"',)
+        )
+        try:
+            home_html = self._submit_http_login(http)
+        except Exception:
+            http.close()
+            raise
+        if home_html is None:
+            http.close()
+            return None
+        self.http = http
+        self.logger.info("HTTP login successful")
+        return home_html
+
+    def _submit_http_login(self, http: HTTPPageFetcher) -> str | None:
+        from urllib.parse import urljoin
+
+        session = http.session
+        resp = session.get(self.LOGIN_URL, timeout=http.timeout)
+        resp.raise_for_status()
+        soup = BeautifulSoup(resp.text, "html.parser")
+
+        login_input = soup.find("input", id="login")
+        form = login_input.find_parent("form") if login_input else None
+        if not form:
+            self.logger.warning("HTTP login form not found")
+            return None
+
+        data = {}
+        for inp in form.find_all("input"):
+            name = inp.get("name")
+            if name and inp.get("type", "text") not in ("submit", "image", "button"):
+                data[name] = inp.get("value", "")
+        data[login_input.get("name") or "login"] = self.username
+        data["password"] = self.password
+        signin = form.find("input", attrs={"type": "submit", "name": "signin"})
+        data["signin"] = signin.get("value", "Sign in") if signin else "Sign in"
+
+        action = urljoin(self.LOGIN_URL, form.get("action") or self.LOGIN_URL)
+        resp = session.post(action, data=data, timeout=http.timeout)
+        if not resp.ok or not self._find_mine_href(BeautifulSoup(resp.text, "html.parser")):
+            self.logger.warning("HTTP login did not reach a page with a 'Mine' link")
+            return None
+        return resp.text
+
+    def _run_http(self) -> list[dict[str, Any]] | None:
+        """Crawl the Mine listing and detail pages over HTTP.
+
+        Returns ``None`` when anything fails, so ``run`` falls back to Selenium;
+        the HTTP session is then dropped so nothing downstream uses it.
+        Manuscripts whose detail page could not be fetched are queued in
+        ``_pending_detail_ids`` for the browser.
+        """
+        manuscripts = self._crawl_http()
+        if manuscripts is None and self.http is not None:
+            self.http.close()
+            self.http = None
+        return manuscripts
+
+    def _crawl_http(self) -> list[dict[str, Any]] | None:
+        from urllib.parse import urljoin
+
+        t0 = time.time()
+        try:
+            home_html = self.login_http()
+            if home_html is None:
+                return None
+            mine_href = self._find_mine_href(BeautifulSoup(home_html, "html.parser"))
+            mine_html = self.http.fetch(urljoin(self.BASE_URL + "/", mine_href))
+            if mine_html is None:
+                return None
+            self._save_debug_html("mine_page", mine_html)
+            manuscripts = self.parse_manuscripts(mine_html)
+
+            urls = {
+                ms["manuscript_id"]: self._detail_url(ms["manuscript_id"]) for ms in manuscripts
+            }
+            pages = self.http.fetch_many(u for u in urls.values() if u)
+            for ms in manuscripts:
+                html = pages.get(urls[ms["manuscript_id"]] or "")
+                if html is None:
+                    self._pending_detail_ids.add(ms["manuscript_id"])
+                    continue
+                try:
+                    self._enrich_manuscript_from_detail_page(ms, html)
+                except Exception as e:
+                    print(f"      ⚠️ Detail-page enrichment error: {str(e)[:60]}")
+        except Exception as e:
+            self.logger.warning(f"HTTP engine failed, falling back to Selenium: {e}")
+            return None
+
+        self.logger.info(
+            f"HTTP engine: {len(manuscripts)} manuscripts in {time.time() - t0:.1f}s "
+            f"({self.http.stats})"
+        )
+        return manuscripts
+
+    def _start_browser(self) -> bool:
+        self.setup_driver()
+        if not self.login():
+            print("❌ Login failed")
+            return False
+        if not self.navigate_to_mine():
+            print("❌ Could not navigate to Mine page")
+            return False
+        return True
+
     def _is_logged_in(self) -> bool:
         selectors = [
             (By.LINK_TEXT, "Mine"),
@@ -230,8 +363,8 @@ class NACOExtractor(CachedExtractorMixin):
             self._save_debug_html("mine_click_error")
             return False
 
-    def parse_manuscripts(self) -> list[dict[str, Any]]:
-        soup = BeautifulSoup(self.driver.page_source, "html.parser")
+    def parse_manuscripts(self, html: str | None = None) -> list[dict[str, Any]]:
+        soup = BeautifulSoup(html if html is not None else self.driver.page_source, "html.parser")
         articles = soup.find_all("article", class_="JournalView-Listing")
 
         if not articles:
@@ -378,11 +511,7 @@ class NACOExtractor(CachedExtractorMixin):
         if not getattr(self, "driver", None):
             return False
 
-        target = article_url
-        if not target:
-            num_match = re.search(r"(\d+)$", manuscript_id or "")
-            if num_match:
-                target = f"https://ef.msp.org/article.php?id={num_match.group(1)}"
+        target = article_url or self._detail_url(manuscript_id)
         if not target:
             return False
 
@@ -395,6 +524,13 @@ class NACOExtractor(CachedExtractorMixin):
             self.logger.warning(f"Failed to navigate to detail page for {manuscript_id}: {e}")
             return False
 
+    @staticmethod
+    def _detail_url(manuscript_id: str) -> str:
+        num_match = re.search(r"(\d+)$", manuscript_id or "")
+        if num_match:
+            return f"https://ef.msp.org/article.php?id={num_match.group(1)}"
+        return ""
+
     def _extract_referees_from_detail_page(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
         """Extract referees from the EditFlow per-manuscript detail page.
 
@@ -564,7 +700,8 @@ class NACOExtractor(CachedExtractorMixin):
         For a PDF, delegate to fs_extractor's helpers (already imported by the
         FS extractor). Returns a canonical report dict or None on failure.
         """
-        if not report_url or not self.driver:
+        http = getattr(self, "http", None)
+        if not report_url or not (self.driver or http):
             return None
 
         absolute = report_url
@@ -577,10 +714,13 @@ class NACOExtractor(CachedExtractorMixin):
         local_pdf = None
         if is_pdf:
             try:
-                import requests
+                if http is not None:
+                    r = http.session.get(absolute, timeout=30)
+                else:
+                    import requests
 
-                cookies = {c["name"]: c["value"] for c in (self.driver.get_cookies() or [])}
-                r = requests.get(absolute, cookies=cookies, timeout=30)
+                    cookies = {c["name"]: c["value"] for c in (self.driver.get_cookies() or [])}
+                    r = requests.get(absolute, cookies=cookies, timeout=30)
                 if r.ok and r.headers.get("content-type", "").startswith(
                     ("application/pdf", "application/octet-stream")
                 ):
@@ -622,13 +762,15 @@ class NACOExtractor(CachedExtractorMixin):
                 return report
 
         try:
-            current = self.driver.current_url
-            self.driver.get(absolute)
-            time.sleep(2)
-            page_src = self.driver.page_source
+            page_src = http.fetch(absolute) if http is not None else None
+            if page_src is None:
+                current = self.driver.current_url
+                self.driver.get(absolute)
+                time.sleep(2)
+                page_src = self.driver.page_source
+                self.driver.get(current)  # restore
             soup = BeautifulSoup(page_src, "html.parser")
             text = soup.get_text(separator="\n", strip=True)
-            self.driver.get(current)  # restore
         except Exception as e:
             self.logger.warning(f"Failed to load report URL {absolute}: {e}")
             return None
@@ -673,24 +815,29 @@ class NACOExtractor(CachedExtractorMixin):
             "available": True,
         }
 
-    def _enrich_manuscript_from_detail_page(self, ms: dict) -> None:
-        """For a manuscript already parsed from the AE listing, navigate to the
+    def _enrich_manuscript_from_detail_page(self, ms: dict, html: str | None = None) -> None:
+        """For a manuscript already parsed from the AE listing, parse the
         detail page and append referee + report data.
 
-        This is the wire-up for live extraction. Defensive: any failure leaves
-        the manuscript untouched.
+        ``html`` is the detail page fetched by the HTTP engine; without it the
+        browser navigates there. Defensive: any failure leaves the manuscript
+        untouched.
         """
         ms_id = ms.get("manuscript_id", "")
         if not ms_id:
             return
 
-        if not self._navigate_to_manuscript_detail(ms_id):
-            return
+        if html is None:
+            if not self._navigate_to_manuscript_detail(ms_id):
+                return
+            try:
+                html = self.driver.page_source
+            except Exception:
+                return
+        else:
+            self._save_debug_html(f"detail_{ms_id}", html)
 
-        try:
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-        except Exception:
-            return
+        soup = BeautifulSoup(html, "html.parser")
 
         detail_referees = self._extract_referees_from_detail_page(soup)
         if not detail_referees:
@@ -784,6 +931,7 @@ class NACOExtractor(CachedExtractorMixin):
             get_cached_web_profile=self.get_cached_web_profile,
             save_web_profile=self.save_web_profile,
             platform_label="editflow_metadata",
+            defer_to=self.JOURNAL_CODE,
         )
 
     # --- Gmail Integration ---
@@ -1150,12 +1298,12 @@ class NACOExtractor(CachedExtractorMixin):
 
         self.logger.info(f"Results saved: {output_file}")
 
-    def _save_debug_html(self, suffix: str):
+    def _save_debug_html(self, suffix: str, html: str | None = None):
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = self.debug_dir / f"naco_debug_{suffix}_{timestamp}.html"
             with open(filename, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
+                f.write(html if html is not None else self.driver.page_source)
             self.logger.debug(f"Debug HTML saved: {filename}")
         except Exception as e:
             self.logger.warning(f"Failed to save debug HTML: {e}")
@@ -1176,17 +1324,16 @@ class NACOExtractor(CachedExtractorMixin):
         print("=" * 60)
 
         try:
-            self.setup_driver()
-
-            if not self.login():
-                print("❌ Login failed")
-                return []
-
-            if not self.navigate_to_mine():
-                print("❌ Could not navigate to Mine page")
-                return []
-
-            self.manuscripts = self.parse_manuscripts()
+            self._pending_detail_ids = set()
+            manuscripts = self._run_http() if self.engine == "http" else None
+
+            if manuscripts is None:
+                if not self._start_browser():
+                    return []
+                self.manuscripts = self.parse_manuscripts()
+                self._pending_detail_ids = {ms.get("manuscript_id", "") for ms in self.manuscripts}
+            else:
+                self.manuscripts = manuscripts
 
             if not self.manuscripts:
                 print("ℹ️  No manuscripts in AE queue (expected if none assigned)")
@@ -1200,11 +1347,14 @@ class NACOExtractor(CachedExtractorMixin):
 
                 # Detail-page enrichment: pulls referees + reports from the
                 # per-manuscript article page (scaffolding; refines after first
-                # live capture). Defensive — never raises.
-                try:
-                    self._enrich_manuscript_from_detail_page(ms)
-                except Exception as e:
-                    print(f"      ⚠️ Detail-page enrichment error: {str(e)[:60]}")
+                # live capture). Defensive — never raises. Pages already parsed
+                # by the HTTP engine are skipped.
+                if ms_id in self._pending_detail_ids:
+                    try:
+                        if self.driver or self._start_browser():
+                            self._enrich_manuscript_from_detail_page(ms)
+                    except Exception as e:
+                        print(f"      ⚠️ Detail-page enrichment error: {str(e)[:60]}")
 
                 try:
                     self._enrich_people_from_web(ms)
@@ -1236,6 +1386,9 @@ class NACOExtractor(CachedExtractorMixin):
             return self.manuscripts
 
         finally:
+            if self.http is not None:
+                self.http.close()
+                self.http = None
             self.cleanup_driver()
 
 
@@ -4,6 +4,8 @@ import json
 import unicodedata
 from pathlib import Path
 
+from core.identity_index import orderless_key as normalize_name_orderless  # noqa: F401
+
 PRODUCTION_DIR = Path(__file__).resolve().parents[2]
 OUTPUTS_DIR = PRODUCTION_DIR / "outputs"
 MODELS_DIR = PRODUCTION_DIR / "models"
@@ -12,6 +14,10 @@ JOURNALS = ["mf", "mor", "fs", "jota", "mafe", "sicon", "sifin", "naco", "mf_wil
 
 H_INDEX_CAP = 40
 
+# Cross-validation fans folds out to all cores from this many samples; below
+# it, process start-up costs more than the folds themselves.
+PARALLEL_CV_MIN_SAMPLES = 500
+
 FREEMAIL_DOMAINS = {
     "gmail.com",
     "yahoo.com",
@@ -31,21 +37,58 @@ FREEMAIL_DOMAINS = {
 
 
 def _load_json(path: Path) -> dict:
+    from core.snapshot_archive import load_snapshot
+
     try:
-        with open(path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return load_snapshot(path)
+    except (json.JSONDecodeError, OSError, ValueError):
         return {}
 
 
-def normalize_name(s: str) -> str:
-    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode().lower().strip()
+def extraction_files(journal_dir: Path) -> list[Path]:
+    """Extraction snapshots in ``journal_dir``, plain JSON or archived manifests."""
+    from core.snapshot_archive import glob_snapshots
+
+    return glob_snapshots(journal_dir, "*_extraction_*.json")
+
+
+def file_stamps(paths) -> tuple:
+    """``(mtime_ns, size)`` per path (None if missing), to notice rewritten artifacts."""
+    stamps = []
+    for path in paths:
+        try:
+            st = Path(path).stat()
+        except OSError:
+            stamps.append(None)
+            continue
+        stamps.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamps)
+
+
+def cv_jobs(n_samples: int) -> int:
+    """``n_jobs`` for ``cross_val_score`` on ``n_samples`` rows."""
+    return -1 if n_samples >= PARALLEL_CV_MIN_SAMPLES else 1
 
 
-def normalize_name_orderless(s: str) -> str:
-    import re
+def dump_joblib(obj, path: Path):
+    """``joblib.dump`` through a temp file, so readers never load a half-written artifact."""
+    import os
 
-    base = normalize_name(s)
-    base = re.sub(r"[,;.]+", " ", base)
-    parts = sorted(base.split())
-    return " ".join(parts)
+    import joblib
+
+    tmp = path.with_name(path.name + ".tmp")
+    joblib.dump(obj, tmp)
+    os.replace(tmp, path)
+
+
+def _iter_changed_manuscripts(path: Path, last_hashes: dict):
+    from core.snapshot_archive import iter_changed_records
+
+    try:
+        yield from iter_changed_records(path, last_hashes)
+    except (json.JSONDecodeError, OSError, ValueError):
+        return
+
+
+def normalize_name(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode().lower().strip()
@@ -0,0 +1,320 @@
+"""Local co-authorship graph for conflict-of-interest checks.
+
+Papers seen in OpenAlex/Semantic Scholar responses, enriched profiles and the
+manuscripts themselves are stored as a bipartite author-paper graph in CSR
+form (``indptr``/``indices`` arrays, one pair per direction) under
+``models/coauthor_graph/``. The arrays are memory-mapped on load, so
+"have X and Y co-authored (within N years)?" and "are X and Y within distance
+2?" are a few array slices and intersections.
+
+A person is recorded under every key we know for them (Semantic Scholar and
+OpenAlex author ids, ORCID, email, orderless name). Lookups use the orderless
+name only when none of the person's author ids or ORCID is in the graph, so
+two people sharing a name don't pool their papers. Papers are keyed by
+normalized title so the same paper from different sources becomes one node.
+"""
+
+import datetime
+import os
+import re
+import shutil
+from pathlib import Path
+
+import numpy as np
+from core.identity_index import normalize, orcid_of, orderless_key
+
+from pipeline import MODELS_DIR, _load_json, extraction_files
+
+GRAPH_DIR = MODELS_DIR / "coauthor_graph"
+
+# Keys the paper sources carry; a person with one of these in the graph isn't
+# looked up by name
+ID_PREFIXES = ("s2:", "oa:", "orcid:")
+
+# Titles shorter than this ("Preface", "Editorial") would merge unrelated papers
+MIN_TITLE_WORDS = 3
+
+_ARRAYS = ("years", "p_indptr", "p_indices", "a_indptr", "a_indices")
+
+
+def paper_key(title: str) -> str:
+    words = re.findall(r"[a-z0-9]+", normalize(title or ""))
+    return " ".join(words) if len(words) >= MIN_TITLE_WORDS else ""
+
+
+def _short_id(value) -> str:
+    return str(value or "").rstrip("/").rsplit("/", 1)[-1]
+
+
+def person_keys(person: dict) -> list[str]:
+    """Every graph key identifying ``person`` (profile ids, ORCID, email, name)."""
+    keys = []
+    wp = person.get("web_profile") or {}
+    s2_id = (wp.get("semantic_scholar") or {}).get("author_id")
+    if s2_id:
+        keys.append(f"s2:{s2_id}")
+    oa_id = (wp.get("openalex") or {}).get("author_id")
+    if oa_id:
+        keys.append(f"oa:{_short_id(oa_id)}")
+    orcid = orcid_of(person.get("orcid") or "")
+    if orcid:
+        keys.append(f"orcid:{orcid}")
+    email = (person.get("email") or "").strip().lower()
+    if email:
+        keys.append(f"email:{email}")
+    name = orderless_key(person.get("name") or "")
+    if name:
+        keys.append(f"name:{name}")
+    return keys
+
+
+class CoauthorGraph:
+    def __init__(self, path: Path = None):
+        self.path = path or GRAPH_DIR
+        self.author_keys: list[str] = []
+        self.titles: list[str] = []
+        self._aid: dict[str, int] = {}
+        self._pid: dict[str, int] | None = {}
+        self.years = np.zeros(0, dtype=np.int16)
+        self.p_indptr = np.zeros(1, dtype=np.int64)
+        self.p_indices = np.zeros(0, dtype=np.int32)
+        self.a_indptr = np.zeros(1, dtype=np.int64)
+        self.a_indices = np.zeros(0, dtype=np.int32)
+        self._new_years: list[int] = []
+        self._pending: list[tuple[int, int]] = []
+        self.dirty = False
+
+    # -- storage ----------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Path = None) -> "CoauthorGraph":
+        graph = cls(path)
+        base = graph.path
+        if not (base / "a_indices.npy").exists():
+            return graph
+        graph.author_keys = (base / "authors.txt").read_text().splitlines()
+        graph.titles = (base / "papers.txt").read_text().splitlines()
+        graph._aid = {k: i for i, k in enumerate(graph.author_keys)}
+        graph._pid = None  # built on first add_paper; queries never need it
+        for name in _ARRAYS:
+            setattr(graph, name, np.load(base / f"{name}.npy", mmap_mode="r"))
+        return graph
+
+    def save(self):
+        self._compact()
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        (tmp / "authors.txt").write_text("\n".join(self.author_keys))
+        (tmp / "papers.txt").write_text("\n".join(self.titles))
+        for name in _ARRAYS:
+            np.save(tmp / f"{name}.npy", np.asarray(getattr(self, name)))
+        old = self.path.with_name(self.path.name + ".old")
+        shutil.rmtree(old, ignore_errors=True)
+        if self.path.exists():
+            os.replace(self.path, old)
+        os.replace(tmp, self.path)
+        shutil.rmtree(old, ignore_errors=True)
+        self.dirty = False
+
+    @property
+    def n_papers(self) -> int:
+        return len(self.titles)
+
+    @property
+    def n_authors(self) -> int:
+        return len(self.author_keys)
+
+    # -- ingestion --------------------------------------------------------
+
+    def add_paper(self, title: str, year, author_keys) -> bool:
+        """Record a paper and its authors (each author given as a list of keys)."""
+        key = paper_key(title)
+        if not key:
+            return False
+        if self._pid is None:
+            self._pid = {paper_key(t): i for i, t in enumerate(self.titles)}
+        pid = self._pid.get(key)
+        if pid is None:
+            pid = self._pid[key] = len(self.titles)
+            self.titles.append(" ".join(str(title).split()))
+            self._new_years.append(_year(year))
+        for keys in author_keys:
+            for k in keys:
+                aid = self._aid.get(k)
+                if aid is None:
+                    aid = self._aid[k] = len(self.author_keys)
+                    self.author_keys.append(k)
+                self._pending.append((pid, aid))
+        self.dirty = True
+        return True
+
+    def add_openalex_work(self, work: dict) -> bool:
+        authors = []
+        for authorship in work.get("authorships") or []:
+            author = authorship.get("author") or {}
+            keys = []
+            if author.get("id"):
+                keys.append(f"oa:{_short_id(author['id'])}")
+            orcid = orcid_of(author.get("orcid") or "")
+            if orcid:
+                keys.append(f"orcid:{orcid}")
+            name = orderless_key(author.get("display_name") or "")
+            if name:
+                keys.append(f"name:{name}")
+            authors.append(keys)
+        title = work.get("title") or work.get("display_name") or ""
+        return self.add_paper(title, work.get("publication_year"), authors)
+
+    def add_s2_paper(self, paper: dict) -> bool:
+        authors = []
+        for author in paper.get("authors") or []:
+            keys = [f"s2:{author['authorId']}"] if author.get("authorId") else []
+            name = orderless_key(author.get("name") or "")
+            if name:
+                keys.append(f"name:{name}")
+            authors.append(keys)
+        return self.add_paper(paper.get("title") or "", paper.get("year"), authors)
+
+    def add_profile_papers(self, person: dict) -> int:
+        """Papers listed in a person's web profile, authored by that person."""
+        keys = person_keys(person)
+        s2 = ((person.get("web_profile") or {}).get("semantic_scholar")) or {}
+        added = 0
+        for paper in s2.get("top_papers") or []:
+            added += self.add_paper(paper.get("title") or "", paper.get("year"), [keys])
+        return added
+
+    def add_manuscript(self, manuscript: dict) -> int:
+        """The manuscript itself (its authors are co-authors) and its people's papers."""
+        authors = [a for a in manuscript.get("authors") or [] if isinstance(a, dict)]
+        added = self.add_paper(
+            manuscript.get("title") or "",
+            (manuscript.get("submission_date") or "")[:4],
+            [person_keys(a) for a in authors],
+        )
+        for person in authors + list(manuscript.get("referees") or []):
+            if isinstance(person, dict):
+                added += self.add_profile_papers(person)
+        return added
+
+    def ingest_outputs(self, outputs_dir: Path, journals: list = None) -> int:
+        """Seed from the latest extraction of each journal."""
+        journals = journals or [d.name for d in Path(outputs_dir).iterdir() if d.is_dir()]
+        added = 0
+        for journal in journals:
+            files = extraction_files(Path(outputs_dir) / journal)
+            if not files:
+                continue
+            latest = max(files, key=lambda p: p.stat().st_mtime)
+            for ms in _load_json(latest).get("manuscripts", []) or []:
+                added += self.add_manuscript(ms)
+        return added
+
+    def _compact(self):
+        if not self._pending and not self._new_years:
+            return
+        n_papers, n_authors = self.n_papers, self.n_authors
+        old_p = np.repeat(np.arange(len(self.p_indptr) - 1, dtype=np.int64), np.diff(self.p_indptr))
+        new = np.array(self._pending, dtype=np.int64).reshape(-1, 2)
+        edges = np.unique(
+            np.concatenate([np.stack([old_p, np.asarray(self.p_indices, np.int64)], 1), new]),
+            axis=0,
+        )
+        self.p_indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(edges[:, 0], minlength=n_papers))]
+        ).astype(np.int64)
+        self.p_indices = edges[:, 1].astype(np.int32)
+        by_author = np.lexsort((edges[:, 0], edges[:, 1]))
+        self.a_indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(edges[:, 1], minlength=n_authors))]
+        ).astype(np.int64)
+        self.a_indices = edges[by_author, 0].astype(np.int32)
+        self.years = np.concatenate(
+            [np.asarray(self.years), np.array(self._new_years, dtype=np.int16)]
+        )
+        self._pending, self._new_years = [], []
+
+    # -- queries ----------------------------------------------------------
+
+    def _nodes(self, keys) -> np.ndarray:
+        return np.array(sorted({self._aid[k] for k in keys if k in self._aid}), dtype=np.int64)
+
+    def _lookup(self, keys) -> np.ndarray:
+        """Nodes for a person, without the name node if one of their ids is known."""
+        keys = list(keys)
+        if any(k.startswith(ID_PREFIXES) and k in self._aid for k in keys):
+            keys = [k for k in keys if not k.startswith("name:")]
+        return self._nodes(keys)
+
+    def papers_of(self, keys) -> np.ndarray:
+        self._compact()
+        nodes = self._lookup(keys)
+        if not nodes.size:
+            return nodes
+        return np.unique(
+            np.concatenate([self.a_indices[self.a_indptr[i] : self.a_indptr[i + 1]] for i in nodes])
+        )
+
+    def coauthors_of(self, keys) -> np.ndarray:
+        papers = self.papers_of(keys)
+        if not papers.size:
+            return papers
+        authors = np.unique(
+            np.concatenate(
+                [self.p_indices[self.p_indptr[p] : self.p_indptr[p + 1]] for p in papers]
+            )
+        )
+        return np.setdiff1d(authors, self._nodes(keys), assume_unique=True)
+
+    def shared_papers(self, x_keys, y_keys, within_years: int = None) -> list[tuple[str, int]]:
+        """(title, year) of papers both people authored, newest first; year 0 = unknown."""
+        common = np.intersect1d(self.papers_of(x_keys), self.papers_of(y_keys))
+        if within_years is not None and common.size:
+            years = np.asarray(self.years)[common]
+            cutoff = datetime.date.today().year - within_years
+            common = common[(years == 0) | (years >= cutoff)]
+        shared = [(self.titles[p], int(self.years[p])) for p in common]
+        return sorted(shared, key=lambda s: -s[1])
+
+    def coauthored(self, x_keys, y_keys, within_years: int = None) -> bool:
+        return bool(self.shared_papers(x_keys, y_keys, within_years))
+
+    def within_two(self, x_keys, y_keys) -> bool:
+        """Same person, co-authors, or sharing a co-author."""
+        x, y = self._lookup(x_keys), self._lookup(y_keys)
+        if not x.size or not y.size:
+            return False
+        if np.intersect1d(x, y).size:
+            return True
+        cx = self.coauthors_of(x_keys)
+        return bool(
+            np.intersect1d(cx, y).size or np.intersect1d(cx, self.coauthors_of(y_keys)).size
+        )
+
+
+def _year(value) -> int:
+    try:
+        year = int(str(value)[:4])
+    except (TypeError, ValueError):
+        return 0
+    return year if 1900 <= year <= 2100 else 0
+
+
+def main():
+    import argparse
+
+    from pipeline import OUTPUTS_DIR
+
+    parser = argparse.ArgumentParser(description="Co-authorship graph")
+    parser.add_argument("--build", action="store_true", help="seed from extraction outputs")
+    args = parser.parse_args()
+    graph = CoauthorGraph.load()
+    if args.build:
+        graph.ingest_outputs(OUTPUTS_DIR)
+        graph.save()
+    print(f"{graph.n_authors} author keys, {graph.n_papers} papers, {len(graph.p_indices)} edges")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,33 @@
 
 
 from core.academic_apis import AcademicProfileEnricher
+from core.identity_index import IdentityIndex
+
+from pipeline.coauthor_graph import CoauthorGraph, person_keys
+
+
+def conflict_index(
+    manuscript_authors: list[dict],
+    opposed_referees: list[dict],
+    manuscript_editors: list[dict],
+) -> IdentityIndex:
+    """Everyone a candidate can conflict with, built once per manuscript."""
+    index = IdentityIndex()
+    for role, people in (
+        ("author", manuscript_authors),
+        ("opposed", opposed_referees),
+        ("editor", manuscript_editors),
+    ):
+        for person in people:
+            if person.get("name") or person.get("email"):
+                index.add(
+                    {
+                        "name": person.get("name", ""),
+                        "email": (person.get("email") or "").lower() if role == "opposed" else "",
+                        "role": role,
+                    }
+                )
+    return index
 
 
 def check_conflicts(
@@ -11,20 +38,25 @@ def check_conflicts(
     opposed_referees: list[dict],
     manuscript_editors: list[dict],
     enricher: AcademicProfileEnricher,
+    index: IdentityIndex | None = None,
+    coauthors: CoauthorGraph | None = None,
+    coauthor_years: int | None = None,
 ) -> list[str]:
+    if index is None:
+        index = conflict_index(manuscript_authors, opposed_referees, manuscript_editors)
     conflicts = []
 
     cand_name = candidate.get("name", "")
     cand_email = (candidate.get("email") or "").lower()
     cand_inst = candidate.get("institution") or ""
 
-    for author in manuscript_authors:
-        author_name = author.get("name", "")
-        if enricher.name_match(cand_name, author_name):
-            conflicts.append(f"Is manuscript author: {author_name}")
-            break
+    by_name = {}
+    for _score, person in index.match(name=cand_name) if cand_name else []:
+        by_name.setdefault(person["role"], person["name"])
 
-    if not any("Is manuscript author" in c for c in conflicts):
+    if "author" in by_name:
+        conflicts.append(f"Is manuscript author: {by_name['author']}")
+    else:
         for author in manuscript_authors:
             author_inst = author.get("institution") or ""
             if author_inst and cand_inst and enricher.institution_match(cand_inst, author_inst):
@@ -34,29 +66,45 @@ def check_conflicts(
                 )
                 break
 
-    for opp in opposed_referees:
-        opp_name = opp.get("name", "")
-        opp_email = (opp.get("email") or "").lower()
-        if opp_email and cand_email and opp_email == cand_email:
-            conflicts.append("Author-opposed referee (email match)")
-            break
-        if opp_name and enricher.name_match(cand_name, opp_name):
-            conflicts.append("Author-opposed referee (name match)")
-            break
-
-    for editor in manuscript_editors:
-        editor_name = editor.get("name", "")
-        if editor_name and enricher.name_match(cand_name, editor_name):
-            conflicts.append(f"Is manuscript editor: {editor_name}")
-            break
-
-    coauthor_conflict = _check_coauthorship(candidate, manuscript_authors)
+    if cand_email and any(p["role"] == "opposed" for _s, p in index.match(email=cand_email)):
+        conflicts.append("Author-opposed referee (email match)")
+    elif "opposed" in by_name:
+        conflicts.append("Author-opposed referee (name match)")
+
+    if "editor" in by_name:
+        conflicts.append(f"Is manuscript editor: {by_name['editor']}")
+
+    coauthor_conflict = None
+    if coauthors is not None:
+        coauthor_conflict = _graph_coauthorship(
+            candidate, manuscript_authors, coauthors, coauthor_years
+        )
+    if not coauthor_conflict:
+        coauthor_conflict = _check_coauthorship(candidate, manuscript_authors)
     if coauthor_conflict:
         conflicts.append(coauthor_conflict)
 
     return conflicts
 
 
+def _graph_coauthorship(
+    candidate: dict,
+    manuscript_authors: list[dict],
+    coauthors: CoauthorGraph,
+    within_years: int | None = None,
+) -> str | None:
+    cand_keys = person_keys(candidate)
+    if not cand_keys:
+        return None
+    for author in manuscript_authors:
+        shared = coauthors.shared_papers(cand_keys, person_keys(author), within_years)
+        if shared:
+            title, year = shared[0]
+            when = f" ({year})" if year else ""
+            return f'Co-author with {author.get("name", "?")}: shared paper "{title[:80]}"{when}'
+    return None
+
+
 def _check_coauthorship(
     candidate: dict,
     manuscript_authors: list[dict],
@@ -350,10 +350,9 @@ def _heuristic_signals(
     scope_desc = JOURNAL_SCOPES_LLM.get(journal_code.upper(), "")
     if scope_desc and abstract:
         try:
-            from pipeline.embeddings import get_engine
+            from pipeline.embeddings import text_similarity
 
-            engine = get_engine()
-            scope_sim = engine.similarity(abstract[:2000], scope_desc)
+            scope_sim = text_similarity(abstract[:2000], scope_desc)
         except (ImportError, AttributeError, RuntimeError, ValueError):
             pass
 
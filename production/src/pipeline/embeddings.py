@@ -12,6 +12,19 @@ def get_engine():
     return _engine
 
 
+def text_similarity(text_a: str, text_b: str) -> float:
+    """``EmbeddingEngine.similarity``, answered by the model server when one is running."""
+    from pipeline.model_client import ModelServerError, get_client
+
+    client = get_client()
+    if client is not None:
+        try:
+            return client.similarity(text_a, text_b)
+        except ModelServerError:
+            pass
+    return get_engine().similarity(text_a, text_b)
+
+
 class EmbeddingEngine:
     MODEL_NAME = "allenai/specter2_base"
     FALLBACK_MODEL = "all-MiniLM-L6-v2"
@@ -21,6 +34,7 @@ class EmbeddingEngine:
         self.dim = None
         self._tfidf = None
         self._tfidf_fitted = False
+        self._tfidf_frozen = False
         self._load_model()
 
     def _load_model(self):
@@ -57,29 +71,30 @@ class EmbeddingEngine:
         vb = self.embed(text_b)
         return float(np.dot(va, vb))
 
-    def build_index(self, texts: list):
-        try:
-            import faiss
-        except ImportError:
-            return None
-        if not texts:
+    def build_index(self, texts: list, backend: str = None):
+        """ANN index over ``texts``; the backend is chosen from the corpus size by default."""
+        from pipeline import ann_index
+
+        if not texts or not ann_index.available():
             return None
-        vecs = self.batch_embed(texts)
-        vecs = vecs.astype(np.float32)
-        index = faiss.IndexFlatIP(vecs.shape[1])
-        index.add(vecs)
-        return index
+        if self.model is None:
+            self._freeze_tfidf(texts)
+        return ann_index.build(self.batch_embed(texts), backend)
 
     def search_index(self, query: str, index, k: int = 10):
+        return self.search_index_batch([query], index, k)[0]
+
+    def search_index_batch(self, queries: list, index, k: int = 10) -> list:
+        """Embed all queries at once and search them in a single index call."""
+        from pipeline import ann_index
+
         if index is None:
-            return []
-        vec = self.embed(query).astype(np.float32).reshape(1, -1)
-        scores, indices = index.search(vec, min(k, index.ntotal))
-        results = []
-        for _i, (idx, score) in enumerate(zip(indices[0], scores[0], strict=False)):
-            if idx >= 0:
-                results.append((int(idx), float(score)))
-        return results
+            return [[] for _ in queries]
+        if self.model is not None:
+            vecs = self.batch_embed(queries)
+        else:
+            vecs = np.stack([self.embed(q) for q in queries])
+        return ann_index.search(index, vecs, k)
 
     def save_index(self, index, path: Path):
         try:
@@ -94,11 +109,28 @@ class EmbeddingEngine:
             import faiss
 
             if path.exists():
-                return faiss.read_index(str(path))
+                from pipeline import ann_index
+
+                return ann_index.tune(faiss.read_index(str(path)))
         except (ImportError, OSError, RuntimeError) as e:
             print(f"   Warning: failed to load FAISS index: {e}")
         return None
 
+    def _freeze_tfidf(self, texts: list):
+        """Fit the fallback vocabulary once, so index and query vectors share one space."""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        if self._tfidf_frozen:
+            return
+        corpus = [t for t in texts if t and t.strip()]
+        if len(corpus) < 2:
+            return
+        self._tfidf = TfidfVectorizer(max_features=768)
+        self._tfidf.fit(corpus)
+        self._tfidf_corpus = corpus
+        self._tfidf_fitted = self._tfidf_frozen = True
+        self.dim = min(len(self._tfidf.vocabulary_), 768)
+
     def _tfidf_embed(self, text: str) -> np.ndarray:
         from sklearn.feature_extraction.text import TfidfVectorizer
 
@@ -106,7 +138,7 @@ class EmbeddingEngine:
             self._tfidf = TfidfVectorizer(max_features=768)
             self._tfidf_corpus = []
             self._tfidf_fitted = False
-        if not self._tfidf_fitted or len(self._tfidf_corpus) < 100:
+        if not self._tfidf_frozen and (not self._tfidf_fitted or len(self._tfidf_corpus) < 100):
             self._tfidf_corpus.append(text)
             if len(self._tfidf_corpus) >= 2:
                 self._tfidf.fit(self._tfidf_corpus)
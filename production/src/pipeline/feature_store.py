@@ -0,0 +1,168 @@
+"""Versioned training features shared by the three trainers.
+
+One pass over the extraction snapshots produces the expertise profiles and
+the response/outcome training matrices. They are written under
+``<features_dir>/<version>/``, where the version hashes the feature code
+version, the embedding backend and every snapshot's ``(mtime, size)``; if
+nothing changed since the last run the stored features are loaded instead.
+
+    referees.json    ExpertiseIndex.build_from input
+    response.npz     X, y_agree, y_complete
+    outcome.npz      X, y
+    manifest.json    version, inputs, row counts
+"""
+
+import hashlib
+import importlib.util
+import json
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+from pipeline import OUTPUTS_DIR, _load_json, extraction_files
+
+# Bump when feature extraction changes so stored features are rebuilt.
+FEATURE_VERSION = 1
+
+MANIFEST = "manifest.json"
+
+
+class FeatureSet:
+    def __init__(self, profiles: list, response: tuple, outcome: tuple, path: Path = None):
+        self.profiles = profiles
+        self.response = response
+        self.outcome = outcome
+        self.path = path
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.profiles) + len(self.response[0]) + len(self.outcome[0])
+
+    def save(self, path: Path):
+        path.mkdir(parents=True, exist_ok=True)
+        with open(path / "referees.json", "w") as f:
+            json.dump(self.profiles, f, default=str)
+        X, y_agree, y_complete = self.response
+        np.savez(path / "response.npz", X=X, y_agree=y_agree, y_complete=y_complete)
+        X, y = self.outcome
+        np.savez(path / "outcome.npz", X=X, y=y)
+        self.path = path
+
+    @classmethod
+    def load(cls, path: Path) -> "FeatureSet":
+        with open(path / "referees.json") as f:
+            profiles = json.load(f)
+        with np.load(path / "response.npz") as r, np.load(path / "outcome.npz") as o:
+            response = (r["X"], r["y_agree"], r["y_complete"])
+            outcome = (o["X"], o["y"])
+        return cls(profiles, response, outcome, path)
+
+
+class FeatureStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def load_or_build(self, journals: list = None) -> FeatureSet:
+        """Stored features for the current snapshots, extracting them if missing."""
+        journals = _journals(journals)
+        inputs = _inputs(journals)
+        version = _version(journals, inputs)
+        path = self.root / version
+        if (path / MANIFEST).exists():
+            try:
+                features = FeatureSet.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"   Stored features unreadable, rebuilding: {e}")
+            else:
+                print(f"   Features unchanged ({version}), reusing")
+                return features
+
+        t0 = time.time()
+        features = extract(journals)
+        tmp = self.root / f"{version}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        features.save(tmp)
+        manifest = {
+            "version": version,
+            "feature_version": FEATURE_VERSION,
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "extract_s": round(time.time() - t0, 2),
+            "inputs": [[j, name, *stamp] for j, name, stamp in inputs],
+            "n_referee_profiles": len(features.profiles),
+            "n_response_samples": len(features.response[0]),
+            "n_outcome_samples": len(features.outcome[0]),
+        }
+        with open(tmp / MANIFEST, "w") as f:
+            json.dump(manifest, f, indent=2)
+        shutil.rmtree(path, ignore_errors=True)
+        tmp.rename(path)
+        features.path = path
+        self._prune(keep=version)
+        return features
+
+    def _prune(self, keep: str):
+        for old in self.root.iterdir():
+            if old.is_dir() and old.name != keep:
+                shutil.rmtree(old, ignore_errors=True)
+
+
+def extract(journals: list) -> FeatureSet:
+    """Read every snapshot once and build all three trainers' inputs."""
+    from pipeline.models.expertise_index import snapshot_profiles
+    from pipeline.models.outcome_predictor import ManuscriptOutcomePredictor, add_manuscript
+    from pipeline.models.response_predictor import RefereeResponsePredictor, add_referee_entries
+
+    profiles = []
+    referee_entries = {}
+    manuscript_map = {}
+    for journal in journals:
+        journal_dir = OUTPUTS_DIR / journal
+        if not journal_dir.exists():
+            continue
+        by_name = {}
+        for json_path in sorted(extraction_files(journal_dir), key=lambda p: p.stat().st_mtime):
+            file_mtime = json_path.stat().st_mtime
+            data = _load_json(json_path)
+            by_name[json_path.name] = snapshot_profiles(data, journal)
+            for ms in data.get("manuscripts", []) or []:
+                add_referee_entries(referee_entries, ms, journal, file_mtime)
+                add_manuscript(manuscript_map, ms, journal, file_mtime)
+        # The expertise index reads snapshots in name order
+        for name in sorted(by_name):
+            profiles.extend(by_name[name])
+
+    response = RefereeResponsePredictor()._training_matrix(
+        [entry for entry, _ in referee_entries.values()]
+    )
+    outcome = ManuscriptOutcomePredictor()._training_matrix(manuscript_map)
+    return FeatureSet(profiles, response, outcome)
+
+
+def _journals(journals: list = None) -> list:
+    if journals is not None:
+        return list(journals)
+    if not OUTPUTS_DIR.exists():
+        return []
+    return [d.name for d in OUTPUTS_DIR.iterdir() if d.is_dir()]
+
+
+def _inputs(journals: list) -> list:
+    inputs = []
+    for journal in journals:
+        for path in sorted(extraction_files(OUTPUTS_DIR / journal), key=lambda p: p.name):
+            st = path.stat()
+            inputs.append((journal, path.name, (st.st_mtime_ns, st.st_size)))
+    return inputs
+
+
+def _version(journals: list, inputs: list) -> str:
+    # Outcome features include embedding similarities, so the backend matters too
+    embedder = (
+        "sentence-transformers"
+        if importlib.util.find_spec("sentence_transformers") is not None
+        else "tfidf"
+    )
+    key = json.dumps([FEATURE_VERSION, embedder, journals, inputs])
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
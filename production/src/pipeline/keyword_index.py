@@ -0,0 +1,250 @@
+"""Persistent inverted index from keywords and topics to historical referees.
+
+Postings map a normalized keyword or research-topic phrase to the
+(journal, manuscript, referee) it was seen with. ``refresh`` only re-reads a
+journal when its latest extraction changed, and then only rewrites the
+manuscripts whose record changed, so repeated searches never re-parse the
+journal outputs. ``search`` scores each posting group by IDF-weighted overlap
+with the query keywords.
+"""
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import threading
+import unicodedata
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from pipeline import JOURNALS, MODELS_DIR, OUTPUTS_DIR, _load_json, extraction_files
+from pipeline import normalize_name_orderless as normalize_name
+
+# Weight of a referee research-topic match relative to a manuscript keyword match
+TOPIC_WEIGHT = 0.5
+
+
+def default_db_path() -> Path:
+    """``$KEYWORD_INDEX_DB`` if set, else ``keyword_index.db`` in the models dir."""
+    return Path(os.environ.get("KEYWORD_INDEX_DB") or MODELS_DIR / "keyword_index.db")
+
+
+def normalize_token(s: str) -> str:
+    s = unicodedata.normalize("NFKD", str(s)).encode("ascii", "ignore").decode().lower()
+    return " ".join(s.replace("-", " ").split())
+
+
+def _record_digest(ms: dict) -> str:
+    raw = json.dumps(ms, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _latest_extraction(journal_dir: Path) -> Path | None:
+    files = extraction_files(journal_dir)
+    return max(files, key=lambda p: p.stat().st_mtime) if files else None
+
+
+def _referee_payload(ref: dict) -> dict:
+    wp = ref.get("web_profile") or {}
+    return {
+        "name": ref.get("name", ""),
+        "email": ref.get("email"),
+        "institution": ref.get("institution"),
+        "orcid": ref.get("orcid"),
+        "web_profile": ref.get("web_profile"),
+        "h_index": wp.get("h_index"),
+        "citation_count": wp.get("citation_count"),
+        "research_topics": wp.get("research_topics", []),
+    }
+
+
+class KeywordIndex:
+    def __init__(self, db_path: Path = None, outputs_dir: Path = None):
+        self.db_path = Path(db_path) if db_path else default_db_path()
+        self.outputs_dir = outputs_dir or OUTPUTS_DIR
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._init_db()
+
+    def _init_db(self):
+        with self._connection() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS sources (
+                    journal TEXT PRIMARY KEY, path TEXT, mtime REAL, size INTEGER,
+                    indexed_at TEXT);
+                CREATE TABLE IF NOT EXISTS manuscripts (
+                    journal TEXT, manuscript_id TEXT, digest TEXT,
+                    PRIMARY KEY (journal, manuscript_id));
+                CREATE TABLE IF NOT EXISTS referees (
+                    journal TEXT, manuscript_id TEXT, referee_key TEXT, payload TEXT,
+                    PRIMARY KEY (journal, manuscript_id, referee_key));
+                CREATE TABLE IF NOT EXISTS postings (
+                    token TEXT, kind TEXT, journal TEXT, manuscript_id TEXT,
+                    referee_key TEXT, seen_at REAL);
+                CREATE INDEX IF NOT EXISTS idx_postings_token ON postings(token);
+                CREATE INDEX IF NOT EXISTS idx_postings_ms ON postings(journal, manuscript_id);
+                """
+            )
+
+    @contextmanager
+    def _connection(self):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def refresh(self, journals: list = None) -> dict:
+        """Index new extractions; returns ``{journal: manuscripts rewritten}``."""
+        updated = {}
+        with self._lock, self._connection() as conn:
+            for journal in journals or JOURNALS:
+                latest = _latest_extraction(self.outputs_dir / journal)
+                if latest is None:
+                    continue
+                st = latest.stat()
+                row = conn.execute(
+                    "SELECT path, mtime, size FROM sources WHERE journal=?", (journal,)
+                ).fetchone()
+                if row == (str(latest), st.st_mtime, st.st_size):
+                    continue
+                updated[journal] = self._index_snapshot(conn, journal, latest, st.st_mtime)
+                conn.execute(
+                    "INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?)",
+                    (journal, str(latest), st.st_mtime, st.st_size, datetime.now().isoformat()),
+                )
+        return updated
+
+    def _index_snapshot(self, conn, journal: str, path: Path, seen_at: float) -> int:
+        known = dict(
+            conn.execute(
+                "SELECT manuscript_id, digest FROM manuscripts WHERE journal=?", (journal,)
+            )
+        )
+        current = set()
+        changed = 0
+        for ms in _load_json(path).get("manuscripts", []) or []:
+            ms_id = ms.get("manuscript_id", "")
+            if not ms_id:
+                continue
+            current.add(ms_id)
+            digest = _record_digest(ms)
+            if known.get(ms_id) == digest:
+                continue
+            self._drop(conn, journal, ms_id)
+            self._add(conn, journal, ms, digest, seen_at)
+            changed += 1
+        for ms_id in set(known) - current:
+            self._drop(conn, journal, ms_id)
+            changed += 1
+        return changed
+
+    @staticmethod
+    def _drop(conn, journal: str, ms_id: str):
+        for table in ("manuscripts", "referees", "postings"):
+            # SAFE: table names are fixed literals.
+            conn.execute(
+                f"DELETE FROM {table} WHERE journal=? AND manuscript_id=?", (journal, ms_id)
+            )
+
+    @staticmethod
+    def _add(conn, journal: str, ms: dict, digest: str, seen_at: float):
+        ms_id = ms["manuscript_id"]
+        conn.execute("INSERT INTO manuscripts VALUES (?, ?, ?)", (journal, ms_id, digest))
+        keywords = {normalize_token(k) for k in ms.get("keywords", []) or []} - {""}
+        postings = []
+        seen = set()
+        for ref in ms.get("referees", []) or []:
+            key = normalize_name(ref.get("name", ""))
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            conn.execute(
+                "INSERT INTO referees VALUES (?, ?, ?, ?)",
+                (journal, ms_id, key, json.dumps(_referee_payload(ref), default=str)),
+            )
+            topics = {
+                normalize_token(t)
+                for t in (ref.get("web_profile") or {}).get("research_topics", []) or []
+            } - {""}
+            postings += [(k, "keyword", journal, ms_id, key, seen_at) for k in keywords]
+            postings += [(t, "topic", journal, ms_id, key, seen_at) for t in topics - keywords]
+        conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?)", postings)
+
+    def search(self, keywords: list, exclude_names: set = frozenset(), limit: int = None) -> list:
+        """Historical referees whose manuscripts or topics share the query keywords.
+
+        Returns dicts with the referee payload plus ``journal``, ``manuscript_id``,
+        ``overlap`` (matched phrases) and ``score``, best first.
+        """
+        tokens = sorted({normalize_token(k) for k in keywords or []} - {""})
+        if not tokens:
+            return []
+        marks = ",".join("?" * len(tokens))
+        with self._lock, self._connection() as conn:
+            n_ms = conn.execute("SELECT COUNT(*) FROM manuscripts").fetchone()[0] or 1
+            df = dict(
+                conn.execute(
+                    "SELECT token, COUNT(DISTINCT journal || '/' || manuscript_id) "
+                    f"FROM postings WHERE token IN ({marks}) GROUP BY token",
+                    tokens,
+                )
+            )
+            rows = conn.execute(
+                "SELECT p.token, p.kind, p.journal, p.manuscript_id, p.referee_key, "
+                "p.seen_at, r.payload FROM postings p JOIN referees r "
+                "ON r.journal=p.journal AND r.manuscript_id=p.manuscript_id "
+                f"AND r.referee_key=p.referee_key WHERE p.token IN ({marks})",
+                tokens,
+            ).fetchall()
+
+        hits = {}
+        for token, kind, journal, ms_id, key, seen_at, payload in rows:
+            if key in exclude_names:
+                continue
+            hit = hits.get((journal, ms_id, key))
+            if hit is None:
+                hit = hits[(journal, ms_id, key)] = {
+                    **json.loads(payload),
+                    "journal": journal,
+                    "manuscript_id": ms_id,
+                    "seen_at": seen_at,
+                    "overlap": [],
+                    "score": 0.0,
+                }
+            weight = 1.0 if kind == "keyword" else TOPIC_WEIGHT
+            hit["score"] += weight * math.log(1 + n_ms / df[token])
+            hit["overlap"].append(token)
+        ranked = sorted(
+            hits.values(),
+            key=lambda h: (-h["score"], -h["seen_at"], h["journal"], h["manuscript_id"]),
+        )
+        for h in ranked:
+            h["score"] = round(h["score"], 4)
+            h["overlap"].sort()
+        return ranked[:limit] if limit else ranked
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> KeywordIndex:
+    """Process-wide index, brought up to date with the latest extractions."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = KeywordIndex()
+        _index.refresh()
+        return _index
+
+
+def reset_index():
+    """Drop the process-wide index so the next ``get_index`` reopens it."""
+    global _index
+    with _index_lock:
+        _index = None
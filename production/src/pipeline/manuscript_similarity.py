@@ -2,7 +2,7 @@
 
 import json
 
-from pipeline import JOURNALS, MODELS_DIR, OUTPUTS_DIR, _load_json
+from pipeline import JOURNALS, MODELS_DIR, OUTPUTS_DIR, _load_json, extraction_files, file_stamps
 
 INDEX_PATH = MODELS_DIR / "manuscript_index.faiss"
 META_PATH = MODELS_DIR / "manuscript_metadata.json"
@@ -27,10 +27,10 @@ class ManuscriptIndex:
             journal_dir = OUTPUTS_DIR / journal
             if not journal_dir.exists():
                 continue
-            extraction_files = sorted(journal_dir.glob("*_extraction_*.json"))
-            if not extraction_files:
+            files = sorted(extraction_files(journal_dir), key=lambda p: p.name)
+            if not files:
                 continue
-            latest = extraction_files[-1]
+            latest = files[-1]
             data = _load_json(latest)
             for ms in data.get("manuscripts", []):
                 title = ms.get("title", "")
@@ -66,7 +66,24 @@ class ManuscriptIndex:
         engine = get_engine()
         query = _manuscript_text(title, abstract)
         results = engine.search_index(query, self.index, k=top_k + 5)
+        return self._matches(title, results, top_k)
 
+    def search_many(self, queries, top_k=5):
+        """Similar manuscripts for several ``(title, abstract)`` pairs in one index call."""
+        if self.index is None or not self.manuscripts:
+            return [[] for _ in queries]
+
+        from pipeline.embeddings import get_engine
+
+        engine = get_engine()
+        texts = [_manuscript_text(title, abstract) for title, abstract in queries]
+        batches = engine.search_index_batch(texts, self.index, k=top_k + 5)
+        return [
+            self._matches(title, results, top_k)
+            for (title, _abstract), results in zip(queries, batches, strict=True)
+        ]
+
+    def _matches(self, title, results, top_k):
         matches = []
         for idx, score in results:
             if 0 <= idx < len(self.manuscripts):
@@ -128,10 +145,31 @@ def _manuscript_text(title, abstract, keywords=None):
     return " ".join(p for p in parts if p)
 
 
-def find_similar_manuscripts(title, abstract, top_k=5):
+_local = {}
+
+
+def _local_index():
+    """This process's index, reloaded only when the files under MODELS_DIR change."""
+    paths = (MODELS_DIR / "manuscript_index.faiss", MODELS_DIR / "manuscript_metadata.json")
+    cached = _local.get(MODELS_DIR)
+    if cached is not None and cached[0] == file_stamps(paths):
+        return cached[1]
     idx = ManuscriptIndex()
     if not idx.load():
         count = idx.build()
         if count > 0:
             idx.save()
-    return idx.search(title, abstract, top_k=top_k)
+    _local[MODELS_DIR] = (file_stamps(paths), idx)
+    return idx
+
+
+def find_similar_manuscripts(title, abstract, top_k=5):
+    from pipeline.model_client import ModelServerError, get_client
+
+    client = get_client()
+    if client is not None:
+        try:
+            return client.similar_manuscripts(title, abstract, top_k)
+        except ModelServerError as e:
+            print(f"   Model server failed, searching in-process: {e}")
+    return _local_index().search(title, abstract, top_k=top_k)
@@ -0,0 +1,143 @@
+"""Thin client for the local model server (``python -m pipeline.model_server``).
+
+``get_client()`` returns None when no server is listening (or
+``MODEL_SERVER=0``), so callers fall back to loading models in-process.
+The ``Remote*`` classes stand in for the in-process index and predictors.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+
+from pipeline import MODELS_DIR
+
+SOCKET_PATH = Path(os.environ.get("MODEL_SERVER_SOCKET") or MODELS_DIR / "model_server.sock")
+TIMEOUT = 30.0
+
+_disabled = False
+
+
+class ModelServerError(RuntimeError):
+    pass
+
+
+def enabled() -> bool:
+    if _disabled:
+        return False
+    return os.environ.get("MODEL_SERVER", "true").lower() not in ("0", "false", "no")
+
+
+def disable():
+    """Never route through a server from this process (the server itself calls this)."""
+    global _disabled
+    _disabled = True
+
+
+class ModelClient:
+    def __init__(self, socket_path: Path = None, timeout: float = TIMEOUT):
+        self.socket_path = Path(socket_path or SOCKET_PATH)
+        self.timeout = timeout
+
+    def call(self, op: str, **args):
+        request = json.dumps({"op": op, "args": args}, default=str).encode() + b"\n"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                sock.sendall(request)
+                with sock.makefile("rb") as f:
+                    line = f.readline()
+        except OSError as e:
+            raise ModelServerError(f"model server unreachable: {e}") from e
+        if not line:
+            raise ModelServerError("model server closed the connection")
+        reply = json.loads(line)
+        if not reply.get("ok"):
+            raise ModelServerError(reply.get("error") or "model server error")
+        return reply["result"]
+
+    def ping(self) -> dict:
+        return self.call("ping")
+
+    def similar_manuscripts(self, title: str, abstract: str, top_k: int = 5) -> list:
+        return self.call("similar", title=title, abstract=abstract, top_k=top_k)
+
+    def expertise_search(self, manuscripts: list, k: int = 30) -> list:
+        return self.call("expertise", manuscripts=manuscripts, k=k)
+
+    def predict_response(self, candidates: list, manuscript: dict, journal: str) -> list:
+        return self.call(
+            "predict_response", candidates=candidates, manuscript=manuscript, journal=journal
+        )
+
+    def predict_outcome(self, manuscript: dict, journal: str) -> float:
+        return self.call("predict_outcome", manuscript=manuscript, journal=journal)
+
+    def similarity(self, text_a: str, text_b: str) -> float:
+        return self.call("similarity", text_a=text_a, text_b=text_b)
+
+
+def get_client(socket_path: Path = None) -> ModelClient | None:
+    """A client for a running server, or None."""
+    if not enabled():
+        return None
+    client = ModelClient(socket_path)
+    if not client.socket_path.exists():
+        return None
+    try:
+        client.ping()
+    except ModelServerError:
+        return None
+    return client
+
+
+class RemoteExpertiseIndex:
+    def __init__(self, client: ModelClient, n_referees: int):
+        self.client = client
+        self.n_referees = n_referees
+        self._prefetched: dict[str, tuple[int, list]] = {}
+
+    def search(self, manuscript: dict, k: int = 30) -> list:
+        from pipeline.models.expertise_index import _manuscript_text
+
+        cached = self._prefetched.get(_manuscript_text(manuscript))
+        if cached is not None and cached[0] >= k:
+            return [dict(c) for c in cached[1][:k]]
+        return self.search_many([manuscript], k)[0]
+
+    def search_many(self, manuscripts: list, k: int = 30) -> list:
+        return self.client.expertise_search(manuscripts, k)
+
+    def prefetch(self, manuscripts: list, k: int = 30):
+        from pipeline.models.expertise_index import _manuscript_text
+
+        # Best effort: each search() asks the server itself if this fails
+        try:
+            results = self.search_many(manuscripts, k)
+        except ModelServerError as e:
+            print(f"   Expertise prefetch failed, searching per manuscript: {e}")
+            return
+        for ms, found in zip(manuscripts, results, strict=True):
+            self._prefetched[_manuscript_text(ms)] = (k, found)
+
+
+class RemoteResponsePredictor:
+    def __init__(self, client: ModelClient):
+        self.client = client
+
+    def predict_for_candidates(self, candidates: list, manuscript: dict, journal: str) -> list:
+        if not candidates:
+            return []
+        return self.client.predict_response(candidates, manuscript, journal)
+
+    def predict_for_candidate(self, candidate: dict, manuscript: dict, journal: str) -> float:
+        return self.predict_for_candidates([candidate], manuscript, journal)[0]
+
+
+class RemoteOutcomePredictor:
+    def __init__(self, client: ModelClient):
+        self.client = client
+
+    def predict(self, manuscript: dict, journal: str) -> float:
+        return self.client.predict_outcome(manuscript, journal)
@@ -0,0 +1,300 @@
+"""Long-lived local model server.
+
+Keeps the embedding model, the expertise and manuscript indexes and the
+trained predictors warm and answers requests on a Unix socket, one JSON
+object per line: ``{"op": ..., "args": {...}}`` -> ``{"ok": true, "result": ...}``.
+Concurrent requests of the same op are collected for ``BATCH_WINDOW`` seconds
+and answered with one batched call. Artifacts under ``MODELS_DIR`` are
+reloaded when their files change. Clients: ``pipeline.model_client``.
+
+    python -m pipeline.model_server            # serve
+    python -m pipeline.model_server --status   # ping a running server
+"""
+
+import json
+import os
+import queue
+import signal
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+import numpy as np
+
+from pipeline import MODELS_DIR, file_stamps
+from pipeline.model_client import SOCKET_PATH, ModelClient, ModelServerError, disable
+
+BATCH_WINDOW = 0.005
+MAX_BATCH = 64
+RELOAD_INTERVAL = 2.0
+
+ARTIFACTS = (
+    "referee_index.faiss",
+    "referee_metadata.json",
+    "manuscript_index.faiss",
+    "manuscript_metadata.json",
+    "response_predictor.joblib",
+    "outcome_predictor.joblib",
+)
+
+
+def artifact_stamps(models_dir: Path) -> tuple:
+    return file_stamps(Path(models_dir) / name for name in ARTIFACTS)
+
+
+class ModelStore:
+    """One consistent generation of loaded artifacts."""
+
+    def __init__(self, models_dir: Path):
+        from pipeline.manuscript_similarity import ManuscriptIndex
+        from pipeline.models.expertise_index import ExpertiseIndex
+        from pipeline.models.outcome_predictor import ManuscriptOutcomePredictor
+        from pipeline.models.response_predictor import RefereeResponsePredictor
+
+        self.stamps = artifact_stamps(models_dir)
+        self.expertise = _loaded(ExpertiseIndex(), models_dir)
+        self.manuscripts = _loaded(ManuscriptIndex(), models_dir)
+        self.response = _loaded(RefereeResponsePredictor(), models_dir)
+        self.outcome = _loaded(ManuscriptOutcomePredictor(), models_dir)
+        self.loaded_at = time.time()
+
+    def status(self) -> dict:
+        return {
+            "expertise_index": len(self.expertise.referees) if self.expertise else None,
+            "manuscript_index": len(self.manuscripts.manuscripts) if self.manuscripts else None,
+            "response_predictor": self.response is not None,
+            "outcome_predictor": self.outcome is not None,
+        }
+
+
+def _loaded(model, models_dir: Path):
+    try:
+        return model if model.load(models_dir) else None
+    except (OSError, ValueError, RuntimeError, EOFError) as e:
+        print(f"   {type(model).__name__} not available: {e}")
+        return None
+
+
+class _Batcher:
+    """Collects concurrent requests for one op and answers them with one call."""
+
+    def __init__(self, fn, window: float = None, max_batch: int = None):
+        self.fn = fn
+        self.window = BATCH_WINDOW if window is None else window
+        self.max_batch = max_batch or MAX_BATCH
+        self.batches = 0
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, args: dict):
+        future = Future()
+        self._queue.put((args, future))
+        return future.result()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.batches += 1
+            try:
+                results = self.fn([args for args, _ in batch])
+            except Exception as e:  # reported back to every waiting client
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results, strict=True):
+                future.set_result(result)
+
+
+class ModelServer:
+    def __init__(self, models_dir: Path = None, socket_path: Path = None):
+        self.models_dir = Path(models_dir or MODELS_DIR)
+        self.socket_path = Path(socket_path or SOCKET_PATH)
+        self.started_at = time.time()
+        self.requests = 0
+        self._reload_lock = threading.Lock()
+        self._checked = time.monotonic()
+        self._server = None
+
+        from pipeline.embeddings import get_engine
+
+        self.engine = get_engine()
+        self.store = ModelStore(self.models_dir)
+        self._batchers = {
+            "similar": _Batcher(self._similar),
+            "expertise": _Batcher(self._expertise),
+            "predict_response": _Batcher(self._predict_response),
+            "predict_outcome": _Batcher(self._predict_outcome),
+            "similarity": _Batcher(self._similarity),
+        }
+
+    # -- artifacts --------------------------------------------------------
+
+    def current_store(self) -> ModelStore:
+        """The loaded artifacts, reloaded first if their files changed."""
+        if time.monotonic() - self._checked >= RELOAD_INTERVAL:
+            with self._reload_lock:
+                if time.monotonic() - self._checked >= RELOAD_INTERVAL:
+                    self._checked = time.monotonic()
+                    if artifact_stamps(self.models_dir) != self.store.stamps:
+                        self.reload()
+        return self.store
+
+    def reload(self):
+        print(f"   Reloading models from {self.models_dir}")
+        self.store = ModelStore(self.models_dir)
+
+    # -- batched ops ------------------------------------------------------
+
+    def _similar(self, batch: list) -> list:
+        index = self.current_store().manuscripts
+        if index is None:
+            return [[] for _ in batch]
+        top_k = max(int(a.get("top_k", 5)) for a in batch)
+        found = index.search_many([(a.get("title"), a.get("abstract")) for a in batch], top_k)
+        return [hits[: int(a.get("top_k", 5))] for a, hits in zip(batch, found, strict=True)]
+
+    def _expertise(self, batch: list) -> list:
+        index = self.current_store().expertise
+        if index is None:
+            return [[[] for _ in a["manuscripts"]] for a in batch]
+        k = max(int(a.get("k", 30)) for a in batch)
+        found = iter(index.search_many([ms for a in batch for ms in a["manuscripts"]], k))
+        return [[next(found)[: int(a.get("k", 30))] for _ in a["manuscripts"]] for a in batch]
+
+    def _predict_response(self, batch: list) -> list:
+        model = self.current_store().response
+        return [
+            (
+                model.predict_for_candidates(a["candidates"], a["manuscript"], a["journal"])
+                if model is not None
+                else [0.5] * len(a["candidates"])
+            )
+            for a in batch
+        ]
+
+    def _predict_outcome(self, batch: list) -> list:
+        model = self.current_store().outcome
+        if model is None:
+            raise ModelServerError("outcome predictor not loaded")
+        return [model.predict(a["manuscript"], a.get("journal")) for a in batch]
+
+    def _similarity(self, batch: list) -> list:
+        texts = [t for a in batch for t in (a["text_a"], a["text_b"])]
+        if not all(t and t.strip() for t in texts):
+            return [self.engine.similarity(a["text_a"], a["text_b"]) for a in batch]
+        vecs = self.engine.batch_embed(texts)
+        return [float(np.dot(vecs[2 * i], vecs[2 * i + 1])) for i in range(len(batch))]
+
+    # -- protocol ---------------------------------------------------------
+
+    def status(self) -> dict:
+        store = self.current_store()
+        return {
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started_at, 1),
+            "requests": self.requests,
+            "loaded_at": store.loaded_at,
+            "models": store.status(),
+            "batches": {op: b.batches for op, b in self._batchers.items()},
+        }
+
+    def handle(self, request: dict) -> dict:
+        self.requests += 1
+        op = request.get("op")
+        try:
+            if op == "ping":
+                result = self.status()
+            elif op == "reload":
+                self.reload()
+                result = self.store.status()
+            elif op in self._batchers:
+                result = self._batchers[op].submit(request.get("args") or {})
+            else:
+                return {"ok": False, "error": f"unknown op: {op}"}
+        except Exception as e:  # the client decides how to fall back
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "result": result}
+
+    def serve_forever(self):
+        if self.socket_path.exists():
+            try:
+                ModelClient(self.socket_path, timeout=1.0).ping()
+            except ModelServerError:
+                self.socket_path.unlink()
+            else:
+                raise RuntimeError(f"a model server is already listening on {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._server = _SocketServer(str(self.socket_path), _Handler)
+        self._server.model_server = self
+        os.chmod(self.socket_path, 0o600)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+
+class _SocketServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                reply = {"ok": False, "error": f"bad request: {e}"}
+            else:
+                reply = self.server.model_server.handle(request)
+            self.wfile.write(json.dumps(reply, default=_jsonable).encode() + b"\n")
+
+
+def _jsonable(value):
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return str(value)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local model server")
+    parser.add_argument("--socket", type=Path, default=SOCKET_PATH)
+    parser.add_argument("--status", action="store_true", help="ping a running server")
+    args = parser.parse_args()
+    if args.status:
+        try:
+            print(json.dumps(ModelClient(args.socket).ping(), indent=2))
+        except ModelServerError as e:
+            print(f"No model server: {e}")
+        return
+    disable()
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    server = ModelServer(socket_path=args.socket)
+    print(f"Model server listening on {server.socket_path} ({server.store.status()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
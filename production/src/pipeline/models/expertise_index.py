@@ -1,57 +1,71 @@
 import json
 from pathlib import Path
 
-from pipeline import MODELS_DIR, OUTPUTS_DIR, _load_json
+from pipeline import MODELS_DIR, OUTPUTS_DIR, _load_json, extraction_files
 
 
 class ExpertiseIndex:
     def __init__(self):
         self.referees = []
         self.index = None
+        self._prefetched: dict[str, tuple[int, list]] = {}
 
     def build(self, journals: list = None):
-        from pipeline.embeddings import get_engine
-
-        engine = get_engine()
-        self.referees = []
-        texts = []
-
         if journals is None:
             journals = [d.name for d in OUTPUTS_DIR.iterdir() if d.is_dir()]
 
+        profiles = []
         for journal in journals:
             journal_dir = OUTPUTS_DIR / journal
             if not journal_dir.exists():
                 continue
-            for json_path in sorted(journal_dir.glob("*_extraction_*.json")):
-                data = _load_json(json_path)
-                for ms in data.get("manuscripts", []):
-                    ms_keywords = ms.get("keywords", []) or []
-                    ms_title = ms.get("title", "")
-                    for ref in ms.get("referees", []):
-                        profile = _build_referee_profile(ref, ms_keywords, ms_title, journal)
-                        if profile["text"].strip():
-                            self.referees.append(profile)
-                            texts.append(profile["text"])
-
-        if not texts:
+            for json_path in sorted(extraction_files(journal_dir), key=lambda p: p.name):
+                profiles.extend(snapshot_profiles(_load_json(json_path), journal))
+        return self.build_from(profiles)
+
+    def build_from(self, profiles: list) -> int:
+        """Index referee profiles (as produced by ``snapshot_profiles``)."""
+        from pipeline.embeddings import get_engine
+
+        self.referees = []
+        if not profiles:
             return 0
 
-        self.referees = _deduplicate(self.referees)
+        self.referees = _deduplicate(profiles)
         texts = [r["text"] for r in self.referees]
-        self.index = engine.build_index(texts)
+        self.index = get_engine().build_index(texts)
+        return len(self.referees)
+
+    @property
+    def n_referees(self) -> int:
         return len(self.referees)
 
     def search(self, manuscript: dict, k: int = 30):
+        cached = self._prefetched.get(_manuscript_text(manuscript))
+        if cached is not None and cached[0] >= k:
+            return [dict(c) for c in cached[1][:k]]
+        return self.search_many([manuscript], k)[0]
+
+    def search_many(self, manuscripts: list, k: int = 30) -> list:
+        """Candidates for several manuscripts with one embedding batch and one index call."""
         if self.index is None or not self.referees:
-            return []
+            return [[] for _ in manuscripts]
 
         from pipeline.embeddings import get_engine
 
         engine = get_engine()
-        query = _manuscript_text(manuscript)
-        results = engine.search_index(query, self.index, k=k)
-
+        queries = [_manuscript_text(ms) for ms in manuscripts]
+        return [
+            self._candidates(results)
+            for results in engine.search_index_batch(queries, self.index, k=k)
+        ]
+
+    def prefetch(self, manuscripts: list, k: int = 30):
+        """Search a batch up front so later ``search`` calls are served from memory."""
+        for ms, found in zip(manuscripts, self.search_many(manuscripts, k), strict=True):
+            self._prefetched[_manuscript_text(ms)] = (k, found)
+
+    def _candidates(self, results) -> list:
         candidates = []
         for idx, score in results:
             if 0 <= idx < len(self.referees):
@@ -114,6 +128,19 @@ def _build_referee_profile(ref: dict, ms_keywords: list, ms_title: str, journal:
     }
 
 
+def snapshot_profiles(data: dict, journal: str) -> list:
+    """Referee profiles with non-empty text from one extraction snapshot."""
+    profiles = []
+    for ms in data.get("manuscripts", []):
+        ms_keywords = ms.get("keywords", []) or []
+        ms_title = ms.get("title", "")
+        for ref in ms.get("referees", []):
+            profile = _build_referee_profile(ref, ms_keywords, ms_title, journal)
+            if profile["text"].strip():
+                profiles.append(profile)
+    return profiles
+
+
 def _manuscript_text(ms: dict) -> str:
     parts = [ms.get("title", ""), ms.get("abstract", "")]
     kw = ms.get("keywords", []) or []
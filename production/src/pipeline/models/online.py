@@ -0,0 +1,49 @@
+"""Online correction layered over a trained classifier.
+
+A logistic model on ``[logit(p_base), *features]`` that starts as the
+identity (``p == p_base``) and takes one SGD step per observed outcome, so
+new evidence moves predictions immediately. The L2 term pulls it back
+towards the identity; a full retrain replaces it with a fresh one.
+"""
+
+import numpy as np
+
+LEARNING_RATE = 0.05
+L2 = 1e-3
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -30.0, 30.0)))
+
+
+def _logit(p):
+    p = np.clip(np.asarray(p, dtype=float), 1e-6, 1 - 1e-6)
+    return np.log(p / (1 - p))
+
+
+class OnlineCorrection:
+    def __init__(self, n_features: int, learning_rate: float = LEARNING_RATE, l2: float = L2):
+        self.identity = np.zeros(n_features + 1)
+        self.identity[0] = 1.0
+        self.coef = self.identity.copy()
+        self.intercept = 0.0
+        self.learning_rate = learning_rate
+        self.l2 = l2
+        self.n_updates = 0
+
+    def apply(self, p_base, X) -> np.ndarray:
+        """Corrected probabilities for base probabilities ``p_base`` and feature rows ``X``."""
+        return _sigmoid(self._inputs(p_base, X) @ self.coef + self.intercept)
+
+    def update(self, p_base, X, y):
+        """One SGD step on the log loss per ``(p_base, row, label)``, in order."""
+        for row, label in zip(self._inputs(p_base, X), np.asarray(y, dtype=float), strict=True):
+            err = _sigmoid(row @ self.coef + self.intercept) - label
+            self.coef -= self.learning_rate * (err * row + self.l2 * (self.coef - self.identity))
+            self.intercept -= self.learning_rate * err
+            self.n_updates += 1
+
+    @staticmethod
+    def _inputs(p_base, X) -> np.ndarray:
+        X = np.asarray(X, dtype=float).reshape(len(np.atleast_1d(p_base)), -1)
+        return np.column_stack([_logit(np.atleast_1d(p_base)), X])
@@ -2,7 +2,16 @@ from pathlib import Path
 
 import numpy as np
 
-from pipeline import FREEMAIL_DOMAINS, H_INDEX_CAP, MODELS_DIR, OUTPUTS_DIR, _load_json
+from pipeline import (
+    FREEMAIL_DOMAINS,
+    H_INDEX_CAP,
+    MODELS_DIR,
+    OUTPUTS_DIR,
+    _iter_changed_manuscripts,
+    cv_jobs,
+    dump_joblib,
+    extraction_files,
+)
 
 FINAL_STATUSES = {
     "accept": ["completed accept", "accept", "accepted"],
@@ -14,6 +23,7 @@ class ManuscriptOutcomePredictor:
     def __init__(self):
         self.model = None
         self.scaler = None
+        self.online = None
         self.feature_names = [
             "scope_similarity",
             "abstract_length",
@@ -27,8 +37,10 @@ class ManuscriptOutcomePredictor:
             "article_type_encoded",
         ]
 
-    def train(self, journals: list = None) -> dict:
-        X, y = self._build_training_data(journals)
+    def train(self, journals: list = None, data: tuple = None) -> dict:
+        """Fit on ``data`` (``_build_training_data`` output, e.g. from the feature store)."""
+        X, y = data if data is not None else self._build_training_data(journals)
+        self.online = None
         if len(X) < 5:
             return {"status": "insufficient_data", "n_samples": len(X)}
 
@@ -48,7 +60,9 @@ class ManuscriptOutcomePredictor:
 
         for name, model in candidates:
             try:
-                scores = cross_val_score(model, X_scaled, y, cv=cv, scoring="accuracy")
+                scores = cross_val_score(
+                    model, X_scaled, y, cv=cv, scoring="accuracy", n_jobs=cv_jobs(n)
+                )
                 mean_score = float(np.mean(scores))
                 if mean_score > best_score:
                     best_score = mean_score
@@ -87,22 +101,42 @@ class ManuscriptOutcomePredictor:
     def predict(self, manuscript: dict, journal_code: str = None) -> float:
         if self.model is None or self.scaler is None:
             return 0.5
+        X_scaled = self._scaled_features(manuscript, journal_code)
+        p = self._p_accept(X_scaled)
+        if self.online is not None:
+            p = self.online.apply(p, X_scaled)
+        return float(p[0])
+
+    def update(self, manuscript: dict, journal_code: str, label: int) -> bool:
+        """Fold one recorded decision (1 = accept) into the online correction."""
+        if self.model is None or self.scaler is None:
+            return False
+        from pipeline.models.online import OnlineCorrection
+
+        X_scaled = self._scaled_features(manuscript, journal_code)
+        if self.online is None:
+            self.online = OnlineCorrection(len(self.feature_names))
+        self.online.update(self._p_accept(X_scaled), X_scaled, [label])
+        return True
+
+    def _scaled_features(self, manuscript: dict, journal_code: str = None) -> np.ndarray:
         features = self._extract_features(manuscript, journal_code)
         X = np.array([[features.get(f, 0.0) for f in self.feature_names]])
-        X_scaled = self.scaler.transform(X)
+        return self.scaler.transform(X)
+
+    def _p_accept(self, X_scaled: np.ndarray) -> np.ndarray:
         proba = self.model.predict_proba(X_scaled)
         pos_idx = list(self.model.classes_).index(1) if 1 in self.model.classes_ else 0
-        return float(proba[0][pos_idx])
+        return proba[:, pos_idx]
 
     def save(self, path: Path = None):
         if path is None:
             path = MODELS_DIR
         path.mkdir(parents=True, exist_ok=True)
         if self.model is not None:
-            import joblib
-
-            joblib.dump(
-                {"model": self.model, "scaler": self.scaler}, path / "outcome_predictor.joblib"
+            dump_joblib(
+                {"model": self.model, "scaler": self.scaler, "online": self.online},
+                path / "outcome_predictor.joblib",
             )
 
     def load(self, path: Path = None) -> bool:
@@ -116,6 +150,7 @@ class ManuscriptOutcomePredictor:
             if isinstance(data, dict):
                 self.model = data.get("model")
                 self.scaler = data.get("scaler")
+                self.online = data.get("online")
             return self.model is not None
         return False
 
@@ -162,18 +197,19 @@ class ManuscriptOutcomePredictor:
             journal_dir = OUTPUTS_DIR / journal
             if not journal_dir.exists():
                 continue
+            last_hashes: dict[str, str] = {}
             for json_path in sorted(
-                journal_dir.glob("*_extraction_*.json"),
+                extraction_files(journal_dir),
                 key=lambda p: p.stat().st_mtime,
             ):
-                data = _load_json(json_path)
                 file_mtime = json_path.stat().st_mtime
-                for ms in data.get("manuscripts", []):
-                    ms_id = ms.get("manuscript_id", "")
-                    key = (journal, ms_id)
-                    if key not in manuscript_map or file_mtime > manuscript_map[key][1]:
-                        manuscript_map[key] = (ms, file_mtime, journal)
+                for ms in _iter_changed_manuscripts(json_path, last_hashes):
+                    add_manuscript(manuscript_map, ms, journal, file_mtime)
+
+        return self._training_matrix(manuscript_map)
 
+    def _training_matrix(self, manuscript_map: dict) -> tuple:
+        """``(X, y)`` from ``{(journal, ms_id): (manuscript, mtime, journal)}``."""
         samples_X = []
         samples_y = []
 
@@ -216,12 +252,11 @@ class ManuscriptOutcomePredictor:
         if journal_code and abstract:
             try:
                 from pipeline.desk_rejection import JOURNAL_SCOPES_LLM
-                from pipeline.embeddings import get_engine
+                from pipeline.embeddings import text_similarity
 
                 scope_desc = JOURNAL_SCOPES_LLM.get(journal_code.upper(), "")
                 if scope_desc:
-                    engine = get_engine()
-                    scope_sim = max(0.0, engine.similarity(abstract[:2000], scope_desc))
+                    scope_sim = max(0.0, text_similarity(abstract[:2000], scope_desc))
             except (ImportError, ValueError, RuntimeError) as e:
                 print(f"   Warning: scope similarity computation failed: {e}")
 
@@ -283,6 +318,13 @@ class ManuscriptOutcomePredictor:
         }
 
 
+def add_manuscript(manuscript_map: dict, ms: dict, journal: str, file_mtime: float):
+    """Keep each manuscript from the newest snapshot it appears in."""
+    key = (journal, ms.get("manuscript_id", ""))
+    if key not in manuscript_map or file_mtime > manuscript_map[key][1]:
+        manuscript_map[key] = (ms, file_mtime, journal)
+
+
 def _classify_outcome(ms: dict) -> int | None:
     status = (ms.get("status") or ms.get("final_status") or "").lower().strip()
     category = (ms.get("category") or "").lower().strip()
@@ -1,14 +1,24 @@
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 
-from pipeline import H_INDEX_CAP, MODELS_DIR, OUTPUTS_DIR, _load_json
+from pipeline import (
+    H_INDEX_CAP,
+    MODELS_DIR,
+    OUTPUTS_DIR,
+    _iter_changed_manuscripts,
+    cv_jobs,
+    dump_joblib,
+    extraction_files,
+)
 
 
 class RefereeResponsePredictor:
     def __init__(self):
         self.model = None
         self.completion_model = None
+        self.online = None
         self.feature_names = [
             "h_index",
             "acceptance_rate",
@@ -20,8 +30,10 @@ class RefereeResponsePredictor:
             "institution_distance",
         ]
 
-    def train(self, journals: list = None) -> dict:
-        X, y_agree, y_complete = self._build_training_data(journals)
+    def train(self, journals: list = None, data: tuple = None) -> dict:
+        """Fit on ``data`` (``_build_training_data`` output, e.g. from the feature store)."""
+        X, y_agree, y_complete = data if data is not None else self._build_training_data(journals)
+        self.online = None
         if len(X) < 10:
             return {"status": "insufficient_data", "n_samples": len(X)}
 
@@ -33,7 +45,9 @@ class RefereeResponsePredictor:
         cv = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=42)
 
         self.model = _make_model()
-        scores = cross_val_score(self.model, X, y_agree, cv=cv, scoring="accuracy")
+        scores = cross_val_score(
+            self.model, X, y_agree, cv=cv, scoring="accuracy", n_jobs=cv_jobs(len(X))
+        )
         mean_cv = float(np.mean(scores))
         positive_rate = float(np.mean(y_agree))
         baseline = max(positive_rate, 1.0 - positive_rate)
@@ -68,7 +82,12 @@ class RefereeResponsePredictor:
                     cv_comp = StratifiedKFold(n_splits=n_comp, shuffle=True, random_state=42)
                     self.completion_model = _make_model()
                     comp_scores = cross_val_score(
-                        self.completion_model, X_agreed, y_comp, cv=cv_comp, scoring="accuracy"
+                        self.completion_model,
+                        X_agreed,
+                        y_comp,
+                        cv=cv_comp,
+                        scoring="accuracy",
+                        n_jobs=cv_jobs(len(X_agreed)),
                     )
                     self.completion_model.fit(X_agreed, y_comp)
                     result["completion_cv_accuracy"] = round(float(np.mean(comp_scores)), 3)
@@ -80,9 +99,7 @@ class RefereeResponsePredictor:
         if self.model is None:
             return 0.5
         X = np.array([[features.get(f, 0.0) for f in self.feature_names]])
-        proba = self.model.predict_proba(X)
-        pos_idx = list(self.model.classes_).index(1) if 1 in self.model.classes_ else 0
-        return float(proba[0][pos_idx])
+        return float(self._p_accept(X)[0])
 
     def predict_completion(self, features: dict) -> float:
         if self.completion_model is None:
@@ -97,19 +114,58 @@ class RefereeResponsePredictor:
         return float(proba[0][pos_idx])
 
     def predict_for_candidate(self, candidate: dict, manuscript: dict, journal: str) -> float:
+        return float(self.predict_for_candidates([candidate], manuscript, journal)[0])
+
+    def predict_for_candidates(
+        self, candidates: list, manuscript: dict, journal: str
+    ) -> np.ndarray:
+        """P(accept) for every candidate with a single ``predict_proba`` call."""
+        if self.model is None or not candidates:
+            return np.full(len(candidates), 0.5)
+        return self._p_accept(self.candidate_matrix(candidates, manuscript, journal))
+
+    def candidate_matrix(self, candidates: list, manuscript: dict, journal: str) -> np.ndarray:
+        """Feature rows for ``candidates``; needs no trained model."""
+        author_insts = [
+            inst
+            for inst in (
+                (a.get("institution") or "").lower() for a in manuscript.get("authors", [])
+            )
+            if inst
+        ]
+        return np.array(
+            [self._candidate_features(c, author_insts, journal) for c in candidates], dtype=float
+        ).reshape(len(candidates), len(self.feature_names))
+
+    def update(self, X, y_agree) -> int:
+        """Fold observed accept/decline outcomes into the online correction."""
+        if self.model is None or len(y_agree) == 0:
+            return 0
+        from pipeline.models.online import OnlineCorrection
+
+        X = np.asarray(X, dtype=float)
+        if self.online is None:
+            self.online = OnlineCorrection(len(self.feature_names))
+        self.online.update(self._p_accept(X, corrected=False), X, y_agree)
+        return len(y_agree)
+
+    def _p_accept(self, X: np.ndarray, corrected: bool = True) -> np.ndarray:
+        proba = self.model.predict_proba(X)
+        pos_idx = list(self.model.classes_).index(1) if 1 in self.model.classes_ else 0
+        p = proba[:, pos_idx]
+        if corrected and self.online is not None:
+            p = self.online.apply(p, X)
+        return p
+
+    def _candidate_features(self, candidate: dict, author_insts: list, journal: str) -> list:
         wp = candidate.get("web_profile") or {}
         h_index = wp.get("h_index") or candidate.get("h_index") or 0
         stats = self._get_referee_stats(candidate)
 
-        ms_authors = manuscript.get("authors", [])
         cand_inst = (candidate.get("institution") or "").lower()
         inst_distance = 1.0
-        if cand_inst:
-            for a in ms_authors:
-                a_inst = (a.get("institution") or "").lower()
-                if a_inst and (cand_inst in a_inst or a_inst in cand_inst):
-                    inst_distance = 0.0
-                    break
+        if cand_inst and any(cand_inst in a or a in cand_inst for a in author_insts):
+            inst_distance = 0.0
 
         features = {
             "h_index": min(h_index / H_INDEX_CAP, 1.0),
@@ -121,17 +177,19 @@ class RefereeResponsePredictor:
             "active_load": min(stats.get("active_reviews", 0) / 5.0, 1.0),
             "institution_distance": inst_distance,
         }
-        return self.predict(features)
+        return [features[f] for f in self.feature_names]
 
     def save(self, path: Path = None):
         if path is None:
             path = MODELS_DIR
         path.mkdir(parents=True, exist_ok=True)
         if self.model is not None:
-            import joblib
-
-            data = {"model": self.model, "completion_model": self.completion_model}
-            joblib.dump(data, path / "response_predictor.joblib")
+            data = {
+                "model": self.model,
+                "completion_model": self.completion_model,
+                "online": self.online,
+            }
+            dump_joblib(data, path / "response_predictor.joblib")
 
     def load(self, path: Path = None) -> bool:
         if path is None:
@@ -144,6 +202,7 @@ class RefereeResponsePredictor:
             if isinstance(data, dict):
                 self.model = data.get("model")
                 self.completion_model = data.get("completion_model")
+                self.online = data.get("online")
             else:
                 self.model = data
             return self.model is not None
@@ -159,118 +218,96 @@ class RefereeResponsePredictor:
             journal_dir = OUTPUTS_DIR / journal
             if not journal_dir.exists():
                 continue
+            last_hashes: dict[str, str] = {}
             for json_path in sorted(
-                journal_dir.glob("*_extraction_*.json"),
+                extraction_files(journal_dir),
                 key=lambda p: p.stat().st_mtime,
             ):
-                data = _load_json(json_path)
                 file_mtime = json_path.stat().st_mtime
-                for ms in data.get("manuscripts", []):
-                    ms_id = ms.get("manuscript_id", "")
-                    ms_keywords = ms.get("keywords", []) or []
-                    for ref in ms.get("referees", []):
-                        ref_key = (ref.get("email") or "").lower().strip() or (
-                            ref.get("name") or ""
-                        ).lower().strip()
-                        if not ref_key:
-                            continue
-                        entry_key = (journal, ms_id, ref_key)
-                        if entry_key not in raw_entries or file_mtime > raw_entries[entry_key][1]:
-                            raw_entries[entry_key] = (
-                                (ref, journal, ms_keywords),
-                                file_mtime,
-                            )
-
-        all_referees = [entry for entry, _ in raw_entries.values()]
-
-        referee_history = {}
-        for ref, journal, _ in all_referees:
-            key = (ref.get("email") or "").lower().strip() or (
-                ref.get("name") or ""
-            ).lower().strip()
-            if not key:
-                continue
-            if key not in referee_history:
-                referee_history[key] = {
-                    "n_invited": 0,
-                    "n_agreed": 0,
-                    "n_completed": 0,
-                    "journals": {},
-                    "turnaround_days": [],
-                    "active_count": 0,
-                }
-
-            status = (ref.get("status") or "").lower()
-            referee_history[key]["n_invited"] += 1
-            referee_history[key]["journals"][journal] = (
-                referee_history[key]["journals"].get(journal, 0) + 1
-            )
-
-            if any(s in status for s in ["agreed", "complete", "submitted", "overdue"]):
-                referee_history[key]["n_agreed"] += 1
-            if any(s in status for s in ["complete", "submitted"]):
-                referee_history[key]["n_completed"] += 1
-
-            days = _extract_turnaround_days(ref)
-            if days is not None:
-                referee_history[key]["turnaround_days"].append(days)
+                for ms in _iter_changed_manuscripts(json_path, last_hashes):
+                    add_referee_entries(raw_entries, ms, journal, file_mtime)
 
-            if any(s in status for s in ["agreed", "awaiting", "in progress", "overdue"]):
-                referee_history[key]["active_count"] += 1
+        return self._training_matrix([entry for entry, _ in raw_entries.values()])
 
-        samples_X = []
-        samples_y_agree = []
-        samples_y_complete = []
+    def _training_matrix(self, all_referees: list) -> tuple:
+        """``(X, y_agree, y_complete)`` from ``(referee, journal, keywords)`` entries.
 
-        for ref, journal, ms_keywords in all_referees:
-            status = (ref.get("status") or "").lower()
-            if not status:
-                continue
-
-            agreed = any(s in status for s in ["agreed", "complete", "submitted", "overdue"])
-            declined = any(s in status for s in ["declined", "uninvited", "no response"])
-            if not agreed and not declined:
-                continue
-
-            completed = any(s in status for s in ["complete", "submitted"])
-
-            key = (ref.get("email") or "").lower().strip() or (
-                ref.get("name") or ""
-            ).lower().strip()
-            stats = referee_history.get(key, {})
-            wp = ref.get("web_profile") or {}
-            h_index = wp.get("h_index") or 0
-
-            n_inv = stats.get("n_invited", 1)
-            acceptance_rate = stats.get("n_agreed", 0) / max(n_inv, 1)
-            turnaround_days = stats.get("turnaround_days", [])
-            avg_turnaround = sum(turnaround_days) / len(turnaround_days) if turnaround_days else 30
-
-            ref_topics = wp.get("research_topics") or []
-            expertise_sim = _keyword_overlap(ref_topics, ms_keywords)
-
-            inst = (ref.get("institution") or "").lower()
-            inst_distance = 1.0 if inst else 0.5
-
-            journal_count = (stats.get("journals") or {}).get(journal, 0)
-            prior_journal_reviews = max(0, journal_count - 1)
-            features = [
-                min(h_index / H_INDEX_CAP, 1.0),
-                acceptance_rate,
-                min(n_inv / 10.0, 1.0),
-                1.0 if prior_journal_reviews > 0 else 0.0,
+        Columnar: one pass pulls the fields out, per-referee history is
+        aggregated with ``np.unique``/``np.bincount`` and statuses are matched
+        as arrays.
+        """
+        n_features = len(self.feature_names)
+        empty = np.array([]).reshape(0, n_features), np.array([]), np.array([])
+        if not all_referees:
+            return empty
+
+        refs = [ref for ref, _, _ in all_referees]
+        keys = np.array([_referee_key(ref) for ref in refs], dtype=str)
+        journals = np.array([journal for _, journal, _ in all_referees], dtype=str)
+        status = np.array([(ref.get("status") or "").lower() for ref in refs], dtype=str)
+
+        agreed = _status_matches(status, AGREED_STATUSES)
+        declined = _status_matches(status, DECLINED_STATUSES)
+        completed = _status_matches(status, COMPLETED_STATUSES)
+        active = _status_matches(status, ACTIVE_STATUSES)
+
+        # Per-referee history over every entry with a key, including ones
+        # without a usable status
+        has_key = keys != ""
+        uniq_keys, key_idx = np.unique(keys, return_inverse=True)
+        _, journal_idx = np.unique(journals, return_inverse=True)
+        n_keys = len(uniq_keys)
+
+        def per_referee(values) -> np.ndarray:
+            totals = np.bincount(
+                key_idx[has_key], weights=np.asarray(values, float)[has_key], minlength=n_keys
+            )
+            return totals[key_idx]
+
+        days = [_extract_turnaround_days(ref) for ref in refs]
+        n_invited = np.where(has_key, per_referee(np.ones(len(refs))), 1.0)
+        n_agreed = np.where(has_key, per_referee(agreed), 0.0)
+        n_active = np.where(has_key, per_referee(active), 0.0)
+        n_days = np.where(has_key, per_referee([d is not None for d in days]), 0.0)
+        sum_days = per_referee([d or 0 for d in days])
+        avg_turnaround = np.divide(sum_days, n_days, out=np.full(len(refs), 30.0), where=n_days > 0)
+        pairs, pair_idx = np.unique(
+            key_idx * (journal_idx.max() + 1) + journal_idx, return_inverse=True
+        )
+        pair_counts = np.bincount(pair_idx[has_key], minlength=len(pairs))
+        journal_count = np.where(has_key, pair_counts[pair_idx], 0)
+
+        keep = (status != "") & (agreed | declined)
+        if not keep.any():
+            return empty
+        rows = np.flatnonzero(keep)
+        h_index = np.array(
+            [(refs[i].get("web_profile") or {}).get("h_index") or 0 for i in rows], dtype=float
+        )
+        expertise_sim = np.array(
+            [
+                _keyword_overlap(
+                    (refs[i].get("web_profile") or {}).get("research_topics") or [],
+                    all_referees[i][2],
+                )
+                for i in rows
+            ]
+        )
+        inst_distance = np.array([1.0 if refs[i].get("institution") else 0.5 for i in rows])
+
+        X = np.column_stack(
+            [
+                np.minimum(h_index / H_INDEX_CAP, 1.0),
+                n_agreed[rows] / np.maximum(n_invited[rows], 1),
+                np.minimum(n_invited[rows] / 10.0, 1.0),
+                (journal_count[rows] > 1).astype(float),
                 expertise_sim,
-                min(avg_turnaround / 60.0, 1.0),
-                min(stats.get("active_count", 0) / 5.0, 1.0),
+                np.minimum(avg_turnaround[rows] / 60.0, 1.0),
+                np.minimum(n_active[rows] / 5.0, 1.0),
                 inst_distance,
             ]
-            samples_X.append(features)
-            samples_y_agree.append(1 if agreed else 0)
-            samples_y_complete.append(1 if completed else 0)
-
-        n_features = len(self.feature_names)
-        X = np.array(samples_X) if samples_X else np.array([]).reshape(0, n_features)
-        return X, np.array(samples_y_agree), np.array(samples_y_complete)
+        )
+        return X, agreed[rows].astype(int), completed[rows].astype(int)
 
     def _get_referee_stats(self, candidate: dict) -> dict:
         return candidate.get(
@@ -285,6 +322,37 @@ class RefereeResponsePredictor:
         )
 
 
+AGREED_STATUSES = ("agreed", "complete", "submitted", "overdue")
+DECLINED_STATUSES = ("declined", "uninvited", "no response")
+COMPLETED_STATUSES = ("complete", "submitted")
+ACTIVE_STATUSES = ("agreed", "awaiting", "in progress", "overdue")
+
+
+def _status_matches(statuses: np.ndarray, patterns: tuple) -> np.ndarray:
+    """Elementwise ``any(p in status for p in patterns)``."""
+    found = np.zeros(len(statuses), dtype=bool)
+    for pattern in patterns:
+        found |= np.char.find(statuses, pattern) >= 0
+    return found
+
+
+def _referee_key(ref: dict) -> str:
+    return (ref.get("email") or "").lower().strip() or (ref.get("name") or "").lower().strip()
+
+
+def add_referee_entries(raw_entries: dict, ms: dict, journal: str, file_mtime: float):
+    """Keep each (journal, manuscript, referee) from the newest snapshot it appears in."""
+    ms_id = ms.get("manuscript_id", "")
+    ms_keywords = ms.get("keywords", []) or []
+    for ref in ms.get("referees", []):
+        ref_key = _referee_key(ref)
+        if not ref_key:
+            continue
+        entry_key = (journal, ms_id, ref_key)
+        if entry_key not in raw_entries or file_mtime > raw_entries[entry_key][1]:
+            raw_entries[entry_key] = ((ref, journal, ms_keywords), file_mtime)
+
+
 def _make_model():
     try:
         from xgboost import XGBClassifier
@@ -311,19 +379,21 @@ def _extract_turnaround_days(ref: dict) -> int | None:
     completed = dates.get("returned") or ref.get("date_completed") or ref.get("report_date")
     if not invited or not completed:
         return None
-    try:
-        from datetime import datetime
-
-        for fmt in ["%Y-%m-%d", "%d %b %Y", "%m/%d/%Y", "%Y-%m-%dT%H:%M:%S"]:
-            try:
-                d1 = datetime.strptime(str(invited).strip()[:19], fmt)
-                d2 = datetime.strptime(str(completed).strip()[:19], fmt)
-                days = (d2 - d1).days
-                return max(0, days) if days < 365 else None
-            except ValueError:
-                continue
-    except (ImportError, AttributeError, TypeError):
-        pass
+    return _turnaround_between(str(invited).strip()[:19], str(completed).strip()[:19])
+
+
+@lru_cache(maxsize=65536)
+def _turnaround_between(invited: str, completed: str) -> int | None:
+    from datetime import datetime
+
+    for fmt in ["%Y-%m-%d", "%d %b %Y", "%m/%d/%Y", "%Y-%m-%dT%H:%M:%S"]:
+        try:
+            d1 = datetime.strptime(invited, fmt)
+            d2 = datetime.strptime(completed, fmt)
+            days = (d2 - d1).days
+            return max(0, days) if days < 365 else None
+        except ValueError:
+            continue
     return None
 
 
@@ -12,6 +12,9 @@ from pipeline import normalize_name_orderless as normalize_name
 
 DB_PATH = MODELS_DIR / "referee_profiles.db"
 
+# Keys per IN (...) query, below SQLite's bound-parameter limit
+_IN_CHUNK = 500
+
 _MIGRATION_COLUMNS_PROFILES = [
     ("overdue_count", "INTEGER DEFAULT 0"),
     ("overdue_rate", "REAL"),
@@ -30,6 +33,11 @@ _MIGRATION_COLUMNS_ASSIGNMENTS = [
     ("reminder_effective", "INTEGER"),
 ]
 
+_MIGRATION_COLUMNS_PREDICTIONS = [
+    ("features", "TEXT"),
+    ("learned_at", "TEXT"),
+]
+
 
 class RefereeDB:
     def __init__(self, db_path: Path = DB_PATH):
@@ -93,6 +101,11 @@ class RefereeDB:
                     conn.execute(f"ALTER TABLE referee_assignments ADD COLUMN {col} {typedef}")
                 except sqlite3.OperationalError:
                     pass
+            for col, typedef in _MIGRATION_COLUMNS_PREDICTIONS:
+                try:
+                    conn.execute(f"ALTER TABLE model_predictions ADD COLUMN {col} {typedef}")
+                except sqlite3.OperationalError:
+                    pass
             conn.commit()
             conn.close()
 
@@ -347,7 +360,10 @@ class RefereeDB:
                 return None
 
     def get_track_record(self, name):
-        profile = self.get_profile(name)
+        return self._track_record(self.get_profile(name))
+
+    @staticmethod
+    def _track_record(profile):
         if not profile:
             return {}
         total = profile.get("total_invitations", 0)
@@ -375,6 +391,42 @@ class RefereeDB:
             "journals": profile["journals_served"],
         }
 
+    def get_scoring_records(self, names, journal=None):
+        """Profiles, track records and journal stats for many referees in one connection.
+
+        Returns ``{referee_key: {"profile", "track_record", "journal_stats"}}`` for
+        the names present in the database.
+        """
+        keys = sorted({normalize_name(n) for n in names if n})
+        records = {}
+        with self._lock:
+            with self._connection() as conn:
+                for i in range(0, len(keys), _IN_CHUNK):
+                    chunk = keys[i : i + _IN_CHUNK]
+                    marks = ",".join("?" * len(chunk))
+                    # SAFE: marks is only "?" placeholders.
+                    for row in conn.execute(
+                        f"SELECT * FROM referee_profiles WHERE referee_key IN ({marks})", chunk
+                    ):
+                        profile = self._deserialize_profile(row)
+                        records[profile["referee_key"]] = {
+                            "profile": profile,
+                            "track_record": self._track_record(profile),
+                            "journal_stats": None,
+                        }
+                    if not journal:
+                        continue
+                    for row in conn.execute(
+                        "SELECT * FROM referee_journal_stats "
+                        f"WHERE journal=? AND referee_key IN ({marks})",
+                        [journal.lower(), *chunk],
+                    ):
+                        record = records.setdefault(
+                            row["referee_key"], {"profile": None, "track_record": {}}
+                        )
+                        record["journal_stats"] = dict(row)
+        return records
+
     def get_journal_stats(self, name, journal):
         key = normalize_name(name)
         with self._lock:
@@ -596,13 +648,21 @@ class RefereeDB:
                     return dict(row)
                 return None
 
-    def store_prediction(self, referee_name, journal, manuscript_id, p_accept):
+    def store_prediction(self, referee_name, journal, manuscript_id, p_accept, features=None):
         key = normalize_name(referee_name)
+        features_json = json.dumps([float(x) for x in features]) if features is not None else None
         with self._lock:
             with self._connection() as conn:
                 conn.execute(
-                    "INSERT OR REPLACE INTO model_predictions (referee_key, journal, manuscript_id, predicted_p_accept, predicted_at) VALUES (?, ?, ?, ?, ?)",
-                    (key, journal.lower(), manuscript_id, p_accept, datetime.now().isoformat()),
+                    "INSERT OR REPLACE INTO model_predictions (referee_key, journal, manuscript_id, predicted_p_accept, predicted_at, features) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        journal.lower(),
+                        manuscript_id,
+                        p_accept,
+                        datetime.now().isoformat(),
+                        features_json,
+                    ),
                 )
                 conn.commit()
 
@@ -624,42 +684,58 @@ class RefereeDB:
                 conn.commit()
 
     def resolve_predictions(self, journal=None):
+        """Fill in the actual response of every open prediction whose assignment has one."""
+        where = ""
+        params = [datetime.now().isoformat()]
+        if journal:
+            where = " AND model_predictions.journal = ?"
+            params.append(journal.lower())
         with self._lock:
             with self._connection() as conn:
-                where = "WHERE resolved_at IS NULL"
-                params = []
-                if journal:
-                    where += " AND journal = ?"
-                    params.append(journal.lower())
-                rows = conn.execute(
-                    f"SELECT id, referee_key, journal, manuscript_id FROM model_predictions {where}",  # nosec B608
+                cur = conn.execute(
+                    "UPDATE model_predictions SET "
+                    "actual_accepted = (ra.response = 'accepted'), "
+                    "actual_completed = CASE WHEN COALESCE(ra.returned_date, '') != '' THEN 1 "
+                    "WHEN ra.response = 'accepted' THEN 0 END, "
+                    "actual_review_days = ra.days_to_complete, resolved_at = ? "
+                    "FROM referee_assignments AS ra "
+                    "WHERE ra.referee_key = model_predictions.referee_key "
+                    "AND ra.journal = model_predictions.journal "
+                    "AND ra.manuscript_id = model_predictions.manuscript_id "
+                    "AND ra.response IN ('accepted', 'declined') "
+                    f"AND model_predictions.resolved_at IS NULL{where}",  # nosec B608
                     params,
-                ).fetchall()  # nosec B608
-                resolved = 0
-                for row in rows:
-                    asg = conn.execute(
-                        "SELECT response, returned_date, days_to_complete FROM referee_assignments WHERE referee_key = ? AND journal = ? AND manuscript_id = ? ORDER BY created_at DESC LIMIT 1",
-                        (row["referee_key"], row["journal"], row["manuscript_id"]),
-                    ).fetchone()
-                    if not asg or asg["response"] not in ("accepted", "declined"):
-                        continue
-                    actual_accepted = 1 if asg["response"] == "accepted" else 0
-                    actual_completed = (
-                        1 if asg["returned_date"] else (0 if actual_accepted == 1 else None)
-                    )
-                    conn.execute(
-                        "UPDATE model_predictions SET actual_accepted = ?, actual_completed = ?, actual_review_days = ?, resolved_at = ? WHERE id = ?",
-                        (
-                            actual_accepted,
-                            actual_completed,
-                            asg["days_to_complete"],
-                            datetime.now().isoformat(),
-                            row["id"],
-                        ),
-                    )
-                    resolved += 1
+                )
+                conn.commit()
+                return cur.rowcount
+
+    def unlearned_outcomes(self, limit=None):
+        """Resolved predictions with stored features not yet fed to the online model."""
+        sql = (
+            "SELECT id, features, actual_accepted FROM model_predictions "
+            "WHERE resolved_at IS NOT NULL AND learned_at IS NULL "
+            "AND features IS NOT NULL AND actual_accepted IS NOT NULL ORDER BY resolved_at, id"
+        )
+        params = []
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            with self._connection() as conn:
+                rows = conn.execute(sql, params).fetchall()
+        return [
+            {"id": r["id"], "features": json.loads(r["features"]), "accepted": r["actual_accepted"]}
+            for r in rows
+        ]
+
+    def mark_learned(self, prediction_ids):
+        with self._lock:
+            with self._connection() as conn:
+                conn.executemany(
+                    "UPDATE model_predictions SET learned_at = ? WHERE id = ?",
+                    [(datetime.now().isoformat(), pid) for pid in prediction_ids],
+                )
                 conn.commit()
-            return resolved
 
     def prediction_calibration(self):
         with self._lock:
@@ -1,10 +1,11 @@
 """Backfill referee performance database from historical extraction data."""
 
-import json
 import sys
 from pathlib import Path
 
-from pipeline import JOURNALS, OUTPUTS_DIR, normalize_name_orderless
+from core.snapshot_archive import glob_snapshots
+
+from pipeline import JOURNALS, OUTPUTS_DIR, _iter_changed_manuscripts, normalize_name_orderless
 from pipeline.referee_db import RefereeDB
 from pipeline.report_quality import assess_report_quality
 
@@ -41,7 +42,11 @@ def backfill(incremental: bool = False):
         if not journal_dir.exists():
             continue
 
-        files = sorted(journal_dir.glob(f"{journal}_extraction_*.json"), reverse=True)
+        files = sorted(
+            glob_snapshots(journal_dir, f"{journal}_extraction_*.json"),
+            key=lambda f: f.name,
+            reverse=True,
+        )
         if not files:
             continue
 
@@ -49,14 +54,9 @@ def backfill(incremental: bool = False):
             files = files[:1]
 
         seen = set()
+        last_hashes: dict[str, str] = {}
         for filepath in files:
-            try:
-                with open(filepath) as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                continue
-
-            for ms in data.get("manuscripts", []):
+            for ms in _iter_changed_manuscripts(filepath, last_hashes):
                 ms_id = ms.get("manuscript_id", "")
                 if not ms_id:
                     continue
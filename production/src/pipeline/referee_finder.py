@@ -2,15 +2,21 @@
 """Referee candidate search: OpenAlex, Semantic Scholar, historical DB, author suggestions."""
 
 import datetime
-import json
+import os
+import random
+import sqlite3
 import time
 
+import numpy as np
 import requests
 from core.academic_apis import AcademicProfileEnricher
 
-from pipeline import H_INDEX_CAP, JOURNALS, OUTPUTS_DIR
+from pipeline import H_INDEX_CAP
 from pipeline import normalize_name_orderless as normalize_name
 
+# Candidates outside the stage-1 top-K enriched anyway, to catch ones local signals underrate
+ENRICH_EXPLORE = 3
+
 
 def find_referees(
     manuscript: dict,
@@ -20,7 +26,17 @@ def find_referees(
     max_candidates: int = 15,
     expertise_index=None,
     response_predictor=None,
+    enrich_top_k: int = None,
+    explore: int = ENRICH_EXPLORE,
+    two_stage: bool = None,
+    coauthors=None,
 ) -> tuple:
+    """Collect, enrich and rank referee candidates.
+
+    In two-stage mode (``REFEREE_TWO_STAGE``, on by default) candidates are first
+    ranked on local signals, and only the top ``enrich_top_k`` (default
+    ``max_candidates``) plus ``explore`` random others are enriched over the web.
+    """
     keywords = manuscript.get("keywords", [])
     title = manuscript.get("title", "")
     abstract = manuscript.get("abstract", "")
@@ -57,14 +73,14 @@ def find_referees(
         except (ValueError, RuntimeError) as e:
             print(f"   Warning: expertise_index search failed: {e}")
 
-    oa_candidates = _search_openalex_works(keywords, title, session, author_names)
+    oa_candidates = _search_openalex_works(keywords, title, session, author_names, coauthors)
     if oa_candidates is not None:
         api_calls["openalex"] += 1
     for c in oa_candidates or []:
         if not _is_duplicate(c, seen_keys):
             candidates.append(c)
 
-    s2_candidates = _search_semantic_scholar(keywords, title, session, author_names)
+    s2_candidates = _search_semantic_scholar(keywords, title, session, author_names, coauthors)
     if s2_candidates is not None:
         api_calls["semantic_scholar"] += 1
     for c in s2_candidates or []:
@@ -76,33 +92,129 @@ def find_referees(
         if not _is_duplicate(c, seen_keys):
             candidates.append(c)
 
-    for c in candidates:
-        if not c.get("web_profile") and (c.get("name") or c.get("orcid")):
-            try:
-                profile = enricher.enrich(
-                    c["name"],
-                    orcid_id=c.get("orcid"),
-                    institution=c.get("institution"),
-                )
-                api_calls["enrichment"] += 1
-                if profile:
-                    c["web_profile"] = profile
-                    c["h_index"] = profile.get("h_index")
-                    c["citation_count"] = profile.get("citation_count")
-                    c["research_topics"] = profile.get("research_topics", [])
-                    s2 = profile.get("semantic_scholar", {})
-                    c["relevant_papers"] = s2.get("top_papers", [])[:5]
-            except (requests.RequestException, ValueError, RuntimeError) as e:
-                print(f"   Warning: enrichment failed for {c.get('name', 'unknown')}: {e}")
-
-    for c in candidates:
-        c["relevance_score"] = _compute_relevance(
-            c, keywords, title, abstract, response_predictor, journal_code, manuscript
+    records = _history_records(candidates, journal_code)
+    _fill_local_profiles(candidates, enricher, records)
+
+    needs_enrichment = [c for c in candidates if _needs_enrichment(c)]
+    top_k = max_candidates if enrich_top_k is None else enrich_top_k
+    if two_stage is None:
+        two_stage = two_stage_enabled()
+    if two_stage and len(needs_enrichment) > top_k:
+        # Stage 1: rank on local signals only; stage 2 enriches the survivors
+        stage1 = _score_candidates(
+            candidates,
+            keywords,
+            title,
+            abstract,
+            response_predictor,
+            journal_code,
+            manuscript,
+            records,
         )
+        order = sorted(range(len(candidates)), key=lambda i: -stage1[i])
+        survivors = [candidates[i] for i in order[:top_k]]
+        rest = [candidates[i] for i in order[top_k:] if _needs_enrichment(candidates[i])]
+        rng = random.Random(manuscript.get("manuscript_id", ""))
+        explorers = rng.sample(rest, min(explore, len(rest)))
+        selected = [c for c in survivors if _needs_enrichment(c)] + explorers
+        stage1_top = {id(candidates[i]) for i in order[:max_candidates]}
+    else:
+        selected, explorers, stage1_top = needs_enrichment, [], None
+
+    for c in selected:
+        _enrich_candidate(c, enricher, api_calls)
+
+    scores = _score_candidates(
+        candidates,
+        keywords,
+        title,
+        abstract,
+        response_predictor,
+        journal_code,
+        manuscript,
+        records,
+    )
+    for c, score in zip(candidates, scores, strict=True):
+        c["relevance_score"] = score
         c["topic_overlap"] = _compute_topic_overlap(c, keywords)
 
     candidates.sort(key=lambda x: -x["relevance_score"])
-    return candidates[:max_candidates], api_calls
+    top = candidates[:max_candidates]
+    api_calls["enrichment_saved"] = len(needs_enrichment) - len(selected)
+    if stage1_top is not None:
+        explorer_ids = {id(c) for c in explorers}
+        api_calls["retrieval"] = {
+            "candidates": len(candidates),
+            "enriched": len(selected),
+            "explored": len(explorers),
+            "promoted": sum(1 for c in top if id(c) not in stage1_top),
+            "promoted_by_exploration": sum(1 for c in top if id(c) in explorer_ids),
+        }
+    return top, api_calls
+
+
+def two_stage_enabled() -> bool:
+    return os.environ.get("REFEREE_TWO_STAGE", "true").lower() not in ("0", "false", "no")
+
+
+def _needs_enrichment(c: dict) -> bool:
+    return (
+        not c.get("web_profile")
+        and "_enrich_cached" not in c
+        and bool(c.get("name") or c.get("orcid"))
+    )
+
+
+def _history_records(candidates: list, journal_code: str = None) -> dict:
+    try:
+        from pipeline.referee_db import RefereeDB
+
+        return RefereeDB().get_scoring_records(
+            [c.get("name", "") for c in candidates], journal_code
+        )
+    except Exception:
+        return {}
+
+
+def _fill_local_profiles(candidates: list, enricher, records: dict):
+    """Fill profiles already known locally: earlier enrichments and referee DB history."""
+    for c in candidates:
+        if c.get("web_profile"):
+            continue
+        profile = enricher.cached_profile(c.get("name", ""), c.get("orcid"), c.get("institution"))
+        if profile is not None:
+            c["_enrich_cached"] = True
+            _apply_profile(c, profile)
+            if profile:
+                continue
+        known = (records.get(normalize_name(c.get("name", ""))) or {}).get("profile") or {}
+        if not c.get("h_index") and known.get("h_index"):
+            c["h_index"] = known["h_index"]
+        if not c.get("research_topics") and known.get("research_topics"):
+            c["research_topics"] = known["research_topics"]
+
+
+def _apply_profile(c: dict, profile: dict):
+    if profile:
+        c["web_profile"] = profile
+        c["h_index"] = profile.get("h_index")
+        c["citation_count"] = profile.get("citation_count")
+        c["research_topics"] = profile.get("research_topics", [])
+        s2 = profile.get("semantic_scholar", {})
+        c["relevant_papers"] = s2.get("top_papers", [])[:5]
+
+
+def _enrich_candidate(c: dict, enricher, api_calls: dict):
+    try:
+        profile = enricher.enrich(
+            c.get("name", ""),
+            orcid_id=c.get("orcid"),
+            institution=c.get("institution"),
+        )
+        api_calls["enrichment"] += 1
+        _apply_profile(c, profile)
+    except (requests.RequestException, ValueError, RuntimeError) as e:
+        print(f"   Warning: enrichment failed for {c.get('name', 'unknown')}: {e}")
 
 
 def _dedup_keys(c: dict) -> list[str]:
@@ -155,6 +267,7 @@ def _search_openalex_works(
     title: str,
     session: requests.Session,
     exclude_names: set,
+    coauthors=None,
 ) -> list:
     query = " ".join(keywords[:5]) if keywords else title[:100]
     if not query.strip():
@@ -177,6 +290,8 @@ def _search_openalex_works(
             return []
 
         for work in resp.json().get("results", []):
+            if coauthors is not None:
+                coauthors.add_openalex_work(work)
             for authorship in work.get("authorships", []):
                 author = authorship.get("author", {})
                 name = author.get("display_name", "")
@@ -214,6 +329,7 @@ def _search_semantic_scholar(
     title: str,
     session: requests.Session,
     exclude_names: set,
+    coauthors=None,
 ) -> list:
     query = title[:200] if title else " ".join(keywords[:5])
     if not query.strip():
@@ -226,7 +342,7 @@ def _search_semantic_scholar(
             "https://api.semanticscholar.org/graph/v1/paper/search",
             params={
                 "query": query,
-                "fields": "title,authors",
+                "fields": "title,year,authors",
                 "limit": 10,
             },
             timeout=15,
@@ -235,6 +351,8 @@ def _search_semantic_scholar(
             return []
 
         for paper in resp.json().get("data", []):
+            if coauthors is not None:
+                coauthors.add_s2_paper(paper)
             for author in paper.get("authors", []):
                 name = author.get("name", "")
                 if not name or normalize_name(name) in exclude_names:
@@ -256,65 +374,33 @@ def _search_historical(
     if not keywords:
         return []
 
-    kw_lower = {k.lower() for k in keywords}
-    candidates = []
-
-    for journal in JOURNALS:
-        journal_dir = OUTPUTS_DIR / journal
-        if not journal_dir.exists():
-            continue
-
-        files = sorted(journal_dir.glob("*.json"), key=lambda f: f.stat().st_mtime, reverse=True)
-        latest = None
-        for f in files:
-            if (
-                "BASELINE" not in f.name
-                and "debug" not in str(f)
-                and "recommendation" not in str(f)
-            ):
-                latest = f
-                break
-        if not latest:
-            continue
-
-        try:
-            with open(latest) as _f:
-                data = json.load(_f)
-        except (json.JSONDecodeError, OSError):
-            continue
+    try:
+        from pipeline.keyword_index import get_index
 
-        for ms in data.get("manuscripts", []):
-            ms_kws = {k.lower() for k in ms.get("keywords", [])}
-            overlap = kw_lower & ms_kws
-            if not overlap:
-                continue
+        hits = get_index().search(keywords, exclude_names)
+    except (sqlite3.Error, OSError) as e:
+        print(f"   Warning: historical keyword index unavailable: {e}")
+        return []
 
-            for ref in ms.get("referees", []):
-                name = ref.get("name", "")
-                if not name or normalize_name(name) in exclude_names:
-                    continue
+    candidates = []
+    for hit in hits:
+        c = _make_candidate(hit, source="historical_referee")
+        c["_hist_journal"] = hit["journal"].upper()
+        c["_hist_ms"] = hit["manuscript_id"]
+        c["_hist_overlap"] = hit["overlap"]
+        c["_hist_score"] = hit["score"]
+        candidates.append(c)
+    return candidates
 
-                c = _make_candidate(
-                    {
-                        "name": name,
-                        "email": ref.get("email"),
-                        "institution": ref.get("institution"),
-                        "orcid": ref.get("orcid"),
-                        "web_profile": ref.get("web_profile"),
-                        "h_index": (ref.get("web_profile") or {}).get("h_index"),
-                        "citation_count": (ref.get("web_profile") or {}).get("citation_count"),
-                        "research_topics": (ref.get("web_profile") or {}).get(
-                            "research_topics", []
-                        ),
-                    },
-                    source="historical_referee",
-                )
-                c["_hist_journal"] = journal.upper()
-                c["_hist_ms"] = ms.get("manuscript_id", "")
-                c["_hist_overlap"] = list(overlap)
-                candidates.append(c)
 
-    return candidates
+SOURCE_TRUST = {
+    "author_suggested": 1.0,
+    "cited_author": 0.6,
+    "expertise_index": 0.85,
+    "historical_referee": 0.7,
+    "openalex_search": 0.4,
+    "semantic_scholar_search": 0.4,
+}
 
 
 def _compute_relevance(
@@ -326,146 +412,163 @@ def _compute_relevance(
     journal_code: str = None,
     manuscript: dict = None,
 ) -> float:
+    return _score_candidates(
+        [candidate], keywords, title, abstract, response_predictor, journal_code, manuscript
+    )[0]
+
+
+def _score_candidates(
+    candidates: list,
+    keywords: list,
+    title: str,
+    abstract: str,
+    response_predictor=None,
+    journal_code: str = None,
+    manuscript: dict = None,
+    records: dict = None,
+) -> list[float]:
+    """Relevance scores for the whole candidate set.
+
+    Component scores are combined as arrays, the response model is called once
+    for all candidates and track records come from one database connection.
+    """
+    n = len(candidates)
+    if not n:
+        return []
+    kw_words = {w for k in keywords or [] for w in k.lower().split()}
+    title_words = set(title.lower().split()) if title else set()
+    current_year = datetime.datetime.now().year
+
+    topic = np.zeros(n)
+    pub = np.zeros(n)
+    h_index = np.zeros(n)
+    trust = np.zeros(n)
+    max_year = np.zeros(n)
+    for i, c in enumerate(candidates):
+        semantic_sim = c.get("semantic_similarity")
+        if semantic_sim is not None:
+            topic[i] = semantic_sim
+        elif kw_words:
+            topic_words = {w for t in c.get("research_topics", []) for w in t.lower().split()}
+            if topic_words:
+                topic[i] = len(kw_words & topic_words) / len(kw_words | topic_words) * 3
+        papers = c.get("relevant_papers", [])
+        if papers and title_words:
+            best = 0.0
+            for paper in papers:
+                p_words = set((paper.get("title") or "").lower().split())
+                if p_words:
+                    best = max(best, len(title_words & p_words) / len(title_words | p_words))
+            pub[i] = best * 3
+        if papers:
+            max_year[i] = max(paper.get("year") or 0 for paper in papers)
+        h_index[i] = c.get("h_index") or 0
+        trust[i] = SOURCE_TRUST.get(c.get("source", ""), 0.3)
+
+    topic_score = np.clip(topic, 0.0, 1.0)
+    pub_score = np.minimum(pub, 1.0)
+    seniority_score = np.minimum(h_index / H_INDEX_CAP, 1.0)
+    recency_score = np.select(
+        [
+            max_year >= current_year - 2,
+            max_year >= current_year - 4,
+            max_year >= current_year - 6,
+        ],
+        [1.0, 0.6, 0.3],
+        0.0,
+    )
+
     # Spec weights: 30% topic, 25% publication, 15% seniority, 15% source trust, 15% recency
-    topic_score = 0.0
-    semantic_sim = candidate.get("semantic_similarity")
-    if semantic_sim is not None:
-        topic_score = min(1.0, max(0.0, semantic_sim))
-    else:
-        topics = candidate.get("research_topics", [])
-        if topics and keywords:
-            kw_words = set()
-            for k in keywords:
-                kw_words.update(k.lower().split())
-            topic_words = set()
-            for t in topics:
-                topic_words.update(t.lower().split())
-            common = kw_words & topic_words
-            union = kw_words | topic_words
-            if union:
-                topic_score = min(1.0, len(common) / len(union) * 3)
-
-    pub_score = 0.0
-    papers = candidate.get("relevant_papers", [])
-    if papers and title:
-        title_words = set(title.lower().split())
-        best = 0.0
-        for p in papers:
-            ptitle = (p.get("title") or "").lower()
-            if not ptitle:
-                continue
-            p_words = set(ptitle.split())
-            common = title_words & p_words
-            union = title_words | p_words
-            if union:
-                best = max(best, len(common) / len(union))
-        pub_score = min(1.0, best * 3)
-
-    h = candidate.get("h_index") or 0
-    seniority_score = min(1.0, h / H_INDEX_CAP)
-
-    source_trust = {
-        "author_suggested": 1.0,
-        "cited_author": 0.6,
-        "expertise_index": 0.85,
-        "historical_referee": 0.7,
-        "openalex_search": 0.4,
-        "semantic_scholar_search": 0.4,
-    }
-    trust_score = source_trust.get(candidate.get("source", ""), 0.3)
-
-    recency_score = 0.0
-    if papers:
-        years = [p.get("year") or 0 for p in papers]
-        max_year = max(years) if years else 0
-        current_year = datetime.datetime.now().year
-        if max_year >= current_year - 2:
-            recency_score = 1.0
-        elif max_year >= current_year - 4:
-            recency_score = 0.6
-        elif max_year >= current_year - 6:
-            recency_score = 0.3
-
-    score = (
+    scores = (
         0.30 * topic_score
         + 0.25 * pub_score
         + 0.15 * seniority_score
-        + 0.15 * trust_score
+        + 0.15 * trust
         + 0.15 * recency_score
     )
 
     if response_predictor is not None and manuscript is not None:
         try:
-            p_accept = response_predictor.predict_for_candidate(
-                candidate, manuscript, journal_code or ""
+            p_accept = np.asarray(
+                response_predictor.predict_for_candidates(
+                    candidates, manuscript, journal_code or ""
+                ),
+                dtype=float,
             )
-            score += 0.05 * p_accept
-            candidate["_predicted_p_accept"] = p_accept
+            scores += 0.05 * p_accept
+            for c, p in zip(candidates, p_accept, strict=True):
+                c["_predicted_p_accept"] = float(p)
         except (ValueError, RuntimeError) as e:
             print(f"   Warning: response prediction failed: {e}")
 
-    try:
-        from pipeline.referee_db import RefereeDB
-
-        db = RefereeDB()
-        tr = db.get_track_record(candidate.get("name", ""))
-        if tr and tr.get("invitations", 0) >= 2:
-            candidate["referee_history"] = tr
-            track_bonus = 0.0
-            acc_rate = tr.get("acceptance_rate", 0)
-            if acc_rate >= 0.7:
-                track_bonus += 0.04
-            elif acc_rate >= 0.5:
-                track_bonus += 0.02
-            elif acc_rate < 0.3:
-                track_bonus -= 0.05
-            avg_days = tr.get("avg_review_days")
-            if avg_days and avg_days < 35:
-                track_bonus += 0.03
-            elif avg_days and avg_days > 90:
-                track_bonus -= 0.03
-            quality = tr.get("avg_quality")
-            if quality and quality > 0.5:
-                track_bonus += 0.03
-
-            if journal_code:
-                j_stats = db.get_journal_stats(candidate.get("name", ""), journal_code)
-                if j_stats and j_stats.get("total_invitations", 0) >= 2:
-                    j_acc = j_stats["total_accepted"] / j_stats["total_invitations"]
-                    if j_acc >= 0.7:
-                        track_bonus += 0.03
-
-            overdue_rate = tr.get("overdue_rate")
-            if overdue_rate and overdue_rate > 0.5:
-                track_bonus -= 0.05
-
-            qt = tr.get("quality_trend", [])
-            if len(qt) >= 2 and qt[-1] > qt[0]:
-                track_bonus += 0.02
-
-            profile = db.get_profile(candidate.get("name", ""))
-            if profile:
-                pq = profile.get("percentile_quality")
-                if pq is not None and pq >= 75:
-                    track_bonus += 0.03
-
-            if profile and profile.get("last_invited_date"):
-                try:
-                    last_inv = datetime.datetime.strptime(
-                        profile["last_invited_date"][:10], "%Y-%m-%d"
-                    ).date()
-                    days_since = (datetime.datetime.now().date() - last_inv).days
-                    if days_since < 60:
-                        score -= 0.05
-                        candidate["_cooling_off_days"] = days_since
-                except (ValueError, TypeError):
-                    pass
-
-            score += track_bonus
-    except Exception:
-        pass
-
-    return round(min(1.0, score), 3)
+    if records is None:
+        records = _history_records(candidates, journal_code)
+
+    result = []
+    for c, score in zip(candidates, scores.tolist(), strict=True):
+        record = records.get(normalize_name(c.get("name", "")))
+        if record:
+            cooling, track_bonus = _track_adjustment(c, record)
+            score = score + cooling + track_bonus
+        result.append(round(min(1.0, score), 3))
+    return result
+
+
+def _track_adjustment(candidate: dict, record: dict) -> tuple[float, float]:
+    """(cooling-off penalty, track-record bonus) from a referee's stored history."""
+    tr = record.get("track_record")
+    if not tr or tr.get("invitations", 0) < 2:
+        return 0.0, 0.0
+    candidate["referee_history"] = tr
+    track_bonus = 0.0
+    acc_rate = tr.get("acceptance_rate", 0)
+    if acc_rate >= 0.7:
+        track_bonus += 0.04
+    elif acc_rate >= 0.5:
+        track_bonus += 0.02
+    elif acc_rate < 0.3:
+        track_bonus -= 0.05
+    avg_days = tr.get("avg_review_days")
+    if avg_days and avg_days < 35:
+        track_bonus += 0.03
+    elif avg_days and avg_days > 90:
+        track_bonus -= 0.03
+    quality = tr.get("avg_quality")
+    if quality and quality > 0.5:
+        track_bonus += 0.03
+
+    j_stats = record.get("journal_stats")
+    if j_stats and j_stats.get("total_invitations", 0) >= 2:
+        j_acc = j_stats["total_accepted"] / j_stats["total_invitations"]
+        if j_acc >= 0.7:
+            track_bonus += 0.03
+
+    overdue_rate = tr.get("overdue_rate")
+    if overdue_rate and overdue_rate > 0.5:
+        track_bonus -= 0.05
+
+    qt = tr.get("quality_trend", [])
+    if len(qt) >= 2 and qt[-1] > qt[0]:
+        track_bonus += 0.02
+
+    cooling = 0.0
+    profile = record.get("profile")
+    if profile:
+        pq = profile.get("percentile_quality")
+        if pq is not None and pq >= 75:
+            track_bonus += 0.03
+        if profile.get("last_invited_date"):
+            try:
+                last_inv = datetime.datetime.strptime(
+                    profile["last_invited_date"][:10], "%Y-%m-%d"
+                ).date()
+                days_since = (datetime.datetime.now().date() - last_inv).days
+                if days_since < 60:
+                    cooling = -0.05
+                    candidate["_cooling_off_days"] = days_since
+            except (ValueError, TypeError):
+                pass
+    return cooling, track_bonus
 
 
 def _compute_topic_overlap(candidate: dict, keywords: list) -> list:
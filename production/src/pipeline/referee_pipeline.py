@@ -12,11 +12,12 @@ from pathlib import Path
 import requests
 from core.academic_apis import AcademicProfileEnricher
 from core.file_utils import load_latest_extraction as load_journal_data
+from core.identity_index import IdentityIndex
 from core.output_schema import JOURNAL_NAME_MAP, PLATFORM_MAP
 
-from pipeline import JOURNALS, OUTPUTS_DIR
+from pipeline import JOURNALS, OUTPUTS_DIR, extraction_files
 from pipeline import normalize_name_orderless as normalize_name
-from pipeline.conflict_checker import check_conflicts
+from pipeline.conflict_checker import check_conflicts, conflict_index
 from pipeline.desk_rejection import assess_desk_rejection
 from pipeline.referee_finder import find_referees
 
@@ -94,7 +95,32 @@ def is_awaiting_referee(manuscript: dict, platform: str) -> bool:
     return False
 
 
+MODEL_ATTRS = ("expertise_index", "response_predictor", "outcome_predictor", "coauthors")
+
+
+class _LoadedOnUse:
+    """Model attribute materialized by ``RefereePipeline._load_models`` on first read."""
+
+    def __set_name__(self, owner, name):
+        self.slot = f"_{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if self.slot not in obj.__dict__:
+            obj._load_models()
+        return obj.__dict__[self.slot]
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.slot] = value
+
+
 class RefereePipeline:
+    expertise_index = _LoadedOnUse()
+    response_predictor = _LoadedOnUse()
+    outcome_predictor = _LoadedOnUse()
+    coauthors = _LoadedOnUse()
+
     def __init__(self, use_llm: bool = False, max_candidates: int = 15):
         self.use_llm = use_llm
         self.max_candidates = max_candidates
@@ -103,12 +129,18 @@ class RefereePipeline:
             {"User-Agent": "Editorial-Scripts/1.0 (mailto:dylansmb@gmail.com)"}
         )
         self.enricher = AcademicProfileEnricher(self.session)
-        self.expertise_index = None
-        self.response_predictor = None
-        self.outcome_predictor = None
-        self._load_models()
 
     def _load_models(self):
+        """Load (retraining first if stale) every model not already set on the instance."""
+        preset = {n: self.__dict__[f"_{n}"] for n in MODEL_ATTRS if f"_{n}" in self.__dict__}
+        for name in MODEL_ATTRS:
+            setattr(self, name, None)
+        self._materialize_models()
+        for name, value in preset.items():
+            setattr(self, name, value)
+        self.enricher.coauthors = self.coauthors
+
+    def _materialize_models(self):
         if self._models_are_stale():
             print("   Models are stale — retraining...")
             try:
@@ -119,13 +151,45 @@ class RefereePipeline:
             except (ImportError, AttributeError, RuntimeError, ValueError) as e:
                 print(f"   Auto-retrain failed: {e}")
 
+        from pipeline.model_client import get_client
+
+        client = get_client()
+        if client is not None:
+            self._use_model_server(client)
+        else:
+            self._load_local_models()
+        try:
+            from pipeline.coauthor_graph import CoauthorGraph
+
+            self.coauthors = CoauthorGraph.load()
+            print(f"   Loaded co-authorship graph ({self.coauthors.n_papers} papers)")
+        except (OSError, ValueError) as e:
+            print(f"   Co-authorship graph not available: {e}")
+
+    def _use_model_server(self, client):
+        from pipeline.model_client import (
+            RemoteExpertiseIndex,
+            RemoteOutcomePredictor,
+            RemoteResponsePredictor,
+        )
+
+        models = client.ping().get("models", {})
+        if models.get("expertise_index"):
+            self.expertise_index = RemoteExpertiseIndex(client, models["expertise_index"])
+        if models.get("response_predictor"):
+            self.response_predictor = RemoteResponsePredictor(client)
+        if models.get("outcome_predictor"):
+            self.outcome_predictor = RemoteOutcomePredictor(client)
+        print(f"   Using model server at {client.socket_path} ({models})")
+
+    def _load_local_models(self):
         try:
             from pipeline.models.expertise_index import ExpertiseIndex
 
             idx = ExpertiseIndex()
             if idx.load():
                 self.expertise_index = idx
-                print(f"   Loaded expertise index ({len(idx.referees)} referees)")
+                print(f"   Loaded expertise index ({idx.n_referees} referees)")
         except (ImportError, AttributeError, OSError, RuntimeError) as e:
             print(f"   Expertise index not available: {e}")
         try:
@@ -157,7 +221,7 @@ class RefereePipeline:
         for journal_dir in OUTPUTS_DIR.iterdir():
             if not journal_dir.is_dir():
                 continue
-            for json_path in journal_dir.glob("*_extraction_*.json"):
+            for json_path in extraction_files(journal_dir):
                 mtime = json_path.stat().st_mtime
                 if mtime > latest_extraction:
                     latest_extraction = mtime
@@ -211,6 +275,8 @@ class RefereePipeline:
             jd = load_journal_data(j)
             if jd:
                 all_journals[j] = jd
+        if self.expertise_index is not None and len(pending) > 1:
+            self.expertise_index.prefetch(pending, k=30)
         reports = []
         for ms in pending:
             report = self._process_manuscript(ms, jc, all_journals)
@@ -268,6 +334,7 @@ class RefereePipeline:
                 self.max_candidates,
                 expertise_index=self.expertise_index,
                 response_predictor=self.response_predictor,
+                coauthors=self.coauthors,
             )
             print(f"   >> Found {len(candidates)} candidates")
 
@@ -279,6 +346,15 @@ class RefereePipeline:
             opposed = rec.get("opposed_referees", [])
 
             print("   [4/5] Checking conflicts...")
+            if self.coauthors is not None:
+                self.coauthors.add_manuscript(manuscript)
+                for c in candidates:
+                    self.coauthors.add_profile_papers(c)
+            index = conflict_index(
+                manuscript.get("authors", []), opposed, manuscript.get("editors", [])
+            )
+            opp_names = {normalize_name(o.get("name", "")) for o in opposed if o.get("name")}
+            opp_emails = {(o.get("email") or "").lower() for o in opposed if o.get("email")}
             for c in candidates:
                 conflicts = check_conflicts(
                     c,
@@ -286,12 +362,12 @@ class RefereePipeline:
                     opposed,
                     manuscript.get("editors", []),
                     self.enricher,
+                    index=index,
+                    coauthors=self.coauthors,
                 )
                 c["conflicts"] = conflicts
                 c["is_conflicted"] = len(conflicts) > 0
 
-                opp_names = {normalize_name(o.get("name", "")) for o in opposed if o.get("name")}
-                opp_emails = {(o.get("email") or "").lower() for o in opposed if o.get("email")}
                 c["author_opposed"] = (
                     c.get("email") or ""
                 ).lower() in opp_emails or normalize_name(c.get("name", "")) in opp_names
@@ -305,19 +381,31 @@ class RefereePipeline:
             print("   [4/5] Skipping conflict check")
 
         try:
+            from pipeline.models.response_predictor import RefereeResponsePredictor
             from pipeline.referee_db import RefereeDB
 
             db = RefereeDB()
             ms_id = manuscript.get("manuscript_id", "unknown")
-            for c in candidates:
-                if c.get("is_conflicted"):
-                    continue
-                p_accept = c.get("_predicted_p_accept")
-                if p_accept is not None:
-                    db.store_prediction(c["name"], journal_code, ms_id, p_accept)
+            predicted = [
+                c
+                for c in candidates
+                if not c.get("is_conflicted") and c.get("_predicted_p_accept") is not None
+            ]
+            # Stored features let resolved outcomes update the response model online
+            X = RefereeResponsePredictor().candidate_matrix(predicted, manuscript, journal_code)
+            for c, features in zip(predicted, X, strict=True):
+                db.store_prediction(
+                    c["name"], journal_code, ms_id, c["_predicted_p_accept"], features=features
+                )
         except Exception:
             pass
 
+        if self.coauthors is not None and self.coauthors.dirty:
+            try:
+                self.coauthors.save()
+            except OSError as e:
+                print(f"   Warning: could not save co-authorship graph: {e}")
+
         print("   [5/5] Building report...")
         report = self._build_report(manuscript, journal_code, desk, candidates, rq, api_calls)
         self._save_report(report, journal_code)
@@ -346,15 +434,14 @@ class RefereePipeline:
         if not rec:
             rec = (manuscript.get("platform_specific") or {}).get("referee_recommendations") or {}
         suggested_status = {}
+        top_index = IdentityIndex({"name": c.get("name", "")} for c in top)
+        conflicted_index = IdentityIndex({"name": c.get("name", "")} for c in conflicted)
         for r in rec.get("recommended_referees", []):
             name = r.get("name", "?")
-            matched = any(self.enricher.name_match(c.get("name", ""), name) for c in top)
-            if matched:
+            if top_index.match(name=name):
                 suggested_status[name] = "recommended"
             else:
-                in_conflicted = any(
-                    self.enricher.name_match(c.get("name", ""), name) for c in conflicted
-                )
+                in_conflicted = bool(conflicted_index.match(name=name))
                 suggested_status[name] = "conflict" if in_conflicted else "not_found"
 
         return {
@@ -386,7 +473,7 @@ class RefereePipeline:
             "outcome_predictor": None,
         }
         if self.expertise_index is not None:
-            info["expertise_index"] = {"n_referees": len(self.expertise_index.referees)}
+            info["expertise_index"] = {"n_referees": self.expertise_index.n_referees}
         if self.response_predictor is not None:
             info["response_predictor"] = {"loaded": True}
         if self.outcome_predictor is not None:
@@ -458,6 +545,7 @@ def _sanitize_candidates(candidates: list) -> list:
         "_hist_journal",
         "_hist_ms",
         "_hist_overlap",
+        "_hist_score",
         "_predicted_p_accept",
         "_referee_stats",
         "_cooling_off_days",
@@ -116,12 +116,9 @@ def _score_single_report(report: dict, manuscript: dict, referee: dict) -> dict:
     engagement_score = 0.0
     if text and manuscript.get("abstract"):
         try:
-            from pipeline.embeddings import get_engine
+            from pipeline.embeddings import text_similarity
 
-            engine = get_engine()
-            engagement_score = max(
-                0.0, engine.similarity(text[:2000], manuscript["abstract"][:2000])
-            )
+            engagement_score = max(0.0, text_similarity(text[:2000], manuscript["abstract"][:2000]))
         except (ImportError, AttributeError, RuntimeError, ValueError):
             pass
 
@@ -1,11 +1,40 @@
 import json
+import multiprocessing
+import os
 import subprocess
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 
-from pipeline import MODELS_DIR
+from pipeline import MODELS_DIR, OUTPUTS_DIR, _load_json, extraction_files
 
 FEEDBACK_DIR = MODELS_DIR / "feedback"
 
+# Recorded decisions the outcome predictor learns from online (1 = accept)
+OUTCOME_LABELS = {"accept": 1, "reject": 0, "desk_reject": 0}
+
+# Below this many feature rows the trainers run in-process: a worker's
+# start-up (numpy, sklearn, the embedding model) costs more than it saves.
+PARALLEL_MIN_ROWS = 1000
+
+JOBS = (
+    ("expertise_index", "_train_expertise_index"),
+    ("response_predictor", "_train_response_predictor"),
+    ("outcome_predictor", "_train_outcome_predictor"),
+)
+
+
+def _parallel_enabled() -> bool:
+    return os.environ.get("TRAIN_PARALLEL", "true").lower() not in ("0", "false", "no")
+
+
+def _train_job(method: str, features_path: str) -> tuple:
+    from pipeline.feature_store import FeatureSet
+
+    t0 = time.time()
+    result = getattr(ModelTrainer(), method)(features=FeatureSet.load(Path(features_path)))
+    return result, time.time() - t0
+
 
 class ModelTrainer:
     def __init__(self):
@@ -13,31 +42,34 @@ class ModelTrainer:
         FEEDBACK_DIR.mkdir(parents=True, exist_ok=True)
 
     def train_all(self, journals: list = None) -> dict:
+        from pipeline.feature_store import FeatureStore
+
         results = {}
         print("\n=== Model Training ===\n")
 
-        print("1. Building expertise index...")
+        print("Extracting features...")
         t0 = time.time()
-        results["expertise_index"] = self._train_expertise_index(journals)
-        print(
-            f"   {results['expertise_index'].get('n_referees', 0)} referees indexed ({time.time()-t0:.1f}s)"
-        )
-
-        print("2. Training response predictor...")
-        t0 = time.time()
-        results["response_predictor"] = self._train_response_predictor(journals)
-        rp = results["response_predictor"]
-        print(
-            f"   {rp.get('status', 'unknown')} — {rp.get('n_samples', 0)} samples, CV={rp.get('cv_accuracy', 'N/A')} ({time.time()-t0:.1f}s)"
-        )
-
-        print("3. Training outcome predictor...")
-        t0 = time.time()
-        results["outcome_predictor"] = self._train_outcome_predictor(journals)
-        op = results["outcome_predictor"]
-        print(
-            f"   {op.get('status', 'unknown')} — {op.get('n_samples', 0)} samples, CV={op.get('cv_accuracy', 'N/A')} ({time.time()-t0:.1f}s)"
-        )
+        features = FeatureStore(MODELS_DIR / "features").load_or_build(journals)
+        print(f"   {features.n_rows} feature rows ({time.time()-t0:.1f}s)")
+
+        if _parallel_enabled() and features.n_rows >= PARALLEL_MIN_ROWS:
+            print(f"Training {len(JOBS)} models in parallel...")
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=len(JOBS), mp_context=ctx) as pool:
+                futures = {
+                    pool.submit(_train_job, method, str(features.path)): name
+                    for name, method in JOBS
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    results[name], elapsed = future.result()
+                    _report(name, results[name], elapsed)
+            results = {name: results[name] for name, _ in JOBS}
+        else:
+            for name, method in JOBS:
+                t0 = time.time()
+                results[name] = getattr(self, method)(journals, features=features)
+                _report(name, results[name], time.time() - t0)
 
         results_path = MODELS_DIR / "training_results.json"
         with open(results_path, "w") as f:
@@ -77,29 +109,31 @@ class ModelTrainer:
             json.dump(metadata, f, indent=2, default=str)
         print(f"Training metadata saved to {metadata_path}")
 
-    def _train_expertise_index(self, journals: list = None) -> dict:
+    def _train_expertise_index(self, journals: list = None, features=None) -> dict:
         from pipeline.models.expertise_index import ExpertiseIndex
 
         idx = ExpertiseIndex()
-        n = idx.build(journals)
+        n = idx.build(journals) if features is None else idx.build_from(features.profiles)
         if n > 0:
             idx.save()
         return {"n_referees": n, "status": "built" if n > 0 else "empty"}
 
-    def _train_response_predictor(self, journals: list = None) -> dict:
+    def _train_response_predictor(self, journals: list = None, features=None) -> dict:
         from pipeline.models.response_predictor import RefereeResponsePredictor
 
         predictor = RefereeResponsePredictor()
-        result = predictor.train(journals)
+        data = None if features is None else features.response
+        result = predictor.train(journals, data=data)
         if result.get("status") == "trained":
             predictor.save()
         return result
 
-    def _train_outcome_predictor(self, journals: list = None) -> dict:
+    def _train_outcome_predictor(self, journals: list = None, features=None) -> dict:
         from pipeline.models.outcome_predictor import ManuscriptOutcomePredictor
 
         predictor = ManuscriptOutcomePredictor()
-        result = predictor.train(journals)
+        data = None if features is None else features.outcome
+        result = predictor.train(journals, data=data)
         if result.get("status") == "trained":
             predictor.save()
         return result
@@ -115,6 +149,46 @@ class ModelTrainer:
         with open(feedback_file, "a") as f:
             f.write(json.dumps(record) + "\n")
         print(f"Recorded: {journal} {manuscript_id} → {decision}")
+        if self.update_outcome_model(journal, manuscript_id, decision):
+            print("   Outcome predictor updated")
+
+    def update_outcome_model(self, journal: str, manuscript_id: str, decision: str) -> bool:
+        """Apply one recorded decision to the outcome predictor's online correction."""
+        label = OUTCOME_LABELS.get(decision)
+        if label is None:
+            return False
+        manuscript = _find_manuscript(journal, manuscript_id)
+        if manuscript is None:
+            return False
+        from pipeline.models.outcome_predictor import ManuscriptOutcomePredictor
+
+        predictor = ManuscriptOutcomePredictor()
+        if not predictor.load(MODELS_DIR) or not predictor.update(manuscript, journal, label):
+            return False
+        predictor.save(MODELS_DIR)
+        return True
+
+    def update_response_model(self, db=None) -> int:
+        """Apply newly resolved referee predictions to the response predictor's online correction."""
+        import numpy as np
+
+        from pipeline.models.response_predictor import RefereeResponsePredictor
+        from pipeline.referee_db import RefereeDB
+
+        db = db or RefereeDB()
+        predictor = RefereeResponsePredictor()
+        outcomes = [
+            o for o in db.unlearned_outcomes() if len(o["features"]) == len(predictor.feature_names)
+        ]
+        if not outcomes or not predictor.load(MODELS_DIR):
+            return 0
+        n = predictor.update(
+            np.array([o["features"] for o in outcomes]), np.array([o["accepted"] for o in outcomes])
+        )
+        if n:
+            predictor.save(MODELS_DIR)
+            db.mark_learned([o["id"] for o in outcomes])
+        return n
 
     def get_feedback_stats(self) -> dict:
         stats = {}
@@ -132,3 +206,25 @@ class ModelTrainer:
                     pass
             stats[journal] = {"total": len(lines), "decisions": decisions}
         return stats
+
+
+def _find_manuscript(journal: str, manuscript_id: str) -> dict | None:
+    """The manuscript's record in the newest extraction snapshot that has it."""
+    snapshots = sorted(
+        extraction_files(OUTPUTS_DIR / journal), key=lambda p: p.stat().st_mtime, reverse=True
+    )
+    for path in snapshots:
+        for ms in _load_json(path).get("manuscripts", []) or []:
+            if ms.get("manuscript_id") == manuscript_id:
+                return ms
+    return None
+
+
+def _report(name: str, result: dict, elapsed: float):
+    if name == "expertise_index":
+        print(f"   {result.get('n_referees', 0)} referees indexed ({elapsed:.1f}s)")
+        return
+    label = name.replace("_", " ")
+    print(
+        f"   {label}: {result.get('status', 'unknown')} — {result.get('n_samples', 0)} samples, CV={result.get('cv_accuracy', 'N/A')} ({elapsed:.1f}s)"
+    )
@@ -5,6 +5,8 @@ import unicodedata
 from datetime import datetime
 from pathlib import Path
 
+from core.snapshot_archive import glob_snapshots, load_snapshot
+
 OUTPUTS_DIR = Path(__file__).parent.parent.parent / "outputs"
 
 JOURNALS = ["mf", "mor", "fs", "jota", "mafe", "sicon", "sifin", "naco", "mf_wiley"]
@@ -40,7 +42,7 @@ def _list_extraction_files(journal: str) -> list[Path]:
         return []
     skip = ("BASELINE", "debug", "rec_", "partial", "ae_", "recommendation")
     return sorted(
-        [f for f in journal_dir.glob("*.json") if not any(s in f.name for s in skip)],
+        [f for f in glob_snapshots(journal_dir) if not any(s in f.name for s in skip)],
         key=lambda f: f.name,
         reverse=True,
     )
@@ -53,9 +55,8 @@ def find_latest_output(journal: str) -> Path | None:
 
 def _load_json(path: Path) -> dict | None:
     try:
-        with open(path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return load_snapshot(path)
+    except (json.JSONDecodeError, OSError, ValueError):
         return None
 
 
@@ -19,11 +19,13 @@ Usage:
     python3 run_extractors.py --journal mor
     python3 run_extractors.py --all
     python3 run_extractors.py --status
+    python3 run_extractors.py --journal jota --resource-ab
 """
 
 import argparse
 import json
 import logging
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -194,12 +196,37 @@ class ExtractorOrchestrator:
         except Exception as e:
             self.logger.warning(f"Referee DB backfill failed: {e}")
 
-    def run_extractor(self, journal_id: str, headless: bool = True) -> Optional[dict]:
+    def _start_enrichment_worker(self):
+        """Drain the deferred web-enrichment queue in a detached process."""
+        try:
+            from core.enrichment_queue import deferral_enabled
+
+            if not deferral_enabled():
+                return
+            import subprocess
+
+            log_path = self.output_dir / "enrichment_worker.log"
+            with open(log_path, "a") as log:
+                subprocess.Popen(
+                    [sys.executable, "-m", "core.enrichment_queue"],
+                    cwd=str(Path(__file__).parent / "production" / "src"),
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                )
+            self.logger.info(f"Web enrichment continues in background (log: {log_path})")
+        except Exception as e:
+            self.logger.warning(f"Enrichment worker not started: {e}")
+
+    def run_extractor(
+        self, journal_id: str, headless: bool = True, start_worker: bool = True
+    ) -> Optional[dict]:
         """Run a specific extractor.
 
         Args:
             journal_id: Journal identifier (mf, mor, etc.)
             headless: Run in headless mode
+            start_worker: Start the deferred web-enrichment worker afterwards
 
         Returns:
             Extraction results or None if failed
@@ -268,6 +295,8 @@ class ExtractorOrchestrator:
                 }
 
                 self._dispatch_events(journal_id)
+                if start_worker:
+                    self._start_enrichment_worker()
 
                 return extraction_data
 
@@ -288,6 +317,48 @@ class ExtractorOrchestrator:
             except Exception as e:
                 self.logger.warning(f"Cleanup error for {journal_id}: {e}")
 
+    def _latest_output(self, journal_id: str) -> list[dict]:
+        journal_dir = Path(__file__).parent / "production" / "outputs" / journal_id
+        files = sorted(journal_dir.glob(f"{journal_id}_extraction_*.json"))
+        if not files:
+            return []
+        with open(files[-1]) as f:
+            return json.load(f).get("manuscripts", [])
+
+    def run_resource_ab(self, journal_id: str, headless: bool = True) -> Optional[dict]:
+        """Run a journal with and without resource blocking; compare duration and output.
+
+        The blocked run goes first, so any warm-cache advantage favours the
+        unblocked baseline and the reported speed-up is a lower bound.
+        """
+        from core.resource_policy import compare_outputs
+
+        previous = os.environ.get("EXTRACTOR_BLOCK_RESOURCES")
+        runs = {}
+        try:
+            for mode, flag in (("blocked", "true"), ("baseline", "false")):
+                os.environ["EXTRACTOR_BLOCK_RESOURCES"] = flag
+                result = self.run_extractor(journal_id, headless=headless)
+                if not result:
+                    self.logger.error(f"A/B {mode} run failed for {journal_id}")
+                    return None
+                runs[mode] = (result["duration_seconds"], self._latest_output(journal_id))
+        finally:
+            if previous is None:
+                os.environ.pop("EXTRACTOR_BLOCK_RESOURCES", None)
+            else:
+                os.environ["EXTRACTOR_BLOCK_RESOURCES"] = previous
+
+        comparison = compare_outputs(runs["baseline"][1], runs["blocked"][1])
+        baseline_s, blocked_s = runs["baseline"][0], runs["blocked"][0]
+        return {
+            "journal": journal_id,
+            "baseline_seconds": round(baseline_s, 1),
+            "blocked_seconds": round(blocked_s, 1),
+            "speedup": round(baseline_s / blocked_s, 2) if blocked_s else None,
+            **comparison,
+        }
+
     def run_all_working(self, headless: bool = True) -> dict[str, Optional[dict]]:
         """Run all working extractors.
 
@@ -323,7 +394,7 @@ class ExtractorOrchestrator:
                 print("   (cleaned quarantined chromedriver)")
 
             journal_headless = False if journal_id in headful_journals else headless
-            result = self.run_extractor(journal_id, headless=journal_headless)
+            result = self.run_extractor(journal_id, headless=journal_headless, start_worker=False)
             results[journal_id] = result
 
             if result:
@@ -333,6 +404,11 @@ class ExtractorOrchestrator:
             else:
                 print(f"❌ {journal_id.upper()} failed")
 
+        # One enrichment pass for the whole sweep, so people shared between
+        # journals are looked up once
+        if any(results.values()):
+            self._start_enrichment_worker()
+
         return results
 
     def get_recent_results(self, journal_id: Optional[str] = None) -> list[dict]:
@@ -404,6 +480,11 @@ def main():
     parser.add_argument(
         "--output", "-o", default="results", help="Output directory (default: results)"
     )
+    parser.add_argument(
+        "--resource-ab",
+        action="store_true",
+        help="Run --journal with and without resource blocking and compare time and output",
+    )
 
     args = parser.parse_args()
 
@@ -445,6 +526,20 @@ def main():
                     f"🗂️  {journal.upper():6} | {time} | {count:3} manuscripts | {duration:6.1f}s"
                 )
 
+    elif args.journal and args.resource_ab:
+        report = orchestrator.run_resource_ab(args.journal, headless=not args.visible)
+        if not report:
+            print("\n❌ A/B RUN FAILED")
+            sys.exit(1)
+        print("\n⏱️ RESOURCE BLOCKING A/B")
+        print(f"Baseline: {report['baseline_seconds']}s  Blocked: {report['blocked_seconds']}s")
+        print(f"Speed-up: x{report['speedup']}")
+        print(f"Identical outputs: {report['identical']}/{report['manuscripts']} manuscripts")
+        for ms_id, paths in report["differences"].items():
+            print(f"   ⚠️ {ms_id}: {', '.join(paths[:5])}")
+        if report["unmatched"]:
+            print(f"   ⚠️ Only in one run: {', '.join(report['unmatched'])}")
+
     elif args.journal:
         headless = not args.visible
         result = orchestrator.run_extractor(args.journal, headless=headless)
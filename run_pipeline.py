@@ -15,13 +15,15 @@ Usage:
 
 import argparse
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent / "production" / "src"))
 
-from pipeline.referee_pipeline import RefereePipeline  # noqa: E402
-
-RETRAIN_THRESHOLD = 5
+# Recorded outcomes update the predictors online right away; a full retrain
+# (drift control) runs after this many new outcomes or this many days.
+RETRAIN_THRESHOLD = 50
+RETRAIN_MAX_AGE_DAYS = 7
 
 
 def _print_feedback_stats():
@@ -54,13 +56,17 @@ def _maybe_retrain_after_feedback():
         except ValueError:
             pass
     new_outcomes = total - last_count
-    if new_outcomes >= RETRAIN_THRESHOLD:
-        print(f"\n{new_outcomes} new outcomes since last training — retraining models...")
+    marker = MODELS_DIR / ".last_trained"
+    age_days = (time.time() - marker.stat().st_mtime) / 86400 if marker.exists() else None
+    if new_outcomes >= RETRAIN_THRESHOLD or (
+        new_outcomes > 0 and age_days is not None and age_days >= RETRAIN_MAX_AGE_DAYS
+    ):
+        print(f"\n{new_outcomes} new outcomes since last full training — retraining models...")
         trainer.train_all()
         count_file.write_text(str(total))
     else:
         remaining = RETRAIN_THRESHOLD - new_outcomes
-        print(f"\n{new_outcomes} new outcomes ({remaining} more until auto-retrain)")
+        print(f"\n{new_outcomes} new outcomes ({remaining} more until a full retrain)")
 
 
 def _run_interactive(journal):
@@ -282,6 +288,8 @@ def main():
     if not args.manuscript and not args.pending:
         parser.error("Specify --manuscript ID, --pending, --train, --validate, or --rebuild-index")
 
+    from pipeline.referee_pipeline import RefereePipeline
+
     pipeline = RefereePipeline(use_llm=args.llm, max_candidates=args.max_candidates)
 
     if args.manuscript:
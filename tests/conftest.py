@@ -2,6 +2,16 @@ import json
 
 import pytest
 from core.cache_manager import CacheManager
+from pipeline import keyword_index
+
+
+@pytest.fixture(autouse=True)
+def isolated_keyword_index(tmp_path, monkeypatch):
+    """Keep ``get_index()`` from building the real models-dir database."""
+    monkeypatch.setenv("KEYWORD_INDEX_DB", str(tmp_path / "keyword_index.db"))
+    keyword_index.reset_index()
+    yield
+    keyword_index.reset_index()
 
 
 @pytest.fixture
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from pipeline import ann_index
+from pipeline.models.expertise_index import ExpertiseIndex
+
+
+@pytest.fixture
+def corpus():
+    return ann_index.synthetic_corpus(2_000, 32, n_queries=50)
+
+
+class TestBackendChoice:
+    def test_thresholds(self):
+        assert ann_index.choose_backend(100) == "flat"
+        assert ann_index.choose_backend(ann_index.FLAT_MAX + 1) == "hnsw"
+        assert ann_index.choose_backend(ann_index.HNSW_MAX + 1) == "ivfpq"
+
+    def test_pq_subquantizers_divide_dim(self):
+        assert ann_index._pq_subquantizers(384) == 192
+        assert ann_index._pq_subquantizers(768) == 384
+        assert ann_index._pq_subquantizers(7) == 1
+
+    def test_exact_search(self):
+        vectors = np.eye(4, dtype=np.float32)
+        queries = np.array([[0.1, 0.9, 0.5, 0.0]], dtype=np.float32)
+        assert ann_index.exact_search(vectors, queries, 2).tolist() == [[1, 2]]
+
+
+class TestBackends:
+    @pytest.fixture(autouse=True)
+    def _faiss(self):
+        pytest.importorskip("faiss")
+
+    @pytest.mark.parametrize("backend", ["flat", "hnsw"])
+    def test_recall_against_exact(self, corpus, backend):
+        vectors, queries = corpus
+        result = ann_index.benchmark(vectors, queries, k=10, backends=[backend])
+        assert result[backend]["recall_at_k"] >= 0.95
+
+    def test_ivfpq_builds_and_searches(self, corpus):
+        vectors, queries = corpus
+        index = ann_index.build(vectors, "ivfpq")
+        hits = ann_index.search(index, queries[:3], 5)
+        assert [len(h) for h in hits] == [5, 5, 5]
+
+    def test_batched_search_matches_single(self, corpus):
+        vectors, queries = corpus
+        index = ann_index.build(vectors)
+        batched = ann_index.search(index, queries[:5], 10)
+        single = [ann_index.search(index, q[None, :], 10)[0] for q in queries[:5]]
+        assert [[i for i, _ in h] for h in batched] == [[i for i, _ in h] for h in single]
+
+    def test_unknown_backend(self, corpus):
+        with pytest.raises(ValueError):
+            ann_index.build(corpus[0], "lsh")
+
+    def test_prefetch_serves_search(self, monkeypatch):
+        from pipeline import embeddings
+
+        engine = embeddings.EmbeddingEngine()
+        monkeypatch.setattr(embeddings, "_engine", engine)
+        idx = ExpertiseIndex()
+        idx.referees = [
+            {"name": "Alice Smith", "text": "stochastic control and optimal stopping"},
+            {"name": "Bob Jones", "text": "marine biology and ecology"},
+            {"name": "Carol White", "text": "mean field games"},
+        ]
+        idx.index = engine.build_index([r["text"] for r in idx.referees])
+        manuscripts = [
+            {"title": "Optimal stopping", "abstract": "stochastic control"},
+            {"title": "Coral reefs", "abstract": "marine ecology"},
+        ]
+        expected = [idx.search(ms, k=2) for ms in manuscripts]
+        assert idx.search_many(manuscripts, k=2) == expected
+        idx.prefetch(manuscripts, k=2)
+        idx.index = None
+        assert [idx.search(ms, k=2) for ms in manuscripts] == expected
+        assert idx.search(manuscripts[0], k=3) == []
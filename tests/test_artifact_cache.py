@@ -0,0 +1,211 @@
+from unittest.mock import MagicMock
+
+import pytest
+from core.cache_integration import CachedExtractorMixin
+from core.cache_manager import CacheManager
+
+
+@pytest.fixture
+def cache():
+    manager = CacheManager(test_mode=True)
+    yield manager
+    manager.cleanup_test_cache()
+
+
+class _Extractor(CachedExtractorMixin):
+    def __init__(self, cache):
+        self.cache_manager = cache
+        self.journal_name = "MF"
+
+
+class TestArtifactStore:
+    def test_round_trip(self, cache):
+        cache.put_artifact("MF", "MAFI-1", "referee_report", {"text": "ok"}, "a@x.org", 1)
+        assert cache.get_artifact("MF", "MAFI-1", "referee_report", "a@x.org", 1) == {"text": "ok"}
+
+    def test_key_includes_revision_and_referee(self, cache):
+        cache.put_artifact("MF", "MAFI-1", "referee_report", {"text": "ok"}, "a@x.org", 1)
+        assert cache.get_artifact("MF", "MAFI-1", "referee_report", "a@x.org", 2) is None
+        assert cache.get_artifact("MF", "MAFI-1", "referee_report", "b@x.org", 1) is None
+
+
+class TestCachedArtifact:
+    def test_fetches_once(self, cache):
+        ext = _Extractor(cache)
+        fetch = MagicMock(return_value={"text": "Decision: accept"})
+        for _ in range(2):
+            assert ext.cached_artifact("decision_letter", "MAFI-1.R1", fetch) == {
+                "text": "Decision: accept"
+            }
+        fetch.assert_called_once()
+
+    def test_revision_from_manuscript_id(self, cache):
+        ext = _Extractor(cache)
+        ext.cached_artifact("decision_letter", "MAFI-1.R2", lambda: {"text": "x"})
+        assert cache.get_artifact("MF", "MAFI-1.R2", "decision_letter", "", 2) == {"text": "x"}
+
+    def test_referee_dict_uses_person_key(self, cache):
+        ext = _Extractor(cache)
+        referee = {"name": "Alice Smith", "email": "Alice@Test.com"}
+        ext.cached_artifact("referee_report", "MAFI-1", lambda: {"t": 1}, referee=referee)
+        assert ext.get_cached_artifact("referee_report", "MAFI-1", "alice@test.com") == {"t": 1}
+
+    def test_rejected_result_not_stored(self, cache):
+        ext = _Extractor(cache)
+        fetch = MagicMock(return_value={"available": False})
+        for _ in range(2):
+            ext.cached_artifact("referee_report", "MAFI-1", fetch, keep=lambda r: r["available"])
+        assert fetch.call_count == 2
+
+    def test_force_refresh_bypasses_cache(self, cache):
+        ext = _Extractor(cache)
+        ext.cached_artifact("author_response", "MAFI-1", lambda: {"text": "old"})
+        ext.force_refresh = True
+        assert ext.cached_artifact("author_response", "MAFI-1", lambda: {"text": "new"}) == {
+            "text": "new"
+        }
+
+    def test_no_cache_manager(self):
+        ext = _Extractor(None)
+        assert ext.cached_artifact("decision_letter", "MAFI-1", lambda: {"t": 1}) == {"t": 1}
+
+
+def _em_extractor(cache, popup_report):
+    from core.em_base import EMExtractor
+
+    ext = EMExtractor.__new__(EMExtractor)
+    ext.cache_manager = cache
+    ext.journal_name = "JOTA"
+    ext._parse_review_popup = MagicMock(side_effect=lambda *a: dict(popup_report))
+    return ext
+
+
+class TestEMReviewReportCache:
+    REF = {"name": "Alice Smith", "email": "alice@test.com"}
+    PL = {"revision": 0, "js": "popupReviewDetails(false, 7, 9, 0)"}
+    MS_INFO = {"manuscript_id": "JOTA-D-24-1"}
+
+    def test_session_urls_not_cached_and_rederived(self, cache):
+        report = {
+            "revision": 0,
+            "comments_to_author": "Solid paper.",
+            "extraction_status": "ok",
+            "_attachment_urls": [{"url": "download.aspx?id=1&s=SESSION", "filename": "r.pdf"}],
+        }
+        ext = _em_extractor(cache, report)
+        ext._review_report(self.PL, 7, self.REF, self.MS_INFO, "")
+
+        stored = ext.get_cached_artifact("referee_report", "JOTA-D-24-1", self.REF, 0)
+        assert "_attachment_urls" not in stored
+        assert "download.aspx" not in str(stored)
+
+        again = ext._review_report(self.PL, 7, self.REF, self.MS_INFO, "")
+        assert again["_attachment_urls"][0]["url"].startswith("download.aspx")
+        assert ext._parse_review_popup.call_count == 2
+
+    def test_report_without_attachments_served_from_cache(self, cache):
+        report = {"revision": 0, "comments_to_author": "Fine.", "extraction_status": "ok"}
+        ext = _em_extractor(cache, report)
+        ext._review_report(self.PL, 7, self.REF, self.MS_INFO, "")
+        cached = ext._review_report(self.PL, 7, self.REF, self.MS_INFO, "")
+        assert cached["comments_to_author"] == "Fine."
+        assert "_attachment_count" not in cached
+        ext._parse_review_popup.assert_called_once()
+
+
+class TestSIAMCachedReviewsPage:
+    def _extractor(self, cache):
+        from bs4 import BeautifulSoup
+        from core.siam_base import SIAMExtractor
+
+        ext = SIAMExtractor.__new__(SIAMExtractor)
+        ext.cache_manager = cache
+        ext.journal_name = "SICON"
+        ext.driver = MagicMock(current_url="https://sicon.siam.org/cgi-bin/main.plex")
+        ext._load_subpage = MagicMock(return_value=BeautifulSoup("<p></p>", "html.parser"))
+        soup = BeautifulSoup(
+            "<a href='main.plex?form_type=display_all_reviews'>r</a>", "html.parser"
+        )
+        return ext, soup
+
+    def _cache_report(self, ext, manuscript, attachment):
+        report = {
+            "comments_to_author": "ok",
+            "extraction_status": "ok",
+            "attachments": [attachment],
+        }
+        ext.store_artifact("referee_report", "M1234", report, manuscript["referees"][0], 0)
+
+    def test_cached_reports_skip_reviews_page(self, cache, tmp_path):
+        ext, soup = self._extractor(cache)
+        pdf = tmp_path / "r.pdf"
+        pdf.write_bytes(b"%PDF")
+        manuscript = {"manuscript_id": "M1234", "referees": [{"name": "Ann Lee"}]}
+        self._cache_report(ext, manuscript, {"local_path": str(pdf)})
+        ext._extract_referee_reports(manuscript, soup)
+        ext._load_subpage.assert_not_called()
+        assert manuscript["referees"][0]["report"]["attachments"][0]["local_path"] == str(pdf)
+
+    def test_missing_attachment_file_reloads_reviews_page(self, cache, tmp_path):
+        ext, soup = self._extractor(cache)
+        manuscript = {"manuscript_id": "M1234", "referees": [{"name": "Ann Lee"}]}
+        self._cache_report(ext, manuscript, {"local_path": str(tmp_path / "gone.pdf")})
+        ext._attach_referee_pdfs = MagicMock()
+        ext._extract_referee_reports(manuscript, soup)
+        ext._load_subpage.assert_called_once()
+        ext._attach_referee_pdfs.assert_called_once()
+
+
+class TestScholarOneRefereeReportCache:
+    REFEREE = {"name": "Ann Lee", "email": "ann@x.org", "report_url": "rev_ms_det_pop.html?X"}
+
+    def _extractor(self, cache, popup_report):
+        from core.scholarone_base import ScholarOneBaseExtractor
+
+        ext = ScholarOneBaseExtractor.__new__(ScholarOneBaseExtractor)
+        ext.cache_manager = cache
+        ext.journal_name = "MF"
+        ext._open_referee_report_popup = MagicMock(return_value=popup_report)
+        return ext
+
+    def _report(self, pdf, **extra):
+        return {
+            "comments_to_author": "Minor revision.",
+            "raw_text": "Minor revision.",
+            "extraction_status": "ok",
+            "available": True,
+            "attached_files": [str(pdf)],
+            "attachments": [{"local_path": str(pdf), "url": "https://mc.manuscriptcentral.com/x"}],
+            **extra,
+        }
+
+    def test_session_urls_not_cached(self, cache, tmp_path):
+        pdf = tmp_path / "r.pdf"
+        pdf.write_bytes(b"%PDF")
+        ext = self._extractor(cache, self._report(pdf))
+        live = ext.extract_referee_report_from_popup(self.REFEREE, "MAFI-1")
+        assert live["attachments"][0]["url"]
+        cached = ext.extract_referee_report_from_popup(self.REFEREE, "MAFI-1")
+        ext._open_referee_report_popup.assert_called_once()
+        assert cached["attachments"] == [{"local_path": str(pdf)}]
+
+    def test_missing_attached_file_reopens_popup(self, cache, tmp_path):
+        pdf = tmp_path / "r.pdf"
+        pdf.write_bytes(b"%PDF")
+        ext = self._extractor(cache, self._report(pdf))
+        ext.extract_referee_report_from_popup(self.REFEREE, "MAFI-1")
+        pdf.unlink()
+        ext.extract_referee_report_from_popup(self.REFEREE, "MAFI-1")
+        assert ext._open_referee_report_popup.call_count == 2
+
+    @pytest.mark.parametrize(
+        "extra",
+        [
+            {"extraction_status": "shell_only"},
+            {"comments_to_author": "", "raw_text": "", "scores": {"Originality": "3"}},
+        ],
+    )
+    def test_incomplete_report_not_cached(self, cache, tmp_path, extra):
+        ext = self._extractor(cache, self._report(tmp_path / "r.pdf", **extra))
+        ext.extract_referee_report_from_popup(self.REFEREE, "MAFI-1")
+        assert ext.get_cached_artifact("referee_report", "MAFI-1", self.REFEREE) is None
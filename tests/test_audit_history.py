@@ -0,0 +1,106 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from core.audit_history import AuditHistory, event_hash
+from core.state_store import StateStore
+
+
+def _event(day, subject="Reminder"):
+    return {
+        "datetime": datetime(2026, 1, day, 12),
+        "date": datetime(2026, 1, day, 12),
+        "event_type": "email",
+        "subject": f"{subject} {day}",
+        "email_content_url": f"popup?session={day}",
+    }
+
+
+def _pages(days):
+    """Newest-first pages of ten events."""
+    events = [_event(d) for d in sorted(days, reverse=True)]
+    return [events[i : i + 10] for i in range(0, len(events), 10)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return StateStore(db_path=tmp_path / "state.db")
+
+
+def _read(store, pages, **kwargs):
+    history = AuditHistory("MF", "MAFI-1", store=store, **kwargs)
+    read = 0
+    for page in pages:
+        read += 1
+        if not history.add_page(page):
+            break
+    return history, history.finish(), read
+
+
+class TestAuditHistory:
+    def test_first_run_reads_everything(self, store):
+        _, events, read = _read(store, _pages(range(1, 26)))
+        assert (len(events), read) == (25, 3)
+        stored, latest = store.get_audit_history("MAFI-1", "mf")
+        assert latest == event_hash(_event(25))
+        assert stored[0]["datetime"] == datetime(2026, 1, 25, 12)
+
+    def test_stops_at_first_known_event(self, store):
+        _read(store, _pages(range(1, 26)))
+        history, events, read = _read(store, _pages(range(1, 28)))
+        assert read == 1
+        assert len(history.new) == 2
+        assert [e["subject"] for e in events[:3]] == ["Reminder 27", "Reminder 26", "Reminder 25"]
+        assert len(events) == 27
+
+    def test_unchanged_trail_is_not_rewritten(self, store):
+        _read(store, _pages(range(1, 5)))
+        with patch.object(store, "save_audit_history") as save:
+            _, events, read = _read(store, _pages(range(1, 5)))
+        save.assert_not_called()
+        assert (len(events), read) == (4, 1)
+
+    def test_session_urls_do_not_affect_identity(self):
+        a, b = _event(3), _event(3)
+        b["email_content_url"] = "popup?session=other"
+        assert event_hash(a) == event_hash(b)
+
+    def test_oldest_first_pages_fall_back_to_full_read(self, store):
+        _read(store, _pages(range(1, 11)))
+        # Pages in ascending order: an older stored event is met before the newest
+        history, events, read = _read(store, [[_event(1)], [_event(11)]])
+        assert read == 2 and not history.reached_known
+        assert [e["subject"] for e in events] == ["Reminder 1", "Reminder 11"]
+
+    def test_full_ignores_stored(self, store):
+        _read(store, _pages(range(1, 15)))
+        _, events, read = _read(store, _pages(range(1, 15)), full=True)
+        assert (len(events), read) == (14, 2)
+
+
+class TestMFIncrementalAudit:
+    def _extractor(self, store, pages):
+        from extractors.mf_extractor import ComprehensiveMFExtractor
+
+        ext = ComprehensiveMFExtractor.__new__(ComprehensiveMFExtractor)
+        ext.JOURNAL_CODE = "MF"
+        ext.driver = MagicMock()
+        ext.driver.page_source = "<html>alice@test.com</html>"
+        ext._all_page_emails = set()
+        ext.get_total_audit_events = MagicMock(return_value=sum(len(p) for p in pages))
+        ext.navigate_to_audit_page = MagicMock()
+        ext.extract_events_from_current_page = MagicMock(side_effect=pages)
+        ext._audit_history = lambda ms_id: AuditHistory("MF", ms_id, store=store)
+        return ext
+
+    def test_second_run_loads_one_page(self, store):
+        with patch("extractors.mf_extractor.time.sleep"):
+            first = self._extractor(store, _pages(range(1, 31)))
+            assert len(first.extract_communication_events("MAFI-1")) == 30
+            assert first.navigate_to_audit_page.call_count == 2
+
+            pages = _pages(range(1, 32))
+            second = self._extractor(store, pages)
+            events = second.extract_communication_events("MAFI-1")
+        assert len(events) == 31
+        second.navigate_to_audit_page.assert_not_called()
@@ -0,0 +1,162 @@
+import datetime
+
+import pytest
+from pipeline.coauthor_graph import CoauthorGraph, paper_key, person_keys
+from pipeline.conflict_checker import check_conflicts
+
+THIS_YEAR = datetime.date.today().year
+
+
+def _work(title, year, *authors):
+    return {
+        "title": title,
+        "publication_year": year,
+        "authorships": [
+            {"author": {"id": f"https://openalex.org/{aid}", "display_name": name}}
+            for aid, name in authors
+        ],
+    }
+
+
+@pytest.fixture
+def graph(tmp_path):
+    g = CoauthorGraph(tmp_path / "graph")
+    g.add_openalex_work(
+        _work(
+            "Mean field games with common noise",
+            THIS_YEAR - 1,
+            ("A1", "Alice Smith"),
+            ("A2", "Bob Jones"),
+        )
+    )
+    g.add_s2_paper(
+        {
+            "title": "Mean-Field Games with Common Noise",
+            "year": THIS_YEAR - 1,
+            "authors": [{"authorId": "99", "name": "Carol White"}],
+        }
+    )
+    g.add_openalex_work(
+        _work("Optimal stopping under ambiguity", 2001, ("A2", "Bob Jones"), ("A3", "Dan Brown"))
+    )
+    return g
+
+
+ALICE = ["oa:A1"]
+BOB = ["oa:A2"]
+CAROL = ["s2:99"]
+DAN = ["name:brown dan"]
+
+
+class TestQueries:
+    def test_sources_merge_on_title(self, graph):
+        assert graph.n_papers == 2
+        assert graph.coauthored(ALICE, CAROL)
+        assert graph.shared_papers(ALICE, BOB) == [
+            ("Mean field games with common noise", THIS_YEAR - 1)
+        ]
+
+    def test_year_window(self, graph):
+        assert graph.coauthored(BOB, DAN)
+        assert not graph.coauthored(BOB, DAN, within_years=5)
+        assert graph.coauthored(ALICE, BOB, within_years=5)
+
+    def test_distance_two(self, graph):
+        assert not graph.coauthored(ALICE, DAN)
+        assert graph.within_two(ALICE, DAN)
+        assert not graph.within_two(ALICE, ["name:nobody"])
+
+    def test_short_titles_ignored(self, graph):
+        assert paper_key("Preface") == ""
+        assert not graph.add_paper("Editorial", 2020, [ALICE, DAN])
+
+
+class TestStorage:
+    def test_roundtrip_and_incremental_update(self, graph, tmp_path):
+        graph.save()
+        loaded = CoauthorGraph.load(tmp_path / "graph")
+        assert loaded.shared_papers(ALICE, BOB) == graph.shared_papers(ALICE, BOB)
+        assert loaded.within_two(ALICE, DAN)
+
+        loaded.add_openalex_work(
+            _work(
+                "Robust portfolio choice revisited", 2024, ("A3", "Dan Brown"), ("A1", "A. Smith")
+            )
+        )
+        loaded.save()
+        again = CoauthorGraph.load(tmp_path / "graph")
+        assert again.coauthored(ALICE, DAN)
+        assert again.coauthored(ALICE, BOB)
+
+    def test_missing_graph_is_empty(self, tmp_path):
+        graph = CoauthorGraph.load(tmp_path / "none")
+        assert graph.n_papers == 0
+        assert not graph.coauthored(ALICE, BOB)
+
+
+class TestConflictCheck:
+    def test_graph_finds_coauthorship_beyond_top_papers(self, graph):
+        candidate = {
+            "name": "Carol White",
+            "web_profile": {"semantic_scholar": {"author_id": "99", "top_papers": []}},
+        }
+        authors = [
+            {
+                "name": "Alice Smith",
+                "web_profile": {"openalex": {"author_id": "https://openalex.org/A1"}},
+            }
+        ]
+        assert person_keys(authors[0]) == ["oa:A1", "name:alice smith"]
+        conflicts = check_conflicts(candidate, authors, [], [], enricher=None, coauthors=graph)
+        assert conflicts == [
+            f'Co-author with Alice Smith: shared paper "Mean field games with common noise" ({THIS_YEAR - 1})'
+        ]
+        assert check_conflicts(candidate, authors, [], [], enricher=None) == []
+
+    def test_manuscript_authors_are_coauthors(self, tmp_path):
+        graph = CoauthorGraph(tmp_path / "g")
+        graph.add_manuscript(
+            {
+                "title": "A new approach to stochastic control",
+                "authors": [{"name": "Alice Smith"}, {"name": "Eve Black"}],
+            }
+        )
+        conflicts = check_conflicts(
+            {"name": "Eve Black"}, [{"name": "Alice Smith"}], [], [], enricher=None, coauthors=graph
+        )
+        assert conflicts and conflicts[0].startswith("Co-author with Alice Smith")
+
+    def test_same_name_different_orcids_not_merged(self, tmp_path):
+        graph = CoauthorGraph(tmp_path / "g")
+        for orcid, coauthor in (
+            ("0000-0001-0000-0001", "Bob Jones"),
+            ("0000-0002-0000-0002", "Eve Black"),
+        ):
+            graph.add_openalex_work(
+                {
+                    "title": f"Stochastic control with {coauthor} in mind",
+                    "publication_year": 2024,
+                    "authorships": [
+                        {"author": {"display_name": "Li Wei", "orcid": orcid}},
+                        {"author": {"display_name": coauthor}},
+                    ],
+                }
+            )
+        wei_1 = {"name": "Li Wei", "orcid": "0000-0001-0000-0001"}
+        wei_2 = {"name": "Wei Li", "orcid": "https://orcid.org/0000-0002-0000-0002"}
+        assert len(graph.papers_of(person_keys(wei_1))) == 1
+        assert check_conflicts(wei_1, [{"name": "Eve Black"}], [], [], None, coauthors=graph) == []
+        assert check_conflicts(wei_2, [{"name": "Eve Black"}], [], [], None, coauthors=graph)
+        assert not graph.coauthored(person_keys(wei_1), person_keys(wei_2))
+
+    def test_author_with_email_matches_by_name(self, tmp_path):
+        graph = CoauthorGraph(tmp_path / "g")
+        graph.add_openalex_work(
+            _work("Backward equations with jumps", 2024, ("A9", "Alice Smith"), ("A2", "Bob Jones"))
+        )
+        candidate = {"name": "Bob Jones", "email": "bob@uni.edu"}
+        for author in ({"name": "Alice Smith"}, {"name": "Alice Smith", "email": "alice@mit.edu"}):
+            conflicts = check_conflicts(candidate, [author], [], [], enricher=None, coauthors=graph)
+            assert conflicts == [
+                'Co-author with Alice Smith: shared paper "Backward equations with jumps" (2024)'
+            ]
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from core.enrichment_queue import EnrichmentQueue, drain
+from core.web_enrichment import enrich_people_from_web
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return EnrichmentQueue(db_path=tmp_path / "queue.db")
+
+
+def _write_output(outputs_dir, journal, manuscripts):
+    path = outputs_dir / journal / f"{journal}_extraction_20260101_120000.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"manuscripts": manuscripts}))
+    return path
+
+
+class _FakeEnrich:
+    def __init__(self, found=True):
+        self.calls = []
+        self.found = found
+
+    def __call__(self, data, get_cached, save, session=None):
+        for person in data.get("referees", []) + data.get("authors", []):
+            self.calls.append(person["name"])
+            if self.found:
+                person["web_profile"] = {"source": "orcid", "h_index": 12}
+
+
+def _drain(queue, outputs_dir, enrich):
+    return drain(
+        queue=queue,
+        outputs_dir=outputs_dir,
+        enrich=enrich,
+        get_cached_web_profile=lambda *a: None,
+        save_web_profile=lambda *a: None,
+        backfill=False,
+    )
+
+
+class TestDeferral:
+    def test_cache_only_and_queued(self, queue, monkeypatch):
+        monkeypatch.setattr("core.enrichment_queue.DB_PATH", queue.db_path)
+        ms = {
+            "manuscript_id": "M-1",
+            "referees": [{"name": "Ann Lee"}, {"name": "Bo Chen"}],
+        }
+        cache = {"ann lee|": {"source": "orcid"}}
+        hits = enrich_people_from_web(
+            ms,
+            get_cached_web_profile=lambda n, i, o: cache.get(f"{n.lower()}|{i.lower()}"),
+            save_web_profile=lambda *a: None,
+            platform_label="em_metadata",
+            defer_to="JOTA",
+        )
+        assert hits == 1
+        assert ms["referees"][0]["web_profile"] == {"source": "orcid"}
+        assert "web_profile" not in ms["referees"][1]
+        assert [(e["journal"], e["manuscript_id"]) for e in queue.pending()] == [("jota", "M-1")]
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("EXTRACTOR_DEFER_ENRICHMENT", "false")
+        ms = {"id": "M-2", "authors": [{"name": "Cy", "institution": "ETH"}]}
+        enrich_people_from_web(ms, lambda *a: {"source": "orcid"}, lambda *a: None, defer_to="MF")
+        assert ms["authors"][0]["web_profile_source"] == "cache"
+
+
+class TestDrain:
+    def test_one_lookup_per_person_across_journals(self, queue, tmp_path):
+        outputs = tmp_path / "outputs"
+        ann = {"name": "Ann Lee", "orcid": "0000-0001-2345-6789"}
+        mf = _write_output(
+            outputs, "mf", [{"id": "MF-1", "referees": [dict(ann)], "authors": [dict(ann)]}]
+        )
+        _write_output(outputs, "jota", [{"manuscript_id": "J-1", "referees": [dict(ann)]}])
+        queue.enqueue("MF", "MF-1", "scholarone_metadata")
+        queue.enqueue("JOTA", "J-1", "em_metadata")
+
+        enrich = _FakeEnrich()
+        stats = _drain(queue, outputs, enrich)
+
+        assert enrich.calls == ["Ann Lee"]
+        assert stats == {"manuscripts": 2, "people": 3, "lookups": 1, "files": 2}
+        patched = json.loads(mf.read_text())["manuscripts"][0]
+        assert patched["authors"][0]["web_profile"]["h_index"] == 12
+        assert queue.pending() == []
+
+    def test_author_falls_back_to_own_metadata(self, queue, tmp_path):
+        outputs = tmp_path / "outputs"
+        path = _write_output(
+            outputs,
+            "mf",
+            [
+                {
+                    "id": "MF-1",
+                    "referees": [{"name": "Bo Chen"}],
+                    "authors": [{"name": "Bo Chen", "country": "France"}],
+                }
+            ],
+        )
+        queue.enqueue("mf", "MF-1", "scholarone_metadata")
+        _drain(queue, outputs, _FakeEnrich(found=False))
+        ms = json.loads(path.read_text())["manuscripts"][0]
+        assert "web_profile" not in ms["referees"][0]
+        assert ms["authors"][0]["web_profile"] == {
+            "source": "scholarone_metadata",
+            "country": "France",
+        }
+
+    def test_requeued_entry_survives(self, queue, tmp_path):
+        queue.enqueue("mf", "MF-1")
+        entries = queue.pending()
+        queue.enqueue("mf", "MF-1")
+        queue.mark_done(entries)
+        assert len(queue.pending()) == 1
@@ -284,6 +284,12 @@ class TestMarkProcessed:
 
 
 class TestProcessAll:
+    @pytest.fixture(autouse=True)
+    def state_store(self, tmp_path):
+        db = tmp_path / "state.db"
+        with patch("core.event_processor.StateStore", lambda: StateStore(db_path=db)):
+            yield db
+
     def _write_pending(self, path, events):
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text("\n".join(json.dumps(e, default=str) for e in events) + "\n")
@@ -394,3 +400,74 @@ class TestProcessAll:
 
             process_all()
         assert len(_mock_mark.call_args[0][0]) == 2
+
+
+class TestRecordOutcomes:
+    REFEREES = [
+        {"name": "Alice Smith", "email": "alice@test.com", "status": "Declined"},
+        {"name": "Bob Jones", "email": "bob@test.com", "status": "Report Submitted"},
+    ]
+    STATUS_DIFF = [{"op": "modified", "kind": "manuscript_field", "path": "fields/status"}]
+
+    def _manuscript(self, status="Under Review"):
+        return {"manuscript_id": "X-1", "status": status, "referees": self.REFEREES}
+
+    def _event(self, diff):
+        return {
+            "type": "STATUS_CHANGED",
+            "manuscript_id": "X-1",
+            "journal": "mf",
+            "timestamp": "T1",
+            "diff": diff,
+        }
+
+    def _run(self, event, db_path, referee_db=None):
+        from core.event_processor import process_all
+
+        referee_db = referee_db or MagicMock()
+        with (
+            patch("core.event_processor.get_pending_events", return_value=[event]),
+            patch("core.event_processor.mark_processed") as mark,
+            patch("core.event_processor.StateStore", lambda: StateStore(db_path=db_path)),
+            patch("pipeline.referee_db.RefereeDB", return_value=referee_db),
+            patch(
+                "reporting.cross_journal_report.load_journal_data",
+                return_value={"manuscripts": [self._manuscript()]},
+            ),
+            patch("pipeline.training.ModelTrainer"),
+        ):
+            done = process_all()
+        return done, mark, referee_db
+
+    def _staged_store(self, db_path):
+        store = StateStore(db_path=db_path)
+        store.diff_manuscript(self._manuscript(), "mf")
+        store.diff_manuscript(self._manuscript("Accept"), "mf", commit=False)
+        return store
+
+    def test_referee_diff_limits_updates(self, tmp_path):
+        event = self._event([{"op": "modified", "path": "referees/bob@test.com/status"}])
+        _, _, db = self._run(event, tmp_path / "state.db")
+        assert [c.args[0] for c in db._update_assignment_outcome.call_args_list] == ["bob jones"]
+
+    def test_status_diff_checks_every_referee(self, tmp_path):
+        _, _, db = self._run(self._event(self.STATUS_DIFF), tmp_path / "state.db")
+        assert db._update_assignment_outcome.call_count == 2
+
+    def test_failed_recording_stays_pending_and_keeps_old_snapshot(self, tmp_path):
+        store = self._staged_store(tmp_path / "state.db")
+        referee_db = MagicMock()
+        referee_db._update_assignment_outcome.side_effect = sqlite3.OperationalError("locked")
+        done, mark, _ = self._run(self._event(self.STATUS_DIFF), store.db_path, referee_db)
+        assert done == []
+        mark.assert_called_once_with([])
+        # The staged snapshot wasn't committed, so the change is diffed again
+        assert store.diff_manuscript(self._manuscript("Accept"), "mf") != []
+
+    def test_success_commits_snapshot(self, tmp_path):
+        store = self._staged_store(tmp_path / "state.db")
+        event = self._event(self.STATUS_DIFF)
+        done, mark, _ = self._run(event, store.db_path)
+        assert done == [event]
+        mark.assert_called_once_with([event])
+        assert store.diff_manuscript(self._manuscript("Accept"), "mf") == []
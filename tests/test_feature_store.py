@@ -0,0 +1,170 @@
+import json
+import os
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from pipeline import embeddings, feature_store
+from pipeline.feature_store import FeatureStore
+from pipeline.models.expertise_index import ExpertiseIndex
+from pipeline.models.outcome_predictor import ManuscriptOutcomePredictor
+from pipeline.models.response_predictor import RefereeResponsePredictor
+from pipeline.training import ModelTrainer
+
+
+def _referee(name, status, topics, h=10):
+    return {
+        "name": name,
+        "email": f"{name.split()[-1].lower()}@uni.edu",
+        "status": status,
+        "web_profile": {"h_index": h, "research_topics": topics},
+    }
+
+
+def _manuscript(ms_id, status, referees, abstract="optimal stochastic control of diffusions"):
+    return {
+        "manuscript_id": ms_id,
+        "title": f"Paper {ms_id}",
+        "abstract": abstract,
+        "keywords": ["stochastic control", "mean field games"],
+        "status": status,
+        "authors": [{"name": "A. Author", "email": "a@gmail.com"}],
+        "referees": referees,
+    }
+
+
+@pytest.fixture
+def outputs(tmp_path, monkeypatch):
+    monkeypatch.setenv("MODEL_SERVER", "0")
+    monkeypatch.setattr(embeddings, "_engine", embeddings.EmbeddingEngine())
+    outputs = tmp_path / "outputs"
+    snapshots = {
+        "sicon": [
+            # (file, mtime, manuscripts): name order differs from mtime order
+            (
+                "sicon_extraction_20250301.json",
+                1_000,
+                [
+                    _manuscript("S1", "Under Review", [_referee("Ann Lee", "Agreed", ["control"])]),
+                    _manuscript("S2", "Accept", [_referee("Bo Chen", "Declined", ["games"])]),
+                ],
+            ),
+            (
+                "sicon_extraction_20250101.json",
+                2_000,
+                [
+                    _manuscript(
+                        "S1",
+                        "Reject",
+                        [
+                            _referee("Ann Lee", "Report submitted", ["control"]),
+                            _referee("Cy Diaz", "No response", ["filtering"]),
+                        ],
+                    ),
+                ],
+            ),
+        ],
+        "mor": [
+            (
+                "mor_extraction_20250201.json",
+                1_500,
+                [
+                    _manuscript(
+                        "M1",
+                        "Accepted",
+                        [_referee("Ann Lee", "Overdue", ["control"], h=12)],
+                        abstract="",
+                    ),
+                    _manuscript("M2", "Desk Reject", []),
+                ],
+            ),
+        ],
+    }
+    for journal, files in snapshots.items():
+        journal_dir = outputs / journal
+        journal_dir.mkdir(parents=True)
+        for name, mtime, manuscripts in files:
+            path = journal_dir / name
+            path.write_text(json.dumps({"manuscripts": manuscripts}))
+            os.utime(path, (mtime, mtime))
+    with (
+        patch("pipeline.feature_store.OUTPUTS_DIR", outputs),
+        patch("pipeline.models.expertise_index.OUTPUTS_DIR", outputs),
+        patch("pipeline.models.response_predictor.OUTPUTS_DIR", outputs),
+        patch("pipeline.models.outcome_predictor.OUTPUTS_DIR", outputs),
+    ):
+        yield outputs
+
+
+class TestFeatureStore:
+    def test_matches_per_trainer_extraction(self, outputs, tmp_path, monkeypatch):
+        features = FeatureStore(tmp_path / "features").load_or_build()
+        # The TF-IDF fallback's vocabulary grows with every text it embeds
+        monkeypatch.setattr(embeddings, "_engine", embeddings.EmbeddingEngine())
+
+        expected = RefereeResponsePredictor()._build_training_data()
+        assert len(features.response[0]) == 4
+        for got, want in zip(features.response, expected, strict=True):
+            np.testing.assert_array_equal(got, want)
+
+        expected = ManuscriptOutcomePredictor()._build_training_data()
+        assert len(features.outcome[0]) == 4
+        for got, want in zip(features.outcome, expected, strict=True):
+            np.testing.assert_allclose(got, want)
+
+        direct = ExpertiseIndex()
+        direct.build()
+        from_store = ExpertiseIndex()
+        from_store.build_from(features.profiles)
+        assert from_store.referees == direct.referees
+
+    def test_unchanged_inputs_skip_extraction(self, outputs, tmp_path):
+        store = FeatureStore(tmp_path / "features")
+        first = store.load_or_build()
+        with patch.object(feature_store, "extract", side_effect=AssertionError("re-extracted")):
+            again = store.load_or_build()
+        assert again.path == first.path
+        np.testing.assert_array_equal(again.response[0], first.response[0])
+        assert again.profiles == first.profiles
+
+    def test_changed_snapshot_rebuilds_and_prunes(self, outputs, tmp_path):
+        store = FeatureStore(tmp_path / "features")
+        first = store.load_or_build()
+        path = outputs / "mor" / "mor_extraction_20250201.json"
+        path.write_text(json.dumps({"manuscripts": []}))
+        second = store.load_or_build()
+        assert second.path != first.path
+        assert not first.path.exists()
+        assert len(second.outcome[0]) == 2
+
+    def test_missing_outputs_dir(self, tmp_path):
+        with patch("pipeline.feature_store.OUTPUTS_DIR", tmp_path / "missing"):
+            features = FeatureStore(tmp_path / "features").load_or_build()
+        assert features.n_rows == 0
+
+
+class TestTrainAllWithStore:
+    def test_sequential_train_all_uses_stored_features(self, outputs, tmp_path, monkeypatch):
+        models = tmp_path / "models"
+        monkeypatch.setattr(embeddings, "_engine", embeddings.EmbeddingEngine())
+        with (
+            patch("pipeline.training.MODELS_DIR", models),
+            patch("pipeline.training.FEEDBACK_DIR", models / "feedback"),
+            patch("pipeline.models.expertise_index.MODELS_DIR", models),
+            patch.object(
+                RefereeResponsePredictor,
+                "_build_training_data",
+                side_effect=AssertionError("rescanned outputs"),
+            ),
+            patch.object(
+                ManuscriptOutcomePredictor,
+                "_build_training_data",
+                side_effect=AssertionError("rescanned outputs"),
+            ),
+        ):
+            results = ModelTrainer().train_all()
+
+        assert results["expertise_index"]["n_referees"] == 3
+        assert results["response_predictor"]["status"] == "insufficient_data"
+        assert results["response_predictor"]["n_samples"] == 4
+        assert list((models / "features").iterdir())
@@ -0,0 +1,129 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from core.http_fetcher import HTTPPageFetcher
+
+
+def _resp(url, text="<html><a href='x'>Logout</a></html>", status=200):
+    r = MagicMock()
+    r.url = url
+    r.text = text
+    r.status_code = status
+    return r
+
+
+@pytest.fixture
+def fetcher():
+    f = HTTPPageFetcher(max_per_host=2, login_markers=("orcid.org/oauth/authorize",))
+    yield f
+    f.close()
+
+
+class TestFetch:
+    def test_returns_html(self, fetcher):
+        url = "https://sicon.siam.org/cgi-bin/main.plex?form_type=view_ms"
+        with patch.object(fetcher.session, "get", return_value=_resp(url)):
+            assert "Logout" in fetcher.fetch(url)
+        assert fetcher.stats["fetched"] == 1
+
+    def test_rejects_cloudflare_challenge(self, fetcher):
+        url = "https://sicon.siam.org/x"
+        page = "<html><title>Just a moment...</title></html>"
+        with patch.object(fetcher.session, "get", return_value=_resp(url, page, 503)):
+            assert fetcher.fetch(url) is None
+        assert fetcher.stats["rejected"] == 1
+
+    def test_rejects_login_page(self, fetcher):
+        url = "https://sicon.siam.org/x"
+        page = "<a href='https://orcid.org/oauth/authorize?client_id=1'>Sign in</a>"
+        with patch.object(fetcher.session, "get", return_value=_resp(url, page)):
+            assert fetcher.fetch(url) is None
+
+    def test_rejects_cross_host_redirect(self, fetcher):
+        with patch.object(fetcher.session, "get", return_value=_resp("https://orcid.org/signin")):
+            assert fetcher.fetch("https://sicon.siam.org/x") is None
+
+    def test_session_markers_required(self):
+        f = HTTPPageFetcher(session_markers=("logout",))
+        url = "https://ef.msp.org/mine.php"
+        with patch.object(f.session, "get", return_value=_resp(url, "<form>login</form>")):
+            assert f.fetch(url) is None
+        with patch.object(f.session, "get", return_value=_resp(url)):
+            assert f.fetch(url) is not None
+
+    def test_disables_after_repeated_failures(self, fetcher):
+        with patch.object(
+            fetcher.session, "get", side_effect=requests.ConnectionError("down")
+        ) as get:
+            for _ in range(fetcher.max_failures + 2):
+                fetcher.fetch("https://sicon.siam.org/x")
+        assert not fetcher.enabled
+        assert get.call_count == fetcher.max_failures
+
+    def test_fetch_many_dedupes(self, fetcher):
+        urls = ["https://a.org/1", "https://a.org/2", "https://a.org/1", ""]
+        with patch.object(fetcher.session, "get", side_effect=lambda u, timeout: _resp(u)) as get:
+            pages = fetcher.fetch_many(urls)
+        assert set(pages) == {"https://a.org/1", "https://a.org/2"}
+        assert get.call_count == 2
+
+
+class TestImportDriverCookies:
+    def test_copies_cookies_and_user_agent(self, fetcher):
+        driver = MagicMock()
+        driver.execute_script.return_value = "Mozilla/5.0 Test"
+        driver.get_cookies.return_value = [
+            {"name": "cf_clearance", "value": "abc", "domain": ".siam.org", "path": "/"},
+            {"name": "session", "value": "xyz", "domain": "sicon.siam.org"},
+        ]
+        assert fetcher.import_driver_cookies(driver) == 2
+        assert fetcher.session.headers["User-Agent"] == "Mozilla/5.0 Test"
+        assert fetcher.session.cookies.get("session", domain="sicon.siam.org") == "xyz"
+
+
+class TestSIAMHybridPages:
+    def _extractor(self):
+        from core.siam_base import SIAMExtractor
+
+        ext = SIAMExtractor.__new__(SIAMExtractor)
+        ext.http = None
+        ext._http_pages = {}
+        ext.driver = MagicMock()
+        ext.output_dir = "/nonexistent"
+        ext.JOURNAL_CODE = "SICON"
+        return ext
+
+    def test_prefetched_page_skips_browser(self):
+        ext = self._extractor()
+        ext._http_pages["https://sicon.siam.org/status"] = "<p>Status details</p>"
+        soup = ext._load_subpage("https://sicon.siam.org/status")
+        assert soup.get_text() == "Status details"
+        ext.driver.get.assert_not_called()
+
+    def test_fetcher_rejects_expired_session(self):
+        ext = self._extractor()
+        ext.http_fetch = True
+        ext.driver.get_cookies.return_value = []
+        ext._init_http_fetcher()
+        url = "https://sicon.siam.org/cgi-bin/main.plex?form_type=status_details"
+        expired = "<html><p>Your session has expired.</p><a href='main.plex'>Login</a></html>"
+        try:
+            with patch.object(ext.http.session, "get", return_value=_resp(url, expired)):
+                assert ext._http_get(url) is None
+            with patch.object(ext.http.session, "get", return_value=_resp(url)):
+                assert "Logout" in ext._http_get(url)
+        finally:
+            ext.http.close()
+
+    def test_falls_back_to_browser(self):
+        ext = self._extractor()
+        ext.driver.current_url = "https://sicon.siam.org/ms"
+        ext.driver.page_source = "<p>From browser</p>"
+        with patch.object(ext, "smart_wait"), patch.object(ext, "_wait_for_cloudflare"):
+            soup = ext._load_subpage("https://sicon.siam.org/status")
+        assert soup.get_text() == "From browser"
+        assert [c.args[0] for c in ext.driver.get.call_args_list] == [
+            "https://sicon.siam.org/status",
+            "https://sicon.siam.org/ms",
+        ]
@@ -0,0 +1,56 @@
+from core.identity_index import IdentityIndex, name_form, names_match, orderless_key, soundex
+
+
+class TestNameRules:
+    def test_surname_and_initials(self):
+        assert names_match("Smith, John", "J. Smith")
+        assert names_match("Jean-Pierre de la Fontaine", "Fontaine, Jean-Pierre")
+        assert not names_match("John Smith", "Jane Smith")
+        assert not names_match("John Smith", "John Smyth")
+
+    def test_particles_excluded_from_surname(self):
+        form = name_form("Ludwig van Beethoven")
+        assert form.surname == "beethoven"
+        assert form.given == ("ludwig",)
+
+    def test_orderless_key(self):
+        assert orderless_key("HUBERT, Emma") == orderless_key("Emma Hubert") == "emma hubert"
+
+    def test_soundex(self):
+        assert soundex("robert") == soundex("rupert") == "r163"
+        assert soundex("ashcraft") == "a261"
+
+
+class TestIdentityIndex:
+    def _index(self):
+        return IdentityIndex(
+            [
+                {"name": "John Smith", "email": "js@mit.edu", "orcid": "0000-0001-2345-6789"},
+                {"name": "Jane Smith"},
+                {"name": "Emma Hubert"},
+                {"name": "Peter Schmidt"},
+            ]
+        )
+
+    def test_scores_rank_evidence(self):
+        index = self._index()
+        assert index.match(orcid="https://orcid.org/0000-0001-2345-6789")[0][0] == 1.0
+        assert index.match(email="JS@mit.edu")[0][1]["name"] == "John Smith"
+        assert [s for s, _ in index.match(name="Smith, John")] == [0.9]
+        assert [p["name"] for _, p in index.match(name="J. Smith")] == ["John Smith", "Jane Smith"]
+
+    def test_no_match_outside_block(self):
+        assert IdentityIndex([{"name": "Emma Hubert"}]).match(name="Emma Hobart") == []
+
+    def test_phonetic_only_when_fuzzy(self):
+        index = self._index()
+        assert index.best(name="P. Schmitt") is None
+        assert index.best(name="P. Schmitt", fuzzy=True)["name"] == "Peter Schmidt"
+
+    def test_agrees_with_pairwise_rule(self):
+        known = ["John Smith", "Jane Smith", "J. Doe", "Emma Hubert", "Hubert, E."]
+        queries = ["Smith, J.", "John Doe", "E. Hubert", "Alice Brown", "Jane Smith"]
+        index = IdentityIndex({"name": n} for n in known)
+        for q in queries:
+            expected = {k for k in known if names_match(q, k)}
+            assert {p["name"] for _, p in index.match(name=q)} == expected
@@ -0,0 +1,65 @@
+"""Cold-start import budget for the lightweight run_pipeline.py subcommands."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Only running the pipeline itself needs these
+HEAVY = (
+    "requests",
+    "numpy",
+    "sklearn",
+    "faiss",
+    "core.academic_apis",
+    "pipeline.referee_pipeline",
+)
+
+# Microseconds of imports beyond interpreter start-up. These subcommands import
+# about 20-60 ms locally; importing the full pipeline costs ~300 ms.
+BUDGET_US = 250_000
+
+
+def _importtime(*argv) -> tuple[subprocess.CompletedProcess, dict, set]:
+    """Run under ``-X importtime``.
+
+    Returns the process, ``{top-level module: cumulative us}`` and every module imported.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        cwd=ROOT,
+    )
+    modules, everything = {}, set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        everything.add(name.strip())
+        if not name[1:].startswith(" "):
+            modules[name.strip()] = int(cumulative)
+    return proc, modules, everything
+
+
+@pytest.fixture(scope="module")
+def startup_modules():
+    return set(_importtime("-c", "pass")[1])
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--feedback-stats"], ["--ae-list"]])
+def test_lightweight_subcommands_start_fast(args, startup_modules):
+    proc, modules, everything = _importtime("run_pipeline.py", *args)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    imported = {m: us for m, us in modules.items() if m not in startup_modules}
+
+    heavy = sorted({h for h in HEAVY for m in everything if m == h or m.startswith(h + ".")})
+    assert not heavy, f"{args} imports {heavy}"
+
+    total = sum(imported.values())
+    slowest = sorted(imported.items(), key=lambda kv: -kv[1])[:5]
+    assert total < BUDGET_US, f"{args} spent {total / 1000:.0f} ms importing; slowest {slowest}"
@@ -53,6 +53,7 @@ class TestPipelineIntegration:
         mock_enricher.name_match = MagicMock(return_value=False)
         mock_enricher.institution_match = MagicMock(return_value=False)
         mock_enricher.enrich = MagicMock(return_value={})
+        mock_enricher.cached_profile = MagicMock(return_value=None)
 
         with (
             patch("pipeline.referee_pipeline.OUTPUTS_DIR", tmp_path),
@@ -68,6 +69,7 @@ class TestPipelineIntegration:
             pipe.expertise_index = None
             pipe.response_predictor = None
             pipe.outcome_predictor = None
+            pipe.coauthors = None
 
             report = pipe.run_single("sicon", "TEST-001")
 
@@ -0,0 +1,119 @@
+import json
+import os
+
+import pytest
+from pipeline import keyword_index
+from pipeline.keyword_index import KeywordIndex, normalize_token
+
+
+def _ms(ms_id, keywords, referees):
+    return {"manuscript_id": ms_id, "keywords": keywords, "referees": referees}
+
+
+def _write(outputs, journal, stamp, manuscripts, mtime):
+    journal_dir = outputs / journal
+    journal_dir.mkdir(parents=True, exist_ok=True)
+    path = journal_dir / f"{journal}_extraction_{stamp}.json"
+    path.write_text(json.dumps({"manuscripts": manuscripts}))
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def outputs(tmp_path):
+    outputs = tmp_path / "outputs"
+    _write(
+        outputs,
+        "sicon",
+        "20260101_000000",
+        [
+            _ms("S-1", ["Stochastic Control", "Games"], [{"name": "Alice Smith"}]),
+            _ms("S-2", ["stochastic control"], [{"name": "Bob Jones"}]),
+        ],
+        1_000,
+    )
+    _write(
+        outputs,
+        "mf",
+        "20260101_000000",
+        [
+            _ms(
+                "M-1",
+                ["Portfolio Choice"],
+                [
+                    {
+                        "name": "Carol White",
+                        "email": "carol@uni.edu",
+                        "web_profile": {"h_index": 12, "research_topics": ["Mean-Field Games"]},
+                    }
+                ],
+            )
+        ],
+        1_000,
+    )
+    return outputs
+
+
+@pytest.fixture
+def index(tmp_path, outputs):
+    idx = KeywordIndex(tmp_path / "kw.db", outputs)
+    assert idx.refresh(["sicon", "mf"]) == {"sicon": 2, "mf": 1}
+    return idx
+
+
+class TestSearch:
+    def test_normalized_keyword_overlap(self, index):
+        hits = index.search(["STOCHASTIC  control"])
+        assert [h["name"] for h in hits] == ["Alice Smith", "Bob Jones"]
+        assert hits[0]["overlap"] == ["stochastic control"]
+        assert hits[0]["journal"] == "sicon"
+
+    def test_rare_keywords_weigh_more(self, index):
+        hits = index.search(["stochastic control", "games"])
+        assert hits[0]["name"] == "Alice Smith"
+        assert hits[0]["score"] > hits[1]["score"]
+
+    def test_topics_match_at_lower_weight(self, index):
+        topic = index.search(["mean field games"])
+        keyword = index.search(["portfolio choice"])
+        assert topic[0]["name"] == keyword[0]["name"] == "Carol White"
+        assert topic[0]["h_index"] == 12
+        assert topic[0]["score"] < keyword[0]["score"]
+
+    def test_excluded_names(self, index):
+        hits = index.search(["stochastic control"], exclude_names={"alice smith"})
+        assert [h["name"] for h in hits] == ["Bob Jones"]
+        assert index.search([]) == []
+
+    def test_normalize_token(self):
+        assert normalize_token(" Mean-Field  Équilibria ") == "mean field equilibria"
+
+
+class TestIncrementalRefresh:
+    def test_unchanged_outputs_are_not_reread(self, index):
+        assert index.refresh(["sicon", "mf"]) == {}
+
+    def test_only_changed_manuscripts_rewritten(self, index, outputs):
+        _write(
+            outputs,
+            "sicon",
+            "20260102_000000",
+            [
+                _ms("S-1", ["Stochastic Control", "Games"], [{"name": "Alice Smith"}]),
+                _ms("S-3", ["optimal stopping"], [{"name": "Dan Brown"}]),
+            ],
+            2_000,
+        )
+        assert index.refresh(["sicon"]) == {"sicon": 2}
+        assert [h["name"] for h in index.search(["stochastic control"])] == ["Alice Smith"]
+        assert index.search(["optimal stopping"])[0]["manuscript_id"] == "S-3"
+
+
+class TestProcessIndex:
+    def test_get_index_uses_configured_path(self, outputs, tmp_path, monkeypatch):
+        db = tmp_path / "elsewhere" / "kw.db"
+        monkeypatch.setenv("KEYWORD_INDEX_DB", str(db))
+        monkeypatch.setattr(keyword_index, "OUTPUTS_DIR", outputs)
+        keyword_index.reset_index()
+        assert keyword_index.get_index().db_path == db
+        assert db.exists()
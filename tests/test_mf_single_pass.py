@@ -0,0 +1,96 @@
+"""Tests for MF single-pass category traversal (no browser)."""
+
+from unittest.mock import MagicMock
+
+from extractors.mf_extractor import ComprehensiveMFExtractor
+
+
+def _extractor(ids):
+    ext = ComprehensiveMFExtractor.__new__(ComprehensiveMFExtractor)
+    ext.manuscripts = []
+    ext.processed_manuscript_ids = set()
+    ext._all_page_emails = set()
+    ext.driver = MagicMock()
+    ext.driver.page_source = "<p>ref@uni.edu</p>"
+    calls = []
+    position = iter(ids)
+    current = [next(position)]
+
+    def step():
+        calls.append("next")
+        current[0] = next(position)
+        return True
+
+    ext.get_current_manuscript_id = lambda: current[0]
+    ext.navigate_next_document = step
+    ext.navigate_previous_document = MagicMock()
+    ext.navigate_to_default_tab = lambda: calls.append("default_tab")
+    ext._capture_page = MagicMock()
+    ext._extract_default_tab = lambda ms, cat: calls.append(("default", ms["id"]))
+    ext._extract_information_tab = lambda ms: calls.append(("info", ms["id"]))
+    ext.extract_audit_trail = lambda ms: calls.append(("audit", ms["id"]))
+    ext._finish_category_extraction = MagicMock()
+    return ext, calls
+
+
+class TestSinglePassTraversal:
+    def test_each_manuscript_visited_once(self):
+        ext, calls = _extractor(["MAFI-1", "MAFI-2", "MAFI-3"])
+        ext.execute_single_pass_extraction({"name": "Under Review", "count": 3})
+        assert calls == [
+            ("default", "MAFI-1"),
+            ("info", "MAFI-1"),
+            ("audit", "MAFI-1"),
+            "next",
+            "default_tab",
+            ("default", "MAFI-2"),
+            ("info", "MAFI-2"),
+            ("audit", "MAFI-2"),
+            "next",
+            "default_tab",
+            ("default", "MAFI-3"),
+            ("info", "MAFI-3"),
+            ("audit", "MAFI-3"),
+        ]
+        ext.navigate_previous_document.assert_not_called()
+        assert [m["id"] for m in ext.manuscripts] == ["MAFI-1", "MAFI-2", "MAFI-3"]
+        assert ext._all_page_emails == {"ref@uni.edu"}
+
+    def test_info_tab_error_still_reads_audit(self):
+        ext, calls = _extractor(["MAFI-1"])
+
+        def broken(ms):
+            raise RuntimeError("tab missing")
+
+        ext._extract_information_tab = broken
+        ext.execute_single_pass_extraction({"name": "Under Review", "count": 1})
+        assert ("audit", "MAFI-1") in calls
+
+    def test_default_tab_reselected_after_next(self):
+        ext, calls = _extractor(["MAFI-1", "MAFI-2"])
+        ext.execute_single_pass_extraction({"name": "Under Review", "count": 2})
+        # First manuscript is opened on the default tab by process_category
+        assert calls.index("default_tab") == calls.index("next") + 1
+        assert calls.count("default_tab") == 1
+
+
+class TestNavigateToDefaultTab:
+    def _extractor(self, links):
+        ext = ComprehensiveMFExtractor.__new__(ComprehensiveMFExtractor)
+        ext.driver = MagicMock()
+        ext.driver.find_elements.return_value = links
+        ext.driver.execute_script.return_value = "complete"
+        return ext
+
+    def test_clicks_task_tab_and_waits(self):
+        link = MagicMock()
+        ext = self._extractor([link])
+        assert ext.navigate_to_default_tab() is True
+        link.click.assert_called_once()
+        ext.driver.execute_script.assert_called_with("return document.readyState")
+        selector = ext.driver.find_elements.call_args_list[0].args[1]
+        assert "redesigndetailtabon" in selector
+
+    def test_missing_tab_is_not_fatal(self):
+        ext = self._extractor([])
+        assert ext.navigate_to_default_tab() is False
@@ -0,0 +1,123 @@
+import json
+import threading
+
+import pytest
+from pipeline import embeddings, model_server
+from pipeline.manuscript_similarity import ManuscriptIndex
+from pipeline.model_client import ModelClient, ModelServerError, RemoteExpertiseIndex, get_client
+from pipeline.models.expertise_index import ExpertiseIndex
+
+pytest.importorskip("faiss")
+
+MANUSCRIPTS = [
+    ("Stochastic control of diffusions", "Optimal control of stochastic differential equations"),
+    ("Coral reef ecology", "Marine biology of tropical reefs"),
+    ("Mean field games", "Nash equilibria with many stochastic players"),
+]
+REFEREES = [
+    ("Alice Smith", "stochastic control optimal stopping"),
+    ("Bob Jones", "marine biology ecology"),
+    ("Carol White", "mean field games nash equilibria"),
+]
+
+
+@pytest.fixture
+def models_dir(tmp_path, monkeypatch):
+    engine = embeddings.EmbeddingEngine()
+    monkeypatch.setattr(embeddings, "_engine", engine)
+    ms_idx = ManuscriptIndex()
+    ms_idx.manuscripts = [
+        {"journal": "sicon", "manuscript_id": f"M{i}", "title": t, "abstract": a}
+        for i, (t, a) in enumerate(MANUSCRIPTS)
+    ]
+    ms_idx.index = engine.build_index([f"{t} {a}" for t, a in MANUSCRIPTS])
+    ms_idx.save(tmp_path)
+    ex_idx = ExpertiseIndex()
+    ex_idx.referees = [{"name": n, "text": t} for n, t in REFEREES]
+    ex_idx.index = engine.build_index([t for _, t in REFEREES])
+    ex_idx.save(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def server(models_dir, monkeypatch):
+    monkeypatch.setattr(model_server, "BATCH_WINDOW", 0.05)
+    srv = model_server.ModelServer(models_dir, models_dir / "s.sock")
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if srv.socket_path.exists():
+            break
+        threading.Event().wait(0.01)
+    yield srv
+    srv.shutdown()
+    thread.join(timeout=5)
+
+
+class TestModelServer:
+    def test_answers_like_in_process(self, server, models_dir):
+        client = get_client(server.socket_path)
+        assert client is not None
+        assert client.ping()["models"]["manuscript_index"] == 3
+
+        local = ManuscriptIndex()
+        local.load(models_dir)
+        assert client.similar_manuscripts("Optimal control", "stochastic control", 2) == (
+            local.search("Optimal control", "stochastic control", top_k=2)
+        )
+
+        ms = {"title": "Reef fish", "abstract": "marine ecology"}
+        remote = RemoteExpertiseIndex(client, 3)
+        expected = ExpertiseIndex()
+        expected.load(models_dir)
+        assert remote.search(ms, k=2) == expected.search(ms, k=2)
+
+    def test_concurrent_requests_are_batched(self, server):
+        client = ModelClient(server.socket_path)
+        results = [None] * 8
+
+        def ask(i):
+            results[i] = client.similar_manuscripts(*MANUSCRIPTS[i % 3], top_k=1)
+
+        threads = [threading.Thread(target=ask, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert all(len(r) == 1 for r in results)
+        assert server._batchers["similar"].batches < 8
+
+    def test_reloads_changed_artifacts(self, server, models_dir, monkeypatch):
+        monkeypatch.setattr(model_server, "RELOAD_INTERVAL", 0)
+        client = ModelClient(server.socket_path)
+        meta_path = models_dir / "manuscript_metadata.json"
+        meta = json.loads(meta_path.read_text())
+        meta[1]["manuscript_id"] = "RENAMED"
+        meta_path.write_text(json.dumps(meta))
+        hits = client.similar_manuscripts("Reef ecology", "marine biology", 1)
+        assert hits[0]["manuscript_id"] == "RENAMED"
+
+    def test_errors_reach_the_client(self, server):
+        client = ModelClient(server.socket_path)
+        with pytest.raises(ModelServerError, match="unknown op"):
+            client.call("nope")
+        with pytest.raises(ModelServerError, match="outcome predictor not loaded"):
+            client.predict_outcome({}, "sicon")
+
+
+class TestClientFallback:
+    def test_no_server(self, tmp_path):
+        assert get_client(tmp_path / "missing.sock") is None
+
+    def test_prefetch_with_server_down(self, server, capsys):
+        remote = RemoteExpertiseIndex(get_client(server.socket_path), 3)
+        server.socket_path.unlink()
+        remote.prefetch([{"title": "Reef fish"}, {"title": "Mean field games"}], k=2)
+        assert remote._prefetched == {}
+        assert "Expertise prefetch failed" in capsys.readouterr().out
+        with pytest.raises(ModelServerError):
+            remote.search({"title": "Reef fish"}, k=2)
+
+    def test_disabled_by_env(self, server, monkeypatch):
+        monkeypatch.setenv("MODEL_SERVER", "0")
+        assert get_client(server.socket_path) is None
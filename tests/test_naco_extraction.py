@@ -183,3 +183,163 @@ class TestEnrichManuscriptFromDetailPage:
         # Will fail at navigate; should not raise
         result = ext._enrich_manuscript_from_detail_page(ms)
         assert result is None
+
+
+# ── HTTP engine ──────────────────────────────────────────────────────────────
+
+LOGIN_FORM_HTML = """
+<html><body>
+<form action="login.php" method="post">
+  <input type="hidden" name="token" value="t0k">
+  <input type="text" id="login" name="user">
+  <input type="password" name="password">
+  <input type="submit" name="signin" value="Sign in">
+</form>
+</body></html>
+"""
+
+
+def _http_extractor():
+    import logging
+    from pathlib import Path
+
+    ext = _make_extractor()
+    ext.username = "ae@example.com"
+    ext.password = "secret"
+    ext.logger = logging.getLogger("NACO-test")
+    ext.debug_dir = Path("/nonexistent")
+    ext.ae_filter = "Possamai"
+    ext.engine = "http"
+    ext.http = None
+    ext.driver = None
+    return ext
+
+
+def _response(text, ok=True):
+    from unittest.mock import MagicMock
+
+    r = MagicMock()
+    r.text = text
+    r.ok = ok
+    return r
+
+
+class TestHttpLogin:
+    def test_posts_form_with_hidden_fields(self):
+        from unittest.mock import patch
+
+        ext = _http_extractor()
+        with (
+            patch("requests.Session.get", return_value=_response(LOGIN_FORM_HTML)),
+            patch(
+                "requests.Session.post",
+                return_value=_response('<a href="mine.php">Mine</a>'),
+            ) as post,
+        ):
+            html = ext.login_http()
+        assert "Mine" in html
+        url = post.call_args.args[0]
+        data = post.call_args.kwargs["data"]
+        assert url == "https://ef.msp.org/login.php"
+        assert data == {
+            "token": "t0k",
+            "user": "ae@example.com",
+            "password": "secret",
+            "signin": "Sign in",
+        }
+
+    def test_failed_login_returns_none(self):
+        from unittest.mock import patch
+
+        ext = _http_extractor()
+        with (
+            patch("requests.Session.get", return_value=_response(LOGIN_FORM_HTML)),
+            patch("requests.Session.post", return_value=_response(LOGIN_FORM_HTML)),
+        ):
+            assert ext.login_http() is None
+
+
+class TestRunHttp:
+    def test_failed_login_falls_back(self):
+        from unittest.mock import patch
+
+        ext = _http_extractor()
+        with patch.object(NACOExtractor, "login_http", return_value=None):
+            assert ext._run_http() is None
+
+    def test_queues_failed_detail_pages_for_browser(self):
+        from unittest.mock import MagicMock, patch
+
+        ext = _http_extractor()
+        ext._pending_detail_ids = set()
+        ext.http = MagicMock()
+        ext.http.fetch.return_value = "<html>mine</html>"
+        ext.http.fetch_many.side_effect = lambda urls: {
+            u: (REFEREE_TABLE_HTML if u.endswith("=1") else None) for u in urls
+        }
+        listing = [
+            {"manuscript_id": "NACO-1", "referees": []},
+            {"manuscript_id": "NACO-2", "referees": []},
+        ]
+        with (
+            patch.object(NACOExtractor, "login_http", return_value='<a href="mine.php">Mine</a>'),
+            patch.object(NACOExtractor, "parse_manuscripts", return_value=listing),
+            patch.object(NACOExtractor, "_save_debug_html"),
+        ):
+            manuscripts = ext._run_http()
+        assert ext.http.fetch.call_args_list[0].args[0] == "https://ef.msp.org/mine.php"
+        assert ext._pending_detail_ids == {"NACO-2"}
+        assert [r["name"] for r in manuscripts[0]["referees"]][:1] == ["Alice Smith"]
+        assert manuscripts[1]["referees"] == []
+
+
+class TestHttpSessionOnlyAfterLogin:
+    def test_failed_login_leaves_no_fetcher(self):
+        from unittest.mock import patch
+
+        ext = _http_extractor()
+        ext._pending_detail_ids = set()
+        with (
+            patch("requests.Session.get", return_value=_response(LOGIN_FORM_HTML)),
+            patch("requests.Session.post", return_value=_response(LOGIN_FORM_HTML)),
+        ):
+            assert ext._run_http() is None
+        assert ext.http is None
+
+    def test_failed_crawl_drops_fetcher(self):
+        from unittest.mock import MagicMock, patch
+
+        ext = _http_extractor()
+        fetcher = MagicMock()
+        fetcher.fetch.return_value = None
+
+        def login():
+            ext.http = fetcher
+            return '<a href="mine.php">Mine</a>'
+
+        with patch.object(NACOExtractor, "login_http", side_effect=login):
+            assert ext._run_http() is None
+        fetcher.close.assert_called_once()
+        assert ext.http is None
+
+    def test_report_pdf_uses_driver_cookies_after_failed_login(self, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        ext = _http_extractor()
+        ext.config = {"base_dir": str(tmp_path)}
+        with (
+            patch("requests.Session.get", return_value=_response(LOGIN_FORM_HTML)),
+            patch("requests.Session.post", return_value=_response(LOGIN_FORM_HTML)),
+        ):
+            assert ext._run_http() is None
+
+        ext.driver = MagicMock()
+        ext.driver.get_cookies.return_value = [{"name": "PHPSESSID", "value": "browser"}]
+        pdf = MagicMock(ok=True, headers={"content-type": "application/pdf"}, content=b"%PDF")
+        with (
+            patch("requests.get", return_value=pdf) as get,
+            patch("requests.Session.get") as session_get,
+        ):
+            ext._extract_referee_report_from_link("/report/42.pdf")
+        assert get.call_args.kwargs["cookies"] == {"PHPSESSID": "browser"}
+        session_get.assert_not_called()
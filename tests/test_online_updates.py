@@ -0,0 +1,131 @@
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from pipeline import embeddings
+from pipeline.models.online import OnlineCorrection
+from pipeline.models.outcome_predictor import ManuscriptOutcomePredictor
+from pipeline.models.response_predictor import RefereeResponsePredictor
+from pipeline.referee_db import RefereeDB
+from pipeline.training import ModelTrainer
+
+
+@pytest.fixture
+def response_predictor():
+    rng = np.random.RandomState(42)
+    X = np.vstack([rng.rand(30, 8) * 0.3, rng.rand(30, 8) * 0.3 + 0.7])
+    y_agree = np.array([0] * 30 + [1] * 30)
+    predictor = RefereeResponsePredictor()
+    assert predictor.train(data=(X, y_agree, y_agree))["status"] == "trained"
+    return predictor
+
+
+@pytest.fixture
+def outcome_predictor(monkeypatch):
+    monkeypatch.setenv("MODEL_SERVER", "0")
+    monkeypatch.setattr(embeddings, "_engine", embeddings.EmbeddingEngine())
+    rng = np.random.RandomState(42)
+    X = rng.rand(20, 10)
+    predictor = ManuscriptOutcomePredictor()
+    assert predictor.train(data=(X, (X[:, 0] > 0.5).astype(int)))["status"] == "trained"
+    return predictor
+
+
+class TestOnlineCorrection:
+    def test_starts_as_identity(self):
+        correction = OnlineCorrection(3)
+        p = np.array([0.1, 0.5, 0.93])
+        np.testing.assert_allclose(correction.apply(p, np.ones((3, 3))), p)
+
+    def test_moves_towards_observed_outcomes(self):
+        correction = OnlineCorrection(2)
+        x = np.array([[1.0, 0.0]])
+        for _ in range(50):
+            correction.update([0.3], x, [1])
+        assert correction.n_updates == 50
+        assert correction.apply([0.3], x)[0] > 0.5
+
+
+class TestPredictorUpdates:
+    def test_response_update_persists_and_retrain_resets(self, response_predictor, tmp_path):
+        X = np.full((1, 8), 0.15)
+        before = response_predictor._p_accept(X)[0]
+        for _ in range(40):
+            response_predictor.update(X, [1])
+        after = response_predictor._p_accept(X)[0]
+        assert after > before
+
+        response_predictor.save(tmp_path)
+        loaded = RefereeResponsePredictor()
+        assert loaded.load(tmp_path)
+        assert loaded._p_accept(X)[0] == pytest.approx(after)
+
+        rng = np.random.RandomState(0)
+        data = (rng.rand(10, 8), np.array([0, 1] * 5), np.array([0, 1] * 5))
+        loaded.train(data=data)
+        assert loaded.online is None
+
+    def test_response_update_without_model(self):
+        assert RefereeResponsePredictor().update(np.zeros((1, 8)), [1]) == 0
+
+    def test_outcome_update(self, outcome_predictor, tmp_path):
+        ms = {"abstract": "", "keywords": ["control"], "authors": []}
+        before = outcome_predictor.predict(ms)
+        for _ in range(40):
+            assert outcome_predictor.update(ms, None, 0)
+        assert outcome_predictor.predict(ms) < before
+
+        outcome_predictor.save(tmp_path)
+        loaded = ManuscriptOutcomePredictor()
+        assert loaded.load(tmp_path)
+        assert loaded.online.n_updates == 40
+
+
+class TestTrainerOnlinePaths:
+    def test_resolved_predictions_update_response_model(self, response_predictor, tmp_path):
+        models = tmp_path / "models"
+        response_predictor.save(models)
+        db = RefereeDB(db_path=tmp_path / "referees.db")
+        db.record_assignment(
+            "Alice Smith", "a@mit.edu", "sicon", "M1", {"invited": "2025-01-01"}, "Declined"
+        )
+        db.store_prediction("Alice Smith", "sicon", "M1", 0.9, features=[0.8] * 8)
+        db.resolve_predictions()
+
+        with (
+            patch("pipeline.training.MODELS_DIR", models),
+            patch("pipeline.training.FEEDBACK_DIR", models / "feedback"),
+        ):
+            trainer = ModelTrainer()
+            assert trainer.update_response_model(db) == 1
+            assert trainer.update_response_model(db) == 0
+
+        loaded = RefereeResponsePredictor()
+        loaded.load(models)
+        assert loaded.online.n_updates == 1
+        assert db.unlearned_outcomes() == []
+
+    def test_record_outcome_updates_outcome_model(self, outcome_predictor, tmp_path):
+        models = tmp_path / "models"
+        outcome_predictor.save(models)
+        outputs = tmp_path / "outputs"
+        (outputs / "sicon").mkdir(parents=True)
+        ms = {"manuscript_id": "M1", "abstract": "control", "keywords": [], "authors": []}
+        (outputs / "sicon" / "sicon_extraction_20250101.json").write_text(
+            json.dumps({"manuscripts": [ms]})
+        )
+
+        with (
+            patch("pipeline.training.MODELS_DIR", models),
+            patch("pipeline.training.FEEDBACK_DIR", models / "feedback"),
+            patch("pipeline.training.OUTPUTS_DIR", outputs),
+        ):
+            trainer = ModelTrainer()
+            trainer.record_outcome("sicon", "M1", "accept")
+            trainer.record_outcome("sicon", "M1", "revise")
+            assert not trainer.update_outcome_model("sicon", "M404", "reject")
+
+        loaded = ManuscriptOutcomePredictor()
+        loaded.load(models)
+        assert loaded.online.n_updates == 1
@@ -0,0 +1,93 @@
+from core.person_registry import PersonRegistry, identity_keys
+
+
+class _FakeEnrich:
+    def __init__(self, profiles=None):
+        self.profiles = profiles or {}
+        self.batches = []
+
+    def __call__(self, data, get_cached, save, session=None):
+        self.batches.append([p["name"] for p in data["referees"] + data["authors"]])
+        for person in data["referees"] + data["authors"]:
+            if person["name"] in self.profiles:
+                person["web_profile"] = self.profiles[person["name"]]
+
+
+def _no_cache(*args):
+    return None
+
+
+def _noop(*args):
+    return None
+
+
+class TestIdentities:
+    def test_orcid_links_name_variants(self):
+        reg = PersonRegistry()
+        with_orcid = {"name": "Lee, Ann", "institution": "MIT", "orcid": "0000-0001-2345-6789"}
+        reg.add(with_orcid, "referees")
+        reg.add({"name": "Ann Lee", "institution": "mit"}, "authors")
+        reg.add({"name": "Ann Lee", "orcid": "https://orcid.org/0000-0001-2345-6789"}, "referees")
+        assert len(reg.identities()) == 1
+
+    def test_email_links_appearances(self):
+        reg = PersonRegistry()
+        reg.add({"name": "A. Lee", "email": "ALee@mit.edu"}, "referees")
+        reg.add({"name": "Ann Lee", "email": "alee@mit.edu", "institution": "MIT"}, "referees")
+        assert len(reg.identities()) == 1
+
+    def test_same_name_different_institution_kept_apart(self):
+        reg = PersonRegistry()
+        reg.add({"name": "Wei Zhang", "institution": "ETH"}, "referees")
+        reg.add({"name": "Wei Zhang", "institution": "NUS"}, "referees")
+        assert len(reg.identities()) == 2
+
+    def test_accents_and_order_ignored(self):
+        assert identity_keys({"name": "Müller, Jörg", "institution": "TU Berlin"}) == (
+            identity_keys({"name": "Jorg Muller", "institution": "tu berlin"})
+        )
+
+
+class TestEnrich:
+    def test_one_lookup_per_identity_fanned_out(self):
+        reg = PersonRegistry()
+        people = [
+            {"name": "Ann Lee", "institution": "MIT", "orcid": "0000-0001-2345-6789"},
+            {"name": "Lee, Ann", "institution": "MIT"},
+            {"name": "Bo Chen", "institution": "ETH"},
+        ]
+        for i, person in enumerate(people * 3):
+            reg.add_manuscript({"referees": [person]} if i % 2 else {"authors": [person]})
+        enrich = _FakeEnrich({"Ann Lee": {"source": "orcid", "h_index": 9}})
+        stats = reg.enrich(_no_cache, _noop, enrich=enrich)
+
+        assert enrich.batches == [["Ann Lee", "Bo Chen"]]
+        assert (stats["identities"], stats["lookups"]) == (2, 2)
+        assert people[1]["web_profile"]["h_index"] == 9
+
+    def test_cache_hit_on_any_variant_skips_lookup(self):
+        reg = PersonRegistry()
+        a = {"name": "Ann Lee", "institution": "MIT", "orcid": "0000-0001-2345-6789"}
+        b = {"name": "Ann Lee", "institution": "MIT"}
+        reg.add(a, "referees")
+        reg.add(b, "referees")
+        cache = {("Ann Lee", "MIT", ""): {"source": "orcid"}}
+        enrich = _FakeEnrich()
+        stats = reg.enrich(lambda n, i, o: cache.get((n, i, o)), _noop, enrich=enrich)
+        assert enrich.batches == []
+        assert stats["cache_hits"] == 1
+        assert a["web_profile"] == b["web_profile"] == {"source": "orcid"}
+
+    def test_unfound_author_gets_own_metadata(self):
+        reg = PersonRegistry()
+        ref = {"name": "Bo Chen", "institution": "ETH"}
+        auth = {"name": "Bo Chen", "institution": "ETH", "country": "CH"}
+        reg.add(ref, "referees", "em_metadata")
+        reg.add(auth, "authors", "em_metadata")
+        reg.enrich(_no_cache, _noop, enrich=_FakeEnrich())
+        assert "web_profile" not in ref
+        assert auth["web_profile"] == {
+            "source": "em_metadata",
+            "institution": "ETH",
+            "country": "CH",
+        }
@@ -436,6 +436,33 @@ class TestResponsePredictor:
         prob = predictor.predict_for_candidate(candidate, ms, "sicon")
         assert 0.0 <= prob <= 1.0
 
+    def test_predict_for_candidates_single_call(self):
+        predictor = RefereeResponsePredictor()
+        rng = np.random.RandomState(42)
+        X = rng.rand(30, 8)
+        y = (X[:, 0] > 0.4).astype(int)
+        with patch.object(predictor, "_build_training_data", return_value=(X, y, y)):
+            predictor.train()
+        if predictor.model is None:
+            pytest.skip("model not useful on synthetic data")
+
+        candidates = [
+            {"web_profile": {"h_index": h}, "institution": inst, "semantic_similarity": s}
+            for h, inst, s in [(5, "MIT", 0.2), (40, "ETH Zurich", 0.9), (0, "", 0.5)]
+        ]
+        ms = {"authors": [{"institution": "MIT"}]}
+        with patch.object(
+            predictor.model, "predict_proba", wraps=predictor.model.predict_proba
+        ) as proba:
+            batch = predictor.predict_for_candidates(candidates, ms, "sicon")
+        assert proba.call_count == 1
+        single = [predictor.predict_for_candidate(c, ms, "sicon") for c in candidates]
+        np.testing.assert_allclose(batch, single)
+
+    def test_predict_for_candidates_untrained(self):
+        batch = RefereeResponsePredictor().predict_for_candidates([{}, {}], {}, "sicon")
+        assert list(batch) == [0.5, 0.5]
+
     def test_save_load(self, tmp_path):
         predictor = RefereeResponsePredictor()
         rng = np.random.RandomState(42)
@@ -537,7 +564,7 @@ class TestRefereeFinderWithModels:
         from pipeline.referee_finder import _compute_relevance
 
         predictor = MagicMock()
-        predictor.predict_for_candidate.return_value = 0.9
+        predictor.predict_for_candidates.return_value = [0.9]
 
         c = {
             "research_topics": ["control"],
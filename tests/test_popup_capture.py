@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from core.popup_capture import FIXED_WAIT_SECONDS, PopupCapture
+
+
+class FakeBrowser:
+    """Minimal window model: handles, switching, closing and per-window HTML."""
+
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.pages = {"main": "<html>folder</html>"}
+        self.closed = []
+        self.switch_to = SimpleNamespace(window=self._switch)
+
+    def _switch(self, handle):
+        self.current_window_handle = handle
+
+    def open_popup(self, html):
+        handle = f"popup{len(self.pages)}"
+        self.window_handles.append(handle)
+        self.pages[handle] = html
+
+    def execute_script(self, js):
+        if "readyState" in js:
+            return ["complete", 3]
+        return None
+
+    @property
+    def page_source(self):
+        return self.pages[self.current_window_handle]
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+        self.closed.append(self.current_window_handle)
+
+
+@pytest.fixture
+def capture():
+    return PopupCapture(open_timeout=0.2, poll_interval=0.01, idle_interval=0.01)
+
+
+class TestPopupCapture:
+    def test_captures_and_closes_popup(self, capture):
+        driver = FakeBrowser()
+        html = capture.capture(driver, lambda: driver.open_popup("<p>Reviewer</p>"))
+        assert html == "<p>Reviewer</p>"
+        assert driver.window_handles == ["main"]
+        assert driver.current_window_handle == "main"
+
+    def test_no_window_returns_none(self, capture):
+        driver = FakeBrowser()
+        assert capture.capture(driver, lambda: None) is None
+        assert capture.stats["missed"] == 1
+
+    def test_capture_many_opens_all_before_reading(self, capture):
+        driver = FakeBrowser()
+        order = []
+        original = driver.open_popup
+
+        def opener(i):
+            order.append(f"open{i}")
+            original(f"<p>{i}</p>")
+
+        driver.close = MagicMock(
+            side_effect=lambda: order.append("close") or FakeBrowser.close(driver)
+        )
+        pages = capture.capture_many(driver, [lambda i=i: opener(i) for i in range(3)])
+        assert pages == ["<p>0</p>", "<p>1</p>", "<p>2</p>"]
+        assert order == ["open0", "open1", "open2", "close", "close", "close"]
+        assert driver.window_handles == ["main"]
+
+    def test_waits_for_resources_to_settle(self, capture):
+        driver = FakeBrowser()
+        states = iter([["loading", 1], ["complete", 4], ["complete", 6], ["complete", 6]])
+        driver.execute_script = lambda js: next(states) if "readyState" in js else None
+        driver.switch_to.window("main")
+        assert capture.wait_ready(driver)
+
+    def test_load_timeout_counted(self):
+        capture = PopupCapture(load_timeout=0.05, poll_interval=0.01)
+        driver = FakeBrowser()
+        driver.execute_script = lambda js: ["loading", 0]
+        assert not capture.wait_ready(driver)
+        assert capture.stats["load_timeouts"] == 1
+
+    def test_report(self, capture):
+        driver = FakeBrowser()
+        capture.capture_many(
+            driver, [lambda: driver.open_popup("a"), lambda: driver.open_popup("b")]
+        )
+        report = capture.report()
+        assert report["popups"] == 2
+        assert report["fixed_wait_seconds"] == round(2 * FIXED_WAIT_SECONDS, 1)
+        assert report["seconds"] < report["fixed_wait_seconds"]
+
+
+class TestEMPopups:
+    def _extractor(self, tmp_path):
+        from core.em_base import EMExtractor
+
+        ext = EMExtractor.__new__(EMExtractor)
+        ext.driver = FakeBrowser()
+        ext.popups = PopupCapture(open_timeout=0.2, poll_interval=0.01, idle_interval=0.01)
+        ext.output_dir = tmp_path
+        ext.JOURNAL_CODE = "JOTA"
+        ext._in_content_frame = False
+        ext.switch_to_default = MagicMock()
+        return ext
+
+    def test_parallel_contacts_fall_back_for_missed_popup(self, tmp_path):
+        ext = self._extractor(tmp_path)
+        driver = ext.driver
+
+        def run_js(js):
+            if "readyState" in js:
+                return ["complete", 1]
+            if js.startswith("popupReviewerInfo(1"):
+                driver.open_popup("<a href='mailto:a@x.org'>a</a>")
+            return None
+
+        driver.execute_script = run_js
+        with patch.object(ext, "switch_to_content_frame", return_value=False):
+            soups = ext._exec_em_js_and_capture_many(
+                [("popupReviewerInfo(1, 9)", "c1"), ("popupReviewerInfo(2, 9)", "c2")], "JOTA-1"
+            )
+        assert soups[0].find("a")["href"] == "mailto:a@x.org"
+        # The second opener never opened a window: captured in place, one by one
+        assert "folder" in soups[1].get_text()
+        assert (tmp_path / "debug" / "jota_c1_JOTA-1.html").exists()
@@ -209,6 +209,22 @@ class TestTrackRecord:
         assert db.get_track_record("Nobody") == {}
 
 
+class TestScoringRecords:
+    def test_batch_matches_single_lookups(self, populated_db):
+        names = ["Alice Smith", "SMITH, Alice", "Bob Jones", "Nobody"]
+        records = populated_db.get_scoring_records(names, "SICON")
+        assert set(records) == {"alice smith", "bob jones"}
+        alice = records["alice smith"]
+        assert alice["track_record"] == populated_db.get_track_record("Alice Smith")
+        assert alice["profile"] == populated_db.get_profile("Alice Smith")
+        assert alice["journal_stats"] == populated_db.get_journal_stats("Alice Smith", "sicon")
+
+    def test_without_journal(self, populated_db):
+        records = populated_db.get_scoring_records(["Alice Smith"])
+        assert records["alice smith"]["journal_stats"] is None
+        assert populated_db.get_scoring_records([]) == {}
+
+
 class TestOverdueOffenders:
     def test_finds_overdue_referees(self, db):
         for i in range(3):
@@ -540,3 +556,39 @@ class TestTiedPercentiles:
         pb = db.get_profile("B")
         pc = db.get_profile("C")
         assert pa["percentile_quality"] == pb["percentile_quality"] == pc["percentile_quality"]
+
+
+class TestSetBasedResolution:
+    def test_fills_actuals_once(self, populated_db):
+        from pipeline import normalize_name_orderless
+
+        populated_db.store_prediction("Alice Smith", "sicon", "M100", 0.8)
+        populated_db.store_prediction("Bob Jones", "sicon", "M100", 0.3)
+        populated_db.store_prediction("Alice Smith", "sicon", "M999", 0.5)
+        assert populated_db.resolve_predictions() == 2
+        assert populated_db.resolve_predictions() == 0
+
+        with populated_db._connection() as conn:
+            rows = {
+                (r["referee_key"], r["manuscript_id"]): dict(r)
+                for r in conn.execute("SELECT * FROM model_predictions")
+            }
+        alice = rows[(normalize_name_orderless("Alice Smith"), "M100")]
+        bob = rows[(normalize_name_orderless("Bob Jones"), "M100")]
+        open_ = rows[(normalize_name_orderless("Alice Smith"), "M999")]
+        assert (alice["actual_accepted"], alice["actual_completed"]) == (1, 1)
+        assert alice["actual_review_days"] is not None
+        assert (bob["actual_accepted"], bob["actual_completed"]) == (0, None)
+        assert open_["resolved_at"] is None
+
+    def test_unlearned_outcomes(self, populated_db):
+        populated_db.store_prediction("Alice Smith", "sicon", "M100", 0.8, features=[0.25] * 8)
+        populated_db.store_prediction("Bob Jones", "sicon", "M100", 0.3)
+        assert populated_db.unlearned_outcomes() == []
+
+        populated_db.resolve_predictions()
+        outcomes = populated_db.unlearned_outcomes()
+        assert [(o["features"], o["accepted"]) for o in outcomes] == [([0.25] * 8, 1)]
+
+        populated_db.mark_learned([o["id"] for o in outcomes])
+        assert populated_db.unlearned_outcomes() == []
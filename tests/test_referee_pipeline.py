@@ -2,7 +2,11 @@ from unittest.mock import MagicMock
 
 from pipeline.conflict_checker import check_conflicts
 from pipeline.desk_rejection import JOURNAL_SCOPE_KEYWORDS, assess_desk_rejection
-from pipeline.referee_finder import _compute_relevance, _compute_topic_overlap
+from pipeline.referee_finder import (
+    _compute_relevance,
+    _compute_topic_overlap,
+    _score_candidates,
+)
 from pipeline.referee_pipeline import is_awaiting_referee
 
 
@@ -250,6 +254,29 @@ class TestRelevanceScoring:
         s2 = _compute_relevance(c2, [], "Test", "")
         assert s1 > s2
 
+    def test_batch_matches_single_scores(self):
+        candidates = [
+            {
+                "name": "Batch Candidate One",
+                "research_topics": ["stochastic control"],
+                "source": "openalex_search",
+                "relevant_papers": [{"title": "Stochastic control of diffusions", "year": 2025}],
+                "h_index": 12,
+            },
+            {
+                "name": "Batch Candidate Two",
+                "research_topics": [],
+                "source": "expertise_index",
+                "semantic_similarity": 0.7,
+                "relevant_papers": [{"title": "Optimal stopping", "year": 2019}],
+            },
+            {"name": "Batch Candidate Three", "source": "author_suggested"},
+        ]
+        kw = ["stochastic control", "optimal stopping"]
+        single = [_compute_relevance(dict(c), kw, "Stochastic Control", "") for c in candidates]
+        assert _score_candidates(candidates, kw, "Stochastic Control", "") == single
+        assert _score_candidates([], kw, "Stochastic Control", "") == []
+
 
 class TestTopicOverlap:
     def test_matching_keywords(self):
@@ -402,3 +429,90 @@ class TestConflictCheckerEdgeCases:
         opposed = [{"name": "Someone Else", "email": "target@example.com"}]
         conflicts = check_conflicts(candidate, [], opposed, [], enricher)
         assert any("opposed" in c.lower() for c in conflicts)
+
+
+class TestTwoStageRetrieval:
+    def _find(self, n=20, **kwargs):
+        from unittest.mock import patch
+
+        from pipeline.referee_finder import find_referees
+
+        found = [
+            {
+                "name": f"Candidate {i:02d}",
+                "source": "openalex_search",
+                "h_index": i,
+                "relevant_papers": [],
+                "research_topics": [],
+            }
+            for i in range(n)
+        ]
+        enricher = MagicMock()
+        enricher.cached_profile.return_value = None
+        enricher.enrich.return_value = {}
+        ms = {"manuscript_id": "M1", "title": "Stochastic Control", "keywords": ["control"]}
+        with (
+            patch("pipeline.referee_finder._search_openalex_works", return_value=found),
+            patch("pipeline.referee_finder._search_semantic_scholar", return_value=[]),
+            patch("pipeline.referee_finder._search_historical", return_value=[]),
+            patch("pipeline.referee_finder._history_records", return_value={}),
+        ):
+            top, api_calls = find_referees(ms, "sicon", enricher, MagicMock(), 5, **kwargs)
+        enriched = [call.args[0] for call in enricher.enrich.call_args_list]
+        return top, api_calls, enriched
+
+    def test_enriches_top_k_and_exploration_slice(self):
+        top, api_calls, enriched = self._find(enrich_top_k=5, explore=2, two_stage=True)
+        assert len(enriched) == 7
+        assert {f"Candidate {i}" for i in range(15, 20)} <= set(enriched)
+        assert api_calls["enrichment_saved"] == 13
+        assert api_calls["retrieval"]["explored"] == 2
+        assert [c["name"] for c in top] == [f"Candidate {i}" for i in range(19, 14, -1)]
+
+    def test_full_path_enriches_everyone(self):
+        top, api_calls, enriched = self._find(two_stage=False)
+        assert len(enriched) == 20
+        assert api_calls["enrichment_saved"] == 0
+        assert "retrieval" not in api_calls
+
+    def test_small_pools_skip_stage_one(self):
+        _, api_calls, enriched = self._find(n=4, two_stage=True)
+        assert len(enriched) == 4
+        assert "retrieval" not in api_calls
+
+    def test_enricher_reuses_profiles(self):
+        from unittest.mock import patch
+
+        import requests
+        from core.academic_apis import AcademicProfileEnricher
+
+        enricher = AcademicProfileEnricher(requests.Session())
+        assert enricher.cached_profile("Jane Doe") is None
+        with patch.object(enricher, "_enrich", return_value={"h_index": 9}) as lookup:
+            enricher.enrich("Jane Doe", institution="MIT")
+            enricher.enrich("jane doe", institution="mit")
+        assert lookup.call_count == 1
+        assert enricher.cached_profile("Jane Doe", institution="MIT") == {"h_index": 9}
+
+
+class TestLazyModels:
+    def test_models_load_on_first_use(self):
+        from unittest.mock import patch
+
+        from pipeline.referee_pipeline import RefereePipeline
+
+        def materialize(pipe):
+            pipe.expertise_index = "index"
+            pipe.coauthors = "graph"
+
+        with patch.object(
+            RefereePipeline, "_materialize_models", autospec=True, side_effect=materialize
+        ) as load:
+            pipe = RefereePipeline()
+            assert load.call_count == 0
+            pipe.response_predictor = "preset"
+            assert pipe.expertise_index == "index"
+            assert pipe.outcome_predictor is None
+            assert load.call_count == 1
+        assert pipe.response_predictor == "preset"
+        assert pipe.enricher.coauthors == "graph"
@@ -0,0 +1,148 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from core.resource_policy import (
+    apply_resource_policy,
+    blocked_patterns,
+    compare_outputs,
+    lift_resource_policy,
+)
+
+
+class TestPolicy:
+    def test_scholarone_keeps_gif_icons(self):
+        patterns = blocked_patterns("scholarone")
+        assert "*.gif" not in patterns
+        assert {"*.png", "*.woff2", "*.mp4", "*google-analytics.com*"} <= set(patterns)
+
+    def test_stylesheets_and_scripts_never_blocked(self):
+        for platform in ("scholarone", "siam", "em", "wiley", "editflow"):
+            assert not {"*.css", "*.js"} & set(blocked_patterns(platform))
+
+    def test_applied_via_cdp(self, monkeypatch):
+        monkeypatch.delenv("EXTRACTOR_BLOCK_RESOURCES", raising=False)
+        driver = MagicMock()
+        assert apply_resource_policy(driver, "em")
+        driver.execute_cdp_cmd.assert_called_with(
+            "Network.setBlockedURLs", {"urls": blocked_patterns("em")}
+        )
+
+    def test_disabled_by_env(self, monkeypatch):
+        monkeypatch.setenv("EXTRACTOR_BLOCK_RESOURCES", "false")
+        driver = MagicMock()
+        assert not apply_resource_policy(driver, "em")
+        driver.execute_cdp_cmd.assert_not_called()
+
+    def test_cdp_failure_is_not_fatal(self, monkeypatch):
+        monkeypatch.delenv("EXTRACTOR_BLOCK_RESOURCES", raising=False)
+        driver = MagicMock()
+        driver.execute_cdp_cmd.side_effect = Exception("not supported")
+        assert not apply_resource_policy(driver, "siam")
+
+    def test_lift_unblocks_everything(self):
+        driver = MagicMock()
+        assert lift_resource_policy(driver)
+        driver.execute_cdp_cmd.assert_called_once_with("Network.setBlockedURLs", {"urls": []})
+
+
+class TestSIAMCloudflareChallenge:
+    def _extractor(self, titles):
+        from core.siam_base import SIAMExtractor
+
+        ext = SIAMExtractor.__new__(SIAMExtractor)
+        ext.driver = MagicMock()
+        type(ext.driver).title = PropertyMock(side_effect=titles)
+        ext._dismiss_alerts = MagicMock()
+        return ext
+
+    def _blocked_urls(self, ext):
+        return [
+            c.args[1]["urls"]
+            for c in ext.driver.execute_cdp_cmd.call_args_list
+            if c.args[0] == "Network.setBlockedURLs"
+        ]
+
+    def test_policy_applied_after_first_challenge(self, monkeypatch):
+        monkeypatch.delenv("EXTRACTOR_BLOCK_RESOURCES", raising=False)
+        ext = self._extractor(["Just a moment...", "SICON Home"])
+        ext._blocking_resources = False
+        with patch("core.siam_base.time.sleep"):
+            assert ext._wait_for_cloudflare(5)
+        assert self._blocked_urls(ext) == [blocked_patterns("siam")]
+        assert ext._blocking_resources
+
+    def test_later_challenge_lifts_then_restores_blocking(self, monkeypatch):
+        monkeypatch.delenv("EXTRACTOR_BLOCK_RESOURCES", raising=False)
+        ext = self._extractor(["Just a moment...", "Just a moment...", "SICON Home"])
+        ext._blocking_resources = True
+        with patch("core.siam_base.time.sleep"):
+            assert ext._wait_for_cloudflare(5)
+        assert self._blocked_urls(ext) == [[], blocked_patterns("siam")]
+
+
+class TestScholarOneCloudflareChallenge(TestSIAMCloudflareChallenge):
+    def _extractor(self, titles):
+        from core.scholarone_base import ScholarOneBaseExtractor
+
+        ext = ScholarOneBaseExtractor.__new__(ScholarOneBaseExtractor)
+        ext.driver = MagicMock()
+        type(ext.driver).title = PropertyMock(side_effect=titles)
+        return ext
+
+    def test_policy_applied_after_first_challenge(self, monkeypatch):
+        monkeypatch.delenv("EXTRACTOR_BLOCK_RESOURCES", raising=False)
+        ext = self._extractor(["Just a moment...", "Manuscript Central"])
+        ext._blocking_resources = False
+        with patch("core.scholarone_base.time.sleep"):
+            assert ext._wait_for_cloudflare(5)
+        assert self._blocked_urls(ext) == [blocked_patterns("scholarone")]
+        assert ext._blocking_resources
+
+    def test_later_challenge_lifts_then_restores_blocking(self, monkeypatch):
+        monkeypatch.delenv("EXTRACTOR_BLOCK_RESOURCES", raising=False)
+        ext = self._extractor(["Just a moment...", "Manuscript Central"])
+        ext._blocking_resources = True
+        with patch("core.scholarone_base.time.sleep"):
+            assert ext._wait_for_cloudflare(5)
+        assert self._blocked_urls(ext) == [[], blocked_patterns("scholarone")]
+
+
+class TestWileyCloudflareChallenge(TestSIAMCloudflareChallenge):
+    def _extractor(self, titles):
+        from core.wiley_base import WileyBaseExtractor
+
+        ext = WileyBaseExtractor.__new__(WileyBaseExtractor)
+        ext.driver = MagicMock()
+        type(ext.driver).title = PropertyMock(side_effect=titles)
+        return ext
+
+    def test_policy_applied_after_first_challenge(self, monkeypatch):
+        monkeypatch.delenv("EXTRACTOR_BLOCK_RESOURCES", raising=False)
+        ext = self._extractor(["Just a moment...", "Research Exchange"])
+        ext._blocking_resources = False
+        with patch("core.wiley_base.time.sleep"):
+            assert ext._wait_for_cloudflare(5)
+        assert self._blocked_urls(ext) == [blocked_patterns("wiley")]
+        assert ext._blocking_resources
+
+    def test_later_challenge_lifts_then_restores_blocking(self, monkeypatch):
+        monkeypatch.delenv("EXTRACTOR_BLOCK_RESOURCES", raising=False)
+        ext = self._extractor(["Un instant...", "Un instant...", "Dashboard"])
+        ext._blocking_resources = True
+        with patch("core.wiley_base.time.sleep"):
+            assert ext._wait_for_cloudflare(5)
+        assert self._blocked_urls(ext) == [[], blocked_patterns("wiley")]
+
+
+class TestCompareOutputs:
+    def test_identical_ignoring_run_timestamps(self):
+        a = [{"manuscript_id": "M1", "title": "T", "extraction_timestamp": "2026-01-01"}]
+        b = [{"manuscript_id": "M1", "title": "T", "extraction_timestamp": "2026-01-02"}]
+        report = compare_outputs(a, b)
+        assert (report["manuscripts"], report["identical"], report["differences"]) == (1, 1, {})
+
+    def test_reports_differences_and_unmatched(self):
+        a = [{"manuscript_id": "M1", "status": "Under Review"}, {"manuscript_id": "M2"}]
+        b = [{"manuscript_id": "M1", "status": ""}, {"manuscript_id": "M3"}]
+        report = compare_outputs(a, b)
+        assert report["differences"] == {"M1": ["fields/status"]}
+        assert report["unmatched"] == ["M2", "M3"]
@@ -0,0 +1,97 @@
+import json
+import zipfile
+
+import pytest
+from core.ror_index import RorIndex, build_index
+
+ETH = {
+    "id": "https://ror.org/05a28rw58",
+    "status": "active",
+    "names": [
+        {"value": "ETH Zurich", "types": ["ror_display", "label"]},
+        {"value": "Eidgenössische Technische Hochschule Zürich", "types": ["label"]},
+        {"value": "ETHZ", "types": ["acronym"]},
+    ],
+    "domains": ["ethz.ch"],
+    "links": [{"type": "website", "value": "https://ethz.ch"}],
+    "locations": [{"geonames_details": {"country_name": "Switzerland", "country_code": "CH"}}],
+    "relationships": [{"type": "child", "id": "https://ror.org/0risk"}],
+}
+RISKLAB = {
+    "id": "https://ror.org/0risk",
+    "status": "active",
+    "names": [{"value": "RiskLab Switzerland", "types": ["ror_display"]}],
+    "domains": [],
+    "links": [{"type": "website", "value": "https://math.ethz.ch/risklab"}],
+    "locations": [{"geonames_details": {"country_name": "Switzerland", "country_code": "CH"}}],
+    "relationships": [{"type": "parent", "id": "https://ror.org/05a28rw58"}],
+}
+DAUPHINE_V1 = {
+    "id": "https://ror.org/052mmv870",
+    "status": "active",
+    "name": "Université Paris Dauphine-PSL",
+    "aliases": ["Paris Dauphine University"],
+    "acronyms": ["UPD"],
+    "labels": [],
+    "links": ["http://www.dauphine.psl.eu/"],
+    "country": {"country_name": "France", "country_code": "FR"},
+    "relationships": [],
+}
+DEFUNCT = {
+    "id": "https://ror.org/0gone",
+    "status": "withdrawn",
+    "names": [{"value": "Old Institute", "types": ["ror_display"]}],
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    dump = tmp_path / "v1.60-2026-01-01-ror-data.zip"
+    with zipfile.ZipFile(dump, "w") as zf:
+        zf.writestr("v1.60-2026-01-01-ror-data_schema_v2.json", json.dumps([ETH, RISKLAB, DEFUNCT]))
+        zf.writestr("v1.60-2026-01-01-ror-data.json", "[]")
+    db = tmp_path / "ror.db"
+    assert build_index(dump, db)["organizations"] == 2
+    v1 = tmp_path / "v1.json"
+    v1.write_text(json.dumps([ETH, RISKLAB, DAUPHINE_V1]))
+    assert build_index(v1, db)["organizations"] == 3
+    return RorIndex(db)
+
+
+class TestLookups:
+    def test_domain_walks_up_subdomains(self, index):
+        assert index.by_domain("someone@math.ethz.ch")["name"] == "ETH Zurich"
+        assert index.by_domain("dauphine.psl.eu")["country"] == "France"
+        assert index.by_domain("x@gmail.com") is None
+
+    def test_name_variants_and_acronyms(self, index):
+        assert index.by_name("Eidgenossische Technische Hochschule Zurich")["name"] == "ETH Zurich"
+        assert index.by_name("ethz")["country_code"] == "CH"
+        assert index.by_name("Paris Dauphine University")["country"] == "France"
+
+    def test_fuzzy_match(self, index):
+        assert index.by_name("Universite de Paris Dauphine-PSL")["ror_id"].endswith("052mmv870")
+        assert index.by_name("Universite de Paris Dauphine-PSL", fuzzy=False) is None
+        assert index.by_name("Institute of Nowhere") is None
+
+    def test_affiliation_parts(self, index):
+        org = index.resolve("Department of Mathematics, ETH Zurich, Switzerland")
+        assert org["name"] == "ETH Zurich"
+        assert index.country("Unknown Lab", email="a@ethz.ch") == "Switzerland"
+
+    def test_withdrawn_orgs_skipped(self, index):
+        assert index.by_name("Old Institute", fuzzy=False) is None
+
+
+class TestSameInstitution:
+    def test_parent_child_and_variants(self, index):
+        assert index.same_institution("ETHZ", "RiskLab Switzerland")
+        assert index.same_institution("ETH Zurich", "Eidgenössische Technische Hochschule Zürich")
+        assert index.same_institution("ETH Zurich", "Paris Dauphine University") is False
+        assert index.same_institution("ETH Zurich", "Institute of Nowhere") is None
+
+    def test_no_index_is_unavailable(self, tmp_path):
+        index = RorIndex(tmp_path / "missing.db")
+        assert not index.available
+        assert index.resolve("ETH Zurich") is None
+        assert index.same_institution("ETH Zurich", "ETHZ") is None
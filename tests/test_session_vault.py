@@ -0,0 +1,76 @@
+import json
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from core.session_vault import SessionVault, session_stats
+
+
+def _driver(cookies=None, url="https://mc.manuscriptcentral.com/mafi"):
+    driver = MagicMock()
+    driver.current_url = url
+    driver.execute_script.return_value = "Mozilla/5.0 Test"
+    driver.get_cookies.return_value = cookies or [
+        {"name": "JSESSIONID", "value": "abc", "domain": "mc.manuscriptcentral.com"},
+        {"name": "cf_clearance", "value": "cf", "domain": ".manuscriptcentral.com"},
+        {"name": "orcid", "value": "o", "domain": "orcid.org"},
+    ]
+    return driver
+
+
+@pytest.fixture
+def vault(tmp_path, monkeypatch):
+    monkeypatch.delenv("EXTRACTOR_SESSION_VAULT", raising=False)
+    return SessionVault("MF", vault_dir=tmp_path)
+
+
+class TestSaveAndRestore:
+    def test_restore_adds_cookies_for_host(self, vault):
+        assert vault.save(_driver())
+        target = _driver()
+        assert vault.restore(target, "https://mc.manuscriptcentral.com/mafi")
+        target.get.assert_called_once_with("https://mc.manuscriptcentral.com/mafi")
+        names = [c.args[0]["name"] for c in target.add_cookie.call_args_list]
+        assert names == ["JSESSIONID", "cf_clearance"]
+
+    def test_saved_file_is_private(self, vault):
+        vault.save(_driver())
+        assert vault.path.stat().st_mode & 0o777 == 0o600
+
+    def test_nothing_saved(self, vault):
+        assert not vault.restore(_driver(), "https://mc.manuscriptcentral.com/mafi")
+
+    def test_expired_cookies_dropped(self, vault):
+        past = int(time.time()) - 60
+        vault.save(_driver([{"name": "s", "value": "1", "domain": "a.org", "expiry": past}]))
+        assert vault.load() is None
+
+    def test_stale_record_ignored(self, vault):
+        vault.save(_driver())
+        record = json.loads(vault.path.read_text())
+        record["saved_at"] -= (vault.max_age_hours + 1) * 3600
+        vault.path.write_text(json.dumps(record))
+        assert vault.load() is None
+
+    def test_disabled_by_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("EXTRACTOR_SESSION_VAULT", "false")
+        vault = SessionVault("MF", vault_dir=tmp_path)
+        assert not vault.save(_driver())
+        assert not vault.path.exists()
+
+
+class TestStats:
+    def test_lifetime_events(self, vault, tmp_path):
+        vault.save(_driver())
+        vault.restore(_driver(), "https://mc.manuscriptcentral.com/mafi")
+        vault.mark_valid()
+        vault.invalidate()
+        assert not vault.path.exists()
+        stats = session_stats(tmp_path)["mf"]
+        assert (stats["logins"], stats["reuses"], stats["expirations"]) == (1, 1, 1)
+        assert stats["max_reused_age_hours"] == 0.0
+
+    def test_profile_dir_opt_in(self, vault, monkeypatch):
+        assert vault.profile_dir() is None
+        monkeypatch.setenv("EXTRACTOR_BROWSER_PROFILE", "true")
+        assert vault.profile_dir().is_dir()
@@ -0,0 +1,145 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+from core import snapshot_archive
+from core.snapshot_archive import (
+    archive_journal,
+    archive_snapshot,
+    glob_snapshots,
+    is_manifest,
+    iter_changed_records,
+    load_snapshot,
+    manifest_hashes,
+    record_hash,
+)
+
+
+def _snapshot(ts, manuscripts):
+    return {
+        "extraction_timestamp": ts,
+        "journal": "mf",
+        "manuscripts": manuscripts,
+        "summary": {"total_manuscripts": len(manuscripts)},
+    }
+
+
+def _ms(ms_id, status="Under Review"):
+    return {"manuscript_id": ms_id, "title": f"Paper {ms_id}", "status": status, "referees": []}
+
+
+@pytest.fixture(params=[".zst", ".gz"])
+def suffix(request):
+    if request.param == ".zst" and snapshot_archive.zstandard is None:
+        pytest.skip("zstandard not installed")
+    return request.param
+
+
+@pytest.fixture
+def journal_dir(tmp_path):
+    d = tmp_path / "mf"
+    d.mkdir()
+    (d / "mf_extraction_20260101_100000.json").write_text(
+        json.dumps(_snapshot("2026-01-01", [_ms("MF-1"), _ms("MF-2")]), indent=2)
+    )
+    (d / "mf_extraction_20260102_100000.json").write_text(
+        json.dumps(_snapshot("2026-01-02", [_ms("MF-1"), _ms("MF-2", "Awaiting AE")]), indent=2)
+    )
+    (d / "mf_extraction_20260103_100000.json").write_text(
+        json.dumps(_snapshot("2026-01-03", [_ms("MF-1"), _ms("MF-2", "Awaiting AE")]), indent=2)
+    )
+    return d
+
+
+class TestArchiveSnapshot:
+    def test_roundtrip(self, journal_dir, suffix):
+        src = journal_dir / "mf_extraction_20260101_100000.json"
+        original = json.loads(src.read_text())
+        manifest = archive_snapshot(src, suffix=suffix)
+        assert is_manifest(manifest)
+        assert manifest.name == f"mf_extraction_20260101_100000.manifest{suffix}"
+        assert load_snapshot(manifest) == original
+
+    def test_preserves_mtime(self, journal_dir, suffix):
+        src = journal_dir / "mf_extraction_20260101_100000.json"
+        os.utime(src, (1_700_000_000, 1_700_000_000))
+        manifest = archive_snapshot(src, suffix=suffix)
+        assert manifest.stat().st_mtime == 1_700_000_000
+
+    def test_identical_records_stored_once(self, journal_dir, suffix):
+        for f in sorted(journal_dir.glob("*.json")):
+            archive_snapshot(f, remove_source=True, suffix=suffix)
+        objects = list((journal_dir / "objects").rglob(f"*{suffix}"))
+        assert len(objects) == 3
+        assert not list(journal_dir.glob("*.json"))
+
+    def test_manifest_hashes_match_record_hash(self, journal_dir, suffix):
+        src = journal_dir / "mf_extraction_20260102_100000.json"
+        expected = manifest_hashes(src)
+        manifest = archive_snapshot(src, suffix=suffix)
+        assert manifest_hashes(manifest) == expected
+        assert expected["MF-1"] == record_hash(_ms("MF-1"))
+
+
+class TestArchiveJournal:
+    def test_keeps_latest_json(self, journal_dir):
+        result = archive_journal(journal_dir, keep_latest=1)
+        assert result["archived"] == 2
+        assert [f.name for f in journal_dir.glob("*.json")] == [
+            "mf_extraction_20260103_100000.json"
+        ]
+        assert len(glob_snapshots(journal_dir, "*_extraction_*.json")) == 3
+
+
+class TestGlobSnapshots:
+    def test_json_wins_over_manifest(self, journal_dir):
+        src = journal_dir / "mf_extraction_20260101_100000.json"
+        archive_snapshot(src)
+        files = glob_snapshots(journal_dir, "*_extraction_*.json")
+        assert len(files) == 3
+        assert src in files
+
+    def test_missing_directory(self, tmp_path):
+        assert glob_snapshots(tmp_path / "nope") == []
+
+
+class TestIterChangedRecords:
+    def test_skips_unchanged_in_manifests(self, journal_dir):
+        archive_journal(journal_dir, keep_latest=0)
+        files = sorted(glob_snapshots(journal_dir, "*_extraction_*.json"), key=lambda f: f.name)
+        last = {}
+        seen = [[ms["manuscript_id"] for ms in iter_changed_records(f, last)] for f in files]
+        assert seen == [["MF-1", "MF-2"], ["MF-2"], []]
+
+    def test_json_always_yields(self, journal_dir):
+        files = sorted(journal_dir.glob("*.json"))
+        last = {}
+        seen = [[ms["manuscript_id"] for ms in iter_changed_records(f, last)] for f in files]
+        assert seen == [["MF-1", "MF-2"]] * 3
+
+
+class TestTransparentReaders:
+    def test_file_utils_reads_archived_history(self, journal_dir):
+        archive_journal(journal_dir, keep_latest=0)
+        with patch("core.file_utils.OUTPUTS_DIR", journal_dir.parent):
+            from core.file_utils import list_extraction_files, load_latest_extraction
+
+            files = list_extraction_files("mf")
+            assert [snapshot_archive.snapshot_stem(f) for f in files] == [
+                "mf_extraction_20260103_100000",
+                "mf_extraction_20260102_100000",
+                "mf_extraction_20260101_100000",
+            ]
+            data = load_latest_extraction("mf")
+        assert data["extraction_timestamp"] == "2026-01-03"
+        assert len(data["manuscripts"]) == 2
+
+    def test_cross_journal_load_journal_data(self, journal_dir):
+        archive_journal(journal_dir, keep_latest=0)
+        with patch("reporting.cross_journal_report.OUTPUTS_DIR", journal_dir.parent):
+            from reporting.cross_journal_report import load_journal_data
+
+            data = load_journal_data("mf")
+        assert data["_source_file"].startswith("mf_extraction_20260103_100000.manifest")
+        assert {m["manuscript_id"] for m in data["manuscripts"]} == {"MF-1", "MF-2"}
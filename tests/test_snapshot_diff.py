@@ -0,0 +1,175 @@
+"""Tests for the structural snapshot diff engine and its StateStore integration."""
+
+import copy
+from unittest.mock import patch
+
+import pytest
+from core.event_dispatcher import process_extraction
+from core.snapshot_diff import (
+    build_tree,
+    changed_referee_keys,
+    diff_trees,
+    person_key,
+    status_changed,
+)
+from core.state_store import StateStore
+
+
+@pytest.fixture
+def manuscript():
+    return {
+        "manuscript_id": "MF-001",
+        "title": "Optimal Stopping",
+        "status": "Under Review",
+        "authors": [{"name": "Jane Doe", "email": "jane@example.com"}],
+        "referees": [
+            {
+                "name": "Alice Smith",
+                "email": "alice@test.com",
+                "status": "Agreed",
+                "dates": {"invited": "2026-01-01", "agreed": "2026-01-03"},
+                "report": {},
+            },
+            {"name": "Bob Jones", "email": "", "status": "Invited", "dates": {}},
+        ],
+        "audit_trail": [{"date": "2026-01-01", "event": "Reviewer invited"}],
+    }
+
+
+class TestBuildTree:
+    def test_deterministic(self, manuscript):
+        assert build_tree(manuscript) == build_tree(copy.deepcopy(manuscript))
+
+    def test_root_hash_covers_nested_change(self, manuscript):
+        changed = copy.deepcopy(manuscript)
+        changed["referees"][0]["dates"]["returned"] = "2026-02-01"
+        assert build_tree(manuscript)["h"] != build_tree(changed)["h"]
+
+    def test_referee_order_irrelevant(self, manuscript):
+        reordered = copy.deepcopy(manuscript)
+        reordered["referees"].reverse()
+        assert build_tree(manuscript)["h"] == build_tree(reordered)["h"]
+
+    def test_person_key_prefers_email(self):
+        assert person_key({"name": "A B", "email": " X@Y.org "}) == "x@y.org"
+        assert person_key({"name": "Bob  Jones"}) == "bob jones"
+
+
+class TestDiffTrees:
+    def test_identical_is_empty(self, manuscript):
+        assert diff_trees(build_tree(manuscript), build_tree(manuscript)) == []
+
+    def test_first_seen(self, manuscript):
+        assert diff_trees(None, build_tree(manuscript))[0]["kind"] == "manuscript"
+
+    def test_referee_date_added(self, manuscript):
+        new = copy.deepcopy(manuscript)
+        new["referees"][0]["dates"]["returned"] = "2026-02-01"
+        changes = diff_trees(build_tree(manuscript), build_tree(new))
+        assert changes == [
+            {
+                "op": "added",
+                "kind": "referee_date",
+                "path": "referees/alice@test.com/dates/returned",
+                "new": "2026-02-01",
+            }
+        ]
+
+    def test_report_and_status_changes(self, manuscript):
+        new = copy.deepcopy(manuscript)
+        new["referees"][0]["report"] = {"comments_to_author": "Fine paper."}
+        new["status"] = "Awaiting AE Decision"
+        kinds = {(c["kind"], c["op"]) for c in diff_trees(build_tree(manuscript), build_tree(new))}
+        assert kinds == {("report", "modified"), ("manuscript_field", "modified")}
+
+    def test_scalar_old_and_new_values(self, manuscript):
+        new = copy.deepcopy(manuscript)
+        new["referees"][1]["status"] = "Declined"
+        (change,) = diff_trees(build_tree(manuscript), build_tree(new))
+        assert change["kind"] == "referee_field"
+        assert (change["old"], change["new"]) == ("Invited", "Declined")
+
+    def test_referee_and_audit_event_added(self, manuscript):
+        new = copy.deepcopy(manuscript)
+        new["referees"].append({"name": "Carol King", "email": "carol@u.edu"})
+        new["audit_trail"].append({"date": "2026-01-05", "event": "Reviewer agreed"})
+        changes = diff_trees(build_tree(manuscript), build_tree(new))
+        assert {(c["kind"], c["op"]) for c in changes} == {
+            ("referee", "added"),
+            ("audit_event", "added"),
+        }
+
+    def test_referee_removed(self, manuscript):
+        new = copy.deepcopy(manuscript)
+        new["referees"] = new["referees"][:1]
+        changes = diff_trees(build_tree(manuscript), build_tree(new))
+        assert changes == [{"op": "removed", "kind": "referee", "path": "referees/bob jones"}]
+
+    def test_changed_referee_keys(self, manuscript):
+        new = copy.deepcopy(manuscript)
+        new["referees"][1]["status"] = "Agreed"
+        new["title"] = "Optimal Stopping II"
+        changes = diff_trees(build_tree(manuscript), build_tree(new))
+        assert changed_referee_keys(changes) == {"bob jones"}
+        assert not status_changed(changes)
+
+    def test_status_changed(self, manuscript):
+        new = copy.deepcopy(manuscript)
+        new["status"] = "Accept"
+        changes = diff_trees(build_tree(manuscript), build_tree(new))
+        assert changed_referee_keys(changes) == set()
+        assert status_changed(changes)
+
+
+class TestStateStoreDiff:
+    def test_first_diff_is_none_then_empty(self, tmp_path, manuscript):
+        store = StateStore(db_path=tmp_path / "state.db")
+        assert store.diff_manuscript(manuscript, "mf") is None
+        assert store.diff_manuscript(manuscript, "mf") == []
+
+    def test_diff_uses_stored_tree(self, tmp_path, manuscript):
+        store = StateStore(db_path=tmp_path / "state.db")
+        store.diff_manuscript(manuscript, "mf")
+        new = copy.deepcopy(manuscript)
+        new["referees"][0]["status"] = "Report Submitted"
+        changes = StateStore(db_path=tmp_path / "state.db").diff_manuscript(new, "mf")
+        assert [c["path"] for c in changes] == ["referees/alice@test.com/status"]
+
+    def test_journals_are_separate(self, tmp_path, manuscript):
+        store = StateStore(db_path=tmp_path / "state.db")
+        store.diff_manuscript(manuscript, "mf")
+        assert store.diff_manuscript(manuscript, "mor") is None
+
+    def test_staged_tree_waits_for_commit(self, tmp_path, manuscript):
+        store = StateStore(db_path=tmp_path / "state.db")
+        store.diff_manuscript(manuscript, "mf")
+        new = copy.deepcopy(manuscript)
+        new["referees"][0]["status"] = "Report Submitted"
+        first = store.diff_manuscript(new, "mf", commit=False)
+        # Not committed yet: the next extraction still diffs against the old tree
+        assert store.diff_manuscript(new, "mf", commit=False) == first
+        assert store.commit_tree("MF-001", "mf")
+        assert store.diff_manuscript(new, "mf") == []
+        assert not store.commit_tree("MF-001", "mf")
+
+    def test_dispatcher_attaches_diff(self, tmp_path, manuscript):
+        db = tmp_path / "state.db"
+        new = copy.deepcopy(manuscript)
+        new["status"] = "Awaiting Decision"
+        with (
+            patch("core.event_dispatcher._append_event"),
+            patch("core.event_dispatcher.StateStore", lambda: StateStore(db_path=db)),
+        ):
+            process_extraction({"manuscripts": [manuscript]}, "mf")
+            StateStore(db_path=db).commit_tree("MF-001", "mf")
+            events = process_extraction({"manuscripts": [new]}, "mf")
+        assert events[0]["type"] == "STATUS_CHANGED"
+        assert events[0]["diff"] == [
+            {
+                "op": "modified",
+                "kind": "manuscript_field",
+                "path": "fields/status",
+                "old": "Under Review",
+                "new": "Awaiting Decision",
+            }
+        ]
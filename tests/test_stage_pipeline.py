@@ -0,0 +1,74 @@
+import threading
+import time
+
+from core.stage_pipeline import StagedPipeline
+
+
+def _mark(name):
+    def stage(item):
+        item.setdefault("stages", []).append(name)
+
+    return stage
+
+
+class TestStagedPipeline:
+    def test_runs_stages_in_order_and_keeps_submission_order(self):
+        def slow_first(item):
+            if item["manuscript_id"] == "M0":
+                time.sleep(0.05)
+            _mark("enrich")(item)
+
+        pipeline = StagedPipeline([("Enrichment", slow_first), ("Analytics", _mark("analytics"))])
+        for i in range(5):
+            pipeline.submit({"manuscript_id": f"M{i}"})
+        results = pipeline.drain()
+        assert [r["manuscript_id"] for r in results] == [f"M{i}" for i in range(5)]
+        assert all(r["stages"] == ["enrich", "analytics"] for r in results)
+
+    def test_submit_does_not_wait_for_stages(self):
+        release = threading.Event()
+        pipeline = StagedPipeline([("Gmail", lambda item: release.wait(5))])
+        start = time.monotonic()
+        pipeline.submit({"manuscript_id": "M1"})
+        pipeline.submit({"manuscript_id": "M2"})
+        assert time.monotonic() - start < 1
+        release.set()
+        assert len(pipeline.drain()) == 2
+
+    def test_stage_error_does_not_drop_manuscript(self, capsys):
+        def boom(item):
+            raise RuntimeError("api down")
+
+        pipeline = StagedPipeline([("Gmail", boom), ("Analytics", _mark("analytics"))])
+        pipeline.submit({"manuscript_id": "M1"})
+        (result,) = pipeline.drain()
+        assert result["stages"] == ["analytics"]
+        assert "Gmail error (M1): api down" in capsys.readouterr().out
+
+    def test_inline_mode(self, monkeypatch):
+        monkeypatch.setenv("EXTRACTOR_PIPELINE", "false")
+        pipeline = StagedPipeline([("Enrichment", _mark("enrich"))])
+        item = {"manuscript_id": "M1"}
+        pipeline.submit(item)
+        assert item["stages"] == ["enrich"]
+        assert pipeline.drain() == [item]
+        assert pipeline.drain() == []
+
+    def test_bounded_queue_applies_backpressure(self):
+        release = threading.Event()
+        pipeline = StagedPipeline([("Enrichment", lambda item: release.wait(5))], maxsize=1)
+        submitted = []
+
+        def browser():
+            for i in range(4):
+                pipeline.submit({"manuscript_id": f"M{i}"})
+                submitted.append(i)
+
+        t = threading.Thread(target=browser)
+        t.start()
+        time.sleep(0.1)
+        # One in the stage, one queued, the third submit blocks
+        assert len(submitted) == 2
+        release.set()
+        t.join(5)
+        assert len(pipeline.drain()) == 4